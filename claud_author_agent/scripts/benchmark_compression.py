@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the content codec (src/utils/compression.py).
+
+Encodes and decodes the fields the author agents actually compress - lesson
+cards, SOW entries and mock exam sections - with each codec/level and reports
+encode time, decode time and encoded size (characters, as Appwrite counts
+them). zstd rows are skipped when the optional ``zstandard`` package is
+not installed.
+
+Usage:
+    python scripts/benchmark_compression.py
+    python scripts/benchmark_compression.py --repeat 50
+    python scripts/benchmark_compression.py --fixture cards=path/to/lesson.json:cards
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.compression import compress_json, decompress_json_gzip_base64
+
+AGENT_ROOT = Path(__file__).parent.parent
+REPO_ROOT = AGENT_ROOT.parent
+
+# (label, fixture path, field to compress)
+DEFAULT_FIXTURES = [
+    ("lesson cards", AGENT_ROOT / "tests" / "mock_lesson_template.json", "cards"),
+    ("SOW entries", REPO_ROOT / "langgraph-author-agent" / "data" / "Seeding_Data_Full" / "input" / "sows" / "mathematics_national-4.json", "entries"),
+    ("mock exam sections", REPO_ROOT / "fixtures" / "sample_nat5_plus_exam.json", "sections"),
+]
+
+CODEC_LEVELS = [("gzip", 9), ("gzip", 6), ("gzip", 1), ("zstd", 3), ("zstd", 10), ("zstd", 19)]
+
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _parse_fixture(spec: str) -> Tuple[str, Path, str]:
+    """Parse LABEL=PATH:FIELD."""
+    label, _, rest = spec.partition("=")
+    path, _, field = rest.rpartition(":")
+    if not label or not path or not field:
+        raise argparse.ArgumentTypeError(f"Expected LABEL=PATH:FIELD, got '{spec}'")
+    return label, Path(path), field
+
+
+def _best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def benchmark(fixtures: List[Tuple[str, Path, str]], repeat: int) -> List[dict]:
+    """Return one row per fixture x codec/level."""
+    zstd_ok = _zstd_available()
+    rows = []
+    for label, path, field in fixtures:
+        data: Any = json.loads(path.read_text(encoding="utf-8"))[field]
+        for codec, level in CODEC_LEVELS:
+            if codec == "zstd" and not zstd_ok:
+                continue
+            result = compress_json(data, codec=codec, level=level)
+            assert decompress_json_gzip_base64(result.encoded) == data, f"{label}: {codec}-{level} roundtrip mismatch"
+            rows.append({
+                "fixture": label,
+                "codec": f"{codec}-{level}",
+                "original": result.original_size,
+                "encoded": result.compressed_size,
+                "ratio": result.stats()["ratio"],
+                "encode_ms": _best_ms(lambda: compress_json(data, codec=codec, level=level), repeat),
+                "decode_ms": _best_ms(lambda: decompress_json_gzip_base64(result.encoded), repeat),
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gzip/zstd encoding of author-agent payloads")
+    parser.add_argument("--repeat", type=int, default=20, help="Timing runs per measurement (best is reported)")
+    parser.add_argument(
+        "--fixture",
+        action="append",
+        type=_parse_fixture,
+        help="LABEL=PATH:FIELD to benchmark instead of the default lesson/SOW/mock exam fixtures"
+    )
+    args = parser.parse_args()
+
+    fixtures = args.fixture or DEFAULT_FIXTURES
+    rows = benchmark(fixtures, args.repeat)
+
+    print(f"{'fixture':<20} {'codec':<8} {'original':>9} {'encoded':>9} {'ratio':>7} {'encode ms':>10} {'decode ms':>10}")
+    print("─" * 79)
+    for row in rows:
+        print(
+            f"{row['fixture']:<20} {row['codec']:<8} {row['original']:>9,} {row['encoded']:>9,} "
+            f"{row['ratio']:>7} {row['encode_ms']:>10.3f} {row['decode_ms']:>10.3f}"
+        )
+    if not _zstd_available():
+        print("\n(zstd rows skipped: pip install zstandard to include them)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark the deterministic diagram-eligibility pre-filter against labels.
+
+For each labelled card the pre-filter either rejects it (no diagram, never
+sent to the LLM) or forwards it to EligibilityAnalyzerAgent. Reports:
+
+- recall:     eligible cards forwarded / eligible cards (a miss loses a diagram)
+- precision:  eligible cards forwarded / cards forwarded
+- reject rate and the input tokens the LLM no longer reads (chars / 4
+  estimate; a lesson whose cards are all rejected also saves the analyzer
+  prompt)
+
+Labels come from tests/fixtures/eligibility_labelled_cards.json by default,
+or from real analyzer runs: pass the lesson_template.json a run analyzed and
+the eligible_cards.json it wrote (cards listed there are the LLM's positives).
+
+Usage:
+    python scripts/benchmark_eligibility_prefilter.py
+    python scripts/benchmark_eligibility_prefilter.py \\
+        --llm-run workspace/exec_x/lesson_template.json:workspace/exec_x/eligible_cards.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.compression import decompress_json_gzip_base64
+from src.utils.diagram_extractor import prefilter_cards
+
+AGENT_ROOT = Path(__file__).parent.parent
+DEFAULT_FIXTURE = AGENT_ROOT / "tests" / "fixtures" / "eligibility_labelled_cards.json"
+PROMPT_FILE = AGENT_ROOT / "src" / "prompts" / "eligibility_analyzer_prompt.md"
+
+
+def _tokens(obj: Any) -> int:
+    text = obj if isinstance(obj, str) else json.dumps(obj, ensure_ascii=False)
+    return len(text) // 4
+
+
+def load_fixture(path: Path) -> List[Dict[str, Any]]:
+    """Return [{lessonTemplateId, cards, labels}] from a labelled fixture file."""
+    return json.loads(path.read_text(encoding="utf-8"))["lessons"]
+
+
+def load_llm_run(spec: str) -> Dict[str, Any]:
+    """Build a labelled lesson from LESSON_TEMPLATE.json:ELIGIBLE_CARDS.json."""
+    template_path, _, eligible_path = spec.rpartition(":")
+    if not template_path:
+        raise argparse.ArgumentTypeError(f"Expected TEMPLATE:ELIGIBLE_CARDS, got '{spec}'")
+    template = json.loads(Path(template_path).read_text(encoding="utf-8"))
+    cards = template.get("cards", [])
+    if isinstance(cards, str):
+        cards = decompress_json_gzip_base64(cards)
+    eligible_ids = {c.get("id") or c.get("cardId") for c in json.loads(Path(eligible_path).read_text(encoding="utf-8"))}
+    return {
+        "lessonTemplateId": template.get("lessonTemplateId") or template.get("$id") or template_path,
+        "cards": cards,
+        "labels": {card["id"]: card["id"] in eligible_ids for card in cards},
+    }
+
+
+def benchmark(lessons: List[Dict[str, Any]], prompt_tokens: int) -> Dict[str, Any]:
+    """Score the pre-filter on labelled lessons."""
+    tp = fp = fn = tn = 0
+    baseline_tokens = prefiltered_tokens = sessions_avoided = 0
+    false_rejects = []
+
+    for lesson in lessons:
+        forwarded, rejected = prefilter_cards(lesson["cards"])
+        labels = lesson["labels"]
+        for card in forwarded:
+            if labels[card["id"]]:
+                tp += 1
+            else:
+                fp += 1
+        for card in rejected:
+            if labels[card["id"]]:
+                fn += 1
+                false_rejects.append(f"{lesson['lessonTemplateId']}/{card['id']}")
+            else:
+                tn += 1
+
+        baseline_tokens += prompt_tokens + _tokens(lesson["cards"])
+        if forwarded:
+            prefiltered_tokens += prompt_tokens + _tokens(forwarded)
+        else:
+            sessions_avoided += 1
+
+    total = tp + fp + fn + tn
+    return {
+        "lessons": len(lessons),
+        "cards": total,
+        "rejected": fn + tn,
+        "reject_rate": round((fn + tn) / total, 3) if total else 0.0,
+        "recall": round(tp / (tp + fn), 3) if tp + fn else 1.0,
+        "precision": round(tp / (tp + fp), 3) if tp + fp else 1.0,
+        "false_rejects": false_rejects,
+        "llm_sessions_avoided": sessions_avoided,
+        "baseline_input_tokens": baseline_tokens,
+        "prefiltered_input_tokens": prefiltered_tokens,
+        "tokens_saved": baseline_tokens - prefiltered_tokens,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the diagram eligibility pre-filter")
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE, help="Labelled fixture JSON")
+    parser.add_argument(
+        "--llm-run",
+        action="append",
+        type=load_llm_run,
+        help="TEMPLATE:ELIGIBLE_CARDS from a real analyzer run (repeatable; replaces --fixture)"
+    )
+    args = parser.parse_args()
+
+    lessons = args.llm_run or load_fixture(args.fixture)
+    result = benchmark(lessons, _tokens(PROMPT_FILE.read_text(encoding="utf-8")))
+
+    print(f"Lessons: {result['lessons']}   Cards: {result['cards']}")
+    print(f"Rejected without LLM: {result['rejected']} ({result['reject_rate']:.0%})")
+    print(f"Recall (eligible cards forwarded): {result['recall']:.3f}")
+    print(f"Precision (forwarded cards eligible): {result['precision']:.3f}")
+    print(f"LLM sessions avoided: {result['llm_sessions_avoided']}")
+    print(
+        f"Input tokens (chars/4): {result['baseline_input_tokens']:,} -> "
+        f"{result['prefiltered_input_tokens']:,} (saved {result['tokens_saved']:,})"
+    )
+    if result["false_rejects"]:
+        print(f"False rejections: {', '.join(result['false_rejects'])}")
+
+
+if __name__ == "__main__":
+    main()
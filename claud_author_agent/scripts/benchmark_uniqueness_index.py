@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the Nat5+ near-duplicate question index
+(src/nat5_plus/near_duplicate_index.py).
+
+Builds a QuestionIndex over synthetic exam question stems (10k+ by default),
+then compares LSH lookups with a full linear scan computing exact shingle
+Jaccard similarity against every stored stem. Reports build, save and load
+time, per-lookup latency, and recall/precision relative to the exact scan.
+
+Usage:
+    python scripts/benchmark_uniqueness_index.py
+    python scripts/benchmark_uniqueness_index.py --stored 20000 --threshold 0.7
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.nat5_plus.near_duplicate_index import QuestionIndex, jaccard, shingle
+
+TEMPLATES = [
+    "Calculate the gradient of the straight line joining A({a}, {b}) and B({c}, {d}).",
+    "Solve the equation {a}x + {b} = {c}x - {d}, showing all working.",
+    "A {item} costs £{a}.{b}0. Its price rises by {c}% each year for {d} years. Find its final price.",
+    "Expand and simplify ({a}x + {b})({c}x - {d}).",
+    "The radius of a circle is {a}.{b} cm. Calculate the area of a sector with angle {c}{d} degrees.",
+    "Factorise fully {a}x squared minus {b}{c}, then solve for x when the expression equals {d}.",
+    "A {item} travels {a}{b} km in {c} hours {d} minutes. Calculate its average speed in km/h.",
+    "Find the volume of a cylinder of radius {a} cm and height {b}{c} cm, giving the answer to {d} significant figures.",
+]
+ITEMS = ["car", "bicycle", "laptop", "train", "phone", "boat", "van", "tablet"]
+
+
+def _stem(rng: random.Random) -> str:
+    return rng.choice(TEMPLATES).format(
+        a=rng.randint(1, 99), b=rng.randint(1, 99), c=rng.randint(1, 99),
+        d=rng.randint(1, 99), item=rng.choice(ITEMS)
+    )
+
+
+def _mutate(stem: str, rng: random.Random) -> str:
+    """Change one number in the stem (a typical LLM near-repeat)."""
+    tokens = stem.split(" ")
+    numeric = [i for i, t in enumerate(tokens) if any(c.isdigit() for c in t)]
+    i = rng.choice(numeric)
+    tokens[i] = "".join(str(rng.randint(0, 9)) if c.isdigit() else c for c in tokens[i])
+    return " ".join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MinHash/LSH near-duplicate lookups")
+    parser.add_argument("--stored", type=int, default=12000, help="Stored question stems (default: 12000)")
+    parser.add_argument("--queries", type=int, default=300, help="Lookups to time (half near-duplicates)")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Jaccard threshold (default: 0.8)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stored = list(dict.fromkeys(_stem(rng) for _ in range(args.stored)))
+    queries: List[str] = [
+        _mutate(rng.choice(stored), rng) if i % 2 == 0 else _stem(rng)
+        for i in range(args.queries)
+    ]
+
+    # Build / persist / load
+    index = QuestionIndex(threshold=args.threshold)
+    started = time.perf_counter()
+    for i, stem in enumerate(stored):
+        index.add(f"q{i}", stem)
+    build_s = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "course.npz"
+        started = time.perf_counter()
+        index.save(path)
+        save_s = time.perf_counter() - started
+        size_mb = path.stat().st_size / 1e6
+        started = time.perf_counter()
+        index = QuestionIndex.load(path, threshold=args.threshold)
+        load_s = time.perf_counter() - started
+
+    # LSH lookups
+    started = time.perf_counter()
+    lsh_matches = [{key for key, _ in index.find_similar(q)} for q in queries]
+    lsh_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+    # Exact linear scan (ground truth)
+    stored_shingles = [shingle(s) for s in stored]
+    started = time.perf_counter()
+    exact_matches = []
+    for q in queries:
+        q_shingles = shingle(q)
+        exact_matches.append({
+            f"q{i}" for i, s in enumerate(stored_shingles) if jaccard(q_shingles, s) >= args.threshold
+        })
+    scan_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+    true_pos = sum(len(l & e) for l, e in zip(lsh_matches, exact_matches))
+    found = sum(len(l) for l in lsh_matches)
+    expected = sum(len(e) for e in exact_matches)
+
+    print(f"stored stems: {len(stored):,}   queries: {len(queries)}   threshold: {args.threshold}")
+    print(f"bands x rows: {index.lsh.bands} x {index.lsh.rows}")
+    print("─" * 60)
+    print(f"build:  {build_s:8.2f} s   ({build_s * 1e6 / len(stored):.0f} µs/stem)")
+    print(f"save:   {save_s:8.3f} s   ({size_mb:.1f} MB)")
+    print(f"load:   {load_s:8.3f} s")
+    print(f"lookup: {lsh_ms:8.3f} ms  LSH")
+    print(f"lookup: {scan_ms:8.3f} ms  exact linear scan  ({scan_ms / lsh_ms:.0f}x slower)")
+    print(f"recall:    {true_pos / expected if expected else 1:.3f}  ({true_pos}/{expected} exact matches found)")
+    print(f"precision: {true_pos / found if found else 1:.3f}")
+
+
+if __name__ == "__main__":
+    main()
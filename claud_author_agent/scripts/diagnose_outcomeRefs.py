@@ -18,9 +18,6 @@ Usage:
 
 import os
 import sys
-import json
-import gzip
-import base64
 import logging
 import argparse
 from pathlib import Path
@@ -39,6 +36,8 @@ from appwrite.client import Client
 from appwrite.services.databases import Databases
 from appwrite.query import Query
 
+from src.utils.compression import decompress_json_gzip_base64
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,39 +47,19 @@ logger = logging.getLogger(__name__)
 
 
 def decompress_entries(data: str) -> List[Dict[str, Any]]:
-    """Decompress gzip+base64 encoded SOW entries.
+    """Decompress gzip/zstd+base64 encoded SOW entries.
 
-    Handles multiple formats:
-    - 'gzip:' prefix + base64 (common format)
+    Handles multiple formats (via src.utils.compression):
+    - 'gzip:' / 'zstd:' prefix + base64 (common format)
     - Raw base64-gzip (Python format)
     - Uncompressed JSON (legacy)
     """
     if not data or data.strip() == '':
         return []
 
-    # Handle gzip: prefix format (most common)
-    if data.startswith('gzip:'):
-        base64_data = data[5:]  # Remove 'gzip:' prefix
-        try:
-            compressed = base64.b64decode(base64_data)
-            decompressed = gzip.decompress(compressed)
-            return json.loads(decompressed.decode('utf-8'))
-        except Exception as e:
-            logger.error(f"gzip: prefix decompression failed: {e}")
-            return []
-
-    # Try direct JSON (legacy uncompressed)
-    try:
-        return json.loads(data)
-    except json.JSONDecodeError:
-        pass
-
-    # Try raw base64-gzip decompression (Python format)
     try:
-        compressed = base64.b64decode(data)
-        decompressed = gzip.decompress(compressed)
-        return json.loads(decompressed.decode('utf-8'))
-    except Exception as e:
+        return decompress_json_gzip_base64(data)
+    except ValueError as e:
         logger.error(f"Failed to decompress/parse entries: {e}")
         return []
 
@@ -80,6 +80,7 @@ class SectionAuthorAgent:
                 - section: dict (full schema format)
                 - section_raw: dict (raw generation output)
                 - message_count: int
+                - input_tokens / output_tokens: int (from ResultMessage.usage)
 
         Raises:
             RuntimeError: If agent fails to produce valid output (fail-fast)
@@ -121,6 +122,8 @@ class SectionAuthorAgent:
         # Execute agent
         message_count = 0
         structured_output = None
+        input_tokens = 0
+        output_tokens = 0
 
         async with ClaudeSDKClient(options) as client:
             logger.info("Sending section prompt to agent...")
@@ -139,6 +142,15 @@ class SectionAuthorAgent:
                 if isinstance(message, ResultMessage):
                     logger.info(f"✅ Section agent completed after {message_count} messages")
 
+                    # Total input includes base + cache tokens
+                    usage = message.usage or {}
+                    input_tokens = (
+                        usage.get('input_tokens', 0)
+                        + usage.get('cache_creation_input_tokens', 0)
+                        + usage.get('cache_read_input_tokens', 0)
+                    )
+                    output_tokens = usage.get('output_tokens', 0)
+
                     if message.subtype == 'error_max_turns':
                         raise RuntimeError(
                             f"Section agent exceeded max turns ({self.max_turns})"
@@ -201,7 +213,9 @@ class SectionAuthorAgent:
             "section": section_full,
             "section_raw": section_raw,
             "message_count": message_count,
-            "section_index": section_idx
+            "section_index": section_idx,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens
         }
 
     def _build_prompt(self) -> str:
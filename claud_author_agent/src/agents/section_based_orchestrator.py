@@ -7,23 +7,26 @@ Key Features:
 - Parallel or sequential section generation
 - Section-level error recovery
 - Uses existing Critic for full exam evaluation
-- Section-level revision when critic fails
+- Section-level revision when critic fails: critic issues are mapped to the
+  sections they reference and only those are regenerated (in parallel);
+  the rest are reused by SectionMerger
 
 Flow:
     1. Parse source to identify sections (assessment cards)
     2. Generate each section (parallel or sequential)
     3. Merge sections into complete exam
     4. Run Critic on full exam
-    5. If Critic fails: Section-level revision on failed sections
+    5. If Critic fails: Regenerate only the sections the critic's issues point at
     6. Exit when Critic passes OR max iterations reached
 """
 
 import asyncio
 import json
 import logging
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Set
 
 from ..tools.mock_exam_schema_models import MockExam
 from ..tools.mock_exam_critic_schema_models import MockExamCriticResult
@@ -36,6 +39,59 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_ITERATIONS = 3
 MOCK_EXAM_FILE = "mock_exam.json"
 
+# Section/question references in critic issue text
+_SECTION_INDEX_RE = re.compile(r"sections\[(\d+)\]", re.IGNORECASE)  # JSON path, 0-based
+_SECTION_NUMBER_RE = re.compile(r"\bsection(?:[\s_#]*order)?[\s_#:]*(\d+)", re.IGNORECASE)  # 1-based
+_QUESTION_NUMBER_RE = re.compile(r"\b(?:q|question)(?:[\s_#.]*(?:id|number))?[\s_#.:]*q?(\d+)\b", re.IGNORECASE)
+
+
+def _critic_issue_texts(critic_result: MockExamCriticResult) -> Iterator[str]:
+    """Yield the critic's failure texts (passing dimensions are ignored)."""
+    if not critic_result.schema_gate.pass_:
+        yield from critic_result.schema_gate.failed_checks
+    yield from critic_result.validation_errors
+    for dimension in (critic_result.dimensions or {}).values():
+        if not dimension.pass_:
+            yield from dimension.issues
+    yield from critic_result.improvements_required
+
+
+def map_critic_to_sections(
+    critic_result: MockExamCriticResult,
+    exam_sections: List[Dict[str, Any]]
+) -> Set[int]:
+    """Map critic issues to the 0-based indices of the sections they reference.
+
+    Recognises "sections[1]" paths, "Section 2" / "section_order 2" and
+    question references ("Q7", "Question 7", "question_id q7"), resolved to
+    sections through the question numbers of the merged exam.
+
+    Args:
+        critic_result: Failed critic result
+        exam_sections: Sections of the merged exam the critic evaluated
+
+    Returns:
+        Indices of sections to regenerate (empty if no issue names a section)
+    """
+    question_sections = {
+        int(question.get("question_number", 0)): index
+        for index, section in enumerate(exam_sections)
+        for question in section.get("questions", [])
+    }
+    total = len(exam_sections)
+
+    indices: Set[int] = set()
+    for text in _critic_issue_texts(critic_result):
+        found = {int(m) for m in _SECTION_INDEX_RE.findall(text)}
+        found.update(int(m) - 1 for m in _SECTION_NUMBER_RE.findall(text))
+        found.update(
+            question_sections[int(m)]
+            for m in _QUESTION_NUMBER_RE.findall(text)
+            if int(m) in question_sections
+        )
+        indices.update(i for i in found if 0 <= i < total)
+    return indices
+
 
 @dataclass
 class SectionResult:
@@ -45,6 +101,13 @@ class SectionResult:
     section: Optional[Dict[str, Any]] = None
     message_count: int = 0
     error: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    reused: bool = False  # Carried over from an earlier iteration
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
 
 
 @dataclass
@@ -58,6 +121,8 @@ class SectionOrchestrationResult:
     total_message_count: int
     parallel_generation: bool
     error: Optional[str] = None
+    total_tokens: int = 0
+    iteration_reports: List[Dict[str, Any]] = field(default_factory=list)
 
 
 class SectionBasedOrchestrator:
@@ -122,8 +187,12 @@ class SectionBasedOrchestrator:
         logger.info(f"Parsed {len(section_specs)} sections from source")
 
         total_messages = 0
+        total_tokens = 0
+        iteration_reports: List[Dict[str, Any]] = []
         final_mock_exam = None
         final_critic_result = None
+        section_results: List[SectionResult] = []
+        merged_sections: List[Dict[str, Any]] = []
 
         for iteration in range(1, self.max_iterations + 1):
             logger.info("")
@@ -140,12 +209,18 @@ class SectionBasedOrchestrator:
                     section_results = await self._revise_failed_sections(
                         section_specs,
                         final_critic_result,
-                        final_mock_exam
+                        final_mock_exam,
+                        previous_results=section_results,
+                        exam_sections=merged_sections
                     )
 
-                # Count messages
+                # Count messages and tokens for sections generated this iteration
+                report = self._iteration_report(iteration, section_results)
+                iteration_reports.append(report)
+                total_tokens += report["tokens_used"]
                 for result in section_results:
-                    total_messages += result.message_count
+                    if not result.reused:
+                        total_messages += result.message_count
 
                 # Check for any section failures
                 failed_sections = [r for r in section_results if not r.success]
@@ -164,6 +239,8 @@ class SectionBasedOrchestrator:
                     validate=False  # Validate after write
                 )
 
+                merged_sections = mock_exam_dict["sections"]
+
                 # Write merged exam
                 output_path = self.workspace_path / MOCK_EXAM_FILE
                 with open(output_path, 'w') as f:
@@ -199,6 +276,7 @@ class SectionBasedOrchestrator:
                     logger.info(f"   Sections: {len(sections)}")
                     logger.info(f"   Questions: {final_mock_exam.summary.total_questions}")
                     logger.info(f"   Total messages: {total_messages}")
+                    logger.info(f"   Total tokens: {total_tokens:,}")
                     logger.info("=" * 80)
 
                     return SectionOrchestrationResult(
@@ -208,7 +286,9 @@ class SectionBasedOrchestrator:
                         sections_generated=len(sections),
                         iterations_completed=iteration,
                         total_message_count=total_messages,
-                        parallel_generation=self.parallel
+                        parallel_generation=self.parallel,
+                        total_tokens=total_tokens,
+                        iteration_reports=iteration_reports
                     )
 
                 # Log failure and continue
@@ -235,7 +315,9 @@ class SectionBasedOrchestrator:
             iterations_completed=self.max_iterations,
             total_message_count=total_messages,
             parallel_generation=self.parallel,
-            error=f"Max iterations ({self.max_iterations}) exceeded"
+            error=f"Max iterations ({self.max_iterations}) exceeded",
+            total_tokens=total_tokens,
+            iteration_reports=iteration_reports
         )
 
     def _parse_section_specs(
@@ -386,10 +468,10 @@ class SectionBasedOrchestrator:
 
             # Convert exceptions to SectionResult
             section_results = []
-            for i, result in enumerate(results):
+            for spec, result in zip(section_specs, results):
                 if isinstance(result, Exception):
                     section_results.append(SectionResult(
-                        section_index=i,
+                        section_index=spec.section_index,
                         success=False,
                         error=str(result)
                     ))
@@ -422,7 +504,9 @@ class SectionBasedOrchestrator:
                 section_index=spec.section_index,
                 success=result["success"],
                 section=result.get("section"),
-                message_count=result.get("message_count", 0)
+                message_count=result.get("message_count", 0),
+                input_tokens=result.get("input_tokens", 0),
+                output_tokens=result.get("output_tokens", 0)
             )
         except Exception as e:
             logger.error(f"Section {spec.section_index} failed: {e}")
@@ -435,17 +519,90 @@ class SectionBasedOrchestrator:
     async def _revise_failed_sections(
         self,
         section_specs: List[SectionGenerationContext],
-        critic_result: MockExamCriticResult,
-        current_exam: MockExam
+        critic_result: Optional[MockExamCriticResult],
+        current_exam: Optional[MockExam],
+        previous_results: Optional[List[SectionResult]] = None,
+        exam_sections: Optional[List[Dict[str, Any]]] = None
     ) -> List[SectionResult]:
-        """Revise sections that caused critic failure.
+        """Regenerate only the sections that caused the previous iteration to fail.
+
+        Sections that failed to generate are always retried. If the critic
+        ran, its issues are mapped to sections with map_critic_to_sections();
+        when no issue names a section (exam-wide feedback), every section is
+        regenerated. The selected sections are regenerated together
+        (in parallel if enabled) and the others are reused as-is.
+
+        Args:
+            section_specs: All section contexts
+            critic_result: Critic result of the previous iteration (None if
+                the critic did not run)
+            current_exam: Exam the critic evaluated (unused; kept for callers)
+            previous_results: Section results of the previous iteration
+            exam_sections: Sections of the merged exam the critic evaluated
 
-        For now, regenerates all sections. Future: identify specific failed sections.
+        Returns:
+            SectionResult per section, in section order
         """
-        # TODO: Parse critic result to identify which sections need revision
-        # For MVP, regenerate all sections
-        logger.info("🔧 Regenerating all sections for revision...")
-        return await self._generate_all_sections(section_specs)
+        previous = {r.section_index: r for r in (previous_results or []) if r.success}
+        missing = {spec.section_index for spec in section_specs} - set(previous)
+
+        targets = set(missing)
+        if critic_result is not None and not missing:
+            targets = map_critic_to_sections(critic_result, exam_sections or [])
+            if not targets:
+                logger.info("🔧 Critic feedback does not name a section - regenerating all sections")
+        if not targets:
+            targets = {spec.section_index for spec in section_specs}
+
+        logger.info(
+            f"🔧 Regenerating {len(targets)}/{len(section_specs)} section(s): "
+            f"{sorted(i + 1 for i in targets)}"
+        )
+
+        regenerated = await self._generate_all_sections(
+            [spec for spec in section_specs if spec.section_index in targets]
+        )
+        by_index = {r.section_index: r for r in regenerated}
+
+        results = []
+        for spec in section_specs:
+            if spec.section_index in by_index:
+                results.append(by_index[spec.section_index])
+            else:
+                kept = previous[spec.section_index]
+                results.append(SectionResult(
+                    section_index=kept.section_index,
+                    success=True,
+                    section=kept.section,
+                    message_count=kept.message_count,
+                    input_tokens=kept.input_tokens,
+                    output_tokens=kept.output_tokens,
+                    reused=True
+                ))
+        return results
+
+    def _iteration_report(self, iteration: int, section_results: List[SectionResult]) -> Dict[str, Any]:
+        """Summarise tokens spent vs. saved by reusing sections this iteration.
+
+        Savings are estimated from each reused section's last generation cost,
+        i.e. what regenerating it again would roughly have cost.
+        """
+        generated = [r for r in section_results if not r.reused]
+        reused = [r for r in section_results if r.reused]
+        report = {
+            "iteration": iteration,
+            "sections_regenerated": [r.section_index for r in generated],
+            "sections_reused": [r.section_index for r in reused],
+            "tokens_used": sum(r.total_tokens for r in generated),
+            "tokens_saved_estimate": sum(r.total_tokens for r in reused)
+        }
+        if reused:
+            logger.info(
+                f"♻️ Iteration {iteration}: reused {len(reused)} section(s), "
+                f"~{report['tokens_saved_estimate']:,} tokens saved "
+                f"({report['tokens_used']:,} tokens used)"
+            )
+        return report
 
 
 async def run_section_based_orchestrator(
@@ -233,11 +233,14 @@ async def run_batch_mode(
         display_dry_run_summary
     )
     from .utils.diagram_validator import validate_structure_batch
-    from .utils.diagram_extractor import fetch_lesson_template
+    from .utils.diagram_extractor import fetch_lesson_template, fetch_lesson_templates_by_order
     from .utils.diagram_cleanup import delete_existing_diagrams_for_lesson
     from .diagram_author_claude_client import DiagramAuthorClaudeAgent
     from .eligibility_analyzer_agent import EligibilityAnalyzerAgent
     from .tools.diagram_screenshot_tool import check_diagram_service_health
+    from .tools.diagram_http_client import get_render_latency_stats, format_render_latency_stats
+    from .tools.diagram_render_cache import get_render_cache
+    from .utils.eligibility_cache import get_eligibility_cache
 
     print(f"\n{BLUE}{'=' * 80}{RESET}")
     print(f"{BLUE}Batch Diagram Generator{RESET}")
@@ -298,12 +301,20 @@ async def run_batch_mode(
         # This catches malformed lessons early before any expensive operations
         print(f"{BLUE}Step 2: Validating lesson structure (fast, no LLM)...{RESET}")
 
-        structure_results = await validate_structure_batch(
+        # One query for every template; decoded once and shared by steps 2, 3 and 6a
+        templates = await fetch_lesson_templates_by_order(
             course_id=args.courseId,
             lesson_orders=lesson_orders,
             mcp_config_path=args.mcp_config
         )
 
+        structure_results = await validate_structure_batch(
+            course_id=args.courseId,
+            lesson_orders=lesson_orders,
+            mcp_config_path=args.mcp_config,
+            templates=templates
+        )
+
         valid_count = sum(1 for v in structure_results.values() if v["valid"])
         invalid_count = len(lesson_orders) - valid_count
         total_cards = sum(v.get("total_cards", 0) for v in structure_results.values() if v["valid"])
@@ -322,7 +333,8 @@ async def run_batch_mode(
         existing_diagrams = await check_existing_diagrams_batch(
             course_id=args.courseId,
             lesson_orders=lesson_orders,
-            mcp_config_path=args.mcp_config
+            mcp_config_path=args.mcp_config,
+            templates=templates
         )
 
         existing_count = sum(1 for diagrams in existing_diagrams.values() if diagrams)
@@ -399,7 +411,7 @@ async def run_batch_mode(
             try:
                 # Step 6a: Eligibility analysis for THIS lesson (LLM call)
                 print(f"{BLUE}  Running eligibility analysis...{RESET}")
-                template = await fetch_lesson_template(
+                template = templates.get(order) or await fetch_lesson_template(
                     course_id=args.courseId,
                     order=order,
                     mcp_config_path=args.mcp_config
@@ -470,7 +482,29 @@ async def run_batch_mode(
 
         # Step 8: Write batch summary
         print(f"\n{BLUE}Writing batch summary...{RESET}")
-        write_batch_summary(batch_id, results, log_dir)
+        render_cache_stats = get_render_cache().get_stats()
+        eligibility_cache_stats = get_eligibility_cache().get_stats()
+        write_batch_summary(
+            batch_id, results, log_dir,
+            extra_sections={
+                "render_latency": get_render_latency_stats(),
+                "render_cache": render_cache_stats,
+                "eligibility_cache": eligibility_cache_stats
+            }
+        )
+        for line in format_render_latency_stats():
+            logger.info(f"Render latency - {line}")
+        print(
+            f"{BLUE}Render cache:{RESET} {render_cache_stats['hits']} hits, "
+            f"{render_cache_stats['misses']} misses ({render_cache_stats['hit_rate']:.0%} hit rate)"
+        )
+        print(
+            f"{BLUE}Eligibility cache:{RESET} {eligibility_cache_stats['hits']} cards reused, "
+            f"{eligibility_cache_stats['misses']} analyzed, "
+            f"{eligibility_cache_stats['cards_prefiltered']} rejected by pre-filter; "
+            f"{eligibility_cache_stats['analyses_avoided']}/{eligibility_cache_stats['lessons_analyzed']} "
+            f"lesson analyses avoided"
+        )
         print(f"{GREEN}✅ Summary written to {log_dir}/batch_summary.json{RESET}\n")
 
         # Step 9: Display final report
@@ -539,6 +573,11 @@ async def main() -> int:
         print(f"\n{RED}❌ Unexpected error: {e}{RESET}\n")
         return 1
 
+    finally:
+        # Close the render tools' keep-alive connections before the loop ends
+        from .tools.diagram_http_client import aclose_diagram_http_client
+        await aclose_diagram_http_client()
+
 
 if __name__ == "__main__":
     exit_code = asyncio.run(main())
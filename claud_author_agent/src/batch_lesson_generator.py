@@ -40,6 +40,8 @@ from .utils.batch_utils import (
 )
 from .utils.diagram_cleanup import delete_diagrams_for_lesson_ids
 from .utils.appwrite_mcp import delete_appwrite_document
+from .utils.appwrite_pool import get_appwrite_pool_stats, format_appwrite_pool_stats
+from .utils.logging_config import log_scope, scope_handler
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -115,6 +117,9 @@ def setup_lesson_logging(
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
 
+    # Only capture this lesson's records when lessons run concurrently
+    scope_handler(file_handler)
+
     # Add to root logger to capture ALL logs from all modules
     root_logger = logging.getLogger()
     root_logger.addHandler(file_handler)
@@ -298,6 +303,19 @@ async def generate_single_lesson(
     """
     start_time = time.time()
 
+    # Scope logging to this lesson so concurrent lessons write separate log files
+    with log_scope(f"lesson_order_{order:03d}"):
+        return await _generate_lesson_with_log(courseId, order, log_file_path, config, start_time)
+
+
+async def _generate_lesson_with_log(
+    courseId: str,
+    order: int,
+    log_file_path: Path,
+    config: Dict[str, Any],
+    start_time: float
+) -> Dict[str, Any]:
+    """Body of generate_single_lesson, run inside the lesson's log scope."""
     # Setup lesson-specific logging
     file_handler = setup_lesson_logging(log_file_path, config.get('log_level', 'INFO'))
 
@@ -307,7 +325,8 @@ async def generate_single_lesson(
             mcp_config_path=config.get('mcp_config_path', '.mcp.json'),
             persist_workspace=config.get('persist_workspace', True),
             max_critic_retries=config.get('max_retries', 10),
-            log_level=config.get('log_level', 'INFO')
+            log_level=config.get('log_level', 'INFO'),
+            workspace_parent_dir=config.get('workspace_parent_dir')
         )
 
         # Execute agent
@@ -350,6 +369,76 @@ async def generate_single_lesson(
         file_handler.close()
 
 
+def _log_lesson_outcome(
+    batch_logger: logging.Logger,
+    idx: int,
+    total: int,
+    outcome: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Log one lesson's outcome and build its batch_summary.json result entry.
+
+    Args:
+        batch_logger: Logger for batch orchestration
+        idx: 1-based position in the SOW entry list
+        total: Total number of SOW entries
+        outcome: Outcome dict from execute_batch_generation
+
+    Returns:
+        Result entry for the batch summary
+    """
+    order = outcome['order']
+    label = outcome['label']
+
+    if outcome['status'] == 'skipped':
+        existing = outcome['existing']
+        batch_logger.info(f"[{idx}/{total}] Order {order} ({label}): SKIP - Already exists (doc: {existing.get('doc_id')})")
+        return {
+            "order": order,
+            "label": label,
+            "status": "skipped",
+            "existing_doc_id": existing.get('doc_id'),
+            "log_file": None
+        }
+
+    result = outcome['result']
+    log_file_name = outcome['log_file']
+
+    if result['success']:
+        batch_logger.info(f"[{idx}/{total}] Order {order} - ✅ SUCCESS")
+        batch_logger.info(f"  Document ID: {result['doc_id']}")
+        batch_logger.info(f"  Duration: {format_duration(result['duration_seconds'])}")
+        batch_logger.info(f"  Cost: ${result['cost_usd']:.4f} USD")
+        batch_logger.info(f"  Tokens: {result['tokens']}")
+
+        return {
+            "order": order,
+            "label": label,
+            "status": "success",
+            "doc_id": result['doc_id'],
+            "duration_seconds": result['duration_seconds'],
+            "cost_usd": result['cost_usd'],
+            "tokens": result['tokens'],
+            "log_file": log_file_name
+        }
+
+    batch_logger.error(f"[{idx}/{total}] Order {order} - ❌ FAILED")
+    batch_logger.error(f"  Error: {result['error']}")
+    batch_logger.error(f"  Duration: {format_duration(result['duration_seconds'])}")
+    batch_logger.error(f"  Partial Cost: ${result['cost_usd']:.4f} USD")
+    batch_logger.error(f"  Partial Tokens: {result['tokens']}")
+
+    return {
+        "order": order,
+        "label": label,
+        "status": "failed",
+        "error": f"{result['error']} (see {log_file_name} for full trace)",
+        "duration_seconds": result['duration_seconds'],
+        "cost_usd": result['cost_usd'],
+        "tokens": result['tokens'],
+        "log_file": log_file_name
+    }
+
+
 async def execute_batch_generation(
     courseId: str,
     force_mode: bool,
@@ -395,6 +484,7 @@ async def execute_batch_generation(
     batch_logger.info(f"Dry Run: No")
     batch_logger.info(f"MCP Config: {config['mcp_config_path']}")
     batch_logger.info(f"Max Retries: {config['max_retries']}")
+    batch_logger.info(f"Max Concurrent: {config.get('max_concurrent', 1)}")
     batch_logger.info(f"Log Directory: {log_dir}/")
     batch_logger.info("─" * 70)
 
@@ -420,7 +510,15 @@ async def execute_batch_generation(
     batch_logger.info(f"Processing {len(sow_entries)} SOW entries...")
     batch_logger.info("─" * 70)
 
-    # Process each entry
+    # Process entries through a bounded worker pool. Results are reported in
+    # SOW order: each lesson's block is logged once every earlier lesson has
+    # finished, so the batch log reads the same as a sequential run.
+    max_concurrent = max(1, config.get('max_concurrent', 1))
+    semaphore = asyncio.Semaphore(max_concurrent)
+    total_entries = len(sow_entries)
+
+    outcomes: Dict[int, Dict[str, Any]] = {}
+    next_to_report = 1
     results = []
     skipped = 0
     generated_success = 0
@@ -428,7 +526,25 @@ async def execute_batch_generation(
     total_cost = 0.0
     total_tokens = 0
 
-    for idx, entry in enumerate(sow_entries, 1):
+    def report_ready_outcomes():
+        nonlocal next_to_report, skipped, generated_success, failed, total_cost, total_tokens
+
+        while next_to_report in outcomes:
+            outcome = outcomes.pop(next_to_report)
+            results.append(_log_lesson_outcome(batch_logger, next_to_report, total_entries, outcome))
+
+            if outcome['status'] == 'skipped':
+                skipped += 1
+            else:
+                if outcome['result']['success']:
+                    generated_success += 1
+                else:
+                    failed += 1
+                total_cost += outcome['result']['cost_usd']
+                total_tokens += outcome['result']['tokens']
+            next_to_report += 1
+
+    async def process_entry(idx: int, entry: Dict[str, Any]):
         order = entry.get('order', 0)
         label = entry.get('label', 'Untitled')
 
@@ -437,75 +553,44 @@ async def execute_batch_generation(
 
         # Decide: skip or generate
         if not force_mode and is_claud_sdk:
-            # SKIP
-            batch_logger.info(f"[{idx}/{len(sow_entries)}] Order {order} ({label}): SKIP - Already exists (doc: {existing.get('doc_id')})")
-            results.append({
-                "order": order,
-                "label": label,
-                "status": "skipped",
-                "existing_doc_id": existing.get('doc_id'),
-                "log_file": None
-            })
-            skipped += 1
+            outcomes[idx] = {"status": "skipped", "order": order, "label": label, "existing": existing}
         else:
-            # GENERATE
-            batch_logger.info("─" * 70)
-            batch_logger.info(f"[{idx}/{len(sow_entries)}] Order {order} ({label}): GENERATING")
-
             log_file_name = f"lesson_order_{order:03d}.log"
-            log_file_path = log_dir / log_file_name
-            batch_logger.info(f"Log file: {log_file_name}")
-
-            # Generate lesson
-            result = await generate_single_lesson(
-                courseId=courseId,
-                order=order,
-                label=label,
-                log_file_path=log_file_path,
-                config=config
-            )
 
-            # Log result
-            if result['success']:
-                batch_logger.info(f"[{idx}/{len(sow_entries)}] Order {order} - ✅ SUCCESS")
-                batch_logger.info(f"  Document ID: {result['doc_id']}")
-                batch_logger.info(f"  Duration: {format_duration(result['duration_seconds'])}")
-                batch_logger.info(f"  Cost: ${result['cost_usd']:.4f} USD")
-                batch_logger.info(f"  Tokens: {result['tokens']}")
+            async with semaphore:
+                if max_concurrent == 1:
+                    batch_logger.info("─" * 70)
+                batch_logger.info(f"[{idx}/{total_entries}] Order {order} ({label}): GENERATING")
+                batch_logger.info(f"Log file: {log_file_name}")
+
+                result = await generate_single_lesson(
+                    courseId=courseId,
+                    order=order,
+                    label=label,
+                    log_file_path=log_dir / log_file_name,
+                    config=config
+                )
 
-                results.append({
-                    "order": order,
-                    "label": label,
-                    "status": "success",
-                    "doc_id": result['doc_id'],
-                    "duration_seconds": result['duration_seconds'],
-                    "cost_usd": result['cost_usd'],
-                    "tokens": result['tokens'],
-                    "log_file": log_file_name
-                })
-                generated_success += 1
-                total_cost += result['cost_usd']
-                total_tokens += result['tokens']
-            else:
-                batch_logger.error(f"[{idx}/{len(sow_entries)}] Order {order} - ❌ FAILED")
-                batch_logger.error(f"  Error: {result['error']}")
-                batch_logger.error(f"  Duration: {format_duration(result['duration_seconds'])}")
-                batch_logger.error(f"  Partial Cost: ${result['cost_usd']:.4f} USD")
-                batch_logger.error(f"  Partial Tokens: {result['tokens']}")
+            if max_concurrent > 1:
+                status = "done" if result['success'] else "FAILED"
+                batch_logger.info(f"[{idx}/{total_entries}] Order {order}: {status} ({format_duration(result['duration_seconds'])})")
 
-                results.append({
-                    "order": order,
-                    "label": label,
-                    "status": "failed",
-                    "error": f"{result['error']} (see {log_file_name} for full trace)",
-                    "duration_seconds": result['duration_seconds'],
-                    "cost_usd": result['cost_usd'],
-                    "tokens": result['tokens'],
-                    "log_file": log_file_name
-                })
-                failed += 1
-                total_cost += result['cost_usd']
-                total_tokens += result['tokens']
+            outcomes[idx] = {
+                "status": "generated",
+                "order": order,
+                "label": label,
+                "log_file": log_file_name,
+                "result": result
+            }
+
+        report_ready_outcomes()
+
+    if max_concurrent > 1:
+        batch_logger.info(f"Concurrency: up to {max_concurrent} lessons in parallel")
+
+    await asyncio.gather(*[
+        process_entry(idx, entry) for idx, entry in enumerate(sow_entries, 1)
+    ])
 
     # Calculate totals
     end_time = time.time()
@@ -525,6 +610,7 @@ async def execute_batch_generation(
         "duration_human": format_duration(total_duration_seconds),
         "force_mode": force_mode,
         "dry_run": False,
+        "max_concurrent": max_concurrent,
         "total_sow_entries": len(sow_entries),
         "skipped": skipped,
         "generated": generated_success,
@@ -534,6 +620,7 @@ async def execute_batch_generation(
         "total_tokens": total_tokens,
         "avg_cost_per_lesson_usd": round(avg_cost_per_lesson, 4),
         "avg_duration_per_lesson_seconds": avg_duration_per_lesson,
+        "appwrite_pool": get_appwrite_pool_stats(),
         "log_directory": str(log_dir.absolute())
     }
 
@@ -551,6 +638,7 @@ async def execute_batch_generation(
     batch_logger.info(f"  Total Tokens: {total_tokens}")
     if generated_success > 0:
         batch_logger.info(f"  Average per lesson: {format_duration(avg_duration_per_lesson)}, ${avg_cost_per_lesson:.4f} USD")
+    batch_logger.info(f"  {format_appwrite_pool_stats(summary['appwrite_pool'])}")
     batch_logger.info("Summary saved to: batch_summary.json")
     batch_logger.info(f"Log directory: {log_dir}/")
 
@@ -834,6 +922,9 @@ Examples:
   # Automated force regeneration (CI/CD)
   python -m src.batch_lesson_generator --courseId course_c84874 --force --yes
 
+  # Generate up to 4 lessons in parallel
+  python -m src.batch_lesson_generator --courseId course_c84874 --max-concurrent 4
+
   # Delete mode - preview deletion (dry-run)
   python -m src.batch_lesson_generator --courseId course_c84874 --delete --dry-run
 
@@ -900,6 +991,12 @@ Examples:
         default=10,
         help='Maximum critic retry attempts per lesson (default: 10)'
     )
+    parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        default=1,
+        help='Maximum lessons generated in parallel (default: 1 = sequential)'
+    )
     parser.add_argument(
         '--no-persist-workspace',
         action='store_true',
@@ -950,9 +1047,18 @@ async def main() -> int:
             "mcp_config_path": args.mcp_config,
             "max_retries": args.max_retries,
             "persist_workspace": not args.no_persist_workspace,
-            "log_level": args.log_level
+            "log_level": args.log_level,
+            "max_concurrent": args.max_concurrent
         }
 
+        if args.max_concurrent < 1:
+            print("\n❌ ERROR: --max-concurrent must be at least 1.\n")
+            return 2
+
+        # Concurrent lessons get isolated workspaces nested under the batch log dir
+        if args.max_concurrent > 1:
+            config["workspace_parent_dir"] = log_dir / "workspaces"
+
         # =====================================================================
         # DELETE MODE
         # =====================================================================
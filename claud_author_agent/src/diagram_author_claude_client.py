@@ -18,7 +18,6 @@ Architecture:
 """
 
 import asyncio
-import base64
 import json
 import logging
 import time
@@ -88,7 +87,9 @@ class DiagramAuthorClaudeAgent:
         self,
         mcp_config_path: str = ".mcp.json",
         persist_workspace: bool = True,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        workspace_parent_dir: Optional[Path] = None,
+        configure_logging: bool = True
     ):
         """Initialize Diagram Author agent.
 
@@ -96,9 +97,15 @@ class DiagramAuthorClaudeAgent:
             mcp_config_path: Path to MCP configuration file
             persist_workspace: If True, preserve workspace for debugging
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            workspace_parent_dir: Optional batch directory. If set, the workspace is
+                nested under it as lesson_order_NNN/ so concurrent agents started
+                in the same second never share a workspace.
+            configure_logging: If False, leave root logging as configured by the
+                caller (concurrent workers must not reset each other's handlers).
         """
         self.mcp_config_path = Path(mcp_config_path)
         self.persist_workspace = persist_workspace
+        self.workspace_parent_dir = Path(workspace_parent_dir) if workspace_parent_dir else None
 
         # Generate execution ID (timestamp-based)
         self.execution_id = datetime.now().strftime("exec_%Y%m%d_%H%M%S")
@@ -107,7 +114,8 @@ class DiagramAuthorClaudeAgent:
         self.cost_tracker = CostTracker(execution_id=self.execution_id)
 
         # Setup logging
-        setup_logging(log_level=log_level)
+        if configure_logging:
+            setup_logging(log_level=log_level)
 
         logger.info(f"Initialized DiagramAuthorClaudeAgent - Execution ID: {self.execution_id}")
 
@@ -270,7 +278,13 @@ class DiagramAuthorClaudeAgent:
 
         try:
             # Create isolated workspace
-            with IsolatedFilesystem(self.execution_id, persist=self.persist_workspace, workspace_type="diagram") as filesystem:
+            workspace_id = f"lesson_order_{order:03d}" if self.workspace_parent_dir else self.execution_id
+            with IsolatedFilesystem(
+                workspace_id,
+                persist=self.persist_workspace,
+                workspace_type="diagram",
+                parent_dir=self.workspace_parent_dir
+            ) as filesystem:
                 workspace_path = filesystem.root
 
                 logger.info(f"Workspace created: {workspace_path}")
@@ -608,14 +622,14 @@ class DiagramAuthorClaudeAgent:
                 # PHASE 4: VALIDATE IMAGE FILES AND LOAD PNG DATA (CRITICAL)
                 # ═══════════════════════════════════════════════════════════════
                 # FILE-BASED ARCHITECTURE: Check that ALL diagrams have image_path
-                # and that the PNG files exist. Then load files and encode to base64
-                # for Appwrite upload.
+                # and that the PNG files exist. The upserter streams each file to
+                # Appwrite Storage, so nothing is loaded here.
                 #
                 # Fast-fail principle: If even ONE diagram is missing its file,
                 # the entire execution is marked as FAILED.
                 # ═══════════════════════════════════════════════════════════════
 
-                logger.info("Validating diagram files and loading PNG data...")
+                logger.info("Validating diagram PNG files...")
 
                 missing_images = []
                 for diagram in diagrams:
@@ -648,12 +662,11 @@ class DiagramAuthorClaudeAgent:
                         logger.error(f"❌ PNG file not found: {image_path}")
                         continue
 
-                    # Load PNG file and encode to base64
                     try:
-                        png_bytes = file_path.read_bytes()
-                        image_base64 = base64.b64encode(png_bytes).decode('utf-8')
-                        diagram["image_base64"] = image_base64
-                        logger.info(f"✅ Loaded PNG from {file_path.name} ({len(png_bytes)} bytes)")
+                        png_size = file_path.stat().st_size
+                        if png_size == 0:
+                            raise ValueError("PNG file is empty")
+                        logger.info(f"✅ Found PNG {file_path.name} ({png_size} bytes)")
                     except Exception as e:
                         missing_images.append({
                             "cardId": card_id,
@@ -692,7 +705,7 @@ class DiagramAuthorClaudeAgent:
                         ]
                     }
 
-                logger.info(f"✅ All {len(diagrams)} diagrams have valid PNG files loaded")
+                logger.info(f"✅ All {len(diagrams)} diagrams have valid PNG files")
 
                 # ═══════════════════════════════════════════════════════════════
                 # FAST-FAIL VALIDATION: Ensure all diagrams have required fields
@@ -786,7 +799,7 @@ class DiagramAuthorClaudeAgent:
                             "diagram_index": diagram_index,  # 0, 1, 2, ... for multi-diagram cards
                             "code": diagram.get("code"),  # NEW: diagram definition as JSON string
                             "tool_name": diagram.get("tool_name"),  # NEW: which tool generated diagram
-                            "image_base64": diagram["image_base64"],
+                            "image_path": diagram["image_path"],
                             "diagram_type": diagram["diagram_type"],
                             "diagram_context": diagram.get("diagram_context"),
                             "diagram_description": diagram.get("diagram_description", ""),
@@ -21,6 +21,7 @@ from dotenv import load_dotenv
 
 from .diagram_author_claude_client import DiagramAuthorClaudeAgent
 from .tools.diagram_screenshot_tool import check_diagram_service_health
+from .tools.diagram_http_client import aclose_diagram_http_client
 
 # Load environment variables from .env file
 load_dotenv()
@@ -351,6 +352,10 @@ async def main() -> int:
         print_failure_banner(str(e))
         return 1
 
+    finally:
+        # Close the render tools' keep-alive connections before the loop ends
+        await aclose_diagram_http_client()
+
 
 if __name__ == "__main__":
     exit_code = asyncio.run(main())
@@ -24,7 +24,6 @@ Key Features:
 """
 
 import asyncio
-import base64
 import json
 import logging
 from datetime import datetime
@@ -425,8 +424,8 @@ Begin by reading eligible_cards.json!
                         "message": "All diagram generation attempts failed"
                     }
 
-                # Load PNG data and encode to base64 for Appwrite upload
-                logger.info("Validating and loading diagram PNG files...")
+                # Validate PNG files; the upserter streams them to Appwrite Storage
+                logger.info("Validating diagram PNG files...")
                 missing_images = []
                 for diagram in diagrams:
                     card_id = diagram.get("cardId", "unknown")
@@ -442,9 +441,10 @@ Begin by reading eligible_cards.json!
                         continue
 
                     try:
-                        png_bytes = file_path.read_bytes()
-                        diagram["image_base64"] = base64.b64encode(png_bytes).decode('utf-8')
-                        logger.info(f"✅ Loaded PNG from {file_path.name} ({len(png_bytes)} bytes)")
+                        png_size = file_path.stat().st_size
+                        if png_size == 0:
+                            raise ValueError("PNG file is empty")
+                        logger.info(f"✅ Found PNG {file_path.name} ({png_size} bytes)")
                     except Exception as e:
                         missing_images.append({"cardId": card_id, "issue": str(e)})
 
@@ -472,7 +472,7 @@ Begin by reading eligible_cards.json!
                         "card_id": diagram.get("cardId"),
                         "diagram_index": diagram.get("diagram_index", 0),
                         "jsxgraph_json": diagram.get("jsxgraph_json", ""),
-                        "image_base64": diagram.get("image_base64"),
+                        "image_path": diagram.get("image_path"),
                         "diagram_type": diagram.get("diagram_type", "geometry"),
                         "diagram_context": diagram.get("diagram_context"),
                         "diagram_description": diagram.get("diagram_description", ""),
@@ -15,6 +15,13 @@ Enhanced Output:
     - cfu_diagram_specs[]: Array of DiagramSpec for CFU context
     - Each spec includes: description, reasoning, key_elements, excluded
 
+Pre-filter and caching:
+    Cards with no visual signal at all (utils/diagram_extractor.py
+    prefilter_cards) are rejected without the LLM. Decisions are cached per
+    card by content hash + prompt version (utils/eligibility_cache.py). Only
+    cards without a cached decision are sent to the agent; a lesson whose
+    cards are all cached never starts a Claude session.
+
 Usage:
     from eligibility_analyzer_agent import EligibilityAnalyzerAgent
 
@@ -34,6 +41,19 @@ from typing import Dict, Any, List, Optional
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, ResultMessage
 
 from .models.diagram_spec import DiagramSpec, DiagramSpecList
+from .utils.diagram_extractor import (
+    DEFAULT_PREFILTER_RULES,
+    PREFILTER_ENABLED,
+    PrefilterRules,
+    prefilter_cards,
+)
+from .utils.eligibility_cache import (
+    CARD_IDENTITY_FIELDS,
+    EligibilityCache,
+    eligibility_cache_key,
+    get_eligibility_cache,
+    prompt_version,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,16 +86,25 @@ class EligibilityAnalyzerAgent:
     def __init__(
         self,
         model: str = "claude-sonnet-4-5-20250929",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        cache: Optional[EligibilityCache] = None,
+        prefilter: bool = PREFILTER_ENABLED,
+        prefilter_rules: PrefilterRules = DEFAULT_PREFILTER_RULES
     ):
         """Initialize Eligibility Analyzer Agent.
 
         Args:
             model: Claude model to use
             temperature: Temperature for analysis (0.0 = deterministic)
+            cache: Decision cache (default: the process-wide cache)
+            prefilter: Reject obvious no-diagram cards before the LLM
+            prefilter_rules: Rules used by the pre-filter
         """
         self.model = model
         self.temperature = temperature
+        self.cache = cache or get_eligibility_cache()
+        self.prefilter = prefilter
+        self.prefilter_rules = prefilter_rules
 
         # Load prompt
         prompts_dir = Path(__file__).parent / "prompts"
@@ -87,6 +116,7 @@ class EligibilityAnalyzerAgent:
             )
 
         self.prompt = prompt_file.read_text()
+        self.prompt_version = prompt_version(self.prompt)
 
         logger.info(f"Initialized EligibilityAnalyzerAgent with model {model}")
 
@@ -96,8 +126,10 @@ class EligibilityAnalyzerAgent:
     ) -> List[Dict[str, Any]]:
         """Analyze lesson template cards for diagram eligibility.
 
-        Creates a temporary workspace, writes lesson_template.json, runs the
-        eligibility analysis agent, and reads the eligible_cards.json output.
+        Cards with a cached decision (same content and prompt version) reuse
+        it; the rest are written to a temporary workspace as
+        lesson_template.json, analyzed by the agent, and their
+        eligible_cards.json output is cached.
 
         Args:
             lesson_template: Lesson template dictionary with cards array
@@ -129,14 +161,73 @@ class EligibilityAnalyzerAgent:
             >>> eligible[0]["lesson_diagram_specs"][0]["key_elements"]
             ["right triangle", "side a=3cm", "side b=4cm"]
         """
-        cards = lesson_template.get("cards", [])
+        all_cards = lesson_template.get("cards", [])
 
-        if not cards:
+        if not all_cards:
             logger.info("Lesson template has no cards - returning empty list")
             return []
 
-        logger.info(f"Analyzing {len(cards)} cards for diagram eligibility...")
+        cards, rejected = (
+            prefilter_cards(all_cards, self.prefilter_rules) if self.prefilter else (all_cards, [])
+        )
+        if not cards:
+            self.cache.record_lesson(llm_called=False, prefiltered=len(rejected))
+            self._log_analysis_summary([], len(all_cards))
+            return []
+
+        keys = [eligibility_cache_key(card, self.prompt_version, self.model) for card in cards]
+        cached = {idx: self.cache.get(key) for idx, key in enumerate(keys)}
+        pending = [idx for idx, decision in cached.items() if decision is None]
+
+        fresh: Dict[int, Optional[Dict[str, Any]]] = {}
+        if pending:
+            logger.info(
+                f"Analyzing {len(pending)}/{len(cards)} cards for diagram eligibility "
+                f"({len(cards) - len(pending)} reused from cache)..."
+            )
+            analyzed = await self._run_agent(
+                {**lesson_template, "cards": [cards[idx] for idx in pending]}
+            )
+            by_id = {_card_id(entry): entry for entry in analyzed}
+            unmatched = set(by_id) - {_card_id(cards[idx]) for idx in pending}
+            if unmatched:
+                # Can't tell which card these belong to - don't cache "not eligible"
+                logger.warning(f"Eligibility output has unknown card ids {sorted(map(str, unmatched))} - not caching")
+            for idx in pending:
+                fresh[idx] = by_id.get(_card_id(cards[idx]))
+                if not unmatched:
+                    self.cache.put(keys[idx], fresh[idx])
+        else:
+            logger.info(f"♻️ All {len(cards)} card eligibility decisions reused from cache")
+        self.cache.record_lesson(llm_called=bool(pending), prefiltered=len(rejected))
+
+        eligible_cards = []
+        for idx, card in enumerate(cards):
+            if idx in fresh:
+                entry = fresh[idx]
+            else:
+                entry = cached[idx]["entry"]
+                if entry is not None:
+                    entry = _with_card_id(entry, _card_id(card))
+            if entry is not None:
+                eligible_cards.append(entry)
+        if pending:
+            eligible_cards.extend(entry for entry in analyzed if _card_id(entry) in unmatched)
+
+        # Log summary with diagram spec counts
+        self._log_analysis_summary(eligible_cards, len(all_cards))
+
+        return eligible_cards
+
+    async def _run_agent(
+        self,
+        lesson_template: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Run one agent session over lesson_template and return eligible_cards.json.
 
+        Raises:
+            Exception: If agent execution fails or writes no output
+        """
         # Create temporary workspace for agent execution
         with tempfile.TemporaryDirectory() as workspace_dir:
             workspace_path = Path(workspace_dir)
@@ -191,12 +282,7 @@ class EligibilityAnalyzerAgent:
                     )
 
                 with open(eligible_cards_file, 'r') as f:
-                    eligible_cards = json.load(f)
-
-                # Log summary with diagram spec counts
-                self._log_analysis_summary(eligible_cards, len(cards))
-
-                return eligible_cards
+                    return json.load(f)
 
             except Exception as e:
                 logger.error(
@@ -289,6 +375,25 @@ class EligibilityAnalyzerAgent:
         )
 
 
+def _card_id(card: Dict[str, Any]) -> Optional[str]:
+    """Return a card's identifier (lesson cards use "id", some outputs "cardId")."""
+    for field in CARD_IDENTITY_FIELDS:
+        if card.get(field):
+            return card[field]
+    return None
+
+
+def _with_card_id(entry: Dict[str, Any], card_id: Optional[str]) -> Dict[str, Any]:
+    """Copy a cached eligible_cards.json entry, pointing it at card_id."""
+    entry = dict(entry)
+    for field in CARD_IDENTITY_FIELDS:
+        if field in entry:
+            entry[field] = card_id
+    if not any(field in entry for field in CARD_IDENTITY_FIELDS):
+        entry["id"] = card_id
+    return entry
+
+
 def parse_diagram_specs_from_card(
     card_data: Dict[str, Any]
 ) -> DiagramSpecList:
@@ -7,7 +7,7 @@ schema-compliant generation.
 Architecture:
     1. Outline Author → Generates lesson sequence skeleton (structured output)
     2. Outline Critic → Validates outline (PASS/REVISION_REQUIRED loop)
-    3. Lesson Entry Author (loop) → Generates each lesson (structured output)
+    3. Lesson Entry Author (loop or parallel waves) → Generates each lesson (structured output)
     4. Lesson Critic (per lesson) → Validates each lesson (PASS/REVISION_REQUIRED loop)
     5. Metadata Author → Generates course-level metadata (structured output)
     6. Python Assembler → Combines into final AuthoredSOW (no LLM)
@@ -17,12 +17,18 @@ Benefits:
     - Critic loops catch pedagogical issues before proceeding
     - Small token scope per call = better coherence
     - Each lesson validates individually = early error detection
+
+Resume:
+    Approved artifacts are persisted as each phase passes (lesson_outline.json +
+    .outline_approved, lesson_NN.json, metadata.json). ``--resume <workspace>``
+    validates and reuses them, continuing from the first missing lesson.
 """
 
 import asyncio
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
@@ -182,6 +188,20 @@ logger.info("Set CLAUDE_CODE_MAX_OUTPUT_TOKENS=100000 (agent output budget)")
 MAX_REVISION_ATTEMPTS = 3
 PASS_THRESHOLD = 0.7
 
+# Lessons generated concurrently per wave. 1 keeps the sequential mode, where
+# each lesson sees every previous lesson in full (previous_lessons.json).
+LESSON_CONCURRENCY = int(os.environ.get("SOW_LESSON_CONCURRENCY", 1))
+
+# Outline neighbours on each side summarised for a lesson in wave mode
+NEIGHBOUR_WINDOW = int(os.environ.get("SOW_NEIGHBOUR_WINDOW", 2))
+
+# Written next to lesson_outline.json once the outline passes critique. The
+# outline critic reads drafts from the same file, so --resume only trusts the
+# outline when this marker exists.
+OUTLINE_APPROVED_MARKER = ".outline_approved"
+
+_APPROVED_LESSON_FILE = re.compile(r"^lesson_\d{2}\.json$")
+
 
 def validate_lesson_entry_schema(lesson_dict: dict) -> tuple[bool, str]:
     """Validate lesson entry against SOWEntry Pydantic model (fail-fast).
@@ -210,6 +230,166 @@ def validate_lesson_entry_schema(lesson_dict: dict) -> tuple[bool, str]:
         return False, "Schema validation failed:\n" + "\n".join(error_messages)
 
 
+def _load_resumable(path: Path, model: Any) -> Optional[Any]:
+    """Load and validate a persisted artifact, or None if missing/invalid."""
+    if not path.exists():
+        return None
+    try:
+        return model.model_validate_json(path.read_text())
+    except (ValidationError, ValueError) as e:
+        logger.warning(f"⚠️ {path.name} is invalid, will regenerate: {e}")
+        return None
+
+
+def _load_course_outcomes(path: Path) -> Optional[Dict[str, Any]]:
+    """Load Course_outcomes.json from a previous run, or None if missing/invalid."""
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text())
+    except ValueError as e:
+        logger.warning(f"⚠️ {path.name} is invalid, will re-extract: {e}")
+        return None
+    if not isinstance(data, dict) or not data.get("outcomes"):
+        logger.warning(f"⚠️ {path.name} has no outcomes, will re-extract")
+        return None
+    return data
+
+
+def _normalize_course_label(value: Any) -> str:
+    """Compare subject/level labels ignoring case and '_' / ' ' vs '-'."""
+    return "-".join(str(value or "").strip().lower().replace("_", " ").split())
+
+
+def validate_resume_workspace(workspace_path: Path, courseId: str, subject: str, level: str) -> None:
+    """Check that an interrupted run's workspace belongs to this course.
+
+    Compares the courseId in Course_outcomes.json and the subject/level of
+    the approved outline (when present) against the requested course, so a
+    wrong --resume path cannot upsert another course's SOW.
+
+    Raises:
+        ValueError: If any persisted artifact names a different course
+    """
+    course_outcomes = _load_course_outcomes(workspace_path / "Course_outcomes.json")
+    if course_outcomes is not None and course_outcomes.get("courseId") != courseId:
+        raise ValueError(
+            f"Resume workspace {workspace_path} belongs to courseId "
+            f"'{course_outcomes.get('courseId')}', not '{courseId}'"
+        )
+
+    if not (workspace_path / OUTLINE_APPROVED_MARKER).exists():
+        return
+    outline = _load_resumable(workspace_path / "lesson_outline.json", LessonOutline)
+    if outline is None:
+        return
+    mismatches = [
+        f"{field} '{found}' != '{expected}'"
+        for field, found, expected in (
+            ("subject", outline.course_subject, subject),
+            ("level", outline.course_level, level),
+        )
+        if _normalize_course_label(found) != _normalize_course_label(expected)
+    ]
+    if mismatches:
+        raise ValueError(
+            f"Resume workspace {workspace_path} outline is for a different course "
+            f"({'; '.join(mismatches)})"
+        )
+
+
+def load_approved_lessons(workspace_path: Path, total_lessons: int) -> Dict[int, SOWEntry]:
+    """Load the approved lesson_NN.json files from a previous run.
+
+    Only approved lessons are written as lesson_NN.json (critic drafts go to
+    lesson_NN_draft.json), so every file that validates against SOWEntry
+    can be reused as-is.
+
+    Args:
+        workspace_path: Workspace of the interrupted run
+        total_lessons: Lesson count from the approved outline
+
+    Returns:
+        Dict of lesson order -> SOWEntry for every valid file
+    """
+    approved = {}
+    for order in range(1, total_lessons + 1):
+        lesson = _load_resumable(workspace_path / f"lesson_{order:02d}.json", SOWEntry)
+        if lesson is not None:
+            approved[order] = lesson
+    return approved
+
+
+def discard_outline_artifacts(workspace_path: Path) -> None:
+    """Remove the approval marker and approved lessons before a new outline.
+
+    The critique loop writes draft outlines into lesson_outline.json, so the
+    marker must not survive while it runs: an interruption would let the next
+    --resume trust a draft. Approved lesson_NN.json files belong to the old
+    outline and would otherwise be reloaded by load_approved_lessons.
+    """
+    (workspace_path / OUTLINE_APPROVED_MARKER).unlink(missing_ok=True)
+    for lesson_file in workspace_path.glob("lesson_*.json"):
+        if _APPROVED_LESSON_FILE.match(lesson_file.name):
+            lesson_file.unlink()
+
+
+def build_neighbour_digest(
+    order: int,
+    outline_entries: List[Dict[str, Any]],
+    generated: Dict[int, SOWEntry],
+    window: int = NEIGHBOUR_WINDOW
+) -> List[Dict[str, Any]]:
+    """Summarise the lessons around `order` for wave-mode generation.
+
+    Neighbours already generated (earlier waves) are summarised from their
+    SOWEntry; the rest from the approved outline. Each summary carries only
+    what a lesson needs for coherence - title, block, outcome refs and card
+    types - so prompt size stays constant instead of growing with course length.
+
+    Args:
+        order: Lesson order (1-based) being generated
+        outline_entries: Approved outline entries (dicts), index = order - 1
+        generated: Lessons approved so far, by order
+        window: Neighbours to include on each side
+
+    Returns:
+        List of digest dicts, ordered by lesson order
+    """
+    digest = []
+    first = max(1, order - window)
+    last = min(len(outline_entries), order + window)
+    for neighbour in range(first, last + 1):
+        if neighbour == order:
+            continue
+        lesson = generated.get(neighbour)
+        if lesson is not None:
+            digest.append({
+                "order": neighbour,
+                "status": "generated",
+                "label": lesson.label,
+                "lesson_type": lesson.lesson_type.value,
+                "block": lesson.coherence.block_name,
+                "outcome_refs": [
+                    ref.code or ref.skill_name
+                    for ref in lesson.standards_or_skills_addressed
+                    if ref.code or ref.skill_name
+                ] or (lesson.outcomeRefs or []),
+                "card_types": [card.card_type.value for card in lesson.lesson_plan.card_structure],
+            })
+        else:
+            entry = outline_entries[neighbour - 1]
+            digest.append({
+                "order": neighbour,
+                "status": "planned",
+                "label": entry.get("label_hint"),
+                "lesson_type": entry.get("lesson_type"),
+                "block": entry.get("block_name"),
+                "outcome_refs": entry.get("standards_or_skills_codes", []),
+            })
+    return digest
+
+
 class IterativeSOWAuthor:
     """Iterative SOW authoring pipeline using Claude Agent SDK with structured output.
 
@@ -237,7 +417,8 @@ class IterativeSOWAuthor:
         self,
         mcp_config_path: str = ".mcp.json",
         persist_workspace: bool = True,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        lesson_concurrency: int = LESSON_CONCURRENCY
     ):
         """Initialize Iterative SOW Author.
 
@@ -245,9 +426,15 @@ class IterativeSOWAuthor:
             mcp_config_path: Path to MCP configuration file
             persist_workspace: If True, preserve workspace for debugging
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            lesson_concurrency: Lessons generated in parallel per wave. 1 (default)
+                generates sequentially with full previous-lesson context; >1
+                gives each lesson a compact digest of its outline neighbours.
         """
+        if lesson_concurrency < 1:
+            raise ValueError(f"lesson_concurrency must be >= 1, got {lesson_concurrency}")
         self.mcp_config_path = Path(mcp_config_path)
         self.persist_workspace = persist_workspace
+        self.lesson_concurrency = lesson_concurrency
         self.execution_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.cost_tracker = CostTracker(execution_id=self.execution_id)
 
@@ -439,6 +626,39 @@ Evaluate the outline now. Read both files, then provide the OutlineCriticResult.
             raise ValueError("Outline critique failed: No structured output received")
         return critique_result
 
+    async def _load_or_generate_outline(
+        self,
+        workspace_path: Path,
+        subject: str,
+        level: str,
+        resume: bool = False
+    ) -> Tuple[LessonOutline, Dict[int, SOWEntry]]:
+        """Reuse the approved outline on resume, otherwise generate a new one.
+
+        Returns:
+            (outline, approved lessons to reuse keyed by order)
+        """
+        outline_path = workspace_path / "lesson_outline.json"
+        outline = None
+        if resume and (workspace_path / OUTLINE_APPROVED_MARKER).exists():
+            outline = _load_resumable(outline_path, LessonOutline)
+
+        if outline is not None:
+            logger.info(f"♻️  Phase 2: Reusing approved outline ({outline.total_lessons} lessons)")
+            return outline, load_approved_lessons(workspace_path, outline.total_lessons)
+
+        logger.info("📋 Phase 2: Generating outline with critique loop...")
+        discard_outline_artifacts(workspace_path)
+
+        outline = await self._generate_outline_with_critique_loop(
+            workspace_path, subject, level
+        )
+
+        # Persist approved outline, then mark it as safe to resume from
+        outline_path.write_text(outline.model_dump_json(indent=2))
+        (workspace_path / OUTLINE_APPROVED_MARKER).touch()
+        return outline, {}
+
     async def _generate_outline_with_critique_loop(
         self,
         workspace_path: Path,
@@ -497,10 +717,11 @@ Evaluate the outline now. Read both files, then provide the OutlineCriticResult.
         workspace_path: Path,
         order: int,
         outline_entry: Dict[str, Any],
-        previous_lessons: List[Dict[str, Any]],
+        previous_lessons: Optional[List[Dict[str, Any]]],
         subject: str,
         level: str,
-        revision_guidance: Optional[List[str]] = None
+        revision_guidance: Optional[List[str]] = None,
+        neighbour_digest: Optional[List[Dict[str, Any]]] = None
     ) -> SOWEntry:
         """Generate single lesson using native structured output.
 
@@ -510,10 +731,13 @@ Evaluate the outline now. Read both files, then provide the OutlineCriticResult.
             workspace_path: Path to isolated workspace
             order: Lesson order number (1-based)
             outline_entry: Outline entry for this lesson
-            previous_lessons: List of previously generated lessons
+            previous_lessons: List of previously generated lessons (sequential mode)
             subject: Course subject identifier
             level: Course level identifier
             revision_guidance: Optional guidance from previous critique
+            neighbour_digest: Compact neighbour summaries (wave mode). When set,
+                context goes to per-lesson files so concurrent lessons don't
+                overwrite each other's inputs.
 
         Returns:
             Validated SOWEntry object
@@ -521,12 +745,26 @@ Evaluate the outline now. Read both files, then provide the OutlineCriticResult.
         logger.info(f"📝 Generating lesson {order}: {outline_entry.get('label_hint', 'Unknown')}")
 
         # Write context files for agent
-        (workspace_path / "current_outline.json").write_text(
-            json.dumps(outline_entry, indent=2)
-        )
-        (workspace_path / "previous_lessons.json").write_text(
-            json.dumps(previous_lessons, indent=2)
-        )
+        if neighbour_digest is None:
+            (workspace_path / "current_outline.json").write_text(
+                json.dumps(outline_entry, indent=2)
+            )
+            (workspace_path / "previous_lessons.json").write_text(
+                json.dumps(previous_lessons or [], indent=2)
+            )
+            context_files = """- Current outline entry: /workspace/current_outline.json
+- Previous lessons (for context): /workspace/previous_lessons.json"""
+        else:
+            outline_file = f"lesson_{order:02d}_outline.json"
+            neighbours_file = f"lesson_{order:02d}_neighbours.json"
+            (workspace_path / outline_file).write_text(json.dumps(outline_entry, indent=2))
+            (workspace_path / neighbours_file).write_text(
+                json.dumps(neighbour_digest, separators=(",", ":"))
+            )
+            context_files = f"""- Current outline entry: /workspace/{outline_file} (use in place of current_outline.json)
+- Neighbouring lessons (for context): /workspace/{neighbours_file} (use in place of previous_lessons.json).
+  Compact summaries of nearby lessons - "generated" ones are final, "planned" ones
+  are outline entries being written in parallel. Keep scaffolding consistent with both."""
 
         # Load the lesson author prompt
         base_prompt = self._load_prompt("lesson_entry_prompt")
@@ -554,8 +792,7 @@ Previous version failed validation. Apply these corrections:
 
 **Required Files (in workspace):**
 - Course outcomes: /workspace/Course_outcomes.json
-- Current outline entry: /workspace/current_outline.json
-- Previous lessons (for context): /workspace/previous_lessons.json
+{context_files}
 {revision_section}
 Generate lesson {order} now. Read all context files, then create the SOWEntry.
 """
@@ -619,8 +856,9 @@ Generate lesson {order} now. Read all context files, then create the SOWEntry.
         """
         logger.info(f"🔍 Critiquing lesson {order}...")
 
-        # Write lesson for critic to read
-        lesson_path = workspace_path / f"lesson_{order:02d}.json"
+        # Write lesson for critic to read (lesson_NN.json is reserved for
+        # approved lessons so --resume can trust it)
+        lesson_path = workspace_path / f"lesson_{order:02d}_draft.json"
         lesson_path.write_text(lesson.model_dump_json(indent=2))
 
         # Load the critic prompt
@@ -636,7 +874,7 @@ Generate lesson {order} now. Read all context files, then create the SOWEntry.
 **Required Files (in workspace):**
 - Course outcomes: /workspace/Course_outcomes.json
 - Lesson outline: /workspace/lesson_outline.json
-- Lesson to critique: /workspace/lesson_{order:02d}.json
+- Lesson to critique: /workspace/lesson_{order:02d}_draft.json
 
 Evaluate lesson {order} now. Read all files, then provide the LessonCriticResult.
 """
@@ -691,9 +929,10 @@ Evaluate lesson {order} now. Read all files, then provide the LessonCriticResult
         workspace_path: Path,
         order: int,
         outline_entry: Dict[str, Any],
-        previous_lessons: List[Dict[str, Any]],
+        previous_lessons: Optional[List[Dict[str, Any]]],
         subject: str,
-        level: str
+        level: str,
+        neighbour_digest: Optional[List[Dict[str, Any]]] = None
     ) -> SOWEntry:
         """Generate lesson with fail-fast schema validation and critic validation loop.
 
@@ -709,9 +948,10 @@ Evaluate lesson {order} now. Read all files, then provide the LessonCriticResult
             workspace_path: Path to isolated workspace
             order: Lesson order number (1-based)
             outline_entry: Outline entry for this lesson
-            previous_lessons: List of previously generated lessons
+            previous_lessons: List of previously generated lessons (sequential mode)
             subject: Course subject identifier
             level: Course level identifier
+            neighbour_digest: Compact neighbour summaries (wave mode)
 
         Returns:
             Validated SOWEntry that passed both schema and critic validation
@@ -736,7 +976,8 @@ Evaluate lesson {order} now. Read all files, then provide the LessonCriticResult
                 # Generate lesson (includes Pydantic validation)
                 lesson = await self._generate_lesson_structured(
                     workspace_path, order, outline_entry, previous_lessons,
-                    subject, level, combined_guidance if combined_guidance else None
+                    subject, level, combined_guidance if combined_guidance else None,
+                    neighbour_digest=neighbour_digest
                 )
                 # Schema validation passed (Pydantic validated in _generate_lesson_structured)
                 schema_errors = None
@@ -774,6 +1015,124 @@ Evaluate lesson {order} now. Read all files, then provide the LessonCriticResult
                 f"Last critique: {critique.summary}"
             )
 
+    async def _generate_lessons_sequentially(
+        self,
+        workspace_path: Path,
+        outline: LessonOutline,
+        subject: str,
+        level: str,
+        approved: Optional[Dict[int, SOWEntry]] = None
+    ) -> List[SOWEntry]:
+        """Generate lessons one at a time, each seeing all previous lessons.
+
+        Args:
+            workspace_path: Path to isolated workspace
+            outline: Approved lesson outline
+            subject: Course subject identifier
+            level: Course level identifier
+            approved: Lessons already approved by a previous run (--resume);
+                these are skipped and used as context for later lessons
+
+        Returns:
+            Approved lessons in order
+        """
+        total_lessons = len(outline.outlines)
+        generated: Dict[int, SOWEntry] = dict(approved or {})
+
+        for i, outline_entry in enumerate(outline.outlines):
+            order = i + 1
+            if order in generated:
+                continue
+
+            lesson = await self._generate_lesson_with_critique_loop(
+                workspace_path=workspace_path,
+                order=order,
+                outline_entry=outline_entry.model_dump(),
+                previous_lessons=[generated[o].model_dump() for o in sorted(generated) if o < order],
+                subject=subject,
+                level=level
+            )
+            generated[order] = lesson
+
+            # Persist each approved lesson
+            lesson_path = workspace_path / f"lesson_{order:02d}.json"
+            lesson_path.write_text(lesson.model_dump_json(indent=2))
+
+            logger.info(f"✅ Lesson {order}/{total_lessons} approved")
+
+        return [generated[o] for o in sorted(generated)]
+
+    async def _generate_lessons_in_waves(
+        self,
+        workspace_path: Path,
+        outline: LessonOutline,
+        subject: str,
+        level: str,
+        approved: Optional[Dict[int, SOWEntry]] = None
+    ) -> List[SOWEntry]:
+        """Generate all lessons in parallel waves of `lesson_concurrency`.
+
+        Each lesson runs the same schema + critic loop as sequential mode but
+        gets a neighbour digest (see build_neighbour_digest) instead of every
+        previous lesson. Lessons approved in earlier waves are summarised from
+        their final entries. Every approved lesson is persisted as
+        lesson_NN.json before a failing wave raises.
+
+        Args:
+            workspace_path: Path to isolated workspace
+            outline: Approved lesson outline
+            subject: Course subject identifier
+            level: Course level identifier
+            approved: Lessons already approved by a previous run (--resume);
+                only the missing orders are generated
+
+        Returns:
+            Approved lessons in order
+
+        Raises:
+            ValueError: If any lesson in a wave fails its critique loop
+        """
+        outline_entries = [entry.model_dump(mode="json") for entry in outline.outlines]
+        total = len(outline_entries)
+        generated: Dict[int, SOWEntry] = dict(approved or {})
+        pending = [order for order in range(1, total + 1) if order not in generated]
+        wave_size = self.lesson_concurrency
+        wave_count = (len(pending) + wave_size - 1) // wave_size
+
+        for wave_index, start in enumerate(range(0, len(pending), wave_size), start=1):
+            wave = pending[start:start + wave_size]
+            logger.info(f"🌊 Wave {wave_index}/{wave_count}: lessons {', '.join(map(str, wave))}")
+
+            results = await asyncio.gather(*[
+                self._generate_lesson_with_critique_loop(
+                    workspace_path=workspace_path,
+                    order=order,
+                    outline_entry=outline_entries[order - 1],
+                    previous_lessons=None,
+                    subject=subject,
+                    level=level,
+                    neighbour_digest=build_neighbour_digest(order, outline_entries, generated)
+                )
+                for order in wave
+            ], return_exceptions=True)
+
+            failures = []
+            for order, result in zip(wave, results):
+                if isinstance(result, BaseException):
+                    failures.append(f"lesson {order}: {result}")
+                    continue
+                generated[order] = result
+                (workspace_path / f"lesson_{order:02d}.json").write_text(result.model_dump_json(indent=2))
+                logger.info(f"✅ Lesson {order}/{total} approved")
+
+            if failures:
+                raise ValueError(
+                    f"{len(failures)} lesson(s) failed in wave {wave_index}/{wave_count}: "
+                    + "; ".join(failures)
+                )
+
+        return [generated[order] for order in sorted(generated)]
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Metadata Generation
     # ═══════════════════════════════════════════════════════════════════════════
@@ -963,7 +1322,8 @@ Generate the course metadata now. Read context files, then provide the Metadata.
         self,
         courseId: str,
         version: str = "1",
-        force: bool = False
+        force: bool = False,
+        resume_workspace: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute the iterative SOW authoring pipeline with critic loops.
 
@@ -971,9 +1331,16 @@ Generate the course metadata now. Read context files, then provide the Metadata.
             courseId: Course identifier (e.g., 'course_c84874')
             version: SOW version number (default: "1")
             force: If True, overwrite existing SOW for this version
+            resume_workspace: Workspace of an interrupted run to continue.
+                Course_outcomes.json, the approved outline, every lesson_NN.json
+                that validates against SOWEntry and metadata.json are reused;
+                only missing or invalid artifacts are regenerated.
 
         Returns:
             Dictionary with execution results
+
+        Raises:
+            ValueError: If the resume workspace belongs to a different course
         """
         is_valid, error_msg = validate_input_schema({"courseId": courseId})
         if not is_valid:
@@ -1027,12 +1394,29 @@ Generate the course metadata now. Read context files, then provide the Metadata.
             existing_sow_id = existing_sows[0]['$id']
             logger.warning(f"FORCE MODE: Will overwrite SOW {existing_sow_id}")
 
-        try:
-            with IsolatedFilesystem(
+        if resume_workspace:
+            resume_path = Path(resume_workspace).resolve()
+            if not resume_path.is_dir():
+                raise ValueError(f"Resume workspace not found: {resume_path}")
+            validate_resume_workspace(resume_path, courseId, subject, level)
+            # Reopen the same directory; never clean up a resumed workspace
+            self.execution_id = resume_path.name
+            filesystem_context = IsolatedFilesystem(
+                resume_path.name,
+                persist=True,
+                workspace_type="iterative_sow_author",
+                parent_dir=resume_path.parent
+            )
+            logger.info(f"♻️  Resuming from workspace: {resume_path}")
+        else:
+            filesystem_context = IsolatedFilesystem(
                 self.execution_id,
                 persist=self.persist_workspace,
                 workspace_type="iterative_sow_author"
-            ) as filesystem:
+            )
+
+        try:
+            with filesystem_context as filesystem:
                 workspace_path = filesystem.root
                 logger.info(f"📁 Workspace: {workspace_path}")
 
@@ -1046,33 +1430,33 @@ Generate the course metadata now. Read context files, then provide the Metadata.
                 # ═══════════════════════════════════════════════════════════════
                 # Phase 1: Extract Course_outcomes.json
                 # ═══════════════════════════════════════════════════════════════
-                logger.info("📥 Phase 1: Extracting Course_outcomes.json...")
+                course_outcomes_path = workspace_path / "Course_outcomes.json"
+                course_outcomes = _load_course_outcomes(course_outcomes_path) if resume_workspace else None
 
-                from .utils.course_outcomes_extractor import extract_course_outcomes_to_file
+                if course_outcomes is not None:
+                    structure_type = course_outcomes.get("structure_type", "unit_based")
+                    logger.info(f"♻️  Phase 1: Reusing Course_outcomes.json (structure_type={structure_type})")
+                else:
+                    logger.info("📥 Phase 1: Extracting Course_outcomes.json...")
 
-                course_outcomes_path = workspace_path / "Course_outcomes.json"
-                extraction_result = await extract_course_outcomes_to_file(
-                    courseId=courseId,
-                    mcp_config_path=str(self.mcp_config_path),
-                    output_path=course_outcomes_path
-                )
+                    from .utils.course_outcomes_extractor import extract_course_outcomes_to_file
+
+                    extraction_result = await extract_course_outcomes_to_file(
+                        courseId=courseId,
+                        mcp_config_path=str(self.mcp_config_path),
+                        output_path=course_outcomes_path
+                    )
 
-                structure_type = extraction_result.get("structure_type", "unit_based")
-                logger.info(f"✅ Course_outcomes.json ready (structure_type={structure_type})")
+                    structure_type = extraction_result.get("structure_type", "unit_based")
+                    logger.info(f"✅ Course_outcomes.json ready (structure_type={structure_type})")
 
                 # ═══════════════════════════════════════════════════════════════
                 # Phase 2: Generate Outline with Critique Loop
                 # ═══════════════════════════════════════════════════════════════
-                logger.info("📋 Phase 2: Generating outline with critique loop...")
-
-                outline = await self._generate_outline_with_critique_loop(
-                    workspace_path, subject, level
+                outline, approved_lessons = await self._load_or_generate_outline(
+                    workspace_path, subject, level, resume=bool(resume_workspace)
                 )
 
-                # Persist approved outline
-                outline_path = workspace_path / "lesson_outline.json"
-                outline_path.write_text(outline.model_dump_json(indent=2))
-
                 total_lessons = outline.total_lessons
                 logger.info(f"✅ Outline approved: {total_lessons} lessons")
 
@@ -1080,42 +1464,47 @@ Generate the course metadata now. Read context files, then provide the Metadata.
                 # Phase 3: Generate Lessons with Critique Loops
                 # ═══════════════════════════════════════════════════════════════
                 logger.info(f"📚 Phase 3: Generating {total_lessons} lessons with critique loops...")
-
-                generated_lessons: List[SOWEntry] = []
-
-                for i, outline_entry in enumerate(outline.outlines):
-                    lesson = await self._generate_lesson_with_critique_loop(
-                        workspace_path=workspace_path,
-                        order=i + 1,
-                        outline_entry=outline_entry.model_dump(),
-                        previous_lessons=[l.model_dump() for l in generated_lessons],
-                        subject=subject,
-                        level=level
+                if approved_lessons:
+                    missing = [o for o in range(1, total_lessons + 1) if o not in approved_lessons]
+                    logger.info(
+                        f"♻️  Reusing {len(approved_lessons)} approved lessons; "
+                        f"continuing from lesson {missing[0] if missing else '-'} ({len(missing)} to generate)"
                     )
-                    generated_lessons.append(lesson)
-
-                    # Persist each approved lesson
-                    lesson_path = workspace_path / f"lesson_{i + 1:02d}.json"
-                    lesson_path.write_text(lesson.model_dump_json(indent=2))
 
-                    logger.info(f"✅ Lesson {i + 1}/{total_lessons} approved")
+                if self.lesson_concurrency > 1:
+                    logger.info(f"   Wave mode: up to {self.lesson_concurrency} lessons in parallel")
+                    generated_lessons = await self._generate_lessons_in_waves(
+                        workspace_path, outline, subject, level, approved=approved_lessons
+                    )
+                else:
+                    generated_lessons = await self._generate_lessons_sequentially(
+                        workspace_path, outline, subject, level, approved=approved_lessons
+                    )
 
                 logger.info(f"✅ All {total_lessons} lessons approved")
 
                 # ═══════════════════════════════════════════════════════════════
                 # Phase 4: Generate Metadata
                 # ═══════════════════════════════════════════════════════════════
-                logger.info("📊 Phase 4: Generating metadata...")
-
-                metadata = await self._generate_metadata_structured(
-                    workspace_path, generated_lessons, subject, level
-                )
-
-                # Persist metadata
                 metadata_path = workspace_path / "metadata.json"
-                metadata_path.write_text(metadata.model_dump_json(indent=2))
+                metadata = None
+                # Metadata summarises the lessons, so only reuse it if none changed
+                if resume_workspace and len(approved_lessons) == total_lessons:
+                    metadata = _load_resumable(metadata_path, Metadata)
+
+                if metadata is not None:
+                    logger.info("♻️  Phase 4: Reusing metadata.json")
+                else:
+                    logger.info("📊 Phase 4: Generating metadata...")
+
+                    metadata = await self._generate_metadata_structured(
+                        workspace_path, generated_lessons, subject, level
+                    )
+
+                    # Persist metadata
+                    metadata_path.write_text(metadata.model_dump_json(indent=2))
 
-                logger.info("✅ Metadata generated")
+                    logger.info("✅ Metadata generated")
 
                 # ═══════════════════════════════════════════════════════════════
                 # Phase 5: Assemble Final SOW
@@ -1208,13 +1597,31 @@ async def main():
         default="INFO",
         help="Log level (default: INFO)"
     )
+    parser.add_argument(
+        "--resume",
+        metavar="WORKSPACE",
+        help=(
+            "Continue an interrupted run from its workspace directory, reusing the "
+            "approved outline and every valid lesson_NN.json"
+        )
+    )
+    parser.add_argument(
+        "--lesson-concurrency",
+        type=int,
+        default=LESSON_CONCURRENCY,
+        help=(
+            "Lessons generated in parallel per wave, each with a compact digest of "
+            f"its outline neighbours (default: {LESSON_CONCURRENCY} = sequential)"
+        )
+    )
 
     args = parser.parse_args()
 
     agent = IterativeSOWAuthor(
         mcp_config_path=".mcp.json",
         persist_workspace=True,
-        log_level=args.log_level
+        log_level=args.log_level,
+        lesson_concurrency=args.lesson_concurrency
     )
 
     # Run the specified phase
@@ -1227,7 +1634,11 @@ async def main():
         else:
             print(f"❌ Phase 1 failed: {result.get('error', 'Unknown error')}")
     else:
-        result = await agent.execute(courseId=args.course_id, version=args.version)
+        result = await agent.execute(
+            courseId=args.course_id,
+            version=args.version,
+            resume_workspace=args.resume
+        )
 
         if result["success"]:
             print(f"✅ SOW authored successfully!")
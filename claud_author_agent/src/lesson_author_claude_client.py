@@ -18,7 +18,7 @@ from .utils.filesystem import IsolatedFilesystem
 from .utils.validation import validate_lesson_author_input
 from .utils.metrics import CostTracker, format_cost_report
 from .utils.logging_config import setup_logging, add_workspace_file_handler
-from .utils.compression import parse_sow_entries
+from .utils.sow_cache import load_sow_entries
 from .tools.json_validator_tool import validation_server
 
 logger = logging.getLogger(__name__)
@@ -60,7 +60,8 @@ class LessonAuthorClaudeAgent:
         mcp_config_path: str = ".mcp.json",
         persist_workspace: bool = True,
         max_critic_retries: int = 10,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        workspace_parent_dir: Optional[Path] = None
     ):
         """Initialize Lesson Author agent.
 
@@ -69,10 +70,14 @@ class LessonAuthorClaudeAgent:
             persist_workspace: If True, preserve workspace for debugging
             max_critic_retries: Maximum attempts for critic validation
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            workspace_parent_dir: Optional batch directory. If set, the workspace is
+                nested under it as lesson_order_NNN/ so concurrent lessons started
+                in the same second never share a workspace.
         """
         self.mcp_config_path = Path(mcp_config_path)
         self.persist_workspace = persist_workspace
         self.max_critic_retries = max_critic_retries
+        self.workspace_parent_dir = Path(workspace_parent_dir) if workspace_parent_dir else None
 
         # Generate execution ID (timestamp-based)
         self.execution_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -159,7 +164,13 @@ class LessonAuthorClaudeAgent:
 
         try:
             # Create isolated workspace
-            with IsolatedFilesystem(self.execution_id, persist=self.persist_workspace, workspace_type="lesson_author") as filesystem:
+            workspace_id = f"lesson_order_{order:03d}" if self.workspace_parent_dir else self.execution_id
+            with IsolatedFilesystem(
+                workspace_id,
+                persist=self.persist_workspace,
+                workspace_type="lesson_author",
+                parent_dir=self.workspace_parent_dir
+            ) as filesystem:
                 workspace_path = filesystem.root
 
                 logger.info(f"Workspace created: {workspace_path}")
@@ -481,27 +492,14 @@ class LessonAuthorClaudeAgent:
             logger.info(f"  ✓ SOW document found: {courseId}")
 
             # Parse entries field (handles all formats: storage bucket, compressed, uncompressed)
-            # Uses unified parse_sow_entries() helper that supports:
-            # - Storage bucket: "storage:<file_id>" - fetch from bucket, decompress
-            # - TypeScript "gzip:" prefix: inline compressed
-            # - Python legacy raw base64: inline compressed
-            # - Uncompressed JSON: legacy format
-            entries_raw = sow_doc.get('entries', [])
-            entries = await parse_sow_entries(
-                entries_raw=entries_raw,
+            # via the course-scoped SOW cache: parsed once per published SOW version
+            # ($id + $updatedAt) and shared by every lesson in a batch
+            sow = await load_sow_entries(
+                sow_doc=sow_doc,
                 mcp_config_path=str(self.mcp_config_path),
                 courseId=courseId
             )
-
-            # Find entry with matching order
-            entry = next((e for e in entries if e.get('order') == order), None)
-
-            if entry is None:
-                available_orders = [e.get('order') for e in entries if 'order' in e]
-                raise ValueError(
-                    f"Order {order} not found in SOW entries for courseId '{courseId}'. "
-                    f"Available orders: {sorted(available_orders)}"
-                )
+            entry = sow.entry_for_order(order, courseId)
 
             logger.info(f"  ✓ SOW entry found at order {order}: {entry.get('label', 'N/A')}")
 
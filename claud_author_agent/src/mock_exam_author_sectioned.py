@@ -359,7 +359,12 @@ class MockExamAuthorSectioned:
                     "sections": orchestration_result.sections_generated,
                     "iterations": orchestration_result.iterations_completed,
                     "parallel": orchestration_result.parallel_generation,
-                    "critic_score": critic_result.overall_score
+                    "critic_score": critic_result.overall_score,
+                    "tokens": orchestration_result.total_tokens,
+                    "tokens_saved_by_section_reuse": sum(
+                        r["tokens_saved_estimate"] for r in orchestration_result.iteration_reports
+                    ),
+                    "iteration_reports": orchestration_result.iteration_reports
                 }
             ))
 
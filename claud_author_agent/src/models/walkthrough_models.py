@@ -16,8 +16,6 @@ from typing import Dict, List, Optional, Literal, Any
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime, timezone
 import json
-import gzip
-import base64
 
 
 # =============================================================================
@@ -335,9 +333,9 @@ class WalkthroughDocument(BaseModel):
 
         Returns base64-encoded gzip compressed JSON.
         """
-        json_str = self.walkthrough.model_dump_json()
-        compressed = gzip.compress(json_str.encode('utf-8'))
-        return base64.b64encode(compressed).decode('utf-8')
+        from ..utils.compression import compress_text
+
+        return compress_text(self.walkthrough.model_dump_json(), prefix=False).encoded
 
     def to_appwrite_row(self) -> Dict[str, Any]:
         """Convert to dictionary for Appwrite row creation.
@@ -375,9 +373,9 @@ class WalkthroughDocument(BaseModel):
         Returns:
             QuestionWalkthrough instance
         """
-        decoded = base64.b64decode(compressed)
-        decompressed = gzip.decompress(decoded)
-        data = json.loads(decompressed.decode('utf-8'))
+        from ..utils.compression import decompress_text
+
+        data = json.loads(decompress_text(compressed))
         return QuestionWalkthrough(**data)
 
 
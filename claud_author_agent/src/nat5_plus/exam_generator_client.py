@@ -7,7 +7,7 @@ Uses granular question-by-question generation with Claude Agent SDK structured o
 Pipeline:
 1. Pre-processing: Extract SOW topics, past paper templates, existing summaries
 2. Plan Exam: Generate exam plan with topic/difficulty distribution
-3. Generate Questions: Parallel question generation with validation
+3. Generate Questions: Concurrent question generation (bounded) with validation
 4. Assemble & Post-process: Stitch questions, validate, upsert to Appwrite
 
 Usage:
@@ -26,25 +26,73 @@ Usage:
 import asyncio
 import argparse
 import logging
+import os
+import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 # Nat5PlusMockExam is returned by assemble_exam
 from .sow_topic_extractor import extract_sow_topics
 from .past_paper_template_extractor import extract_templates
-from .uniqueness_manager import UniquenessManager, load_existing_summaries
+from .uniqueness_manager import load_uniqueness_manager
 from .question_generator_agent import generate_exam_plan, generate_single_question
 from .exam_assembler import assemble_exam
 from .exam_upserter import upsert_exam, update_exam_summary, delete_exam, list_exams
 
 logger = logging.getLogger(__name__)
 
+# Maximum question agent sessions running at once in Phase 3
+QUESTION_CONCURRENCY = int(os.environ.get("NAT5_PLUS_QUESTION_CONCURRENCY", "5"))
 
-def chunk(lst: List, size: int):
-    """Split list into chunks of given size."""
-    for i in range(0, len(lst), size):
-        yield lst[i:i + size]
+
+async def generate_questions(
+    specs: List[Any],
+    sow_topics: List[Dict[str, Any]],
+    templates: List[Dict[str, Any]],
+    workspace_path: Path,
+    concurrency: int = QUESTION_CONCURRENCY
+) -> List[Tuple[Any, float]]:
+    """Generate one question per spec, at most ``concurrency`` at a time.
+
+    Each question runs its whole agent session inside its own task, so the
+    SDK's anyio cancel scopes never cross tasks. Results come back in spec
+    order with question_index == spec position, so numbering and q_NNN.json
+    names match sequential generation exactly.
+
+    Args:
+        specs: exam_plan.question_specs
+        sow_topics: Available topics for detail lookup
+        templates: Past paper templates for style reference
+        workspace_path: Directory for intermediate outputs
+        concurrency: Maximum concurrent generate_single_question calls
+
+    Returns:
+        [(question or Exception, latency_seconds)] in spec order
+
+    Raises:
+        ValueError: If concurrency < 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def generate(index: int, spec: Any) -> Tuple[Any, float]:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await generate_single_question(
+                    spec, sow_topics, templates, workspace_path, index
+                )
+            except Exception as e:
+                result = e
+            latency = time.perf_counter() - started
+            status = "✓" if not isinstance(result, Exception) else "❌"
+            logger.info(f"  {status} Question {index + 1}/{len(specs)} ({spec.topic}) in {latency:.1f}s")
+            return result, latency
+
+    return list(await asyncio.gather(*(generate(i, spec) for i, spec in enumerate(specs))))
 
 
 async def generate_nat5_plus_exam(
@@ -54,7 +102,8 @@ async def generate_nat5_plus_exam(
     target_marks: int = 90,
     target_questions: int = 15,
     force_regenerate: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    question_concurrency: int = QUESTION_CONCURRENCY
 ) -> str:
     """Generate a Nat5+ mock exam for a course.
 
@@ -66,6 +115,7 @@ async def generate_nat5_plus_exam(
         target_questions: Number of questions target (default: 15)
         force_regenerate: Skip uniqueness checks
         dry_run: Generate without upserting to Appwrite
+        question_concurrency: Maximum question agent sessions running at once
 
     Returns:
         Document ID of the created exam (or "DRY_RUN" if dry_run=True)
@@ -114,9 +164,9 @@ async def generate_nat5_plus_exam(
     # Convert QuestionTemplate dataclasses to dicts for downstream functions
     templates = [asdict(t) for t in templates_result.templates]
 
-    # Load existing exam summaries for uniqueness checking
-    existing_summaries = await load_existing_summaries(course_id)
-    uniqueness_manager = UniquenessManager(existing_summaries)
+    # Load existing exam summaries + question index for uniqueness checking
+    uniqueness_manager = await load_uniqueness_manager(course_id)
+    existing_summaries = uniqueness_manager.existing_summaries
     logger.info(f"Loaded {len(existing_summaries)} existing exam summaries")
 
     # ═══════════════════════════════════════════════════════════════
@@ -136,40 +186,46 @@ async def generate_nat5_plus_exam(
     logger.info(f"Generated exam plan with {len(exam_plan.question_specs)} questions")
 
     # ═══════════════════════════════════════════════════════════════
-    # PHASE 3: Generate Questions (Parallel, Structured Output)
+    # PHASE 3: Generate Questions (Concurrent, Structured Output)
     # ═══════════════════════════════════════════════════════════════
-    logger.info("PHASE 3: Generating questions")
-
-    questions = []
-    question_offset = 0
-    for batch_idx, batch in enumerate(chunk(exam_plan.question_specs, size=5)):
-        logger.info(f"Processing batch {batch_idx + 1}")
-        batch_results = []
-        for i, spec in enumerate(batch):
-            try:
-                result = await generate_single_question(
-                    spec, sow_topics, templates, workspace_path, question_offset + i
-                )
-                batch_results.append(result)
-            except Exception as e:
-                batch_results.append(e)
-        question_offset += len(batch)
-
-        for i, result in enumerate(batch_results):
-            if isinstance(result, Exception):
-                logger.error(f"Question generation failed: {result}")
-                raise ValueError(f"Failed to generate question: {result}")
-
-            question = result
-            # Check uniqueness (skip critic for now - can be added later)
-            if not force_regenerate and not uniqueness_manager.check_question_unique(question.stem):
-                logger.warning(f"Question not unique, continuing anyway (full regen not implemented)")
-                # For now, still add it - full uniqueness regen needs more work
+    logger.info(
+        f"PHASE 3: Generating {len(exam_plan.question_specs)} questions "
+        f"(concurrency: {question_concurrency})"
+    )
 
-            questions.append(question)
-            logger.info(f"Generated question {len(questions)}: {question.question_number}")
+    phase_started = time.perf_counter()
+    results = await generate_questions(
+        exam_plan.question_specs,
+        sow_topics,
+        templates,
+        workspace_path,
+        concurrency=question_concurrency
+    )
+    wall_seconds = time.perf_counter() - phase_started
 
-    logger.info(f"Generated {len(questions)} questions total")
+    questions = []
+    for result, _latency in results:
+        if isinstance(result, Exception):
+            logger.error(f"Question generation failed: {result}")
+            raise ValueError(f"Failed to generate question: {result}")
+
+        question = result
+        # Check uniqueness (skip critic for now - can be added later)
+        if not force_regenerate and not uniqueness_manager.check_question_unique(question.stem):
+            logger.warning(f"Question not unique, continuing anyway (full regen not implemented)")
+            # For now, still add it - full uniqueness regen needs more work
+
+        questions.append(question)
+        logger.info(f"Generated question {len(questions)}: {question.question_number}")
+
+    latencies = [latency for _result, latency in results]
+    sequential_seconds = sum(latencies)
+    logger.info(
+        f"Generated {len(questions)} questions total in {wall_seconds:.1f}s "
+        f"(sum of per-question latency {sequential_seconds:.1f}s, "
+        f"max {max(latencies, default=0):.1f}s, "
+        f"speedup {sequential_seconds / wall_seconds if wall_seconds else 1:.1f}x)"
+    )
 
     # ═══════════════════════════════════════════════════════════════
     # PHASE 3.5: Diagram Generation (Claude SDK + MCP tools)
@@ -209,11 +265,34 @@ async def generate_nat5_plus_exam(
         f.write(validated_exam.model_dump_json(indent=2))
     logger.info(f"Saved exam to: {exam_json_path}")
 
+    return await persist_exam(validated_exam, questions, uniqueness_manager, course_id, dry_run)
+
+
+async def persist_exam(
+    validated_exam: Any,
+    questions: List[Any],
+    uniqueness_manager: Any,
+    course_id: str,
+    dry_run: bool = False
+) -> str:
+    """Upsert an assembled exam and record its questions for uniqueness checks.
+
+    Question stems are added to the (process-wide cached) question index only
+    after the upsert and summary update succeed, so dry runs and failed
+    upserts never leave unattributed stems behind.
+
+    Args:
+        validated_exam: Assembled Nat5PlusMockExam
+        questions: Generated questions (stems are fingerprinted)
+        uniqueness_manager: UniquenessManager from load_uniqueness_manager
+        course_id: Course the exam belongs to
+        dry_run: Skip the upsert and leave uniqueness state untouched
+
+    Returns:
+        Document ID of the created exam (or "DRY_RUN" if dry_run=True)
+    """
     # Generate question fingerprints for uniqueness tracking
-    question_fingerprints = []
-    for question in questions:
-        fingerprint = uniqueness_manager.register_question(question.stem)
-        question_fingerprints.append(fingerprint)
+    question_fingerprints = [uniqueness_manager.fingerprint(question.stem) for question in questions]
     logger.info(f"Generated {len(question_fingerprints)} question fingerprints")
 
     if dry_run:
@@ -228,6 +307,12 @@ async def generate_nat5_plus_exam(
     await update_exam_summary(validated_exam, doc_id, question_fingerprints)
     logger.info("Updated exam summary")
 
+    # Persist new question stems for near-duplicate checks in later exams
+    for question in questions:
+        uniqueness_manager.register_question(question.stem, exam_id=doc_id)
+    index_path = uniqueness_manager.save_question_index(course_id, doc_id)
+    logger.info(f"Updated question index: {index_path}")
+
     return doc_id
 
 
@@ -278,6 +363,12 @@ def main():
         action="store_true",
         help="Generate without upserting to Appwrite"
     )
+    generate_parser.add_argument(
+        "--question-concurrency",
+        type=int,
+        default=QUESTION_CONCURRENCY,
+        help=f"Question agent sessions to run at once (default: {QUESTION_CONCURRENCY})"
+    )
     generate_parser.add_argument(
         "--calculator",
         type=lambda x: x.lower() == "true",
@@ -363,7 +454,8 @@ def main():
             target_marks=args.target_marks,
             target_questions=args.target_questions,
             force_regenerate=args.force_regenerate,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            question_concurrency=args.question_concurrency
         ))
         calc_label = "Calculator" if args.calculator else "Non-Calculator"
         print(f"Generated {calc_label} exam: {result}")
@@ -6,35 +6,30 @@ Handles upserting generated exams to Appwrite:
 - nat5_plus_exam_summaries: Uniqueness tracking
 - exam_diagrams bucket: Diagram image storage
 
-Uses gzip+base64 compression for large JSON fields.
+Uses gzip+base64 compression (utils.compression) for large JSON fields.
 """
 
 import json
-import gzip
-import base64
 import logging
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
 from ..models.nat5_plus_exam_models import Nat5PlusMockExam
+from ..utils.compression import compress_json as compress_content_json, decompress_text
 
 logger = logging.getLogger(__name__)
 
 
 def compress_json(data: dict) -> str:
     """Compress a dictionary to gzip+base64 string."""
-    json_str = json.dumps(data)
-    compressed = gzip.compress(json_str.encode('utf-8'))
-    return base64.b64encode(compressed).decode('utf-8')
+    return compress_content_json(data, prefix=False).encoded
 
 
 def decompress_json(compressed: str) -> dict:
-    """Decompress a gzip+base64 string to dictionary."""
+    """Decompress a gzip+base64 (or "zstd:"/"gzip:"-prefixed) string to dictionary."""
     try:
-        decoded = base64.b64decode(compressed)
-        decompressed = gzip.decompress(decoded)
-        return json.loads(decompressed.decode('utf-8'))
+        return json.loads(decompress_text(compressed))
     except Exception as e:
         logger.error(f"Decompression failed: {e}")
         return {}
@@ -0,0 +1,339 @@
+"""
+Near-Duplicate Index (MinHash + LSH)
+
+Approximate Jaccard-similarity lookups for the UniquenessManager:
+
+- Question stems are normalised and split into character shingles; each stem
+  is reduced to a fixed-size MinHash signature.
+- Signatures are split into LSH bands; only stems sharing at least one band
+  bucket are compared, so a lookup touches a handful of candidates instead of
+  every stored question.
+- The (bands, rows) split is chosen from the similarity threshold so pairs at
+  or above it are very likely to collide; question candidates are then
+  scored by exact shingle Jaccard against their stored stems.
+
+QuestionIndex persists stems, owning exam IDs and signatures per course as a
+single .npz file, so a course's history is loaded once instead of re-hashed.
+
+Configuration:
+    NAT5_PLUS_UNIQUENESS_INDEX_DIR  (default: workspace/.nat5_plus_uniqueness)
+"""
+
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent.parent / "workspace" / ".nat5_plus_uniqueness"
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_SEED = 1
+
+# Minimum probability that a pair exactly at the threshold shares an LSH bucket
+LSH_MIN_RECALL = 0.95
+
+# Mersenne prime 2^31 - 1: a * x + b stays below 2^63 for 31-bit a, b, x
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace (as fingerprints do)."""
+    normalized = "".join(c for c in text.lower() if c.isalnum() or c.isspace())
+    return " ".join(normalized.split())
+
+
+def shingle(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> Set[str]:
+    """Return the character shingles of normalised text.
+
+    Texts shorter than size yield a single shingle so they still hash.
+    """
+    normalized = normalize_text(text)
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def jaccard(a: AbstractSet[str], b: AbstractSet[str]) -> float:
+    """Exact Jaccard similarity of two sets (0.0 for two empty sets)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def optimal_bands(threshold: float, num_perm: int, min_recall: float = LSH_MIN_RECALL) -> Tuple[int, int]:
+    """Pick (bands, rows) with bands * rows == num_perm for a Jaccard threshold.
+
+    Returns the most selective split (most rows per band, so fewest
+    candidates) whose collision probability 1 - (1 - t^r)^b at the threshold
+    is still at least min_recall. Candidates are re-checked against the
+    threshold, so extra collisions only cost time while misses lose
+    duplicates.
+
+    Raises:
+        ValueError: If threshold is not in (0, 1)
+    """
+    if not 0.0 < threshold < 1.0:
+        raise ValueError(f"threshold must be between 0 and 1, got {threshold}")
+
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= min_recall:
+            best = (bands, rows)
+    return best
+
+
+class MinHashLSH:
+    """In-memory MinHash signatures with banded LSH buckets.
+
+    Tokens are arbitrary strings (shingles for text, IDs for topic sets).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = DEFAULT_NUM_PERM,
+        seed: int = DEFAULT_SEED
+    ):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.seed = seed
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._keys: List[str] = []
+        self._key_rows: Dict[str, int] = {}
+        self._signatures: List[np.ndarray] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_rows
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        """Return the MinHash signature (uint32[num_perm]) of a token set."""
+        hashes = np.fromiter(
+            (zlib.crc32(t.encode("utf-8")) for t in set(tokens)), dtype=np.uint64
+        ) % np.uint64(_MERSENNE_PRIME)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint32)
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str, signature: np.ndarray) -> None:
+        """Insert a signature under key (re-adding an existing key is a no-op)."""
+        if key in self._key_rows:
+            return
+        row = len(self._keys)
+        self._keys.append(key)
+        self._key_rows[key] = row
+        self._signatures.append(signature)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(row)
+
+    def _candidate_rows(self, signature: np.ndarray) -> List[int]:
+        rows: Set[int] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            rows.update(self._buckets[band].get(band_key, ()))
+        return sorted(rows)
+
+    def candidates(self, signature: np.ndarray) -> List[str]:
+        """Return keys sharing at least one LSH bucket with signature (unfiltered)."""
+        return [self._keys[row] for row in self._candidate_rows(signature)]
+
+    def query(
+        self,
+        signature: np.ndarray,
+        threshold: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """Return [(key, estimated Jaccard)] at or above threshold, most similar first.
+
+        Args:
+            signature: Signature from signature()
+            threshold: Override the index threshold for this lookup (band
+                layout is fixed, so much lower values lose recall)
+        """
+        threshold = self.threshold if threshold is None else threshold
+        rows = self._candidate_rows(signature)
+        if not rows:
+            return []
+
+        matrix = np.stack([self._signatures[row] for row in rows])
+        similarities = (matrix == signature).mean(axis=1)
+        matches = [
+            (self._keys[row], float(similarity))
+            for row, similarity in zip(rows, similarities)
+            if similarity >= threshold
+        ]
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+
+class QuestionIndex:
+    """Persisted near-duplicate index of question stems for one course."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = DEFAULT_SEED
+    ):
+        self.shingle_size = shingle_size
+        self.lsh = MinHashLSH(threshold=threshold, num_perm=num_perm, seed=seed)
+        self._stems: Dict[str, str] = {}
+        self._exam_ids: Dict[str, str] = {}
+        # Shingle sets of stored stems, built on first use as an LSH candidate
+        # (a loaded index has signatures, so history is never re-shingled
+        # up front) and then reused by every later lookup
+        self._shingles: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.lsh)
+
+    @property
+    def threshold(self) -> float:
+        return self.lsh.threshold
+
+    def signature(self, stem: str) -> np.ndarray:
+        return self.lsh.signature(shingle(stem, self.shingle_size))
+
+    def add(
+        self,
+        key: str,
+        stem: str,
+        exam_id: str = "",
+        signature: Optional[np.ndarray] = None
+    ) -> None:
+        """Index a question stem under key (its content fingerprint)."""
+        if key in self.lsh:
+            return
+        if signature is None:
+            shingles = frozenset(shingle(stem, self.shingle_size))
+            self._shingles[key] = shingles
+            signature = self.lsh.signature(shingles)
+        self.lsh.add(key, signature)
+        self._stems[key] = stem
+        self._exam_ids[key] = exam_id
+
+    def _stored_shingles(self, key: str) -> FrozenSet[str]:
+        shingles = self._shingles.get(key)
+        if shingles is None:
+            shingles = self._shingles[key] = frozenset(shingle(self._stems[key], self.shingle_size))
+        return shingles
+
+    def find_similar(self, stem: str, threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Return [(key, Jaccard)] of stored stems similar to stem, most similar first.
+
+        LSH only nominates candidates; each is scored by exact shingle
+        Jaccard against its stored stem, since MinHash estimates are too
+        noisy near the threshold for templated questions.
+        """
+        threshold = self.lsh.threshold if threshold is None else threshold
+        shingles = shingle(stem, self.shingle_size)
+        matches = []
+        for key in self.lsh.candidates(self.lsh.signature(shingles)):
+            similarity = jaccard(shingles, self._stored_shingles(key))
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def stem(self, key: str) -> Optional[str]:
+        return self._stems.get(key)
+
+    def assign_exam(self, exam_id: str) -> int:
+        """Attach exam_id to every entry that does not have one yet.
+
+        Returns:
+            Number of entries assigned
+        """
+        pending = [key for key, owner in self._exam_ids.items() if not owner]
+        for key in pending:
+            self._exam_ids[key] = exam_id
+        return len(pending)
+
+    def retain_exams(self, exam_ids: Set[str]) -> "QuestionIndex":
+        """Return a copy without entries whose (non-empty) exam no longer exists."""
+        kept = QuestionIndex(
+            threshold=self.lsh.threshold,
+            num_perm=self.lsh.num_perm,
+            shingle_size=self.shingle_size,
+            seed=self.lsh.seed
+        )
+        for key in self.lsh._keys:
+            owner = self._exam_ids[key]
+            if owner and owner not in exam_ids:
+                continue
+            kept.add(key, self._stems[key], owner, self.lsh._signatures[self.lsh._key_rows[key]])
+        return kept
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically as .npz (temp file + rename)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        keys = self.lsh._keys
+        signatures = (
+            np.stack(self.lsh._signatures) if keys
+            else np.empty((0, self.lsh.num_perm), dtype=np.uint32)
+        )
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                params=np.array([self.lsh.num_perm, self.shingle_size, self.lsh.seed], dtype=np.int64),
+                keys=np.array(keys, dtype=np.str_),
+                stems=np.array([self._stems[k] for k in keys], dtype=np.str_),
+                exam_ids=np.array([self._exam_ids[k] for k in keys], dtype=np.str_),
+                signatures=signatures
+            )
+        os.replace(temp_path, path)
+        logger.info(f"Saved question index ({len(keys)} stems) to {path}")
+
+    @classmethod
+    def load(cls, path: Path, threshold: float = 0.8) -> "QuestionIndex":
+        """Load an index saved by save(); a missing file gives an empty index.
+
+        Signatures are recomputed from the stored stems if num_perm, shingle
+        size or seed changed since the file was written.
+        """
+        index = cls(threshold=threshold)
+        if not path.exists():
+            return index
+
+        with np.load(path) as data:
+            num_perm, shingle_size, seed = (int(v) for v in data["params"])
+            keys, stems, exam_ids = data["keys"], data["stems"], data["exam_ids"]
+            signatures = data["signatures"]
+
+        reuse = (num_perm, shingle_size, seed) == (index.lsh.num_perm, index.shingle_size, index.lsh.seed)
+        if not reuse:
+            logger.info(f"Question index parameters changed; re-hashing {len(keys)} stems")
+
+        for row, key in enumerate(keys):
+            index.add(str(key), str(stems[row]), str(exam_ids[row]), signatures[row] if reuse else None)
+        return index
+
+
+def question_index_path(course_id: str, index_dir: Optional[Path] = None) -> Path:
+    """Return the .npz path of a course's question index."""
+    base = Path(index_dir) if index_dir else Path(
+        os.environ.get("NAT5_PLUS_UNIQUENESS_INDEX_DIR", DEFAULT_INDEX_DIR)
+    )
+    safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in course_id)
+    return base / f"{safe_id}.npz"
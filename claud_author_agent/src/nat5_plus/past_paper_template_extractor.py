@@ -214,8 +214,8 @@ def _parse_paper_data(data_str: str) -> Dict[str, Any]:
     except json.JSONDecodeError:
         # Try decompression if needed
         try:
-            from ..utils.compression import decompress_json
-            return decompress_json(data_str) or {}
+            from ..utils.compression import decompress_json_gzip_base64
+            return decompress_json_gzip_base64(data_str) or {}
         except Exception:
             return {}
 
@@ -10,12 +10,13 @@ Usage:
 
 import json
 import logging
-import gzip
-import base64
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+from ..utils.compression import decompress_text
+from ..utils.sow_cache import get_sow_cache
+
 logger = logging.getLogger(__name__)
 
 # Storage bucket constants for SOW entries
@@ -27,7 +28,7 @@ def _decompress_entries(entries_str: str) -> List[Dict[str, Any]]:
     """Decompress SOW entries, handling all storage formats.
 
     The Authored_SOW collection uses dual storage strategy:
-    1. Inline storage: 'gzip:BASE64_DATA' for entries < 100KB
+    1. Inline storage: 'gzip:BASE64_DATA' (or 'zstd:') for entries < 100KB
     2. Storage bucket: 'storage:<file_id>' for entries > 100KB
 
     Args:
@@ -49,17 +50,11 @@ def _decompress_entries(entries_str: str) -> List[Dict[str, Any]]:
 
         from ..utils.appwrite_client import download_file_content
         entries_bytes = download_file_content(STORAGE_BUCKET_ID, file_id)
-        entries_str = entries_bytes.decode('utf-8')  # Now has gzip: prefix
-
-    # Case 2: Inline compressed with gzip: prefix
-    if entries_str.startswith("gzip:"):
-        entries_str = entries_str[5:]  # Remove 'gzip:' prefix
+        entries_str = entries_bytes.decode('utf-8')  # Now has gzip:/zstd: prefix
 
-    # Case 3: Base64 decode and gzip decompress
+    # Case 2: Inline "gzip:"/"zstd:" prefixed or raw base64 - decompress
     try:
-        compressed_data = base64.b64decode(entries_str)
-        decompressed_data = gzip.decompress(compressed_data)
-        entries = json.loads(decompressed_data.decode('utf-8'))
+        entries = json.loads(decompress_text(entries_str))
         if not isinstance(entries, list):
             raise ValueError(f"Expected list of entries, got {type(entries).__name__}")
         return entries
@@ -153,9 +148,9 @@ async def extract_sow_topics(
         sow_doc = sow_docs["documents"][0]
         logger.info(f"Found SOW document: {sow_doc['$id']} version {sow_doc.get('version', 'unknown')}")
 
-        # Decompress and parse entries
-        entries_raw = sow_doc.get("entries", "")
-        entries = _decompress_entries(entries_raw)
+        # Decompress and parse entries (cached per SOW $id + $updatedAt so
+        # repeated extractions skip the storage download and gunzip)
+        entries = get_sow_cache().get_or_load(sow_doc, _decompress_entries).entries
 
         if not entries:
             raise ValueError(f"No entries found in SOW for course: {course_id}")
@@ -4,20 +4,34 @@ Uniqueness Manager
 Ensures generated exams are unique by tracking:
 - Topic combinations already used
 - Question fingerprints (content hashes)
+- Near-duplicate question stems (MinHash/LSH, see near_duplicate_index)
 - Style/difficulty distributions
 
-Uses nat5_plus_exam_summaries collection for persistence.
+Uses nat5_plus_exam_summaries collection for persistence; question stems are
+persisted per course in a local QuestionIndex file.
 """
 
+import asyncio
 import json
 import hashlib
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Set, Optional
+from typing import AbstractSet, List, Dict, Any, FrozenSet, Set, Optional, Tuple
 from dataclasses import dataclass, field
 
+from .near_duplicate_index import MinHashLSH, QuestionIndex, question_index_path
+
 logger = logging.getLogger(__name__)
 
+# Estimated stem Jaccard similarity at which a question is a near-duplicate
+QUESTION_SIMILARITY_THRESHOLD = float(os.environ.get("NAT5_PLUS_QUESTION_SIMILARITY", "0.8"))
+
+# Weights of the combined exam similarity score
+TOPIC_WEIGHT = 0.6
+FINGERPRINT_WEIGHT = 0.4
+
 
 @dataclass
 class ExamSummary:
@@ -41,38 +55,67 @@ class UniquenessResult:
 
 
 class UniquenessManager:
-    """Manages exam uniqueness checking and tracking."""
+    """Manages exam uniqueness checking and tracking.
+
+    Questions are checked for exact fingerprint matches and, through a
+    MinHash/LSH QuestionIndex, for near-duplicate stems. Exam checks only
+    score the candidate exams that could exceed the threshold: exams sharing
+    a question fingerprint (inverted index) or, when topic overlap alone can
+    conflict, exams whose topic set collides in a topic LSH index.
+    """
 
     def __init__(
         self,
         existing_summaries: List[ExamSummary],
-        similarity_threshold: float = 0.7
+        similarity_threshold: float = 0.7,
+        question_index: Optional[QuestionIndex] = None,
+        question_similarity_threshold: float = QUESTION_SIMILARITY_THRESHOLD
     ):
         """Initialize with existing exam summaries.
 
         Args:
             existing_summaries: Summaries of previously generated exams
             similarity_threshold: Max similarity before rejecting (0-1)
+            question_index: Near-duplicate index of earlier question stems
+                (see load_uniqueness_manager); empty if not given
+            question_similarity_threshold: Estimated stem Jaccard similarity
+                at which a question counts as a near-duplicate
         """
         self.existing_summaries = existing_summaries
         self.similarity_threshold = similarity_threshold
+        self.question_index = question_index or QuestionIndex(threshold=question_similarity_threshold)
 
-        # Build lookup sets for fast checking
-        self._topic_combinations: Dict[str, Set[str]] = {}
+        # Build lookup sets for fast checking (once, not per check)
+        self._topic_combinations: Dict[str, FrozenSet[str]] = {}
+        self._exam_fingerprints: Dict[str, FrozenSet[str]] = {}
+        self._fingerprint_exams: Dict[str, Set[str]] = {}
         self._fingerprints: Set[str] = set()
 
         for summary in existing_summaries:
             exam_key = summary.exam_id
-            self._topic_combinations[exam_key] = set(summary.topic_ids)
+            self._topic_combinations[exam_key] = frozenset(summary.topic_ids)
+            self._exam_fingerprints[exam_key] = frozenset(summary.question_fingerprints)
             self._fingerprints.update(summary.question_fingerprints)
+            for fingerprint in summary.question_fingerprints:
+                self._fingerprint_exams.setdefault(fingerprint, set()).add(exam_key)
+
+        # Without shared fingerprints an exam conflicts only if
+        # TOPIC_WEIGHT * topic_similarity > threshold
+        self._min_topic_similarity = similarity_threshold / TOPIC_WEIGHT
+        self._topic_index: Optional[MinHashLSH] = None
+        if 0.0 < self._min_topic_similarity < 1.0:
+            self._topic_index = MinHashLSH(threshold=self._min_topic_similarity)
+            for exam_key, topics in self._topic_combinations.items():
+                self._topic_index.add(exam_key, self._topic_index.signature(topics))
 
         logger.info(
             f"Initialized UniquenessManager with {len(existing_summaries)} existing exams, "
-            f"{len(self._fingerprints)} known fingerprints"
+            f"{len(self._fingerprints)} known fingerprints, "
+            f"{len(self.question_index)} indexed question stems"
         )
 
     def check_question_unique(self, question_content: str) -> bool:
-        """Check if a question is unique by content fingerprint.
+        """Check if a question is unique by fingerprint and stem similarity.
 
         Args:
             question_content: Question stem text
@@ -81,7 +124,25 @@ class UniquenessManager:
             True if unique, False if too similar to existing
         """
         fingerprint = self._generate_fingerprint(question_content)
-        return fingerprint not in self._fingerprints
+        if fingerprint in self._fingerprints:
+            return False
+        return not self.find_similar_questions(question_content)
+
+    def find_similar_questions(
+        self,
+        question_content: str,
+        threshold: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """Return near-duplicate stored questions, most similar first.
+
+        Args:
+            question_content: Question stem text
+            threshold: Override the index's similarity threshold
+
+        Returns:
+            [(fingerprint, estimated Jaccard similarity)]
+        """
+        return self.question_index.find_similar(question_content, threshold)
 
     def check_exam_unique(
         self,
@@ -90,6 +151,16 @@ class UniquenessManager:
     ) -> UniquenessResult:
         """Check if an exam combination is unique.
 
+        The check is approximate. Only candidate exams are scored. Those
+        share a question fingerprint with this exam (always found) or
+        collide with its topic set in a MinHash/LSH band match
+        (probabilistic). The band layout gives at least LSH_MIN_RECALL
+        (95%) collision probability for an exam exactly at the threshold.
+        The candidate check matched a full scan in the unit tests, and the
+        stem benchmark (scripts/benchmark_uniqueness_index.py) measured
+        recall 1.0. Even so, a conflicting exam can occasionally be missed,
+        so similarity_score is a lower bound.
+
         Args:
             topic_ids: Topics covered by the exam
             question_fingerprints: Content fingerprints of questions
@@ -103,24 +174,21 @@ class UniquenessManager:
         max_similarity = 0.0
         conflicting = []
 
-        for summary in self.existing_summaries:
-            existing_topics = set(summary.topic_ids)
-            existing_fps = set(summary.question_fingerprints)
-
+        for exam_key in self._candidate_exams(topic_set, fingerprint_set):
             # Calculate Jaccard similarity for topics
-            topic_similarity = self._jaccard_similarity(topic_set, existing_topics)
+            topic_similarity = self._jaccard_similarity(topic_set, self._topic_combinations[exam_key])
 
             # Calculate fingerprint overlap
-            fp_overlap = len(fingerprint_set & existing_fps) / max(len(fingerprint_set), 1)
+            fp_overlap = len(fingerprint_set & self._exam_fingerprints[exam_key]) / max(len(fingerprint_set), 1)
 
             # Combined similarity score
-            combined = 0.6 * topic_similarity + 0.4 * fp_overlap
+            combined = TOPIC_WEIGHT * topic_similarity + FINGERPRINT_WEIGHT * fp_overlap
 
             if combined > max_similarity:
                 max_similarity = combined
 
             if combined > self.similarity_threshold:
-                conflicting.append(summary.exam_id)
+                conflicting.append(exam_key)
 
         is_unique = max_similarity < self.similarity_threshold
 
@@ -131,19 +199,57 @@ class UniquenessManager:
             reason=None if is_unique else f"Too similar to existing exams: {conflicting[:3]}"
         )
 
-    def register_question(self, question_content: str) -> str:
-        """Register a question fingerprint.
+    def _candidate_exams(self, topic_set: Set[str], fingerprint_set: Set[str]) -> List[str]:
+        """Return exams whose combined similarity could exceed the threshold."""
+        if self._min_topic_similarity <= 0.0:
+            return list(self._topic_combinations)
+
+        candidates: Set[str] = set()
+        for fingerprint in fingerprint_set:
+            candidates.update(self._fingerprint_exams.get(fingerprint, ()))
+        if self._topic_index is not None and topic_set:
+            candidates.update(self._topic_index.candidates(self._topic_index.signature(topic_set)))
+        return sorted(candidates)
+
+    def fingerprint(self, question_content: str) -> str:
+        """Return a question's content fingerprint without registering it."""
+        return self._generate_fingerprint(question_content)
+
+    def register_question(self, question_content: str, exam_id: str = "") -> str:
+        """Register a question fingerprint and index its stem.
+
+        The question index may be shared with later exams for the course, so
+        only register questions of an exam that has been saved.
 
         Args:
             question_content: Question stem text
+            exam_id: Exam the question was saved under (if empty, attributed
+                by the next save_question_index call)
 
         Returns:
             The fingerprint string
         """
         fingerprint = self._generate_fingerprint(question_content)
         self._fingerprints.add(fingerprint)
+        self.question_index.add(fingerprint, question_content, exam_id)
         return fingerprint
 
+    def save_question_index(self, course_id: str, exam_id: str, index_dir: Optional[Path] = None) -> Path:
+        """Attribute newly registered stems to exam_id and persist the index.
+
+        Args:
+            course_id: Course the index belongs to
+            exam_id: Exam document ID the new questions were upserted under
+            index_dir: Override NAT5_PLUS_UNIQUENESS_INDEX_DIR
+
+        Returns:
+            Path of the saved index
+        """
+        self.question_index.assign_exam(exam_id)
+        path = question_index_path(course_id, index_dir)
+        self.question_index.save(path)
+        return path
+
     def _generate_fingerprint(self, content: str) -> str:
         """Generate a content fingerprint.
 
@@ -157,7 +263,7 @@ class UniquenessManager:
         # Hash for compact storage
         return hashlib.sha256(normalized.encode()).hexdigest()[:16]
 
-    def _jaccard_similarity(self, set1: Set[str], set2: Set[str]) -> float:
+    def _jaccard_similarity(self, set1: AbstractSet[str], set2: AbstractSet[str]) -> float:
         """Calculate Jaccard similarity between two sets."""
         if not set1 and not set2:
             return 0.0
@@ -166,6 +272,59 @@ class UniquenessManager:
         return intersection / union if union > 0 else 0.0
 
 
+_question_indexes: Dict[str, QuestionIndex] = {}
+_question_indexes_lock = threading.Lock()
+
+
+async def load_uniqueness_manager(
+    course_id: str,
+    similarity_threshold: float = 0.7,
+    question_similarity_threshold: float = QUESTION_SIMILARITY_THRESHOLD,
+    index_dir: Optional[Path] = None
+) -> UniquenessManager:
+    """Load a course's exam summaries and question index into a UniquenessManager.
+
+    The persisted question index is read from disk once per course per
+    process and reused by later exams for the same course. Entries for exams
+    whose summary no longer exists are dropped.
+
+    Args:
+        course_id: Course to load history for
+        similarity_threshold: Exam-level threshold (see UniquenessManager)
+        question_similarity_threshold: Near-duplicate stem threshold
+        index_dir: Override NAT5_PLUS_UNIQUENESS_INDEX_DIR
+
+    Returns:
+        UniquenessManager sharing the course's cached QuestionIndex
+    """
+    existing_summaries = await load_existing_summaries(course_id)
+
+    path = question_index_path(course_id, index_dir)
+    cache_key = f"{path}:{question_similarity_threshold}"
+    with _question_indexes_lock:
+        question_index = _question_indexes.get(cache_key)
+    if question_index is None:
+        question_index = await asyncio.to_thread(QuestionIndex.load, path, question_similarity_threshold)
+        if existing_summaries:
+            question_index = question_index.retain_exams({s.exam_id for s in existing_summaries})
+        with _question_indexes_lock:
+            question_index = _question_indexes.setdefault(cache_key, question_index)
+        logger.info(f"Loaded question index for {course_id}: {len(question_index)} stems")
+
+    return UniquenessManager(
+        existing_summaries,
+        similarity_threshold=similarity_threshold,
+        question_index=question_index,
+        question_similarity_threshold=question_similarity_threshold
+    )
+
+
+def reset_question_index_cache() -> None:
+    """Forget cached per-course question indexes (files on disk are kept)."""
+    with _question_indexes_lock:
+        _question_indexes.clear()
+
+
 async def load_existing_summaries(course_id: str) -> List[ExamSummary]:
     """Load existing exam summaries from Appwrite.
 
@@ -187,15 +346,19 @@ async def load_existing_summaries(course_id: str) -> List[ExamSummary]:
 
     try:
         from appwrite.query import Query
+        from ..utils.appwrite_pagination import iter_document_pages
 
-        result = databases.list_documents(
-            database_id="default",
-            collection_id="nat5_plus_exam_summaries",
-            queries=[Query.equal("courseId", course_id)]
-        )
+        documents = []
+        async for page in iter_document_pages(
+            databases,
+            "default",
+            "nat5_plus_exam_summaries",
+            query_objects=[Query.equal("courseId", course_id)]
+        ):
+            documents.extend(page)
 
         summaries = []
-        for doc in result["documents"]:
+        for doc in documents:
             summary = ExamSummary(
                 exam_id=doc.get("exam_id", ""),
                 course_id=doc.get("courseId", ""),
@@ -22,7 +22,6 @@ Exit codes:
 
 import argparse
 import asyncio
-import base64
 import json
 import logging
 import sys
@@ -161,8 +160,8 @@ Examples:
 
     diagrams_data = []
     for diagram in diagrams:
-        # Convert image_path to base64 (diagrams_output.json has image_path, not image_base64)
-        # Image paths in diagrams_output.json are absolute paths
+        # Image paths in diagrams_output.json are absolute paths; the upserter
+        # streams each PNG to Storage
         image_path = Path(diagram["image_path"])
 
         if not image_path.exists():
@@ -170,9 +169,6 @@ Examples:
             print_banner(f"❌ FAILED - Image file not found: {image_path}", RED)
             return 1
 
-        with open(image_path, "rb") as img_file:
-            image_base64 = base64.b64encode(img_file.read()).decode('utf-8')
-
         # Extract or assign diagram_index for multi-diagram support
         # If diagram_index is in the JSON, use it; otherwise assign sequential index
         lesson_template_id = diagram["lessonTemplateId"]
@@ -201,7 +197,7 @@ Examples:
             "lesson_template_id": lesson_template_id,
             "card_id": card_id,
             "jsxgraph_json": diagram["jsxgraph_json"],
-            "image_base64": image_base64,  # Converted from PNG file
+            "image_path": str(image_path),
             "diagram_type": diagram["diagram_type"],
             "visual_critique_score": diagram["visual_critique_score"],
             "critique_iterations": diagram["critique_iterations"],
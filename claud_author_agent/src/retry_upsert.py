@@ -11,7 +11,6 @@ Example:
 """
 
 import asyncio
-import base64
 import json
 import logging
 import os
@@ -42,38 +41,26 @@ def load_diagrams_output(workspace_path: str) -> List[Dict[str, Any]]:
     return diagrams
 
 
-def convert_png_to_base64(image_path: str) -> str:
-    """Convert PNG file to base64 string."""
-    if not os.path.exists(image_path):
-        raise FileNotFoundError(f"Image file not found: {image_path}")
-
-    with open(image_path, "rb") as f:
-        image_bytes = f.read()
-
-    return base64.b64encode(image_bytes).decode("utf-8")
-
-
 def transform_diagram_for_upserter(diagram: Dict[str, Any], execution_id: str) -> Dict[str, Any]:
     """Transform diagram data to match batch_upsert_diagrams expected format.
 
     Field mapping:
         - lessonTemplateId → lesson_template_id
         - cardId → card_id
-        - image_path → image_base64 (converted)
+        - image_path (checked, streamed to Storage by the upserter)
         - Add execution_id
         - Handle optional critique fields safely
     """
-    # Convert image to base64
     image_path = diagram["image_path"]
-    logger.info(f"Converting {os.path.basename(image_path)} to base64...")
-    image_base64 = convert_png_to_base64(image_path)
+    if not os.path.exists(image_path):
+        raise FileNotFoundError(f"Image file not found: {image_path}")
 
     # Build upserter-compatible data structure
     transformed = {
         "lesson_template_id": diagram["lessonTemplateId"],
         "card_id": diagram["cardId"],
         "jsxgraph_json": diagram.get("jsxgraph_json", ""),
-        "image_base64": image_base64,
+        "image_path": image_path,
         "diagram_type": diagram.get("diagram_type", "geometry"),
         # Safe access for optional critique fields (fixed in this version)
         "visual_critique_score": diagram.get("visual_critique_score", 0.0),
@@ -46,11 +46,12 @@ import logging
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-import requests
-from requests.exceptions import RequestException, Timeout
+import httpx
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
+from .diagram_http_client import post_render_request
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -376,11 +377,13 @@ def create_desmos_server(workspace_path: str, api_base_url: str, api_key: str =
 
                 logger.info(f"🔧 Desmos: POST to {render_url}")
 
-                response = requests.post(
+                response = await post_render_request(
+                    "desmos",
                     render_url,
-                    json=payload,
+                    payload,
+                    headers,
                     timeout=REQUEST_TIMEOUT,
-                    headers=headers
+                    cache=True
                 )
 
                 # Parse response JSON
@@ -407,7 +410,7 @@ def create_desmos_server(workspace_path: str, api_base_url: str, api_key: str =
                     else:
                         return _build_error_response(
                             code="HTTP_ERROR",
-                            message=f"HTTP {response.status_code}: {response.reason}",
+                            message=f"HTTP {response.status_code}: {response.reason_phrase}",
                             details={"response_body": response.text[:500]},
                             suggestion="Check Desmos expression syntax"
                         )
@@ -451,7 +454,7 @@ def create_desmos_server(workspace_path: str, api_base_url: str, api_key: str =
                     }]
                 }
 
-            except Timeout:
+            except httpx.TimeoutException:
                 return _build_error_response(
                     code="TIMEOUT_ERROR",
                     message=f"DiagramScreenshot service did not respond within {REQUEST_TIMEOUT} seconds",
@@ -459,7 +462,7 @@ def create_desmos_server(workspace_path: str, api_base_url: str, api_key: str =
                     suggestion="Check if service is overloaded or expressions are too complex"
                 )
 
-            except RequestException as e:
+            except httpx.HTTPError as e:
                 return _build_error_response(
                     code="SERVICE_UNREACHABLE",
                     message=f"Failed to connect to DiagramScreenshot service: {str(e)}",
@@ -0,0 +1,230 @@
+"""Shared async HTTP client for the diagram rendering tools.
+
+The JSXGraph, Desmos, Plotly, Imagen and DiagramScreenshot tools used to call
+synchronous ``requests.post`` inside their async MCP handlers: every render
+blocked the event loop and opened a fresh connection. They now go through
+``post_render_request``, which provides:
+
+- One keep-alive ``httpx.AsyncClient`` per event loop (httpx clients can't be
+  shared across loops, and tests/CLIs may run several loops in one process).
+- A per-host concurrency limit matching the renderer's capacity, so parallel
+  diagram agents queue locally instead of overloading the headless browser.
+- Per-tool latency histograms (see ``get_render_latency_stats``).
+- Optional content-addressed PNG caching (``cache=True``, see diagram_render_cache).
+
+Usage:
+    response = await post_render_request("jsxgraph", render_url, payload, headers, timeout=30)
+    response.status_code, response.json(), response.text, response.reason_phrase
+
+Errors are httpx's: ``httpx.TimeoutException`` for timeouts and
+``httpx.HTTPError`` for any other transport failure.
+"""
+
+import asyncio
+import base64
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .diagram_render_cache import get_render_cache, render_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Concurrent renders per host; matches MAX_CONCURRENT_RENDERS in the
+# DiagramScreenshot docker-compose so extra requests wait here, not in Chromium
+MAX_CONCURRENT_RENDERS_PER_HOST = int(os.environ.get("DIAGRAM_MAX_CONCURRENT_RENDERS", 5))
+
+# Keep a couple of spare idle connections above the concurrency limit
+MAX_KEEPALIVE_CONNECTIONS = MAX_CONCURRENT_RENDERS_PER_HOST + 2
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = [100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+class _LoopHTTPState:
+    """Client and per-host semaphores bound to one event loop."""
+
+    def __init__(self):
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=60
+            )
+        )
+        self.host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self.host_limits:
+            self.host_limits[host] = asyncio.Semaphore(MAX_CONCURRENT_RENDERS_PER_HOST)
+        return self.host_limits[host]
+
+
+_loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopHTTPState]" = weakref.WeakKeyDictionary()
+
+_stats_lock = threading.Lock()
+_latency_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def _get_loop_state() -> _LoopHTTPState:
+    loop = asyncio.get_running_loop()
+    state = _loop_states.get(loop)
+    if state is None:
+        state = _LoopHTTPState()
+        _loop_states[loop] = state
+    return state
+
+
+def _record_latency(tool: str, elapsed_ms: float, queued_ms: float, ok: bool) -> None:
+    with _stats_lock:
+        stats = _latency_stats.setdefault(tool, {
+            "requests": 0,
+            "errors": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "total_queued_ms": 0.0,
+            "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        })
+        stats["requests"] += 1
+        if not ok:
+            stats["errors"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["total_queued_ms"] += queued_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+        bucket = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                bucket = i
+                break
+        stats["buckets"][bucket] += 1
+
+
+def _store_rendered_png(cache_key: str, response: httpx.Response) -> None:
+    """Put a successful render response's PNG into the render cache."""
+    if response.status_code != 200:
+        return
+    try:
+        data = response.json()
+    except ValueError:
+        return
+    if isinstance(data, dict) and data.get("success") and data.get("image"):
+        get_render_cache().put(cache_key, base64.b64decode(data["image"]), data.get("metadata", {}))
+
+
+async def post_render_request(
+    tool: str,
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+    cache: bool = False
+) -> httpx.Response:
+    """POST a render request through the shared keep-alive client.
+
+    Args:
+        tool: Tool name for latency stats (e.g. "jsxgraph")
+        url: Render endpoint URL
+        payload: JSON body
+        headers: Request headers
+        timeout: Timeout in seconds for the request itself (time spent
+            waiting for a per-host slot is not counted)
+        cache: Serve/store the PNG via the content-addressed render cache.
+            Only for deterministic renderers returning {success, image, metadata}.
+            A hit returns a synthesised 200 response without touching the network.
+
+    Returns:
+        httpx.Response (any status code)
+
+    Raises:
+        httpx.TimeoutException: If the service doesn't respond in time
+        httpx.HTTPError: If the service is unreachable
+    """
+    cache_key = None
+    if cache:
+        cache_key = render_cache_key(tool, {"endpoint": urlsplit(url).path, "payload": payload})
+        cached = get_render_cache().get(tool, cache_key)
+        if cached is not None:
+            logger.info(f"♻️  {tool}: render cache hit ({cache_key[:12]})")
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "image": base64.b64encode(cached.png_bytes).decode("ascii"),
+                    "metadata": cached.metadata,
+                },
+                request=httpx.Request("POST", url)
+            )
+
+    state = _get_loop_state()
+
+    queued_at = time.perf_counter()
+    async with state.host_limit(url):
+        started_at = time.perf_counter()
+        ok = False
+        try:
+            response = await state.client.post(url, json=payload, headers=headers, timeout=timeout)
+            ok = response.status_code < 400
+        finally:
+            finished_at = time.perf_counter()
+            _record_latency(
+                tool,
+                elapsed_ms=(finished_at - started_at) * 1000,
+                queued_ms=(started_at - queued_at) * 1000,
+                ok=ok
+            )
+
+    if cache_key is not None:
+        _store_rendered_png(cache_key, response)
+    return response
+
+
+def get_render_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """Return per-tool latency stats.
+
+    Returns:
+        Dict of tool name -> {requests, errors, mean_ms, max_ms, mean_queued_ms,
+        histogram_ms: {"<=100": n, ..., ">30000": n}}
+    """
+    labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+    with _stats_lock:
+        return {
+            tool: {
+                "requests": s["requests"],
+                "errors": s["errors"],
+                "mean_ms": round(s["total_ms"] / s["requests"], 1) if s["requests"] else 0.0,
+                "max_ms": round(s["max_ms"], 1),
+                "mean_queued_ms": round(s["total_queued_ms"] / s["requests"], 1) if s["requests"] else 0.0,
+                "histogram_ms": dict(zip(labels, s["buckets"])),
+            }
+            for tool, s in sorted(_latency_stats.items())
+        }
+
+
+def format_render_latency_stats(stats: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+    """Render latency stats as log lines, one per tool."""
+    stats = get_render_latency_stats() if stats is None else stats
+    return [
+        f"{tool}: {s['requests']} requests ({s['errors']} errors), "
+        f"mean {s['mean_ms']}ms, max {s['max_ms']}ms, queued {s['mean_queued_ms']}ms avg"
+        for tool, s in stats.items()
+    ]
+
+
+def reset_render_latency_stats() -> None:
+    """Clear latency stats (e.g. between batch runs or tests)."""
+    with _stats_lock:
+        _latency_stats.clear()
+
+
+async def aclose_diagram_http_client() -> None:
+    """Close the current loop's client (a new one is created on next use)."""
+    state = _loop_states.pop(asyncio.get_running_loop(), None)
+    if state is not None:
+        await state.client.aclose()
@@ -0,0 +1,204 @@
+"""Content-addressed PNG cache for diagram renders.
+
+Critique iterations in DiagramAuthorClaudeAgent and retries in
+batch_diagram_generator often re-render an identical JSXGraph/Desmos/Plotly
+spec or Matplotlib script, each costing a headless-browser (or sandbox)
+render. This cache stores the resulting PNG keyed by a SHA-256 of the
+canonicalised request:
+
+    sha256(json.dumps({"tool": ..., "request": ...}, sort_keys=True, separators=(",", ":")))
+
+``request`` is the full render payload (diagram JSON + render options) for the
+HTTP tools and {code, width, height, dpi} for Matplotlib, so any change to the
+spec or options is a different key.
+
+Entries live on disk as ``<key>.png`` plus a ``<key>.json`` metadata sidecar
+and are evicted least-recently-used once the cache exceeds its size bound.
+
+Configuration:
+    DIAGRAM_RENDER_CACHE_DIR     (default: workspace/.render_cache)
+    DIAGRAM_RENDER_CACHE_MAX_MB  (default: 256; 0 disables the cache)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "workspace" / ".render_cache"
+DEFAULT_MAX_MB = 256
+
+
+@dataclass
+class CachedRender:
+    """A cached PNG and the metadata the renderer returned with it."""
+    png_bytes: bytes
+    metadata: Dict[str, Any]
+
+
+def render_cache_key(tool: str, request: Dict[str, Any]) -> str:
+    """Return the content address for a render request.
+
+    Args:
+        tool: Renderer name (e.g. "jsxgraph") - identical specs for different
+            renderers must not collide
+        request: JSON-serialisable render request (spec + options)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        {"tool": tool, "request": request},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiagramRenderCache:
+    """Size-bounded LRU disk cache of rendered PNGs (thread-safe)."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(
+            os.environ.get("DIAGRAM_RENDER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        )
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("DIAGRAM_RENDER_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> bytes on disk, LRU first
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "bytes_served": 0}
+        self._tool_stats: Dict[str, Dict[str, int]] = {}
+        self._load_index()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.png", self.cache_dir / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU order from file mtimes left by previous runs."""
+        if not self.enabled or not self.cache_dir.exists():
+            return
+        found = []
+        for png_path in self.cache_dir.glob("*.png"):
+            meta_path = png_path.with_suffix(".json")
+            try:
+                size = png_path.stat().st_size + meta_path.stat().st_size
+                found.append((png_path.stat().st_mtime, png_path.stem, size))
+            except OSError:
+                continue
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict_locked()
+
+    def _count(self, tool: str, stat: str) -> None:
+        # Caller holds self._lock
+        self._stats[stat] += 1
+        self._tool_stats.setdefault(tool, {"hits": 0, "misses": 0})[stat] += 1
+
+    def get(self, tool: str, key: str) -> Optional[CachedRender]:
+        """Return the cached render for key, or None (counted as a miss)."""
+        if not self.enabled:
+            return None
+
+        png_path, meta_path = self._paths(key)
+        with self._lock:
+            if key in self._entries:
+                try:
+                    png_bytes = png_path.read_bytes()
+                    metadata = json.loads(meta_path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    # Evicted by another process or half-written - treat as a miss
+                    self._total_bytes -= self._entries.pop(key)
+                else:
+                    self._entries.move_to_end(key)
+                    os.utime(png_path)  # Persist recency for the next run's index
+                    self._count(tool, "hits")
+                    self._stats["bytes_served"] += len(png_bytes)
+                    return CachedRender(png_bytes=png_bytes, metadata=metadata)
+
+            self._count(tool, "misses")
+            return None
+
+    def put(self, key: str, png_bytes: bytes, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Store a render and evict least-recently-used entries over the size bound."""
+        if not self.enabled:
+            return
+
+        png_path, meta_path = self._paths(key)
+        meta_bytes = json.dumps(metadata or {}).encode("utf-8")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for path, data in ((meta_path, meta_bytes), (png_path, png_bytes)):
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write diagram render cache entry {key[:12]}: {e}")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            size = len(png_bytes) + len(meta_bytes)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._stats["stores"] += 1
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self._stats["evictions"] += 1
+            for path in self._paths(key):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss stats for batch summaries."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "by_tool": {tool: dict(s) for tool, s in sorted(self._tool_stats.items())},
+            }
+
+
+_cache: Optional[DiagramRenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> DiagramRenderCache:
+    """Return the process-wide render cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DiagramRenderCache()
+        return _cache
+
+
+def reset_render_cache() -> None:
+    """Forget the process-wide cache object (files on disk are kept)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
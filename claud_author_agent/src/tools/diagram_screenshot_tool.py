@@ -38,11 +38,14 @@ import logging
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
+import httpx
 import requests
-from requests.exceptions import RequestException, Timeout
+from requests.exceptions import RequestException
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
+from .diagram_http_client import post_render_request
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -431,11 +434,13 @@ def create_diagram_screenshot_server_with_workspace(workspace_path: str):
                     "Content-Type": "application/json",
                     "X-API-Key": DIAGRAM_SCREENSHOT_API_KEY
                 }
-                response = requests.post(
+                response = await post_render_request(
+                    "diagram_screenshot",
                     render_url,
-                    json=payload,
+                    payload,
+                    headers,
                     timeout=REQUEST_TIMEOUT,
-                    headers=headers
+                    cache=True
                 )
 
                 # Parse response JSON
@@ -465,7 +470,7 @@ def create_diagram_screenshot_server_with_workspace(workspace_path: str):
                     else:
                         return _build_error_response(
                             code="HTTP_ERROR",
-                            message=f"HTTP {response.status_code}: {response.reason}",
+                            message=f"HTTP {response.status_code}: {response.reason_phrase}",
                             details={"response_body": response.text[:500]},
                             suggestion="Check diagram JSON syntax and DiagramScreenshot service logs"
                         )
@@ -516,7 +521,7 @@ def create_diagram_screenshot_server_with_workspace(workspace_path: str):
                         suggestion="Check workspace permissions and disk space"
                     )
 
-            except Timeout:
+            except httpx.TimeoutException:
                 # FR-040: Throw exception on timeout (no retry, no fallback)
                 return _build_error_response(
                     code="TIMEOUT_ERROR",
@@ -525,7 +530,7 @@ def create_diagram_screenshot_server_with_workspace(workspace_path: str):
                     suggestion="Check if service is overloaded or diagram is too complex"
                 )
 
-            except RequestException as e:
+            except httpx.HTTPError as e:
                 # FR-040: Service unreachable
                 return _build_error_response(
                     code="SERVICE_UNREACHABLE",
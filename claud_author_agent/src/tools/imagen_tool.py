@@ -53,11 +53,12 @@ import logging
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-import requests
-from requests.exceptions import RequestException, Timeout
+import httpx
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
+from .diagram_http_client import post_render_request
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -374,11 +375,12 @@ def create_imagen_server(workspace_path: str, api_base_url: str, api_key: str =
 
                 logger.info(f"🔧 Imagen: POST to {render_url}")
 
-                response = requests.post(
+                response = await post_render_request(
+                    "imagen",
                     render_url,
-                    json=payload,
-                    timeout=REQUEST_TIMEOUT,
-                    headers=headers
+                    payload,
+                    headers,
+                    timeout=REQUEST_TIMEOUT
                 )
 
                 # Parse response
@@ -405,7 +407,7 @@ def create_imagen_server(workspace_path: str, api_base_url: str, api_key: str =
                     else:
                         return _build_error_response(
                             code="HTTP_ERROR",
-                            message=f"HTTP {response.status_code}: {response.reason}",
+                            message=f"HTTP {response.status_code}: {response.reason_phrase}",
                             details={"response_body": response.text[:500]},
                             suggestion="Check prompt content for policy violations"
                         )
@@ -479,14 +481,14 @@ def create_imagen_server(workspace_path: str, api_base_url: str, api_key: str =
                     }]
                 }
 
-            except Timeout:
+            except httpx.TimeoutException:
                 return _build_error_response(
                     code="TIMEOUT_ERROR",
                     message=f"DiagramScreenshot service did not respond within {REQUEST_TIMEOUT} seconds",
                     suggestion="Imagen generation can be slow; try simplifying the prompt"
                 )
 
-            except RequestException as e:
+            except httpx.HTTPError as e:
                 return _build_error_response(
                     code="SERVICE_UNREACHABLE",
                     message=f"Failed to connect to DiagramScreenshot service: {str(e)}",
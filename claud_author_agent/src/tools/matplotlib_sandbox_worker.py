@@ -0,0 +1,135 @@
+"""Long-lived sandbox process for Matplotlib renders.
+
+Launched by matplotlib_worker_pool as ``python matplotlib_sandbox_worker.py
+'<safe_imports_json>'``. Imports matplotlib/numpy once, then serves render
+requests over a line-delimited JSON protocol:
+
+    stdin  <- {"code": "...", "cwd": "...", "fig_width": 8.0, "fig_height": 6.0, "dpi": 100}
+    stdout -> {"ok": true|false, "error": "...", "stderr": "...", "stdout": "..."}
+
+The first line written is {"ready": true} once the imports are done.
+
+Each render gets a fresh globals dict, closed figures and default rcParams,
+and may only import modules listed in SAFE_IMPORTS (or their submodules).
+Exits when stdin closes.
+
+This file is executed as a script, never imported.
+"""
+
+import builtins
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+import warnings
+
+# Keep the protocol channel private: anything the render code (or a C
+# extension) writes to fd 1 goes to stderr instead of corrupting responses.
+_protocol = os.fdopen(os.dup(1), "w", buffering=1, encoding="utf-8")
+os.dup2(2, 1)
+
+warnings.filterwarnings('ignore')
+
+# Force non-interactive backend BEFORE importing pyplot
+import matplotlib  # noqa: E402
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import matplotlib.patches as patches  # noqa: E402
+import matplotlib.lines as mlines  # noqa: E402
+from matplotlib.patches import Arc, FancyArrowPatch, Circle, Polygon, Rectangle, Wedge, PathPatch  # noqa: E402
+from matplotlib.path import Path as MplPath  # noqa: E402
+import numpy as np  # noqa: E402
+import math  # noqa: E402
+
+SAFE_IMPORTS = json.loads(sys.argv[1]) if len(sys.argv) > 1 else []
+_real_import = builtins.__import__
+
+
+def _guarded_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """__import__ for render code: only SAFE_IMPORTS and their submodules."""
+    allowed = level == 0 and any(
+        name == safe or name.startswith(safe + ".") for safe in SAFE_IMPORTS
+    )
+    if not allowed:
+        raise ImportError(
+            f"Import of '{name}' is not allowed in matplotlib code "
+            f"(allowed: {', '.join(SAFE_IMPORTS)})"
+        )
+    return _real_import(name, globals, locals, fromlist, level)
+
+
+_render_builtins = dict(vars(builtins))
+_render_builtins["__import__"] = _guarded_import
+
+# Names the one-shot wrapper used to pre-import for render code
+_PRELUDE = {
+    "sys": sys,
+    "warnings": warnings,
+    "matplotlib": matplotlib,
+    "plt": plt,
+    "patches": patches,
+    "mlines": mlines,
+    "Arc": Arc,
+    "FancyArrowPatch": FancyArrowPatch,
+    "Circle": Circle,
+    "Polygon": Polygon,
+    "Rectangle": Rectangle,
+    "Wedge": Wedge,
+    "PathPatch": PathPatch,
+    "MplPath": MplPath,
+    "np": np,
+    "math": math,
+}
+
+
+def _reset_matplotlib(fig_width: float, fig_height: float, dpi: int) -> None:
+    """Clear state left by the previous render and apply figure defaults."""
+    plt.close('all')
+    matplotlib.rcdefaults()
+    plt.rcParams['figure.figsize'] = [fig_width, fig_height]
+    plt.rcParams['figure.dpi'] = dpi
+    plt.rcParams['savefig.dpi'] = dpi
+    plt.rcParams['savefig.bbox'] = 'tight'
+    plt.rcParams['savefig.facecolor'] = 'white'
+    plt.rcParams['axes.facecolor'] = 'white'
+    plt.rcParams['figure.facecolor'] = 'white'
+
+
+def _render(request: dict) -> dict:
+    _reset_matplotlib(request["fig_width"], request["fig_height"], request["dpi"])
+    os.chdir(request["cwd"])
+
+    render_globals = {"__name__": "__main__", "__builtins__": _render_builtins, **_PRELUDE}
+    out, err = io.StringIO(), io.StringIO()
+
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            exec(compile(request["code"], "<matplotlib>", "exec"), render_globals)
+    except BaseException as e:  # SystemExit from render code is a failed render too
+        err.write(f"MATPLOTLIB_ERROR: {e}\n")
+        err.write(traceback.format_exc())
+        return {"ok": False, "error": str(e), "stderr": err.getvalue(), "stdout": out.getvalue()}
+    finally:
+        plt.close('all')
+
+    return {"ok": True, "stderr": err.getvalue(), "stdout": out.getvalue()}
+
+
+def main() -> None:
+    _protocol.write(json.dumps({"ready": True}) + "\n")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            response = _render(json.loads(line))
+        except Exception as e:
+            response = {"ok": False, "error": f"Worker error: {e}", "stderr": traceback.format_exc(), "stdout": ""}
+        _protocol.write(json.dumps(response) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,13 +14,13 @@ via local Python code execution.
 - Arc and sector diagrams
 
 **LOCAL EXECUTION ARCHITECTURE**: Unlike browser-based tools (Desmos, GeoGebra, JSXGraph),
-Matplotlib runs locally in a sandboxed Python subprocess. The agent generates Python code
+Matplotlib runs locally in a pool of sandboxed Python worker processes. The agent generates Python code
 that uses matplotlib to create the diagram, then executes it to produce a PNG.
 
 Process:
 1. Agent generates matplotlib Python code with OUTPUT_PATH placeholder
 2. Tool injects actual file path for OUTPUT_PATH
-3. Code executes in isolated subprocess with timeout
+3. Code executes in a pre-warmed sandbox worker process with timeout
 4. PNG written to workspace/diagrams/
 5. File path returned to agent
 
@@ -42,17 +42,18 @@ Returns:
     - Failure: {"success": false, "error": {...}} with isError: True
 """
 
+import asyncio
 import json
 import logging
 import os
-import subprocess
-import sys
-import textwrap
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
+from .diagram_render_cache import get_render_cache, render_cache_key
+from .matplotlib_worker_pool import MatplotlibWorkerPool, get_matplotlib_worker_pool
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -134,26 +135,28 @@ def _build_error_response(
     }
 
 
-def _indent_code(code: str, spaces: int = 4) -> str:
-    """Indent each line of code by specified spaces."""
-    indent = " " * spaces
-    lines = code.splitlines()
-    return "\n".join(indent + line for line in lines)
+def _get_render_pool() -> MatplotlibWorkerPool:
+    """Return the shared pool of warm sandbox workers."""
+    return get_matplotlib_worker_pool(safe_imports=SAFE_IMPORTS, timeout=EXECUTION_TIMEOUT)
 
 
-def _execute_matplotlib_sandboxed(
+async def _execute_matplotlib_sandboxed(
     code: str,
     output_path: Path,
     width: int,
     height: int,
     dpi: int
 ) -> Dict[str, Any]:
-    """Execute matplotlib code in isolated subprocess.
+    """Execute matplotlib code in a pre-warmed sandbox worker process.
 
     Security measures:
-    - Runs in subprocess with timeout
+    - Runs in a separate worker process, killed after EXECUTION_TIMEOUT
     - Uses Agg backend (no display required)
-    - Controlled execution environment
+    - Imports restricted to SAFE_IMPORTS (and their submodules)
+    - Fresh globals, closed figures and default rcParams for every render
+
+    The blocking round trip runs in a thread so the event loop stays free.
+    Identical code + size is served from the diagram render cache.
 
     Args:
         code: Python matplotlib code to execute (with OUTPUT_PATH placeholder)
@@ -165,6 +168,18 @@ def _execute_matplotlib_sandboxed(
     Returns:
         Dict with 'success' bool and optional 'error'/'stderr' keys
     """
+    # Same script + size renders the same PNG regardless of card/output path
+    render_cache = get_render_cache()
+    cache_key = render_cache_key(
+        "matplotlib",
+        {"code": code, "width": width, "height": height, "dpi": dpi}
+    )
+    cached = render_cache.get("matplotlib", cache_key)
+    if cached is not None:
+        output_path.write_bytes(cached.png_bytes)
+        logger.info(f"♻️  Matplotlib: render cache hit ({cache_key[:12]}), output: {output_path}")
+        return {"success": True}
+
     # Inject OUTPUT_PATH into code
     exec_code = code.replace("OUTPUT_PATH", f'r"{output_path}"')
 
@@ -172,85 +187,45 @@ def _execute_matplotlib_sandboxed(
     fig_width = width / dpi
     fig_height = height / dpi
 
-    # Create wrapper script with safety measures
-    wrapper = f'''
-import sys
-import warnings
-warnings.filterwarnings('ignore')
-
-# Force non-interactive backend BEFORE importing pyplot
-import matplotlib
-matplotlib.use('Agg')
-
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import matplotlib.lines as mlines
-from matplotlib.patches import Arc, FancyArrowPatch, Circle, Polygon, Rectangle, Wedge, PathPatch
-from matplotlib.path import Path as MplPath
-import numpy as np
-import math
-
-# Set figure defaults
-plt.rcParams['figure.figsize'] = [{fig_width}, {fig_height}]
-plt.rcParams['figure.dpi'] = {dpi}
-plt.rcParams['savefig.dpi'] = {dpi}
-plt.rcParams['savefig.bbox'] = 'tight'
-plt.rcParams['savefig.facecolor'] = 'white'
-plt.rcParams['axes.facecolor'] = 'white'
-plt.rcParams['figure.facecolor'] = 'white'
-
-try:
-{_indent_code(exec_code, 4)}
-except Exception as e:
-    import traceback
-    print(f"MATPLOTLIB_ERROR: {{e}}", file=sys.stderr)
-    traceback.print_exc(file=sys.stderr)
-    sys.exit(1)
-'''
-
-    # Execute with timeout
     try:
-        result = subprocess.run(
-            [sys.executable, "-c", wrapper],
-            capture_output=True,
-            text=True,
-            timeout=EXECUTION_TIMEOUT,
-            cwd=str(output_path.parent),
-            env={**os.environ, "MPLBACKEND": "Agg"}  # Force Agg backend
+        result = await asyncio.to_thread(
+            _get_render_pool().render,
+            exec_code,
+            output_path.parent,
+            fig_width,
+            fig_height,
+            dpi
         )
-
-        if result.returncode == 0 and output_path.exists():
-            logger.info(f"✅ Matplotlib: Code executed successfully, output: {output_path}")
-            return {"success": True}
-        else:
-            error_msg = result.stderr.strip() if result.stderr else "Unknown execution error"
-            # Clean up matplotlib error messages
-            if "MATPLOTLIB_ERROR:" in error_msg:
-                error_msg = error_msg.split("MATPLOTLIB_ERROR:")[1].strip().split("\n")[0]
-            logger.error(f"❌ Matplotlib execution failed: {error_msg}")
-            return {
-                "success": False,
-                "error": error_msg,
-                "stderr": result.stderr,
-                "stdout": result.stdout
-            }
-
-    except subprocess.TimeoutExpired:
-        logger.error(f"❌ Matplotlib execution timed out ({EXECUTION_TIMEOUT}s)")
+    except Exception as e:
+        logger.error(f"❌ Matplotlib sandbox error: {e}")
         return {
             "success": False,
-            "error": f"Matplotlib execution timed out ({EXECUTION_TIMEOUT}s limit)",
-            "stderr": "Timeout"
+            "error": str(e),
+            "stderr": str(e)
         }
 
-    except Exception as e:
-        logger.error(f"❌ Matplotlib subprocess error: {e}")
+    if result["success"] and output_path.exists():
+        logger.info(f"✅ Matplotlib: Code executed successfully, output: {output_path}")
+        render_cache.put(cache_key, output_path.read_bytes(), {"width": width, "height": height, "dpi": dpi})
+        return {"success": True}
+
+    if result.get("timed_out"):
+        logger.error(f"❌ Matplotlib execution timed out ({EXECUTION_TIMEOUT}s)")
         return {
             "success": False,
-            "error": str(e),
-            "stderr": str(e)
+            "error": result["error"],
+            "stderr": result["stderr"]
         }
 
+    error_msg = result.get("error") or "Code finished without writing OUTPUT_PATH"
+    logger.error(f"❌ Matplotlib execution failed: {error_msg}")
+    return {
+        "success": False,
+        "error": error_msg,
+        "stderr": result.get("stderr", ""),
+        "stdout": result.get("stdout", "")
+    }
+
 
 # ═══════════════════════════════════════════════════════════════
 # MCP Tool Implementation Factory
@@ -273,6 +248,8 @@ def create_matplotlib_server(workspace_path: str, api_base_url: str = None, api_
     Example:
         server = create_matplotlib_server("/workspace")
     """
+    # Start sandbox workers now so their matplotlib import overlaps agent start-up
+    _get_render_pool().prewarm()
 
     @tool(
         "render_matplotlib",
@@ -459,7 +436,7 @@ def create_matplotlib_server(workspace_path: str, api_base_url: str = None, api_
             output_path = diagrams_dir / filename
 
             # Execute matplotlib code
-            result = _execute_matplotlib_sandboxed(code, output_path, width, height, dpi)
+            result = await _execute_matplotlib_sandboxed(code, output_path, width, height, dpi)
 
             if result["success"]:
                 logger.info(f"✅ Matplotlib: Diagram rendered successfully: {output_path}")
@@ -523,7 +500,6 @@ if __name__ == "__main__":
     Reads configuration from environment variables:
     - WORKSPACE_PATH: Path to workspace directory (required)
     """
-    import asyncio
 
     # Read configuration from environment
     workspace_path = os.environ.get("WORKSPACE_PATH")
@@ -0,0 +1,291 @@
+"""Pool of pre-warmed Matplotlib sandbox processes.
+
+Spawning ``python -c <wrapper>`` per render pays interpreter start-up plus
+``import matplotlib, numpy`` (often ~1s) every time. This pool keeps a few
+long-lived matplotlib_sandbox_worker.py processes with those imports done and
+hands each render to an idle one.
+
+- Workers are recycled after ``max_renders`` renders, and replaced after a
+  crash or timeout (a timed-out worker is killed, never reused).
+- Replacements are spawned immediately so they warm up before they're needed.
+- ``render`` is blocking; async callers use ``await asyncio.to_thread(...)``.
+
+Usage:
+    pool = get_matplotlib_worker_pool(safe_imports=SAFE_IMPORTS, timeout=EXECUTION_TIMEOUT)
+    pool.prewarm()
+    result = await asyncio.to_thread(pool.render, code, output_dir, fig_w, fig_h, dpi)
+"""
+
+import atexit
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("matplotlib_sandbox_worker.py")
+
+# Renders run concurrently across diagram agents; two warm workers cover the
+# common case without holding much memory (~60MB each)
+POOL_SIZE = int(os.environ.get("MATPLOTLIB_POOL_SIZE", 2))
+
+# Recycle workers periodically so leaked figures/fonts/memory can't accumulate
+MAX_RENDERS_PER_WORKER = int(os.environ.get("MATPLOTLIB_MAX_RENDERS_PER_WORKER", 50))
+
+# Cold start budget for a worker (interpreter + matplotlib import + font cache)
+STARTUP_TIMEOUT = 60
+
+
+class _SandboxWorker:
+    """One sandbox process speaking the line-delimited JSON protocol."""
+
+    def __init__(self, safe_imports: Sequence[str]):
+        self.process = subprocess.Popen(
+            [sys.executable, str(WORKER_SCRIPT), json.dumps(list(safe_imports))],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            env={**os.environ, "MPLBACKEND": "Agg"}  # Force Agg backend
+        )
+        self.renders = 0
+        self.ready = False
+        self.timed_out = False
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _read_line(self, timeout: float) -> Optional[str]:
+        """Read one response line, killing the process if it takes too long.
+
+        Returns None on EOF (crash or kill).
+        """
+        def expire():
+            self.timed_out = True
+            self.process.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        try:
+            line = self.process.stdout.readline()
+        finally:
+            timer.cancel()
+        return line or None
+
+    def wait_ready(self) -> None:
+        """Block until the worker has finished its imports.
+
+        Raises:
+            RuntimeError: If the worker dies or doesn't start in time
+        """
+        if self.ready:
+            return
+        line = self._read_line(STARTUP_TIMEOUT)
+        if line is None or not json.loads(line).get("ready"):
+            raise RuntimeError("Matplotlib sandbox worker failed to start")
+        self.ready = True
+
+    def render(self, request: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """Send one render request.
+
+        Returns:
+            Response dict, or None if the worker died or was killed on timeout
+        """
+        self.renders += 1
+        try:
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return None
+
+        line = self._read_line(timeout)
+        return json.loads(line) if line is not None else None
+
+    def close(self) -> None:
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class MatplotlibWorkerPool:
+    """Bounded pool of warm sandbox workers (thread-safe)."""
+
+    def __init__(
+        self,
+        safe_imports: Sequence[str],
+        timeout: float,
+        size: int = POOL_SIZE,
+        max_renders: int = MAX_RENDERS_PER_WORKER
+    ):
+        if size < 1:
+            raise ValueError(f"Matplotlib pool size must be >= 1, got {size}")
+        self.safe_imports = list(safe_imports)
+        self.timeout = timeout
+        self.size = size
+        self.max_renders = max_renders
+        self._idle: List[_SandboxWorker] = []
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {
+            "renders": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+            "worker_crashes": 0,
+            "timeouts": 0,
+        }
+
+    def _spawn(self) -> _SandboxWorker:
+        # Caller holds self._cond
+        worker = _SandboxWorker(self.safe_imports)
+        self._total += 1
+        self.stats["workers_started"] += 1
+        return worker
+
+    def prewarm(self) -> None:
+        """Start workers up to the pool size (non-blocking; they warm up in the background)."""
+        with self._cond:
+            while not self._closed and self._total < self.size:
+                self._idle.append(self._spawn())
+
+    def _acquire(self) -> _SandboxWorker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Matplotlib worker pool is shut down")
+                if self._idle:
+                    return self._idle.pop()
+                if self._total < self.size:
+                    return self._spawn()
+                self._cond.wait()
+
+    def _release(self, worker: _SandboxWorker, reusable: bool) -> None:
+        with self._cond:
+            if reusable and not self._closed:
+                self._idle.append(worker)
+            else:
+                self._total -= 1
+                worker.close()
+                if not self._closed:
+                    # Start the replacement now so it's warm by the next render
+                    self._idle.append(self._spawn())
+            self._cond.notify()
+
+    def render(
+        self,
+        code: str,
+        cwd: Path,
+        fig_width: float,
+        fig_height: float,
+        dpi: int
+    ) -> Dict[str, Any]:
+        """Execute render code in a warm worker.
+
+        Args:
+            code: Python matplotlib code (OUTPUT_PATH already substituted)
+            cwd: Working directory for the render
+            fig_width: Default figure width in inches
+            fig_height: Default figure height in inches
+            dpi: Default figure/savefig DPI
+
+        Returns:
+            Dict with 'success' bool and 'error'/'stderr'/'stdout' keys on failure,
+            and 'timed_out' when the render exceeded the timeout
+        """
+        worker = self._acquire()
+        reusable = False
+        try:
+            worker.wait_ready()
+            response = worker.render(
+                {
+                    "code": code,
+                    "cwd": str(cwd),
+                    "fig_width": fig_width,
+                    "fig_height": fig_height,
+                    "dpi": dpi
+                },
+                self.timeout
+            )
+
+            with self._cond:
+                self.stats["renders"] += 1
+
+            if response is None:
+                with self._cond:
+                    self.stats["timeouts" if worker.timed_out else "worker_crashes"] += 1
+                if worker.timed_out:
+                    return {
+                        "success": False,
+                        "error": f"Matplotlib execution timed out ({self.timeout}s limit)",
+                        "stderr": "Timeout",
+                        "timed_out": True
+                    }
+                return {
+                    "success": False,
+                    "error": "Matplotlib sandbox worker exited unexpectedly",
+                    "stderr": f"Worker exit code: {worker.process.returncode}"
+                }
+
+            reusable = worker.alive and worker.renders < self.max_renders
+            if not reusable and worker.alive:
+                with self._cond:
+                    self.stats["workers_recycled"] += 1
+
+            if response.get("ok"):
+                return {"success": True, "stdout": response.get("stdout", "")}
+            return {
+                "success": False,
+                "error": response.get("error") or "Unknown execution error",
+                "stderr": response.get("stderr", ""),
+                "stdout": response.get("stdout", "")
+            }
+        finally:
+            self._release(worker, reusable)
+
+    def shutdown(self) -> None:
+        """Kill idle workers; busy workers are killed when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+
+_pool: Optional[MatplotlibWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_matplotlib_worker_pool(safe_imports: Sequence[str], timeout: float) -> MatplotlibWorkerPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MatplotlibWorkerPool(safe_imports=safe_imports, timeout=timeout)
+            logger.debug(f"Created Matplotlib worker pool (size={_pool.size}, max_renders={_pool.max_renders})")
+        return _pool
+
+
+def shutdown_matplotlib_worker_pool() -> None:
+    """Shut down the process-wide pool (a new one is created on next use)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_matplotlib_worker_pool)
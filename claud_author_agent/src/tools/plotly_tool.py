@@ -50,11 +50,12 @@ import logging
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-import requests
-from requests.exceptions import RequestException, Timeout
+import httpx
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
+from .diagram_http_client import post_render_request
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -327,11 +328,13 @@ def create_plotly_server(workspace_path: str, api_base_url: str, api_key: str =
 
                 logger.info(f"🔧 Plotly: POST to {render_url}")
 
-                response = requests.post(
+                response = await post_render_request(
+                    "plotly",
                     render_url,
-                    json=payload,
+                    payload,
+                    headers,
                     timeout=REQUEST_TIMEOUT,
-                    headers=headers
+                    cache=True
                 )
 
                 # Parse response
@@ -358,7 +361,7 @@ def create_plotly_server(workspace_path: str, api_base_url: str, api_key: str =
                     else:
                         return _build_error_response(
                             code="HTTP_ERROR",
-                            message=f"HTTP {response.status_code}: {response.reason}",
+                            message=f"HTTP {response.status_code}: {response.reason_phrase}",
                             details={"response_body": response.text[:500]},
                             suggestion="Check Plotly chart specification"
                         )
@@ -401,14 +404,14 @@ def create_plotly_server(workspace_path: str, api_base_url: str, api_key: str =
                     }]
                 }
 
-            except Timeout:
+            except httpx.TimeoutException:
                 return _build_error_response(
                     code="TIMEOUT_ERROR",
                     message=f"DiagramScreenshot service did not respond within {REQUEST_TIMEOUT} seconds",
                     suggestion="Check if service is overloaded or chart has too many data points"
                 )
 
-            except RequestException as e:
+            except httpx.HTTPError as e:
                 return _build_error_response(
                     code="SERVICE_UNREACHABLE",
                     message=f"Failed to connect to DiagramScreenshot service: {str(e)}",
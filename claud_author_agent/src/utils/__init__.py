@@ -15,6 +15,7 @@ from .appwrite_mcp import (
     create_appwrite_document,
     delete_appwrite_document
 )
+from .appwrite_pool import get_appwrite_connection, get_appwrite_pool_stats
 
 __all__ = [
     "IsolatedFilesystem",
@@ -28,5 +29,7 @@ __all__ = [
     "get_appwrite_document",
     "list_appwrite_documents",
     "create_appwrite_document",
-    "delete_appwrite_document"
+    "delete_appwrite_document",
+    "get_appwrite_connection",
+    "get_appwrite_pool_stats"
 ]
@@ -0,0 +1,85 @@
+"""Non-blocking Appwrite I/O for async callers.
+
+The Appwrite Python SDK is synchronous. Calling it directly inside an
+``async def`` blocks the event loop, so ``asyncio.gather`` over several
+agents serialises on every database round trip. ``run_appwrite`` offloads a
+blocking SDK call to a bounded, process-wide thread pool so database I/O
+overlaps with agent work.
+
+Usage:
+    from .appwrite_async import run_appwrite
+
+    doc = await run_appwrite(
+        databases.get_document,
+        database_id="default",
+        collection_id="courses",
+        document_id=course_id
+    )
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from .appwrite_pool import POOL_MAXSIZE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upper bound on concurrent in-flight Appwrite calls per process. Defaults to
+# the keep-alive pool size so every worker thread can hold a live connection.
+APPWRITE_MAX_WORKERS = int(os.environ.get("APPWRITE_MAX_WORKERS", POOL_MAXSIZE))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_appwrite_executor() -> ThreadPoolExecutor:
+    """Return the shared Appwrite I/O thread pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=APPWRITE_MAX_WORKERS,
+                thread_name_prefix="appwrite-io"
+            )
+            logger.debug(f"Started Appwrite I/O pool with {APPWRITE_MAX_WORKERS} workers")
+        return _executor
+
+
+async def run_appwrite(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking Appwrite SDK call without blocking the event loop.
+
+    Context variables (e.g. logging context) are propagated to the worker
+    thread, matching asyncio.to_thread semantics.
+
+    Args:
+        func: Blocking callable (e.g. databases.list_documents)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+
+    Raises:
+        Whatever func raises (e.g. AppwriteException)
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_appwrite_executor(), call)
+
+
+def shutdown_appwrite_executor(wait: bool = True) -> None:
+    """Shut down the shared pool (a new one is created on next use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
@@ -5,16 +5,20 @@ and uploading files to Appwrite Storage. Extracted from appwrite_mcp.py
 to maintain code quality standards (<500 lines per file).
 """
 
-import json
 import logging
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from .appwrite_pool import get_appwrite_connection
+
 logger = logging.getLogger(__name__)
 
 
 def _get_appwrite_client(mcp_config_path: str):
-    """Helper to initialize Appwrite client from MCP config.
+    """Helper to get the shared Appwrite client for an MCP config.
+
+    The client comes from the process-wide pool in appwrite_pool, so the
+    config is parsed once and HTTP connections are kept alive across calls.
 
     Args:
         mcp_config_path: Path to .mcp.json configuration
@@ -26,42 +30,8 @@ def _get_appwrite_client(mcp_config_path: str):
         FileNotFoundError: If MCP config not found
         ValueError: If credentials missing
     """
-    from appwrite.client import Client
-
-    config_path = Path(mcp_config_path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-    with open(config_path) as f:
-        mcp_config = json.load(f)
-
-    appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-    args = appwrite_config.get("args", [])
-
-    endpoint = None
-    api_key = None
-    project_id = None
-
-    for arg in args:
-        if arg.startswith("APPWRITE_ENDPOINT="):
-            endpoint = arg.split("=", 1)[1]
-        elif arg.startswith("APPWRITE_API_KEY="):
-            api_key = arg.split("=", 1)[1]
-        elif arg.startswith("APPWRITE_PROJECT_ID="):
-            project_id = arg.split("=", 1)[1]
-
-    if not all([endpoint, api_key, project_id]):
-        raise ValueError(
-            f"Missing Appwrite credentials in MCP config. "
-            f"Found: endpoint={bool(endpoint)}, api_key={bool(api_key)}, project_id={bool(project_id)}"
-        )
-
-    client = Client()
-    client.set_endpoint(endpoint)
-    client.set_project(project_id)
-    client.set_key(api_key)
-
-    return client, endpoint, api_key, project_id
+    conn = get_appwrite_connection(mcp_config_path)
+    return conn.client, conn.endpoint, conn.api_key, conn.project_id
 
 
 async def create_appwrite_collection(
@@ -7,8 +7,11 @@ for use in validation and other non-agent operations.
 import json
 import logging
 import subprocess
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+from typing import AsyncIterator, Dict, Any, List, Optional
+
+from .appwrite_async import run_appwrite
+from .appwrite_pagination import DEFAULT_PAGE_SIZE, build_select_fields, iter_document_pages
+from .appwrite_pool import get_appwrite_connection
 
 logger = logging.getLogger(__name__)
 
@@ -41,52 +44,15 @@ async def get_appwrite_document(
 
     try:
         # Import Appwrite SDK for Python
-        from appwrite.client import Client
-        from appwrite.services.databases import Databases
         from appwrite.exception import AppwriteException
 
-        # Load MCP config to get credentials
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        # Extract Appwrite credentials from MCP config
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        # Parse environment variables from args
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError(
-                f"Missing Appwrite credentials in MCP config. "
-                f"Found: endpoint={bool(endpoint)}, api_key={bool(api_key)}, project_id={bool(project_id)}"
-            )
-
-        # Initialize Appwrite client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        databases = Databases(client)
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        databases = get_appwrite_connection(mcp_config_path).databases
 
         # Get document
         try:
-            result = databases.get_document(
+            result = await run_appwrite(
+                databases.get_document,
                 database_id=database_id,
                 collection_id=collection_id,
                 document_id=document_id
@@ -112,19 +78,76 @@ async def get_appwrite_document(
         raise
 
 
+def _parse_query_strings(queries: Optional[List[str]]) -> List[str]:
+    """Convert MCP-style query strings to Appwrite Query objects.
+
+    Args:
+        queries: Query strings like 'equal("subject", "mathematics")'
+
+    Returns:
+        List of Appwrite Query objects (unsupported strings are ignored)
+    """
+    from appwrite.query import Query
+
+    query_objects = []
+    if queries:
+        for query_str in queries:
+            # Parse query string like:
+            # - 'equal("subject", "mathematics")'
+            # - 'equal("sow_order", 1)'
+            # - 'equal("lessonTemplateId", ["id1", "id2", ...])'  # NEW: JSON array support
+            if 'equal(' in query_str:
+                # Extract field and value
+                # Split only on FIRST comma to handle arrays with commas
+                content = query_str.replace('equal(', '').replace(')', '')
+                parts = content.split(',', 1)  # Split on first comma only
+                if len(parts) == 2:
+                    # Strip both double and single quotes from field name
+                    field = parts[0].strip().strip('"').strip("'")
+                    value_str = parts[1].strip()
+
+                    # Check if value is a JSON array
+                    if value_str.startswith('['):
+                        # Parse JSON array (e.g., ["id1", "id2", "id3"])
+                        value = json.loads(value_str)
+                    # Detect if value is quoted (string) or unquoted (numeric)
+                    elif (value_str.startswith('"') and value_str.endswith('"')) or \
+                         (value_str.startswith("'") and value_str.endswith("'")):
+                        value = [value_str.strip('"').strip("'")]  # String value in list
+                    else:
+                        # Try to parse as numeric (int first, then float)
+                        try:
+                            value = [int(value_str)]
+                        except ValueError:
+                            try:
+                                value = [float(value_str)]
+                            except ValueError:
+                                value = [value_str]  # Keep as string in list
+
+                    # Query.equal() expects value to be a list
+                    query_objects.append(Query.equal(field, value))
+
+    return query_objects
+
+
 async def list_appwrite_documents(
     database_id: str,
     collection_id: str,
     queries: Optional[List[str]] = None,
-    mcp_config_path: str = ".mcp.json"
+    mcp_config_path: str = ".mcp.json",
+    select: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """List documents from Appwrite via MCP with optional filters.
 
+    Returns a single page (Appwrite's default limit). Use
+    iter_appwrite_documents() to stream every matching document.
+
     Args:
         database_id: Database ID (e.g., 'sqa_education')
         collection_id: Collection ID (e.g., 'current_sqa')
         queries: Optional list of query strings (e.g., ['equal("subject", "mathematics")'])
         mcp_config_path: Path to .mcp.json configuration
+        select: Optional attribute projection (e.g., ['sow_order'])
 
     Returns:
         List of document dictionaries
@@ -137,88 +160,21 @@ async def list_appwrite_documents(
         logger.info(f"  Filters: {queries}")
 
     try:
-        from appwrite.client import Client
-        from appwrite.services.databases import Databases
         from appwrite.query import Query
         from appwrite.exception import AppwriteException
 
-        # Load MCP config
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        # Extract credentials
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError("Missing Appwrite credentials in MCP config")
-
-        # Initialize client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        databases = Databases(client)
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        databases = get_appwrite_connection(mcp_config_path).databases
 
         # Convert query strings to Query objects
-        query_objects = []
-        if queries:
-            for query_str in queries:
-                # Parse query string like:
-                # - 'equal("subject", "mathematics")'
-                # - 'equal("sow_order", 1)'
-                # - 'equal("lessonTemplateId", ["id1", "id2", ...])'  # NEW: JSON array support
-                if 'equal(' in query_str:
-                    # Extract field and value
-                    # Split only on FIRST comma to handle arrays with commas
-                    content = query_str.replace('equal(', '').replace(')', '')
-                    parts = content.split(',', 1)  # Split on first comma only
-                    if len(parts) == 2:
-                        # Strip both double and single quotes from field name
-                        field = parts[0].strip().strip('"').strip("'")
-                        value_str = parts[1].strip()
-
-                        # Check if value is a JSON array
-                        if value_str.startswith('['):
-                            # Parse JSON array (e.g., ["id1", "id2", "id3"])
-                            value = json.loads(value_str)
-                        # Detect if value is quoted (string) or unquoted (numeric)
-                        elif (value_str.startswith('"') and value_str.endswith('"')) or \
-                             (value_str.startswith("'") and value_str.endswith("'")):
-                            value = [value_str.strip('"').strip("'")]  # String value in list
-                        else:
-                            # Try to parse as numeric (int first, then float)
-                            try:
-                                value = [int(value_str)]
-                            except ValueError:
-                                try:
-                                    value = [float(value_str)]
-                                except ValueError:
-                                    value = [value_str]  # Keep as string in list
-
-                        # Query.equal() expects value to be a list
-                        query_objects.append(Query.equal(field, value))
+        query_objects = _parse_query_strings(queries)
+        if select:
+            query_objects.append(Query.select(build_select_fields(select)))
 
         # List documents
         try:
-            result = databases.list_documents(
+            result = await run_appwrite(
+                databases.list_documents,
                 database_id=database_id,
                 collection_id=collection_id,
                 queries=query_objects if query_objects else []
@@ -241,6 +197,72 @@ async def list_appwrite_documents(
         raise
 
 
+async def iter_appwrite_document_pages(
+    database_id: str,
+    collection_id: str,
+    queries: Optional[List[str]] = None,
+    mcp_config_path: str = ".mcp.json",
+    select: Optional[List[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Stream every matching document page by page (cursor pagination).
+
+    Args:
+        database_id: Database ID (e.g., 'default')
+        collection_id: Collection ID (e.g., 'lesson_templates')
+        queries: Optional list of query strings (e.g., ['equal("courseId", "c1")'])
+        mcp_config_path: Path to .mcp.json configuration
+        select: Optional attribute projection; $id is always included
+        page_size: Documents per request
+
+    Yields:
+        Lists of document dictionaries, one per page
+    """
+    logger.info(f"MCP Stream: Paging documents from {database_id}.{collection_id}")
+    if queries:
+        logger.info(f"  Filters: {queries}")
+
+    databases = get_appwrite_connection(mcp_config_path).databases
+
+    async for page in iter_document_pages(
+        databases,
+        database_id=database_id,
+        collection_id=collection_id,
+        query_objects=_parse_query_strings(queries),
+        select=select,
+        page_size=page_size
+    ):
+        yield page
+
+
+async def iter_appwrite_documents(
+    database_id: str,
+    collection_id: str,
+    queries: Optional[List[str]] = None,
+    mcp_config_path: str = ".mcp.json",
+    select: Optional[List[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream every matching document one at a time.
+
+    Same arguments as iter_appwrite_document_pages(); only one page is held
+    in memory at a time.
+
+    Yields:
+        Document dictionaries
+    """
+    async for page in iter_appwrite_document_pages(
+        database_id=database_id,
+        collection_id=collection_id,
+        queries=queries,
+        mcp_config_path=mcp_config_path,
+        select=select,
+        page_size=page_size
+    ):
+        for document in page:
+            yield document
+
+
 async def create_appwrite_document(
     database_id: str,
     collection_id: str,
@@ -272,45 +294,11 @@ async def create_appwrite_document(
         logger.info(f"  Using auto-generated document_id")
 
     try:
-        from appwrite.client import Client
-        from appwrite.services.databases import Databases
         from appwrite.id import ID
         from appwrite.exception import AppwriteException
 
-        # Load MCP config
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        # Extract credentials
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError("Missing Appwrite credentials in MCP config")
-
-        # Initialize client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        databases = Databases(client)
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        databases = get_appwrite_connection(mcp_config_path).databases
 
         # Auto-generate document ID if not provided
         if document_id is None:
@@ -322,7 +310,8 @@ async def create_appwrite_document(
 
         # Create document
         try:
-            result = databases.create_document(
+            result = await run_appwrite(
+                databases.create_document,
                 database_id=database_id,
                 collection_id=collection_id,
                 document_id=document_id,
@@ -371,48 +360,15 @@ async def update_appwrite_document(
     logger.info(f"MCP Update: Updating document {document_id} in {database_id}.{collection_id}")
 
     try:
-        from appwrite.client import Client
-        from appwrite.services.databases import Databases
         from appwrite.exception import AppwriteException
 
-        # Load MCP config
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        # Extract credentials
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError("Missing Appwrite credentials in MCP config")
-
-        # Initialize client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        databases = Databases(client)
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        databases = get_appwrite_connection(mcp_config_path).databases
 
         # Update document
         try:
-            result = databases.update_document(
+            result = await run_appwrite(
+                databases.update_document,
                 database_id=database_id,
                 collection_id=collection_id,
                 document_id=document_id,
@@ -455,47 +411,14 @@ async def delete_appwrite_document(
     logger.info(f"MCP Delete: Deleting document {document_id} from {database_id}.{collection_id}")
 
     try:
-        from appwrite.client import Client
-        from appwrite.services.databases import Databases
         from appwrite.exception import AppwriteException
 
-        # Load credentials (same pattern as get_document)
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        # Extract Appwrite credentials
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError("Missing Appwrite credentials in MCP config")
-
-        # Initialize client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        databases = Databases(client)
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        databases = get_appwrite_connection(mcp_config_path).databases
 
         # Delete document
-        databases.delete_document(
+        await run_appwrite(
+            databases.delete_document,
             database_id=database_id,
             collection_id=collection_id,
             document_id=document_id
@@ -0,0 +1,106 @@
+"""Cursor-based streaming pagination for Appwrite list queries.
+
+Offset pagination (``Query.offset``) gets slower the deeper you page and
+encourages accumulating whole result sets in memory. These helpers page with
+``Query.cursor_after`` and yield one page at a time, with optional
+``Query.select`` projection so callers that only need a few fields (e.g.
+``$id`` / ``sow_order``) don't pull compressed ``cards`` / ``entries`` blobs.
+
+Usage:
+    async for page in iter_document_pages(databases, "default", "lesson_templates",
+                                          query_objects=[Query.equal("courseId", [cid])],
+                                          select=["sow_order"]):
+        for doc in page:
+            ...
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from .appwrite_async import run_appwrite
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Appwrite caps list responses; 100 keeps each page small while minimising round trips
+DEFAULT_PAGE_SIZE = 100
+
+# Appwrite rejects equal()/contains() queries with more than 100 values
+MAX_QUERY_VALUES = 100
+
+
+def chunked(values: Sequence[T], size: int = MAX_QUERY_VALUES) -> Iterator[List[T]]:
+    """Split values into lists of at most size (for multi-value equal() queries)."""
+    for start in range(0, len(values), size):
+        yield list(values[start:start + size])
+
+
+def build_select_fields(select: Sequence[str]) -> List[str]:
+    """Return a projection list that always includes $id (needed for the cursor)."""
+    fields = list(dict.fromkeys(select))
+    if "$id" not in fields:
+        fields.insert(0, "$id")
+    return fields
+
+
+async def iter_document_pages(
+    databases,
+    database_id: str,
+    collection_id: str,
+    query_objects: Optional[List[str]] = None,
+    select: Optional[Sequence[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield pages of documents using cursor pagination.
+
+    Args:
+        databases: Appwrite Databases service
+        database_id: Database ID
+        collection_id: Collection ID
+        query_objects: Appwrite Query objects (filters/ordering). Must not
+            include limit/offset/cursor queries - those are added here.
+        select: Optional attribute projection ($id is always included)
+        page_size: Documents per request
+
+    Yields:
+        Non-empty lists of document dicts, in collection order
+
+    Raises:
+        AppwriteException: If a page request fails
+    """
+    from appwrite.query import Query
+
+    if page_size < 1:
+        raise ValueError(f"page_size must be >= 1, got {page_size}")
+
+    base_queries = list(query_objects or [])
+    if select:
+        base_queries.append(Query.select(build_select_fields(select)))
+
+    cursor: Optional[str] = None
+    page_count = 0
+
+    while True:
+        page_queries = base_queries + [Query.limit(page_size)]
+        if cursor is not None:
+            page_queries.append(Query.cursor_after(cursor))
+
+        result = await run_appwrite(
+            databases.list_documents,
+            database_id=database_id,
+            collection_id=collection_id,
+            queries=page_queries
+        )
+
+        documents = result.get("documents", [])
+        page_count += 1
+
+        if documents:
+            yield documents
+
+        if len(documents) < page_size:
+            logger.debug(f"Paged {database_id}.{collection_id} in {page_count} request(s)")
+            return
+
+        cursor = documents[-1]["$id"]
@@ -0,0 +1,297 @@
+"""Process-wide pooled Appwrite client registry.
+
+Every Appwrite helper used to re-read ``.mcp.json``, build a fresh
+``appwrite.client.Client`` and pay a new TLS handshake per call. This module
+keeps one client per MCP config path for the lifetime of the process and
+routes all Appwrite SDK HTTP traffic through a keep-alive
+``requests.Session`` (one per endpoint origin) so connections are reused.
+
+Usage:
+    from .appwrite_pool import get_appwrite_connection
+
+    conn = get_appwrite_connection(mcp_config_path)
+    conn.databases.get_document(...)
+    conn.storage.create_file(...)
+"""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing per endpoint. POOL_MAXSIZE bounds how many sockets are
+# kept alive per host and must be >= the number of worker threads issuing
+# Appwrite calls concurrently (see appwrite_async.APPWRITE_MAX_WORKERS).
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+
+@dataclass(frozen=True)
+class AppwriteCredentials:
+    """Appwrite credentials parsed from the MCP server args in .mcp.json."""
+
+    endpoint: str
+    api_key: str
+    project_id: str
+
+
+def load_appwrite_credentials(mcp_config_path: str) -> AppwriteCredentials:
+    """Parse Appwrite credentials from an MCP config file.
+
+    Args:
+        mcp_config_path: Path to .mcp.json configuration
+
+    Returns:
+        AppwriteCredentials with endpoint, api_key and project_id
+
+    Raises:
+        FileNotFoundError: If MCP config not found
+        ValueError: If credentials missing
+    """
+    config_path = Path(mcp_config_path)
+    if not config_path.exists():
+        raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
+
+    with open(config_path) as f:
+        mcp_config = json.load(f)
+
+    appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
+    args = appwrite_config.get("args", [])
+
+    endpoint = None
+    api_key = None
+    project_id = None
+
+    for arg in args:
+        if arg.startswith("APPWRITE_ENDPOINT="):
+            endpoint = arg.split("=", 1)[1]
+        elif arg.startswith("APPWRITE_API_KEY="):
+            api_key = arg.split("=", 1)[1]
+        elif arg.startswith("APPWRITE_PROJECT_ID="):
+            project_id = arg.split("=", 1)[1]
+
+    if not all([endpoint, api_key, project_id]):
+        raise ValueError(
+            f"Missing Appwrite credentials in MCP config. "
+            f"Found: endpoint={bool(endpoint)}, api_key={bool(api_key)}, project_id={bool(project_id)}"
+        )
+
+    return AppwriteCredentials(endpoint=endpoint, api_key=api_key, project_id=project_id)
+
+
+class AppwriteConnection:
+    """A configured Appwrite client plus lazily created service wrappers.
+
+    Instances are shared across the process via get_appwrite_connection();
+    do not mutate the underlying client (headers, endpoint) after creation.
+    """
+
+    def __init__(self, config_path: str, credentials: AppwriteCredentials):
+        from appwrite.client import Client
+
+        self.config_path = config_path
+        self.credentials = credentials
+
+        self.client = Client()
+        self.client.set_endpoint(credentials.endpoint)
+        self.client.set_project(credentials.project_id)
+        self.client.set_key(credentials.api_key)
+
+        self._databases = None
+        self._storage = None
+
+    @property
+    def endpoint(self) -> str:
+        return self.credentials.endpoint
+
+    @property
+    def api_key(self) -> str:
+        return self.credentials.api_key
+
+    @property
+    def project_id(self) -> str:
+        return self.credentials.project_id
+
+    @property
+    def databases(self):
+        """Shared Databases service for this connection."""
+        if self._databases is None:
+            from appwrite.services.databases import Databases
+            self._databases = Databases(self.client)
+        return self._databases
+
+    @property
+    def storage(self):
+        """Shared Storage service for this connection."""
+        if self._storage is None:
+            from appwrite.services.storage import Storage
+            self._storage = Storage(self.client)
+        return self._storage
+
+
+# ═══════════════════════════════════════════════════════════════
+# Keep-alive HTTP sessions
+# ═══════════════════════════════════════════════════════════════
+
+class _SessionRoutedRequests:
+    """Stand-in for the ``requests`` module inside ``appwrite.client``.
+
+    The Appwrite SDK calls the module-level ``requests.request`` for every
+    API call, which opens (and closes) a new connection each time. This shim
+    sends those calls through a per-origin ``requests.Session`` instead and
+    delegates every other attribute to the real ``requests`` module.
+    """
+
+    def __init__(self, requests_module):
+        self._requests = requests_module
+
+    def request(self, method, url, **kwargs):
+        session = _get_session(url)
+        with _lock:
+            _stats["http_requests"] += 1
+        return session.request(method=method, url=url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._requests, name)
+
+
+_lock = threading.RLock()
+_registry: Dict[str, Tuple[int, AppwriteConnection]] = {}
+_sessions: Dict[str, Any] = {}
+_stats: Dict[str, int] = {
+    "clients_created": 0,
+    "client_cache_hits": 0,
+    "http_requests": 0,
+}
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _get_session(url: str):
+    """Return the keep-alive session for the URL's origin, creating it once."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    origin = _origin(url)
+    with _lock:
+        session = _sessions.get(origin)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[origin] = session
+            logger.debug(f"Opened pooled HTTP session for {origin}")
+        return session
+
+
+def _install_session_routing() -> None:
+    """Route Appwrite SDK HTTP calls through pooled sessions (idempotent)."""
+    import appwrite.client as appwrite_client_module
+
+    if not isinstance(appwrite_client_module.requests, _SessionRoutedRequests):
+        appwrite_client_module.requests = _SessionRoutedRequests(appwrite_client_module.requests)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Public API
+# ═══════════════════════════════════════════════════════════════
+
+def get_appwrite_connection(mcp_config_path: str) -> AppwriteConnection:
+    """Get the shared Appwrite connection for an MCP config path.
+
+    The config file is parsed once per process; it is re-read only if its
+    modification time changes.
+
+    Args:
+        mcp_config_path: Path to .mcp.json configuration
+
+    Returns:
+        Cached AppwriteConnection
+
+    Raises:
+        FileNotFoundError: If MCP config not found
+        ValueError: If credentials missing
+    """
+    config_path = Path(mcp_config_path)
+    if not config_path.exists():
+        raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
+
+    key = str(config_path.resolve())
+    mtime = config_path.stat().st_mtime_ns
+
+    with _lock:
+        cached = _registry.get(key)
+        if cached is not None and cached[0] == mtime:
+            _stats["client_cache_hits"] += 1
+            return cached[1]
+
+        credentials = load_appwrite_credentials(mcp_config_path)
+        _install_session_routing()
+        connection = AppwriteConnection(key, credentials)
+        _registry[key] = (mtime, connection)
+        _stats["clients_created"] += 1
+
+    logger.debug(f"Created pooled Appwrite client for {key} (project: {credentials.project_id})")
+    return connection
+
+
+def get_appwrite_pool_stats() -> Dict[str, int]:
+    """Return connection reuse counters for the process-wide pool.
+
+    Returns:
+        Dict with:
+        - clients_created / client_cache_hits: config registry usage
+        - http_requests: Appwrite API calls sent through pooled sessions
+        - connections_opened: TCP/TLS connections actually established
+        - connections_reused: http_requests served on an existing connection
+    """
+    with _lock:
+        stats = dict(_stats)
+        sessions = list(_sessions.values())
+
+    # The same adapter is mounted for http:// and https://, so dedupe first
+    adapters = {id(a): a for s in sessions for a in s.adapters.values()}
+
+    connections_opened = 0
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is not None:
+                connections_opened += pool.num_connections
+
+    stats["connections_opened"] = connections_opened
+    stats["connections_reused"] = max(stats["http_requests"] - connections_opened, 0)
+    return stats
+
+
+def format_appwrite_pool_stats(stats: Optional[Dict[str, int]] = None) -> str:
+    """One-line human readable summary of get_appwrite_pool_stats()."""
+    stats = stats or get_appwrite_pool_stats()
+    return (
+        f"Appwrite pool: {stats['http_requests']} requests over "
+        f"{stats['connections_opened']} connection(s) "
+        f"({stats['connections_reused']} reused), "
+        f"{stats['clients_created']} client(s) created, "
+        f"{stats['client_cache_hits']} cache hit(s)"
+    )
+
+
+def reset_appwrite_pool() -> None:
+    """Close pooled sessions and forget cached clients (useful for testing)."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _registry.clear()
+        for key in _stats:
+            _stats[key] = 0
@@ -14,7 +14,7 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -60,14 +60,23 @@ async def fetch_lesson_orders_from_sow(
 async def check_existing_diagrams_batch(
     course_id: str,
     lesson_orders: List[int],
-    mcp_config_path: str
+    mcp_config_path: str,
+    templates: Optional[Dict[int, Dict[str, Any]]] = None
 ) -> Dict[int, List[tuple]]:
     """Check which diagrams already exist for each lesson.
 
+    Answers every lesson with one equal("lessonTemplateId", [...]) query
+    against lesson_diagrams (chunked at Appwrite's 100-value limit) instead
+    of a template fetch + diagram query per lesson. If a batched query
+    fails, its lessons are re-checked one at a time, so a failure only
+    leaves its own lesson order looking diagram-free.
+
     Args:
         course_id: Course identifier
         lesson_orders: List of lesson order numbers to check
         mcp_config_path: Path to MCP config file
+        templates: Optional pre-fetched sow_order → template mapping
+            (e.g. the one validate_structure_batch used)
 
     Returns:
         Dictionary mapping order → list of (cardId, diagram_context) tuples
@@ -83,50 +92,66 @@ async def check_existing_diagrams_batch(
         >>> existing[1]
         [("card_001", "lesson"), ("card_002", "cfu")]
     """
-    from .diagram_extractor import fetch_lesson_template
-    from .appwrite_mcp import list_appwrite_documents
+    from .diagram_extractor import fetch_lesson_templates_by_order
+    from .appwrite_mcp import iter_appwrite_documents
+    from .appwrite_pagination import chunked
+
+    if templates is None:
+        templates = await fetch_lesson_templates_by_order(
+            course_id=course_id,
+            lesson_orders=lesson_orders,
+            mcp_config_path=mcp_config_path
+        )
 
-    existing = {}
+    existing: Dict[int, List[tuple]] = {order: [] for order in lesson_orders}
+    order_by_template_id: Dict[str, int] = {}
 
     for order in lesson_orders:
-        try:
-            # Fetch lesson template to get lessonTemplateId
-            template = await fetch_lesson_template(
-                course_id=course_id,
-                order=order,
-                mcp_config_path=mcp_config_path
-            )
-
-            if not template:
-                existing[order] = []
-                logger.warning(f"Lesson order {order}: Template not found")
-                continue
-
-            lesson_template_id = template["$id"]
+        template = templates.get(order)
+        if not template:
+            logger.warning(f"Lesson order {order}: Template not found")
+            continue
+        order_by_template_id[template["$id"]] = order
 
-            # Query lesson_diagrams collection
-            diagrams = await list_appwrite_documents(
+    async def query_diagrams(template_ids: List[str]) -> List[Dict[str, Any]]:
+        # Collected in full so a query failing mid-page adds nothing
+        return [
+            diagram async for diagram in iter_appwrite_documents(
                 database_id="default",
                 collection_id="lesson_diagrams",
-                queries=[f'equal("lessonTemplateId", "{lesson_template_id}")'],
-                mcp_config_path=mcp_config_path
+                queries=[f'equal("lessonTemplateId", {json.dumps(template_ids)})'],
+                mcp_config_path=mcp_config_path,
+                select=["lessonTemplateId", "cardId", "diagram_context"]
             )
+        ]
 
-            # Extract (cardId, diagram_context) tuples
-            # Note: list_appwrite_documents returns List[Dict], not {documents: [...]}
-            existing[order] = [
-                (d["cardId"], d.get("diagram_context", "lesson"))
-                for d in diagrams
-            ]
-
-            if existing[order]:
-                logger.info(f"Lesson order {order}: Found {len(existing[order])} existing diagrams")
-            else:
-                logger.info(f"Lesson order {order}: No existing diagrams")
-
+    for chunk in chunked(list(order_by_template_id)):
+        try:
+            diagrams = await query_diagrams(chunk)
         except Exception as e:
-            logger.error(f"Failed to check existing diagrams for order {order}: {e}")
-            existing[order] = []
+            # Retry lesson by lesson so one bad query only blanks its own order
+            logger.warning(
+                f"Batched diagram check failed for {len(chunk)} lessons of course {course_id}; "
+                f"retrying per lesson: {e}"
+            )
+            diagrams = []
+            for template_id in chunk:
+                try:
+                    diagrams.extend(await query_diagrams([template_id]))
+                except Exception as e:
+                    order = order_by_template_id[template_id]
+                    logger.error(f"Failed to check existing diagrams for order {order}: {e}")
+
+        for diagram in diagrams:
+            order = order_by_template_id.get(diagram.get("lessonTemplateId"))
+            if order is not None:
+                existing[order].append((diagram["cardId"], diagram.get("diagram_context", "lesson")))
+
+    for order in order_by_template_id.values():
+        if existing[order]:
+            logger.info(f"Lesson order {order}: Found {len(existing[order])} existing diagrams")
+        else:
+            logger.info(f"Lesson order {order}: No existing diagrams")
 
     return existing
 
@@ -500,7 +525,8 @@ def display_estimates(execution_plan: List[Dict[str, Any]]) -> None:
 def write_batch_summary(
     batch_id: str,
     results: List[Dict[str, Any]],
-    log_dir: Path
+    log_dir: Path,
+    extra_sections: Optional[Dict[str, Any]] = None
 ) -> None:
     """Write batch execution summary to JSON file.
 
@@ -508,6 +534,7 @@ def write_batch_summary(
         batch_id: Unique batch execution ID
         results: List of execution results from execute_diagram_batch()
         log_dir: Directory to write summary file
+        extra_sections: Optional top-level sections to include (e.g. render latency stats)
 
     Creates:
         {log_dir}/batch_summary.json with metrics and results
@@ -539,6 +566,7 @@ def write_batch_summary(
             "avg_time_per_lesson_seconds": int(total_time / total) if total > 0 else 0,
             "avg_cost_per_lesson_usd": round(total_cost / total, 4) if total > 0 else 0
         },
+        **(extra_sections or {}),
         "results": results
     }
 
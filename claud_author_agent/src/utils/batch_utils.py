@@ -12,8 +12,8 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
-from .appwrite_mcp import list_appwrite_documents
-from .compression import parse_sow_entries
+from .appwrite_mcp import list_appwrite_documents, iter_appwrite_documents
+from .sow_cache import load_sow_entries
 
 logger = logging.getLogger(__name__)
 
@@ -56,17 +56,13 @@ async def fetch_sow_entries(
     sow_doc = sow_docs[0]
 
     # Parse entries field (handles all formats: storage bucket, compressed, uncompressed)
-    # Uses unified parse_sow_entries() helper that supports:
-    # - Storage bucket: "storage:<file_id>" - fetch from bucket, decompress
-    # - TypeScript "gzip:" prefix: inline compressed
-    # - Python legacy raw base64: inline compressed
-    # - Uncompressed JSON: legacy format
-    entries_raw = sow_doc.get('entries', [])
-    entries = await parse_sow_entries(
-        entries_raw=entries_raw,
+    # through the SOW cache so the per-lesson agents reuse this parse
+    sow = await load_sow_entries(
+        sow_doc=sow_doc,
         mcp_config_path=mcp_config_path,
         courseId=courseId
     )
+    entries = sow.entries
 
     if not entries:
         raise ValueError(f"SOW document has no entries for courseId '{courseId}'")
@@ -105,16 +101,22 @@ async def check_existing_lessons(
     logger.info(f"Checking existing lessons for courseId '{courseId}' with model_version='claud_Agent_sdk'...")
 
     # Query lesson_templates for this course AND model_version == "claud_Agent_sdk"
-    # This filters out all lessons created by other systems
-    lessons = await list_appwrite_documents(
-        database_id="default",
-        collection_id="lesson_templates",
-        queries=[
-            f'equal("courseId", "{courseId}")',
-            'equal("model_version", "claud_Agent_sdk")'
-        ],
-        mcp_config_path=mcp_config_path
-    )
+    # This filters out all lessons created by other systems.
+    # Cursor-paged and projected: only the fields below are fetched, never the
+    # compressed cards payload, and courses with >25 lessons are fully covered.
+    lessons = [
+        lesson
+        async for lesson in iter_appwrite_documents(
+            database_id="default",
+            collection_id="lesson_templates",
+            queries=[
+                f'equal("courseId", "{courseId}")',
+                'equal("model_version", "claud_Agent_sdk")'
+            ],
+            mcp_config_path=mcp_config_path,
+            select=["sow_order", "model_version", "$createdAt"]
+        )
+    ]
 
     logger.info(f"Database returned {len(lessons)} lessons")
 
@@ -1,27 +1,245 @@
-"""Compression utilities for large JSON fields using gzip + base64.
+"""Compression utilities for large JSON fields (gzip or zstd + base64).
 
 Reduces database field sizes to fit within Appwrite's field size limits.
 Supports both entries arrays and metadata objects.
 
+This is the single codec for every compressed field the author agents write
+(SOW entries, lesson cards, mock exam sections, walkthroughs, Nat5+ exams).
 Mirrors TypeScript compression.ts for consistency across Python/TypeScript code.
 
+Encoded formats (all readers here auto-detect them):
+- "gzip:<base64>"  - TypeScript format, the default written by compress_json_gzip_base64
+- "<base64>"       - raw base64 gzip (Python legacy, still written for lesson cards)
+- "zstd:<base64>"  - zstd frame; faster to encode/decode and smaller than gzip -9.
+                     Opt-in only: the frontend (pako) cannot read it yet, and it
+                     needs the optional ``zstandard`` package.
+
+Configuration:
+    CONTENT_COMPRESSION_CODEC  (default: gzip) - "gzip" or "zstd"
+    CONTENT_COMPRESSION_GZIP_LEVEL  (default: 9, range 0-9)
+    CONTENT_COMPRESSION_ZSTD_LEVEL  (default: 10, range 1-22)
+
 Also provides unified parsing for SOW entries that may be stored:
-- Inline as compressed gzip+base64 (TypeScript or Python format)
+- Inline as compressed gzip/zstd+base64 (TypeScript or Python format)
 - In Appwrite Storage bucket with reference "storage:<file_id>"
 - As uncompressed JSON (legacy)
 """
 
 import base64
+import binascii
 import gzip
 import json
 import logging
-from typing import Any, Dict, List, Union
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 # Match TypeScript compression prefix for cross-platform compatibility
 # TypeScript uses "gzip:" prefix to identify compressed data
 COMPRESSION_PREFIX = "gzip:"
+GZIP_PREFIX = COMPRESSION_PREFIX
+ZSTD_PREFIX = "zstd:"
+
+SUPPORTED_CODECS = ("gzip", "zstd")
+DEFAULT_LEVELS = {"gzip": 9, "zstd": 10}
+LEVEL_RANGES = {"gzip": (0, 9), "zstd": (1, 22)}
+
+DEFAULT_CODEC = os.environ.get("CONTENT_COMPRESSION_CODEC", "gzip")
+# Levels are configured per codec: gzip and zstd use different scales, so a
+# single shared setting would be invalid for one of them.
+LEVEL_ENV_VARS = {
+    "gzip": "CONTENT_COMPRESSION_GZIP_LEVEL",
+    "zstd": "CONTENT_COMPRESSION_ZSTD_LEVEL",
+}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_BASE64_PATTERN = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Codec - one compress/decompress path for every compressed field
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class CompressionResult:
+    """Encoded payload plus the size stats gathered while producing it.
+
+    Sizes are in characters, as Appwrite counts them against field limits.
+    """
+    encoded: str
+    codec: str
+    level: int
+    original_size: int
+    compressed_size: int
+    encode_ms: float
+
+    @property
+    def ratio(self) -> float:
+        """Compressed size as a percentage of the original."""
+        return (self.compressed_size / self.original_size) * 100 if self.original_size else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return stats in the get_compression_stats() format (plus codec/level)."""
+        return {
+            "original": self.original_size,
+            "compressed": self.compressed_size,
+            "ratio": f"{self.ratio:.1f}%",
+            "savings": f"{100 - self.ratio:.1f}%",
+            "codec": self.codec,
+            "level": self.level,
+        }
+
+
+def _zstandard():
+    """Import the optional zstd backend."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ValueError(
+            "zstd compression requires the optional 'zstandard' package "
+            "(pip install zstandard)"
+        )
+    return zstandard
+
+
+def _resolve_codec(codec: Optional[str], level: Optional[int]):
+    codec = codec or DEFAULT_CODEC
+    if codec not in SUPPORTED_CODECS:
+        raise ValueError(f"Unsupported compression codec '{codec}'. Supported: {SUPPORTED_CODECS}")
+    if level is None:
+        env_level = os.environ.get(LEVEL_ENV_VARS[codec])
+        try:
+            level = int(env_level) if env_level else DEFAULT_LEVELS[codec]
+        except ValueError:
+            raise ValueError(f"{LEVEL_ENV_VARS[codec]} must be an integer, got '{env_level}'")
+    low, high = LEVEL_RANGES[codec]
+    if not low <= level <= high:
+        raise ValueError(f"Invalid {codec} compression level {level}. Expected {low}-{high}")
+    return codec, level
+
+
+def compress_bytes(raw: bytes, codec: Optional[str] = None, level: Optional[int] = None) -> bytes:
+    """Compress bytes with the given codec (gzip or zstd).
+
+    Args:
+        raw: Bytes to compress
+        codec: "gzip" or "zstd" (default: CONTENT_COMPRESSION_CODEC)
+        level: Codec level (default: CONTENT_COMPRESSION_<CODEC>_LEVEL or the codec default)
+
+    Returns:
+        A complete gzip member or zstd frame
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable, or the level is
+            out of range for it
+    """
+    codec, level = _resolve_codec(codec, level)
+    if codec == "zstd":
+        return _zstandard().ZstdCompressor(level=level).compress(raw)
+    # mtime=0 keeps output deterministic for identical input
+    return gzip.compress(raw, compresslevel=level, mtime=0)
+
+
+def decompress_bytes(blob: bytes) -> bytes:
+    """Decompress a gzip member or zstd frame, detected by its magic number.
+
+    Raises:
+        ValueError: If blob is neither gzip nor zstd, or is corrupt
+    """
+    if blob[:2] == _GZIP_MAGIC:
+        try:
+            return gzip.decompress(blob)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Corrupt gzip data: {e}")
+    if blob[:4] == _ZSTD_MAGIC:
+        zstandard = _zstandard()
+        try:
+            # max_output_size covers frames written without a content size
+            return zstandard.ZstdDecompressor().decompress(blob, max_output_size=1 << 30)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupt zstd data: {e}")
+    raise ValueError("Data is neither gzip nor zstd compressed")
+
+
+def compress_text(
+    text: str,
+    codec: Optional[str] = None,
+    level: Optional[int] = None,
+    prefix: bool = True
+) -> CompressionResult:
+    """Compress a string to "<codec>:<base64>" and measure it in the same pass.
+
+    Args:
+        text: String to compress (usually serialised JSON)
+        codec: "gzip" or "zstd" (default: CONTENT_COMPRESSION_CODEC)
+        level: Codec level (default: CONTENT_COMPRESSION_<CODEC>_LEVEL or the codec default)
+        prefix: Add the codec prefix. Only gzip may be written without one
+            (raw base64 gzip, the Python legacy format readers still expect
+            for some fields); zstd is always prefixed.
+
+    Returns:
+        CompressionResult with the encoded string and its size stats
+    """
+    codec, level = _resolve_codec(codec, level)
+    started = time.perf_counter()
+    b64 = base64.b64encode(compress_bytes(text.encode('utf-8'), codec, level)).decode('ascii')
+    if prefix or codec != "gzip":
+        b64 = (ZSTD_PREFIX if codec == "zstd" else GZIP_PREFIX) + b64
+    return CompressionResult(
+        encoded=b64,
+        codec=codec,
+        level=level,
+        original_size=len(text),
+        compressed_size=len(b64),
+        encode_ms=(time.perf_counter() - started) * 1000
+    )
+
+
+def compress_json(
+    data: Any,
+    codec: Optional[str] = None,
+    level: Optional[int] = None,
+    prefix: bool = True
+) -> CompressionResult:
+    """Serialise data to JSON once and compress it (see compress_text).
+
+    Raises:
+        ValueError: If data is not JSON-serializable
+    """
+    try:
+        json_str = json.dumps(data)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Failed to compress JSON: {e}")
+    return compress_text(json_str, codec=codec, level=level, prefix=prefix)
+
+
+def decompress_text(data: str) -> str:
+    """Decode any compressed format written by compress_text back to a string.
+
+    Accepts "gzip:<b64>", "zstd:<b64>" and raw base64 gzip/zstd.
+
+    Raises:
+        ValueError: If data is not a compressed payload or is corrupt
+    """
+    if data.startswith(GZIP_PREFIX):
+        b64_data = data[len(GZIP_PREFIX):]
+    elif data.startswith(ZSTD_PREFIX):
+        b64_data = data[len(ZSTD_PREFIX):]
+    else:
+        b64_data = data
+    try:
+        blob = base64.b64decode(b64_data, validate=True)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid base64 data: {e}")
+    try:
+        return decompress_bytes(blob).decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Decompressed data is not UTF-8: {e}")
 
 
 def compress_json_gzip_base64(data: Any) -> str:
@@ -29,6 +247,7 @@ def compress_json_gzip_base64(data: Any) -> str:
 
     Format matches TypeScript compressJSON() from compression.ts.
     Adds "gzip:" prefix to identify compressed data format for cross-platform compatibility.
+    With CONTENT_COMPRESSION_CODEC=zstd the result is "zstd:"-prefixed instead.
 
     Compression ratio: typically ~70% reduction for large JSON structures.
 
@@ -47,33 +266,17 @@ def compress_json_gzip_base64(data: Any) -> str:
         >>> print(len(json.dumps(entries)), "->", len(compressed))
         >>> assert compressed.startswith("gzip:")  # Cross-platform format
     """
-    try:
-        # Step 1: Convert to JSON string
-        json_str = json.dumps(data)
-
-        # Step 2: Encode to UTF-8 bytes
-        json_bytes = json_str.encode('utf-8')
-
-        # Step 3: Compress with gzip
-        compressed_bytes = gzip.compress(json_bytes, compresslevel=9)
-
-        # Step 4: Base64 encode to string
-        b64_encoded = base64.b64encode(compressed_bytes).decode('ascii')
-
-        # Step 5: Add prefix to match TypeScript format (gzip:)
-        return COMPRESSION_PREFIX + b64_encoded
-
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Failed to compress JSON: {e}")
+    return compress_json(data).encoded
 
 
 def decompress_json_gzip_base64(data: str) -> Any:
-    """Decompress gzip+base64 JSON data with smart format detection.
+    """Decompress gzip/zstd+base64 JSON data with smart format detection.
 
     Handles multiple compression formats for cross-platform compatibility:
     1. TypeScript format: "gzip:H4sI..." (with "gzip:" prefix)
-    2. Python legacy format: "H4sI..." (raw base64, no prefix)
-    3. Uncompressed format: "{...}" or "[...]" (fallback for backward compatibility)
+    2. zstd format: "zstd:KLUv/..." (with "zstd:" prefix)
+    3. Python legacy format: "H4sI..." (raw base64, no prefix)
+    4. Uncompressed format: "{...}" or "[...]" (fallback for backward compatibility)
 
     Args:
         data: Compressed or uncompressed JSON string
@@ -94,37 +297,19 @@ def decompress_json_gzip_base64(data: str) -> Any:
         raise ValueError(f"Expected string, got {type(data).__name__}")
 
     try:
-        # Try 1: Check for TypeScript "gzip:" prefix format
-        if data.startswith(COMPRESSION_PREFIX):
-            logger.debug("[compression] Detected TypeScript format (with gzip: prefix)")
-            # Step 1: Remove prefix
-            b64_data = data[len(COMPRESSION_PREFIX):]
-            # Step 2: Base64 decode
-            compressed_bytes = base64.b64decode(b64_data)
-            # Step 3: Decompress gzip
-            json_bytes = gzip.decompress(compressed_bytes)
-            # Step 4: Decode UTF-8
-            json_str = json_bytes.decode('utf-8')
-            # Step 5: Parse JSON
-            return json.loads(json_str)
+        # Try 1: Prefixed formats ("gzip:" from TypeScript/Python, "zstd:" from Python)
+        if data.startswith((GZIP_PREFIX, ZSTD_PREFIX)):
+            logger.debug(f"[compression] Detected prefixed format ({data[:4]})")
+            return json.loads(decompress_text(data))
 
         # Try 2: Check if looks like raw base64-gzip (Python legacy format)
         # Base64 data only contains: A-Z, a-z, 0-9, +, /, and = for padding
         if _is_likely_base64(data):
-            logger.debug("[compression] Attempting raw base64-gzip decompression (Python legacy format)")
+            logger.debug("[compression] Attempting raw base64 decompression (Python legacy format)")
             try:
-                # Step 1: Base64 decode (no prefix to strip)
-                compressed_bytes = base64.b64decode(data, validate=True)
-                # Step 2: Check if it looks like gzip (magic number: 1f 8b)
-                if len(compressed_bytes) >= 2 and compressed_bytes[0:2] == b'\x1f\x8b':
-                    # Step 3: Decompress gzip
-                    json_bytes = gzip.decompress(compressed_bytes)
-                    # Step 4: Decode UTF-8
-                    json_str = json_bytes.decode('utf-8')
-                    # Step 5: Parse JSON
-                    return json.loads(json_str)
+                return json.loads(decompress_text(data))
             except Exception as base64_error:
-                logger.debug(f"[compression] Base64-gzip decompression failed: {base64_error}")
+                logger.debug(f"[compression] Raw base64 decompression failed: {base64_error}")
                 # Fall through to JSON parsing
 
         # Try 3: Assume uncompressed JSON (backward compatibility)
@@ -152,9 +337,7 @@ def _is_likely_base64(data: str) -> bool:
         return False
 
     # Check if string matches base64 pattern
-    import re
-    base64_pattern = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
-    if not base64_pattern.match(data):
+    if not _BASE64_PATTERN.match(data):
         logger.debug("[compression] String does not match base64 pattern")
         return False
 
@@ -170,7 +353,9 @@ def _is_likely_base64(data: str) -> bool:
 def get_compression_stats(data: Any) -> dict:
     """Calculate and return compression statistics.
 
-    Useful for logging and debugging compression effectiveness.
+    Useful for logging and debugging compression effectiveness. Callers that
+    also need the compressed string should use compress_json(data) and read
+    both from the result rather than compressing twice.
 
     Args:
         data: JSON-serializable object
@@ -188,21 +373,7 @@ def get_compression_stats(data: Any) -> dict:
         >>> print(f"Compressed to {stats['ratio']} ({stats['savings']} savings)")
     """
     try:
-        original_json = json.dumps(data)
-        original_size = len(original_json)
-
-        compressed_data = compress_json_gzip_base64(data)
-        compressed_size = len(compressed_data)
-
-        ratio = (compressed_size / original_size) * 100
-        savings = 100 - ratio
-
-        return {
-            "original": original_size,
-            "compressed": compressed_size,
-            "ratio": f"{ratio:.1f}%",
-            "savings": f"{savings:.1f}%"
-        }
+        return compress_json(data).stats()
 
     except Exception as e:
         logger.error(f"Failed to calculate compression stats: {e}")
@@ -215,25 +386,27 @@ def get_compression_stats(data: Any) -> dict:
 
 
 def is_compressed(data: str) -> bool:
-    """Check if a string appears to be gzip+base64 compressed data.
+    """Check if a string appears to be compressed data written by this module.
 
-    Note: This is a heuristic check. Compression is not explicitly marked
-    in Python (unlike TypeScript with "gzip:" prefix).
+    Recognises the "gzip:"/"zstd:" prefixes and raw base64 gzip/zstd
+    (heuristic: decodes the base64 and checks the magic number).
 
     Args:
         data: String to check
 
     Returns:
-        True if data looks like base64-encoded gzip (heuristic)
+        True if data looks like compressed data
     """
     if not isinstance(data, str) or len(data) < 20:
         return False
+    if data.startswith((GZIP_PREFIX, ZSTD_PREFIX)):
+        return True
 
     try:
         # Try to decode as base64
         decoded = base64.b64decode(data, validate=True)
-        # Check if it starts with gzip magic number (1f 8b)
-        return len(decoded) >= 2 and decoded[0:2] == b'\x1f\x8b'
+        # Check for the gzip (1f 8b) or zstd (28 b5 2f fd) magic number
+        return decoded[:2] == _GZIP_MAGIC or decoded[:4] == _ZSTD_MAGIC
     except Exception:
         return False
 
@@ -4,6 +4,7 @@ Provides functions for:
 1. Fetching lesson templates from Appwrite
 2. LLM-based card eligibility analysis (identifying cards that need diagrams)
 3. Filtering cards requiring diagram generation
+4. Deterministic pre-filter that rejects obvious no-diagram cards before the LLM
 
 Key Design Decisions:
 - LLM-based eligibility (FR-014, FR-015, FR-016) instead of keyword heuristics
@@ -22,10 +23,14 @@ Usage:
 
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
-from .appwrite_mcp import get_appwrite_document, list_appwrite_documents
+from .appwrite_mcp import get_appwrite_document, list_appwrite_documents, iter_appwrite_documents
+from .appwrite_pagination import MAX_QUERY_VALUES, chunked
 from .compression import decompress_json_gzip_base64
 
 logger = logging.getLogger(__name__)
@@ -92,17 +97,7 @@ async def fetch_lesson_template(
 
         # Decompress cards field if compressed (gzip+base64)
         # Cards may be stored as compressed string to fit within Appwrite size limits
-        cards = template.get("cards", [])
-        if isinstance(cards, str):
-            logger.info(f"Decompressing cards field (compressed format detected)...")
-            try:
-                cards = decompress_json_gzip_base64(cards)
-                template["cards"] = cards
-                logger.info(f"✓ Cards decompressed successfully")
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to decompress cards field for lesson template {lesson_template_id}: {e}"
-                )
+        cards = decode_lesson_template_cards(template)
 
         card_count = len(cards)
 
@@ -124,6 +119,93 @@ async def fetch_lesson_template(
         ) from e
 
 
+def decode_lesson_template_cards(template: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Decompress a template's cards field in place (no-op if already decoded).
+
+    Args:
+        template: Lesson template document
+
+    Returns:
+        The decoded cards list
+
+    Raises:
+        ValueError: If the cards field cannot be decompressed
+    """
+    cards = template.get("cards", [])
+    if isinstance(cards, str):
+        lesson_template_id = template.get("$id", template.get("lessonTemplateId", "UNKNOWN"))
+        logger.info(f"Decompressing cards field (compressed format detected)...")
+        try:
+            cards = decompress_json_gzip_base64(cards)
+        except Exception as e:
+            raise ValueError(
+                f"Failed to decompress cards field for lesson template {lesson_template_id}: {e}"
+            )
+        template["cards"] = cards
+        logger.info(f"✓ Cards decompressed successfully")
+    return cards
+
+
+async def fetch_lesson_templates_by_order(
+    course_id: str,
+    lesson_orders: List[int],
+    mcp_config_path: str = ".mcp.json"
+) -> Dict[int, Dict[str, Any]]:
+    """Fetch the lesson templates for several orders with one paged query.
+
+    Batch counterpart of fetch_lesson_template() for pre-flight checks that
+    touch every lesson. Cards are NOT decompressed here - call
+    decode_lesson_template_cards() per template (it decodes in place, so
+    every consumer of the returned dict shares the decoded cards).
+
+    Args:
+        course_id: Course identifier (e.g., "course_c84474")
+        lesson_orders: sow_order values to fetch
+        mcp_config_path: Path to MCP configuration file
+
+    Returns:
+        dict: sow_order → lesson template document. Orders with no template
+        are absent from the result.
+
+    Raises:
+        Exception: If Appwrite query fails (fast-fail)
+    """
+    wanted = sorted(set(lesson_orders))
+    templates: Dict[int, Dict[str, Any]] = {}
+    if not wanted:
+        return templates
+
+    logger.info(f"Fetching {len(wanted)} lesson templates for courseId={course_id} (batched)")
+
+    try:
+        for chunk in chunked(wanted, MAX_QUERY_VALUES):
+            async for template in iter_appwrite_documents(
+                database_id="default",
+                collection_id="lesson_templates",
+                queries=[
+                    f'equal("courseId", "{course_id}")',
+                    f'equal("sow_order", {json.dumps(chunk)})'
+                ],
+                mcp_config_path=mcp_config_path
+            ):
+                order = template.get("sow_order")
+                if order in templates:
+                    # Same policy as fetch_lesson_template(): keep the first match
+                    logger.warning(
+                        f"Multiple lesson templates found for courseId='{course_id}', order={order}. "
+                        f"Using first result. This may indicate a data integrity issue."
+                    )
+                    continue
+                templates[order] = template
+    except Exception as e:
+        raise Exception(
+            f"Failed to fetch lesson templates for courseId='{course_id}': {str(e)}"
+        ) from e
+
+    logger.info(f"✓ Found {len(templates)}/{len(wanted)} lesson templates for course {course_id}")
+    return templates
+
+
 async def query_all_lesson_templates(
     course_id: str,
     mcp_config_path: str = ".mcp.json"
@@ -224,6 +306,11 @@ async def extract_diagram_cards(
             "Provide a DiagramAuthorClaudeClient instance."
         )
 
+    if PREFILTER_ENABLED:
+        cards, _ = prefilter_cards(cards)
+        if not cards:
+            return []
+
     logger.info(f"Analyzing {len(cards)} cards for JSXGraph diagram eligibility using LLM...")
 
     # Use LLM-based semantic analysis
@@ -457,3 +544,149 @@ def _simple_eligibility_heuristic(cards: List[Dict[str, Any]]) -> List[Dict[str,
     )
 
     return eligible_cards
+
+
+# ═══════════════════════════════════════════════════════════════
+# Deterministic Pre-filter (before LLM eligibility)
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class PrefilterRules:
+    """Rules for rejecting obvious no-diagram cards before LLM analysis.
+
+    A card is rejected only when none of its title, explainer or CFU text
+    shows a visual signal (keyword, coordinate pair, angle/measurement,
+    visual CFU type). Everything else is forwarded to the LLM, so the rules
+    should err towards forwarding: a false rejection loses a diagram, a
+    false forward only costs tokens.
+
+    Attributes:
+        visual_keywords: Whole-word terms that suggest visualizable content
+        visual_patterns: Regexes for coordinates, angles, measured lengths, etc.
+        visual_cfu_types: CFU types that always need the LLM (e.g. "graph")
+        always_forward_card_types: cardType values never rejected
+        text_fields: Card fields scanned (cfu is always scanned)
+    """
+    visual_keywords: Tuple[str, ...] = (
+        # Geometry / spatial
+        "triangle", "rectangle", "circle", "square", "polygon", "angle", "angles",
+        "parallel", "perpendicular", "radius", "diameter", "circumference",
+        "area", "perimeter", "volume", "shape", "shapes", "cube", "cuboid",
+        "prism", "cylinder", "sphere", "cone", "pyramid", "net", "symmetry",
+        "reflection", "rotation", "translation", "enlargement", "bearing",
+        "bearings", "pythagoras", "hypotenuse", "trigonometry", "sohcahtoa",
+        "scale", "compass", "protractor", "vector", "vectors",
+        # Graphs / coordinates
+        "graph", "graphs", "plot", "sketch", "axis", "axes", "coordinate",
+        "coordinates", "gradient", "slope", "intercept", "parabola", "quadratic",
+        "linear", "function", "number line", "grid", "straight line",
+        # Statistics / data display
+        "chart", "histogram", "scatter", "pie", "bar", "frequency",
+        "distribution", "stem and leaf", "box plot", "boxplot", "tally", "table",
+        # Explicit visual requests
+        "diagram", "draw", "visualize", "visualise", "illustrate", "label",
+        "labelled", "labeled", "picture", "image", "figure",
+        # Science / geography / history
+        "cell", "organ", "ecosystem", "food chain", "food web", "circuit",
+        "force", "forces", "cycle", "map", "maps", "route", "region", "timeline",
+        "flowchart", "cross-section", "structure", "layer", "layers",
+        "river", "rivers", "meander", "meanders", "landform", "landforms",
+        "coast", "glacier", "volcano", "climate graph",
+        # Fractions / measurement with natural visual models
+        "fraction wall", "pie chart", "clock", "ruler", "thermometer", "scale drawing",
+    )
+    visual_patterns: Tuple[str, ...] = (
+        r"\(\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*\)",   # (3, -2)
+        r"\d+(?:\.\d+)?\s*(?:°|º|degrees?\b)",                  # 45°, 90 degrees
+        r"\b\d+(?:\.\d+)?\s*(?:mm|cm|km|m)(?:²|³|\^?[23])?(?![a-zA-Z])",  # 5cm, 12 m²
+        r"\by\s*=\s*[-\d]",                                      # y = 2x + 1
+        r"\\(?:frac|angle|triangle|circ|degree)",                # LaTeX geometry/fraction markup
+    )
+    visual_cfu_types: Tuple[str, ...] = ("graph", "diagram", "drawing", "plot", "sketch", "label", "drag_drop")
+    always_forward_card_types: Tuple[str, ...] = ()
+    text_fields: Tuple[str, ...] = ("title", "explainer")
+
+    def __post_init__(self):
+        keywords = sorted(set(k.lower() for k in self.visual_keywords), key=len, reverse=True)
+        self._keyword_re = re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b", re.IGNORECASE)
+        self._pattern_res = [re.compile(p, re.IGNORECASE) for p in self.visual_patterns]
+
+    def visual_signal(self, text: str) -> Optional[str]:
+        """Return the first visual signal found in text, or None."""
+        match = self._keyword_re.search(text)
+        if match:
+            return f"keyword '{match.group(0).lower()}'"
+        for pattern in self._pattern_res:
+            match = pattern.search(text)
+            if match:
+                return f"pattern '{match.group(0)}'"
+        return None
+
+
+DEFAULT_PREFILTER_RULES = PrefilterRules()
+
+# Set DIAGRAM_ELIGIBILITY_PREFILTER=0 to send every card to the LLM
+PREFILTER_ENABLED = os.environ.get("DIAGRAM_ELIGIBILITY_PREFILTER", "1") != "0"
+
+
+def classify_card_for_diagrams(
+    card: Dict[str, Any],
+    rules: PrefilterRules = DEFAULT_PREFILTER_RULES
+) -> Tuple[bool, str]:
+    """Decide whether a card must go to LLM eligibility analysis.
+
+    Args:
+        card: Lesson card dict
+        rules: Pre-filter rules
+
+    Returns:
+        Tuple of (forward, reason). forward=False means the card confidently
+        needs no diagram in either context.
+    """
+    card_type = str(card.get("cardType") or "").lower()
+    if card_type and card_type in rules.always_forward_card_types:
+        return True, f"cardType '{card_type}' always analyzed"
+
+    cfu = card.get("cfu") or {}
+    cfu_type = str(cfu.get("type") or "").lower() if isinstance(cfu, dict) else ""
+    if cfu_type in rules.visual_cfu_types:
+        return True, f"visual CFU type '{cfu_type}'"
+
+    texts = [str(card.get(field) or "") for field in rules.text_fields]
+    texts.append(json.dumps(cfu, ensure_ascii=False) if isinstance(cfu, dict) else str(cfu))
+    signal = rules.visual_signal("\n".join(texts))
+    if signal:
+        return True, f"visual signal: {signal}"
+
+    return False, "no visual keywords, shapes, coordinates or graph content"
+
+
+def prefilter_cards(
+    cards: List[Dict[str, Any]],
+    rules: PrefilterRules = DEFAULT_PREFILTER_RULES
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split cards into those the LLM must analyze and obvious no-diagram cards.
+
+    Args:
+        cards: Lesson cards
+        rules: Pre-filter rules
+
+    Returns:
+        Tuple of (forwarded cards, rejected cards). Rejected cards are copies
+        carrying "_prefilter_reason".
+    """
+    forwarded, rejected = [], []
+    for card in cards:
+        forward, reason = classify_card_for_diagrams(card, rules)
+        if forward:
+            forwarded.append(card)
+        else:
+            rejected.append({**card, "_prefilter_reason": reason})
+            logger.debug(f"Pre-filter rejected card {card.get('id', 'UNKNOWN')}: {reason}")
+
+    if rejected:
+        logger.info(
+            f"🔎 Pre-filter: {len(rejected)}/{len(cards)} cards need no diagram, "
+            f"{len(forwarded)} forwarded to LLM analysis"
+        )
+    return forwarded, rejected
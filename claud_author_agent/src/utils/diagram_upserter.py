@@ -2,7 +2,7 @@
 
 Provides functions for:
 1. Upserting single lesson diagram to Appwrite lesson_diagrams collection
-2. Batch upsert for multiple diagrams
+2. Concurrent batch upsert for multiple diagrams (PNG streamed from disk)
 3. Fast-fail error handling (no silent failures)
 
 Supports multiple rendering tools:
@@ -35,7 +35,8 @@ Usage:
         card_id="card_002",
         code='{"board": {...}, "elements": [...]}',
         tool_name="jsxgraph",
-        image_base64="iVBORw0KGgoAAAANS...",
+        image_base64=None,
+        image_path="workspace/diagrams/card_002_lesson.png",
         diagram_type="geometry",
         visual_critique_score=0.87,
         critique_iterations=2,
@@ -47,10 +48,14 @@ Usage:
     results = await batch_upsert_diagrams(diagrams_data)
 """
 
+import asyncio
 import hashlib
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
 from .appwrite_mcp import create_appwrite_document, update_appwrite_document, get_appwrite_document
@@ -58,6 +63,17 @@ from .storage_uploader import upload_diagram_image
 
 logger = logging.getLogger(__name__)
 
+# Diagrams uploaded + upserted at once by batch_upsert_diagrams
+DIAGRAM_UPSERT_CONCURRENCY = int(os.environ.get("DIAGRAM_UPSERT_CONCURRENCY", "6"))
+
+
+def _image_size(diagram_data: Dict[str, Any]) -> int:
+    """PNG size in bytes for a batch item, without loading a file from disk."""
+    if diagram_data.get("image_path"):
+        return Path(diagram_data["image_path"]).stat().st_size
+    image_base64 = diagram_data.get("image_base64") or ""
+    return len(image_base64) * 3 // 4 - image_base64[-2:].count("=")
+
 
 # ═══════════════════════════════════════════════════════════════
 # Diagram Type Normalization
@@ -129,7 +145,7 @@ async def upsert_lesson_diagram(
     card_id: str,
     code: Optional[str],
     tool_name: str,
-    image_base64: str,
+    image_base64: Optional[str],
     diagram_type: str,
     visual_critique_score: float,
     critique_iterations: int,
@@ -138,7 +154,8 @@ async def upsert_lesson_diagram(
     diagram_context: Optional[str] = None,
     diagram_description: Optional[str] = None,
     diagram_index: int = 0,
-    mcp_config_path: str = ".mcp.json"
+    mcp_config_path: str = ".mcp.json",
+    image_path: Optional[Union[str, Path]] = None
 ) -> Dict[str, Any]:
     """Upsert lesson diagram to Appwrite lesson_diagrams collection.
 
@@ -151,7 +168,7 @@ async def upsert_lesson_diagram(
         card_id: Card identifier (e.g., "card_001", "card_002")
         code: Diagram definition as JSON string (replaces legacy jsxgraph_json)
         tool_name: Which tool generated the diagram (jsxgraph|desmos|matplotlib|plotly|imagen)
-        image_base64: Base64-encoded PNG image
+        image_base64: Base64-encoded PNG image (None when image_path is given)
         diagram_type: Diagram category (geometry|algebra|statistics|mixed|science|geography|history)
         visual_critique_score: Final accepted score (0.0-1.0)
         critique_iterations: Number of refinement iterations (1-10)
@@ -161,6 +178,8 @@ async def upsert_lesson_diagram(
         diagram_description: Optional 1-2 sentence description for downstream LLMs
         diagram_index: Diagram index for multi-diagram cards (0-indexed, default 0 for backward compatibility)
         mcp_config_path: Path to MCP configuration file
+        image_path: Path to the PNG in the workspace, streamed to Storage
+            instead of passing image_base64
 
     Returns:
         dict: Created/updated Appwrite document
@@ -200,8 +219,8 @@ async def upsert_lesson_diagram(
         )
         code = ""  # Use empty string for Appwrite (null not allowed in string field)
 
-    if not image_base64:
-        raise ValueError("image_base64 is required")
+    if not image_base64 and not image_path:
+        raise ValueError("image_base64 or image_path is required")
     if not diagram_type:
         raise ValueError("diagram_type is required")
 
@@ -233,6 +252,7 @@ async def upsert_lesson_diagram(
             lesson_template_id=lesson_template_id,
             card_id=card_id,
             image_base64=image_base64,
+            image_path=image_path,
             diagram_context=diagram_context,  # Pass diagram_context for unique file IDs (lesson vs CFU)
             diagram_index=diagram_index,  # Pass diagram_index for unique file IDs per diagram
             mcp_config_path=mcp_config_path
@@ -392,20 +412,26 @@ async def upsert_lesson_diagram(
 
 async def batch_upsert_diagrams(
     diagrams_data: List[Dict[str, Any]],
-    mcp_config_path: str = ".mcp.json"
+    mcp_config_path: str = ".mcp.json",
+    concurrency: int = DIAGRAM_UPSERT_CONCURRENCY
 ) -> Dict[str, Any]:
     """Batch upsert multiple lesson diagrams to Appwrite.
 
     Implements US2 batch processing with partial success model (FR-050).
     Continues on individual failures and collects errors for reporting.
 
+    Diagrams are upserted concurrently, at most ``concurrency`` at a time.
+    Items that carry ``image_path`` instead of ``image_base64`` are streamed
+    from disk to Storage, so a large batch never holds every PNG in memory.
+
     Args:
         diagrams_data: List of diagram data dictionaries with fields:
             - lesson_template_id (str)
             - card_id (str)
             - code (str): Diagram definition as JSON string
             - tool_name (str): Which tool generated diagram (jsxgraph|desmos|matplotlib|plotly|imagen)
-            - image_base64 (str)
+            - image_path (str | Path): PNG file in the workspace (preferred), or
+            - image_base64 (str): Base64-encoded PNG
             - diagram_type (str)
             - visual_critique_score (float)
             - critique_iterations (int)
@@ -415,79 +441,103 @@ async def batch_upsert_diagrams(
             - diagram_description (str, optional): Brief description for downstream LLMs
             - diagram_index (int, optional): Diagram index for multi-diagram cards (default 0)
         mcp_config_path: Path to MCP configuration file
+        concurrency: Maximum diagrams uploaded/upserted at once
 
     Returns:
         dict: Batch results with keys:
             - total: Total diagrams attempted
             - succeeded: Number of successful upserts
             - failed: Number of failed upserts
-            - documents: List of created/updated documents (successful)
-            - errors: List of error dictionaries with context (failed)
+            - documents: List of created/updated documents (successful, input order)
+            - errors: List of error dictionaries with context (failed, input order)
+            - elapsed_seconds: Wall time of the batch
+            - bytes_uploaded: PNG bytes sent for successful diagrams
+            - diagrams_per_second: Successful diagrams per second
+            - mb_per_second: Uploaded megabytes per second
 
     Raises:
-        Never raises - returns partial success results with errors array
+        ValueError: If concurrency < 1 (otherwise never raises - returns
+            partial success results with errors array)
     """
-    logger.info(f"Batch upserting {len(diagrams_data)} lesson diagrams...")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
 
     total = len(diagrams_data)
-    succeeded = 0
-    failed = 0
-    documents = []
-    errors = []
-
-    for idx, diagram_data in enumerate(diagrams_data, start=1):
-        try:
-            # Extract fields from diagram_data
-            lesson_template_id = diagram_data["lesson_template_id"]
-            card_id = diagram_data["card_id"]
-            diagram_index = diagram_data.get("diagram_index", 0)  # Extract diagram_index (default 0)
-
-            logger.info(
-                f"[{idx}/{total}] Upserting diagram: "
-                f"lessonTemplateId={lesson_template_id}, cardId={card_id}, diagram_index={diagram_index}"
-            )
-
-            # Upsert single diagram
-            doc = await upsert_lesson_diagram(
-                lesson_template_id=lesson_template_id,
-                card_id=card_id,
-                code=diagram_data.get("code"),  # Diagram definition as JSON string
-                tool_name=diagram_data["tool_name"],  # Required: which tool generated the diagram
-                image_base64=diagram_data["image_base64"],
-                diagram_type=diagram_data["diagram_type"],
-                visual_critique_score=diagram_data["visual_critique_score"],
-                critique_iterations=diagram_data["critique_iterations"],
-                critique_feedback=diagram_data["critique_feedback"],
-                execution_id=diagram_data["execution_id"],
-                diagram_context=diagram_data.get("diagram_context"),  # Optional - may not be present
-                diagram_description=diagram_data.get("diagram_description"),  # Optional - brief description for LLMs
-                diagram_index=diagram_index,  # Pass diagram_index for multi-diagram support
-                mcp_config_path=mcp_config_path
-            )
-
-            documents.append(doc)
-            succeeded += 1
-
-        except Exception as e:
-            # FR-050: Partial success model - continue on failure, collect errors
-            failed += 1
-            error_entry = {
-                "lesson_template_id": diagram_data.get("lesson_template_id", "UNKNOWN"),
-                "card_id": diagram_data.get("card_id", "UNKNOWN"),
-                "error": str(e),
-                "exception_type": type(e).__name__,
-                "index": idx
-            }
-            errors.append(error_entry)
-            logger.error(
-                f"[{idx}/{total}] Failed to upsert diagram: "
-                f"lessonTemplateId={error_entry['lesson_template_id']}, "
-                f"cardId={error_entry['card_id']}, error={str(e)}"
-            )
+    logger.info(f"Batch upserting {total} lesson diagrams (concurrency={concurrency})...")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * total
+    started = time.perf_counter()
+
+    async def upsert_one(idx: int, diagram_data: Dict[str, Any]) -> None:
+        async with semaphore:
+            try:
+                # Extract fields from diagram_data
+                lesson_template_id = diagram_data["lesson_template_id"]
+                card_id = diagram_data["card_id"]
+                diagram_index = diagram_data.get("diagram_index", 0)  # Extract diagram_index (default 0)
+                image_path = diagram_data.get("image_path")
+
+                logger.info(
+                    f"[{idx}/{total}] Upserting diagram: "
+                    f"lessonTemplateId={lesson_template_id}, cardId={card_id}, diagram_index={diagram_index}"
+                )
+
+                # Upsert single diagram
+                doc = await upsert_lesson_diagram(
+                    lesson_template_id=lesson_template_id,
+                    card_id=card_id,
+                    code=diagram_data.get("code"),  # Diagram definition as JSON string
+                    tool_name=diagram_data["tool_name"],  # Required: which tool generated the diagram
+                    image_base64=None if image_path else diagram_data["image_base64"],
+                    image_path=image_path,
+                    diagram_type=diagram_data["diagram_type"],
+                    visual_critique_score=diagram_data["visual_critique_score"],
+                    critique_iterations=diagram_data["critique_iterations"],
+                    critique_feedback=diagram_data["critique_feedback"],
+                    execution_id=diagram_data["execution_id"],
+                    diagram_context=diagram_data.get("diagram_context"),  # Optional - may not be present
+                    diagram_description=diagram_data.get("diagram_description"),  # Optional - brief description for LLMs
+                    diagram_index=diagram_index,  # Pass diagram_index for multi-diagram support
+                    mcp_config_path=mcp_config_path
+                )
+
+                outcomes[idx - 1] = {"document": doc, "bytes": _image_size(diagram_data)}
+
+            except Exception as e:
+                # FR-050: Partial success model - continue on failure, collect errors
+                error_entry = {
+                    "lesson_template_id": diagram_data.get("lesson_template_id", "UNKNOWN"),
+                    "card_id": diagram_data.get("card_id", "UNKNOWN"),
+                    "error": str(e),
+                    "exception_type": type(e).__name__,
+                    "index": idx
+                }
+                outcomes[idx - 1] = {"error": error_entry}
+                logger.error(
+                    f"[{idx}/{total}] Failed to upsert diagram: "
+                    f"lessonTemplateId={error_entry['lesson_template_id']}, "
+                    f"cardId={error_entry['card_id']}, error={str(e)}"
+                )
+
+    await asyncio.gather(*(
+        upsert_one(idx, diagram_data) for idx, diagram_data in enumerate(diagrams_data, start=1)
+    ))
+
+    elapsed = time.perf_counter() - started
+    documents = [o["document"] for o in outcomes if "document" in o]
+    errors = [o["error"] for o in outcomes if "error" in o]
+    bytes_uploaded = sum(o["bytes"] for o in outcomes if "document" in o)
+    succeeded = len(documents)
+    failed = len(errors)
+
+    diagrams_per_second = succeeded / elapsed if elapsed > 0 else 0.0
+    mb_per_second = bytes_uploaded / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
 
     # Log batch summary
     logger.info(
-        f"Batch upsert complete: {succeeded} succeeded, {failed} failed out of {total}"
+        f"Batch upsert complete: {succeeded} succeeded, {failed} failed out of {total} "
+        f"in {elapsed:.2f}s ({diagrams_per_second:.2f} diagrams/s, {mb_per_second:.2f} MB/s)"
     )
 
     return {
@@ -495,7 +545,11 @@ async def batch_upsert_diagrams(
         "succeeded": succeeded,
         "failed": failed,
         "documents": documents,
-        "errors": errors
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 3),
+        "bytes_uploaded": bytes_uploaded,
+        "diagrams_per_second": round(diagrams_per_second, 2),
+        "mb_per_second": round(mb_per_second, 3)
     }
 
 
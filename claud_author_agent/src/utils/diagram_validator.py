@@ -16,7 +16,7 @@ Uses comprehensive Pydantic validation from json_validator_tool.py to catch:
 
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -41,17 +41,23 @@ class ValidationResult:
 async def validate_structure_batch(
     course_id: str,
     lesson_orders: List[int],
-    mcp_config_path: str
+    mcp_config_path: str,
+    templates: Optional[Dict[int, Dict[str, Any]]] = None
 ) -> Dict[int, Dict[str, Any]]:
     """Validate ONLY structure (Pydantic schema) for all lessons.
 
     Fast, free (no LLM calls). Use this for fail-fast validation before
     processing lessons individually with eligibility analysis.
 
+    All templates are fetched with one query (see fetch_lesson_templates_by_order);
+    pass ``templates`` to reuse an existing fetch. Cards are decompressed in
+    place, so the same dict can be handed to later steps.
+
     Args:
         course_id: Course identifier
         lesson_orders: List of lesson order numbers to validate
         mcp_config_path: Path to MCP config file
+        templates: Optional pre-fetched sow_order → template mapping
 
     Returns:
         Dictionary mapping order → validation result:
@@ -72,20 +78,22 @@ async def validate_structure_batch(
         >>> results[1]["total_cards"]
         5
     """
-    from .diagram_extractor import fetch_lesson_template
+    from .diagram_extractor import fetch_lesson_templates_by_order, decode_lesson_template_cards
+
+    if templates is None:
+        templates = await fetch_lesson_templates_by_order(
+            course_id=course_id,
+            lesson_orders=lesson_orders,
+            mcp_config_path=mcp_config_path
+        )
 
     results = {}
 
     for order in lesson_orders:
         try:
-            # Fetch lesson template
             logger.info(f"Validating lesson order {order} (structure only)...")
 
-            template = await fetch_lesson_template(
-                course_id=course_id,
-                order=order,
-                mcp_config_path=mcp_config_path
-            )
+            template = templates.get(order)
 
             if not template:
                 results[order] = {
@@ -98,6 +106,8 @@ async def validate_structure_batch(
                 logger.error(f"❌ Lesson order {order}: Not found in database")
                 continue
 
+            decode_lesson_template_cards(template)
+
             # Validate lesson template structure (Pydantic - fast, no LLM)
             validation_result = validate_lesson_template_structure(template)
 
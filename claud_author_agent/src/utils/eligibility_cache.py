@@ -0,0 +1,160 @@
+"""Content-hash cache for EligibilityAnalyzerAgent decisions.
+
+Deciding which cards need diagrams costs a full Claude agent session per
+lesson, yet ``--force`` reruns and lesson migrations usually leave most card
+text untouched. This cache stores the decision for each card - its
+eligible_cards.json entry, or "not eligible" - keyed by:
+
+    sha256(json.dumps({"prompt": <prompt version>, "model": ..., "card": <card minus id>},
+                      sort_keys=True, separators=(",", ":")))
+
+The prompt version is a digest of the analyzer prompt text, so editing the
+prompt invalidates every entry. The card ``id`` is left out of the key (and
+rewritten on reuse) so renumbered but otherwise identical cards still hit.
+
+Entries live on disk as one small ``<key>.json`` file each.
+
+Configuration:
+    ELIGIBILITY_CACHE_DIR      (default: workspace/.eligibility_cache)
+    ELIGIBILITY_CACHE_ENABLED  (default: 1; 0 disables the cache)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "workspace" / ".eligibility_cache"
+
+# Card fields that identify the card rather than describe its content
+CARD_IDENTITY_FIELDS = ("id", "cardId")
+
+
+def prompt_version(prompt: str) -> str:
+    """Return a short digest identifying an analyzer prompt revision."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def eligibility_cache_key(card: Dict[str, Any], prompt_version: str, model: str) -> str:
+    """Return the content address for one card's eligibility decision.
+
+    Args:
+        card: Lesson card dict as written to lesson_template.json
+        prompt_version: Digest from prompt_version()
+        model: Claude model that makes the decision
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    content = {k: v for k, v in card.items() if k not in CARD_IDENTITY_FIELDS}
+    canonical = json.dumps(
+        {"prompt": prompt_version, "model": model, "card": content},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class EligibilityCache:
+    """Disk cache of per-card eligibility decisions (thread-safe)."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: Optional[bool] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(
+            os.environ.get("ELIGIBILITY_CACHE_DIR", DEFAULT_CACHE_DIR)
+        )
+        if enabled is None:
+            enabled = os.environ.get("ELIGIBILITY_CACHE_ENABLED", "1") != "0"
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "lessons_analyzed": 0,
+            "analyses_avoided": 0,
+            "cards_prefiltered": 0,
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached decision {"eligible": bool, "entry": dict|None}, or None."""
+        if not self.enabled:
+            return None
+
+        try:
+            decision = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            decision = None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable eligibility cache entry {key[:12]}: {e}")
+            decision = None
+
+        with self._lock:
+            self._stats["hits" if decision is not None else "misses"] += 1
+        return decision
+
+    def put(self, key: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Store a card's eligible_cards.json entry (None = not eligible)."""
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        data = json.dumps({"eligible": entry is not None, "entry": entry}).encode("utf-8")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write eligibility cache entry {key[:12]}: {e}")
+            return
+
+        with self._lock:
+            self._stats["stores"] += 1
+
+    def record_lesson(self, llm_called: bool, prefiltered: int = 0) -> None:
+        """Count one analyze() call, whether it still needed the LLM, and
+        how many cards the rule-based pre-filter rejected before lookup."""
+        with self._lock:
+            self._stats["lessons_analyzed"] += 1
+            self._stats["cards_prefiltered"] += prefiltered
+            if not llm_called:
+                self._stats["analyses_avoided"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss and avoided-analysis counts for batch summaries."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "enabled": self.enabled,
+            }
+
+
+_cache: Optional[EligibilityCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_eligibility_cache() -> EligibilityCache:
+    """Return the process-wide eligibility cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EligibilityCache()
+        return _cache
+
+
+def reset_eligibility_cache() -> None:
+    """Forget the process-wide cache object (files on disk are kept)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -12,7 +12,7 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from .appwrite_mcp import list_appwrite_documents
-from .compression import parse_sow_entries
+from .sow_cache import load_sow_entries
 
 logger = logging.getLogger(__name__)
 
@@ -130,11 +130,10 @@ async def get_authored_sow_for_course(
         sow_doc = sow_docs[0]
 
         # Parse entries field (handles all formats: storage bucket, compressed, uncompressed)
-        # Uses unified parse_sow_entries() helper
-        entries_raw = sow_doc.get('entries', [])
+        # through the SOW cache - every question in a walkthrough batch hits the same SOW
         try:
-            entries = await parse_sow_entries(
-                entries_raw=entries_raw,
+            sow = await load_sow_entries(
+                sow_doc=sow_doc,
                 mcp_config_path=mcp_config_path,
                 courseId=course_id
             )
@@ -142,6 +141,7 @@ async def get_authored_sow_for_course(
             logger.error(f"Failed to parse SOW entries: {e}")
             return None
 
+        entries = sow.entries
         sow_doc['entries'] = entries
         logger.info(f"Found SOW with {len(entries)} entries")
         return sow_doc
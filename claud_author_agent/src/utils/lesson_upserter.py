@@ -4,13 +4,12 @@ Upserts lesson templates to Appwrite lesson_templates collection with card compr
 Ports compression logic from TypeScript seedAuthoredLesson.ts script.
 """
 
-import base64
-import gzip
 import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .compression import CompressionResult, compress_json, decompress_text
 from .appwrite_mcp import (
     list_appwrite_documents,
     create_appwrite_document,
@@ -23,6 +22,10 @@ logger = logging.getLogger(__name__)
 def compress_cards_gzip_base64(cards: list) -> str:
     """Compress cards using gzip + base64 (ported from TypeScript).
 
+    Cards are stored as raw base64 gzip (no "gzip:" prefix), which the
+    frontend's decompressCards() reads as the Python format. With
+    CONTENT_COMPRESSION_CODEC=zstd the result is "zstd:"-prefixed.
+
     Args:
         cards: List of card dictionaries
 
@@ -32,23 +35,24 @@ def compress_cards_gzip_base64(cards: list) -> str:
     Raises:
         ValueError: If cards is not serializable to JSON
     """
-    try:
-        # Step 1: Convert cards to JSON string
-        cards_json = json.dumps(cards)
-
-        # Step 2: Encode to UTF-8 bytes
-        cards_bytes = cards_json.encode('utf-8')
+    return _compress_cards(cards).encoded
 
-        # Step 3: Compress with gzip
-        compressed = gzip.compress(cards_bytes)
 
-        # Step 4: Base64 encode
-        b64_encoded = base64.b64encode(compressed).decode('ascii')
+def _compress_cards(cards: list) -> CompressionResult:
+    try:
+        return compress_json(cards, prefix=False)
+    except ValueError as e:
+        raise ValueError(f"Failed to compress cards: {e}")
 
-        return b64_encoded
 
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Failed to compress cards: {e}")
+def _format_compression_stats(result: CompressionResult) -> Dict[str, Any]:
+    stats = result.stats()
+    return {
+        "original_bytes": stats["original"],
+        "compressed_bytes": stats["compressed"],
+        "ratio_percent": stats["ratio"],
+        "savings_percent": stats["savings"]
+    }
 
 
 def get_compression_stats(cards: list) -> Dict[str, Any]:
@@ -60,20 +64,7 @@ def get_compression_stats(cards: list) -> Dict[str, Any]:
     Returns:
         Dictionary with compression metrics
     """
-    original_json = json.dumps(cards)
-    compressed = compress_cards_gzip_base64(cards)
-
-    original_size = len(original_json)
-    compressed_size = len(compressed)
-    ratio = (compressed_size / original_size) * 100
-    savings = ((1 - compressed_size / original_size) * 100)
-
-    return {
-        "original_bytes": original_size,
-        "compressed_bytes": compressed_size,
-        "ratio_percent": f"{ratio:.1f}%",
-        "savings_percent": f"{savings:.1f}%"
-    }
+    return _format_compression_stats(_compress_cards(cards))
 
 
 async def upsert_lesson_template(
@@ -134,10 +125,12 @@ async def upsert_lesson_template(
     if not cards:
         logger.warning("No cards found in lesson template - proceeding with empty cards")
 
-    compressed_cards = compress_cards_gzip_base64(cards)
+    # Compress once; the stats come from the same pass
+    compression = _compress_cards(cards)
+    compressed_cards = compression.encoded
 
     # Log compression stats
-    stats = get_compression_stats(cards)
+    stats = _format_compression_stats(compression)
     logger.info(f"Card compression: {stats['original_bytes']} → {stats['compressed_bytes']} bytes "
                 f"({stats['ratio_percent']}, saved {stats['savings_percent']})")
 
@@ -236,6 +229,7 @@ def decompress_cards_gzip_base64(compressed_cards: str) -> list:
 
     Args:
         compressed_cards: Base64-encoded gzip-compressed JSON string
+            (raw, "gzip:" or "zstd:" prefixed)
 
     Returns:
         List of card dictionaries
@@ -244,19 +238,6 @@ def decompress_cards_gzip_base64(compressed_cards: str) -> list:
         ValueError: If decompression fails
     """
     try:
-        # Step 1: Base64 decode
-        compressed_bytes = base64.b64decode(compressed_cards.encode('ascii'))
-
-        # Step 2: Gzip decompress
-        decompressed_bytes = gzip.decompress(compressed_bytes)
-
-        # Step 3: UTF-8 decode
-        cards_json = decompressed_bytes.decode('utf-8')
-
-        # Step 4: JSON parse
-        cards = json.loads(cards_json)
-
-        return cards
-
-    except (ValueError, gzip.BadGzipFile, json.JSONDecodeError) as e:
+        return json.loads(decompress_text(compressed_cards))
+    except ValueError as e:
         raise ValueError(f"Failed to decompress cards: {e}")
@@ -5,12 +5,58 @@ Sets up structured logging with appropriate levels and formatters.
 
 import logging
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 # Track file handlers added to workspaces for cleanup
 _workspace_file_handlers: dict[str, logging.FileHandler] = {}
 
+# Active log scope for the current asyncio task (e.g. "lesson_order_003").
+# Lets concurrent runs in one process each write their own log file.
+_current_log_scope: ContextVar[Optional[str]] = ContextVar("log_scope", default=None)
+
+
+class LogScopeFilter(logging.Filter):
+    """Only pass records emitted while the given log scope is active."""
+
+    def __init__(self, scope: str):
+        super().__init__()
+        self.scope = scope
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return _current_log_scope.get() == self.scope
+
+
+@contextmanager
+def log_scope(scope: str) -> Iterator[str]:
+    """Mark all logging in the current task (and tasks it spawns) with a scope.
+
+    File handlers added while a scope is active only receive that scope's
+    records, and survive setup_logging() calls made by concurrent agents.
+
+    Args:
+        scope: Unique scope name for this unit of work
+    """
+    token = _current_log_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_log_scope.reset(token)
+
+
+def scope_handler(handler: logging.Handler) -> logging.Handler:
+    """Restrict a handler to the current log scope (no-op outside a scope)."""
+    scope = _current_log_scope.get()
+    if scope is not None:
+        handler.addFilter(LogScopeFilter(scope))
+    return handler
+
+
+def _is_scoped(handler: logging.Handler) -> bool:
+    return any(isinstance(f, LogScopeFilter) for f in handler.filters)
+
 
 def add_workspace_file_handler(
     workspace_path: Path,
@@ -43,6 +89,7 @@ def add_workspace_file_handler(
     file_handler = logging.FileHandler(log_file, mode='w')  # 'w' to start fresh each run
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
+    scope_handler(file_handler)
 
     # Add to root logger
     root_logger = logging.getLogger()
@@ -106,8 +153,9 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove existing handlers
-    root_logger.handlers.clear()
+    # Remove existing handlers (scoped handlers belong to concurrent in-flight
+    # runs and are removed by their owners)
+    root_logger.handlers = [h for h in root_logger.handlers if _is_scoped(h)]
 
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
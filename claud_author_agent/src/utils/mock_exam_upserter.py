@@ -12,7 +12,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from .compression import compress_json_gzip_base64, get_compression_stats
+from .compression import compress_json
 from ..tools.mock_exam_validator_tool import validate_mock_exam_schema
 
 logger = logging.getLogger(__name__)
@@ -278,8 +278,9 @@ def _transform_to_appwrite_schema(
     """
     # Compress sections (largest field)
     sections = mock_exam_data.get("sections", [])
-    sections_compressed = compress_json_gzip_base64(sections)
-    sections_stats = get_compression_stats(sections)
+    sections_compression = compress_json(sections)
+    sections_compressed = sections_compression.encoded
+    sections_stats = sections_compression.stats()
 
     logger.info(
         f"Sections compressed: {sections_stats['original']} -> "
@@ -13,7 +13,10 @@ the `data` field contains a JSON blob with questions, solutions, and metadata.
 import json
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .appwrite_async import run_appwrite
+from .appwrite_pagination import DEFAULT_PAGE_SIZE, iter_document_pages
 
 
 # =============================================================================
@@ -315,7 +318,8 @@ async def get_appwrite_document(
         client, _, _, _ = _get_appwrite_client(mcp_config_path)
         databases = Databases(client)
 
-        result = databases.get_document(
+        result = await run_appwrite(
+            databases.get_document,
             database_id=database_id,
             collection_id=collection_id,
             document_id=document_id
@@ -391,17 +395,21 @@ async def list_appwrite_documents(
     database_id: str,
     collection_id: str,
     queries: List[str],
-    mcp_config_path: str = ".mcp.json"
+    mcp_config_path: str = ".mcp.json",
+    select: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """List documents from Appwrite with queries.
 
-    Uses direct Appwrite SDK access for standalone CLI usage.
+    Uses direct Appwrite SDK access for standalone CLI usage. Collects every
+    page from iter_appwrite_documents(); prefer that generator when the
+    result set may be large.
 
     Args:
         database_id: Database ID
         collection_id: Collection ID
         queries: List of query strings in format 'equal("field", "value")'
         mcp_config_path: Path to MCP config file
+        select: Optional attribute projection ($id is always included)
 
     Returns:
         List of matching documents
@@ -411,47 +419,63 @@ async def list_appwrite_documents(
         FileNotFoundError: If MCP config not found
         ValueError: If credentials missing or invalid query
     """
-    try:
-        from .appwrite_infrastructure import _get_appwrite_client
-        from appwrite.services.databases import Databases
-        from appwrite.query import Query
-
-        client, _, _, _ = _get_appwrite_client(mcp_config_path)
-        databases = Databases(client)
-
-        # Convert query strings to Query objects
-        appwrite_queries = [_parse_query_string(q) for q in queries]
-
-        # Fetch documents with pagination (Appwrite returns max 25 by default)
-        all_documents = []
-        offset = 0
-        limit = 100  # Fetch in batches
-
-        while True:
-            paginated_queries = appwrite_queries + [
-                Query.limit(limit),
-                Query.offset(offset)
-            ]
+    return [
+        document
+        async for document in iter_appwrite_documents(
+            database_id, collection_id, queries, mcp_config_path, select=select
+        )
+    ]
 
-            result = databases.list_documents(
-                database_id=database_id,
-                collection_id=collection_id,
-                queries=paginated_queries
-            )
 
-            documents = result.get("documents", [])
-            all_documents.extend(documents)
+async def iter_appwrite_documents(
+    database_id: str,
+    collection_id: str,
+    queries: List[str],
+    mcp_config_path: str = ".mcp.json",
+    select: Optional[List[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream documents from Appwrite using cursor pagination.
 
-            # Check if we've fetched all documents
-            if len(documents) < limit:
-                break
-            offset += limit
+    Args:
+        database_id: Database ID
+        collection_id: Collection ID
+        queries: List of query strings in format 'equal("field", "value")'
+        mcp_config_path: Path to MCP config file
+        select: Optional attribute projection ($id is always included)
+        page_size: Documents per request
 
-        return all_documents
+    Yields:
+        Matching documents, one page held in memory at a time
 
+    Raises:
+        ImportError: If Appwrite SDK not installed
+        FileNotFoundError: If MCP config not found
+        ValueError: If credentials missing or invalid query
+    """
+    try:
+        from .appwrite_infrastructure import _get_appwrite_client
+        from appwrite.services.databases import Databases
     except ImportError:
         raise ImportError("Appwrite Python SDK not installed. Run: pip install appwrite")
 
+    client, _, _, _ = _get_appwrite_client(mcp_config_path)
+    databases = Databases(client)
+
+    # Convert query strings to Query objects
+    appwrite_queries = [_parse_query_string(q) for q in queries]
+
+    async for page in iter_document_pages(
+        databases,
+        database_id=database_id,
+        collection_id=collection_id,
+        query_objects=appwrite_queries,
+        select=select,
+        page_size=page_size
+    ):
+        for document in page:
+            yield document
+
 
 async def fetch_paper(
     paper_id: str,
@@ -4,20 +4,28 @@ Handles:
 1. Uploading large content (question data, block data) to storage bucket
 2. Creating/updating documents in practice_questions and practice_blocks collections
 3. Content hash-based deduplication to avoid duplicate uploads
+   (questions: one projected $id/contentHash query per lesson, then
+   bounded concurrent writes for the changed ones)
 
 Uses the pattern from lesson_upserter.py and storage_uploader.py.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from io import BytesIO
 
 from appwrite.exception import AppwriteException
 
+from .appwrite_async import run_appwrite
+from .appwrite_pagination import iter_document_pages
+from .appwrite_pool import get_appwrite_connection
 from ..models.practice_question_models import (
     ExtractedBlock,
     GeneratedQuestion,
@@ -34,9 +42,48 @@ PRACTICE_CONTENT_BUCKET_ID = "practice_content"
 PRACTICE_QUESTIONS_COLLECTION = "practice_questions"
 PRACTICE_BLOCKS_COLLECTION = "practice_blocks"
 
+# Questions whose storage upload + document write may be in flight at once
+UPSERT_CONCURRENCY = int(os.environ.get("PRACTICE_UPSERT_CONCURRENCY", "8"))
+
+
+@dataclass
+class QuestionUpsertReport:
+    """Outcome of a bulk question upsert.
+
+    Attributes:
+        created: Document IDs created
+        updated: Document IDs whose content changed
+        skipped: Document IDs already stored with the same content hash
+        failed: question_id -> error message for questions that could not be written
+        elapsed_seconds: Wall time of the whole upsert
+        question_doc_ids: Document ID of every input question, in input order
+        failed_doc_ids: Document IDs whose write failed
+    """
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    question_doc_ids: List[str] = field(default_factory=list, repr=False)
+    failed_doc_ids: Set[str] = field(default_factory=set, repr=False)
+
+    @property
+    def doc_ids(self) -> List[str]:
+        """Document IDs now up to date in Appwrite, in input question order."""
+        return [doc_id for doc_id in self.question_doc_ids if doc_id not in self.failed_doc_ids]
+
+    def raise_for_failures(self) -> None:
+        """Raise RuntimeError listing every failed question, if any."""
+        if self.failed:
+            details = "; ".join(f"{qid}: {err}" for qid, err in self.failed.items())
+            raise RuntimeError(
+                f"Failed to upsert {len(self.failed)} question(s) "
+                f"({len(self.doc_ids)} succeeded): {details}"
+            )
+
 
 def _get_appwrite_client(mcp_config_path: str):
-    """Initialize Appwrite client from MCP config.
+    """Get the shared Appwrite client for an MCP config.
 
     Args:
         mcp_config_path: Path to .mcp.json
@@ -47,39 +94,8 @@ def _get_appwrite_client(mcp_config_path: str):
     Raises:
         ValueError: If credentials missing
     """
-    from appwrite.client import Client
-
-    config_path = Path(mcp_config_path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-    with open(config_path) as f:
-        mcp_config = json.load(f)
-
-    appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-    args = appwrite_config.get("args", [])
-
-    endpoint = None
-    api_key = None
-    project_id = None
-
-    for arg in args:
-        if arg.startswith("APPWRITE_ENDPOINT="):
-            endpoint = arg.split("=", 1)[1]
-        elif arg.startswith("APPWRITE_API_KEY="):
-            api_key = arg.split("=", 1)[1]
-        elif arg.startswith("APPWRITE_PROJECT_ID="):
-            project_id = arg.split("=", 1)[1]
-
-    if not all([endpoint, api_key, project_id]):
-        raise ValueError("Missing Appwrite credentials in MCP config")
-
-    client = Client()
-    client.set_endpoint(endpoint)
-    client.set_project(project_id)
-    client.set_key(api_key)
-
-    return client, project_id
+    conn = get_appwrite_connection(mcp_config_path)
+    return conn.client, conn.project_id
 
 
 def _generate_doc_id(content: str, max_length: int = 36) -> str:
@@ -161,7 +177,8 @@ class PracticeQuestionUpserter:
 
         try:
             # Try to create new file
-            result = self._storage.create_file(
+            result = await run_appwrite(
+                self._storage.create_file,
                 bucket_id=bucket_id,
                 file_id=file_id,
                 file=input_file
@@ -194,7 +211,8 @@ class PracticeQuestionUpserter:
         self._init_client()
 
         try:
-            return self._databases.get_document(
+            return await run_appwrite(
+                self._databases.get_document,
                 database_id=self.database_id,
                 collection_id=collection_id,
                 document_id=document_id
@@ -279,7 +297,8 @@ class PracticeQuestionUpserter:
             # Create or update document
             try:
                 if existing:
-                    self._databases.update_document(
+                    await run_appwrite(
+                        self._databases.update_document,
                         database_id=self.database_id,
                         collection_id=PRACTICE_BLOCKS_COLLECTION,
                         document_id=doc_id,
@@ -287,7 +306,8 @@ class PracticeQuestionUpserter:
                     )
                     logger.debug(f"Updated block: {doc_id}")
                 else:
-                    self._databases.create_document(
+                    await run_appwrite(
+                        self._databases.create_document,
                         database_id=self.database_id,
                         collection_id=PRACTICE_BLOCKS_COLLECTION,
                         document_id=doc_id,
@@ -303,101 +323,182 @@ class PracticeQuestionUpserter:
         logger.info(f"✅ Upserted {len(doc_ids)} blocks")
         return doc_ids
 
-    async def upsert_questions(
+    async def _load_question_hashes(self, lesson_template_id: str) -> Dict[str, str]:
+        """Load $id -> contentHash for every question already stored for a lesson.
+
+        One projected, cursor-paged query replaces a get_document per question.
+
+        Args:
+            lesson_template_id: Lesson template document ID
+
+        Returns:
+            Dict mapping document ID to its stored content hash
+        """
+        self._init_client()
+        from appwrite.query import Query
+
+        hashes: Dict[str, str] = {}
+        async for page in iter_document_pages(
+            self._databases,
+            self.database_id,
+            PRACTICE_QUESTIONS_COLLECTION,
+            query_objects=[Query.equal("lessonTemplateId", lesson_template_id)],
+            select=["$id", "contentHash"]
+        ):
+            for doc in page:
+                hashes[doc["$id"]] = doc.get("contentHash")
+        return hashes
+
+    async def _write_question(
         self,
         lesson_template_id: str,
-        questions: List[GeneratedQuestion],
+        question: GeneratedQuestion,
+        doc_id: str,
+        content_hash: str,
+        exists: bool,
         execution_id: str
-    ) -> List[str]:
-        """Upsert generated questions to practice_questions collection.
+    ) -> None:
+        """Upload one question's storage content, then create or update its document."""
+        storage_content = question.get_storage_content()
+        file_id_content = f"question:{lesson_template_id}:{question.question_id}"
+        file_id = _generate_doc_id(file_id_content)
+
+        await self._upload_to_storage(
+            storage_content.model_dump(),
+            file_id
+        )
+
+        doc_data = {
+            "lessonTemplateId": lesson_template_id,
+            "blockId": question.block_id,
+            "blockTitle": question.block_title,
+            "difficulty": question.difficulty,
+            "questionType": question.question_type,
+            "stemPreview": question.stem_preview,
+            "optionsPreview": question.options_preview,
+            "questionDataFileId": file_id,
+            "contentHash": content_hash,
+            "diagramRequired": question.diagram_needed,
+            "diagramFileId": question.diagram_file_id,
+            "diagramTool": question.diagram_tool,
+            "generatorVersion": "1.0.0",
+            "executionId": execution_id,
+            "generatedAt": datetime.utcnow().isoformat(),
+            "status": "published"
+        }
+
+        write = self._databases.update_document if exists else self._databases.create_document
+        await run_appwrite(
+            write,
+            database_id=self.database_id,
+            collection_id=PRACTICE_QUESTIONS_COLLECTION,
+            document_id=doc_id,
+            data=doc_data
+        )
+        logger.debug(f"{'Updated' if exists else 'Created'} question: {doc_id}")
+
+    async def bulk_upsert_questions(
+        self,
+        lesson_template_id: str,
+        questions: List[GeneratedQuestion],
+        execution_id: str,
+        concurrency: int = UPSERT_CONCURRENCY
+    ) -> QuestionUpsertReport:
+        """Upsert questions with one existence query and bounded concurrent writes.
+
+        Existing ``$id``/``contentHash`` pairs for the lesson are loaded with a
+        single projected query; unchanged questions are skipped without any
+        per-item GET. The remaining storage uploads and document writes run
+        concurrently (at most ``concurrency`` questions in flight). A failing
+        question is recorded in the report and does not abort the others.
 
         Args:
             lesson_template_id: Source lesson template ID
             questions: List of generated questions
             execution_id: Execution ID for tracking
+            concurrency: Maximum questions written at once
 
         Returns:
-            List of document IDs created/updated
+            QuestionUpsertReport with created/updated/skipped IDs and failures
+
+        Raises:
+            ValueError: If concurrency < 1
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
         self._init_client()
         logger.info(f"Upserting {len(questions)} questions for {lesson_template_id}")
+        started = time.perf_counter()
 
-        doc_ids = []
+        existing = await self._load_question_hashes(lesson_template_id)
+        report = QuestionUpsertReport()
 
+        # Diff against stored hashes; identical questions in one batch map to
+        # the same doc ID, so only the first is written.
+        pending: List[Tuple[GeneratedQuestion, str, str]] = []
+        seen = set()
         for question in questions:
-            # Generate deterministic document ID
             content_hash = question.compute_content_hash()
             doc_id_content = f"{lesson_template_id}:{question.block_id}:{question.difficulty}:{content_hash[:16]}"
             doc_id = _generate_doc_id(doc_id_content)
+            report.question_doc_ids.append(doc_id)
 
-            # Check if question already exists
-            existing = await self._get_existing_document(
-                PRACTICE_QUESTIONS_COLLECTION, doc_id
-            )
-
-            if existing and existing.get("contentHash") == content_hash:
+            if doc_id in seen or existing.get(doc_id) == content_hash:
                 logger.debug(f"Question {question.question_id} unchanged, skipping")
-                doc_ids.append(doc_id)
-                continue
+                report.skipped.append(doc_id)
+            else:
+                pending.append((question, doc_id, content_hash))
+            seen.add(doc_id)
 
-            # Upload large content to storage
-            storage_content = question.get_storage_content()
-            file_id_content = f"question:{lesson_template_id}:{question.question_id}"
-            file_id = _generate_doc_id(file_id_content)
+        semaphore = asyncio.Semaphore(concurrency)
 
-            await self._upload_to_storage(
-                storage_content.model_dump(),
-                file_id
-            )
+        async def write(question: GeneratedQuestion, doc_id: str, content_hash: str) -> None:
+            exists = doc_id in existing
+            async with semaphore:
+                try:
+                    await self._write_question(
+                        lesson_template_id, question, doc_id, content_hash, exists, execution_id
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Failed to upsert question {question.question_id}: {e}")
+                    report.failed[question.question_id] = str(e)
+                    report.failed_doc_ids.add(doc_id)
+                    return
+            (report.updated if exists else report.created).append(doc_id)
 
-            # Build document data
-            doc_data = {
-                "lessonTemplateId": lesson_template_id,
-                "blockId": question.block_id,
-                "blockTitle": question.block_title,
-                "difficulty": question.difficulty,
-                "questionType": question.question_type,
-                "stemPreview": question.stem_preview,
-                "optionsPreview": question.options_preview,
-                "questionDataFileId": file_id,
-                "contentHash": content_hash,
-                "diagramRequired": question.diagram_needed,
-                "diagramFileId": question.diagram_file_id,
-                "diagramTool": question.diagram_tool,
-                "generatorVersion": "1.0.0",
-                "executionId": execution_id,
-                "generatedAt": datetime.utcnow().isoformat(),
-                "status": "published"
-            }
+        await asyncio.gather(*(write(*item) for item in pending))
 
-            # Create or update document
-            try:
-                if existing:
-                    self._databases.update_document(
-                        database_id=self.database_id,
-                        collection_id=PRACTICE_QUESTIONS_COLLECTION,
-                        document_id=doc_id,
-                        data=doc_data
-                    )
-                    logger.debug(f"Updated question: {doc_id}")
-                else:
-                    self._databases.create_document(
-                        database_id=self.database_id,
-                        collection_id=PRACTICE_QUESTIONS_COLLECTION,
-                        document_id=doc_id,
-                        data=doc_data
-                    )
-                    logger.debug(f"Created question: {doc_id}")
+        report.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"✅ Upserted questions in {report.elapsed_seconds:.2f}s: "
+            f"{len(report.created)} created, {len(report.updated)} updated, "
+            f"{len(report.skipped)} unchanged, {len(report.failed)} failed"
+        )
+        return report
 
-                doc_ids.append(doc_id)
+    async def upsert_questions(
+        self,
+        lesson_template_id: str,
+        questions: List[GeneratedQuestion],
+        execution_id: str
+    ) -> List[str]:
+        """Upsert generated questions to practice_questions collection.
 
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to upsert question {question.question_id}: {e}"
-                )
+        Args:
+            lesson_template_id: Source lesson template ID
+            questions: List of generated questions
+            execution_id: Execution ID for tracking
 
-        logger.info(f"✅ Upserted {len(doc_ids)} questions")
-        return doc_ids
+        Returns:
+            List of document IDs created/updated/unchanged
+
+        Raises:
+            RuntimeError: If any question failed (after the rest were written)
+        """
+        report = await self.bulk_upsert_questions(lesson_template_id, questions, execution_id)
+        report.raise_for_failures()
+        return report.doc_ids
 
     async def check_content_exists(
         self,
@@ -415,7 +516,8 @@ class PracticeQuestionUpserter:
         from appwrite.query import Query
 
         # Query practice_blocks for this lesson
-        blocks_result = self._databases.list_documents(
+        blocks_result = await run_appwrite(
+            self._databases.list_documents,
             database_id=self.database_id,
             collection_id=PRACTICE_BLOCKS_COLLECTION,
             queries=[Query.equal("lessonTemplateId", lesson_template_id)]
@@ -423,7 +525,8 @@ class PracticeQuestionUpserter:
         block_count = blocks_result.get("total", 0)
 
         # Query practice_questions for this lesson
-        questions_result = self._databases.list_documents(
+        questions_result = await run_appwrite(
+            self._databases.list_documents,
             database_id=self.database_id,
             collection_id=PRACTICE_QUESTIONS_COLLECTION,
             queries=[
@@ -466,7 +569,8 @@ class PracticeQuestionUpserter:
         deleted = {"blocks": 0, "questions": 0, "storage_files": 0}
 
         # 1. Get all questions and delete them + their storage files
-        questions_result = self._databases.list_documents(
+        questions_result = await run_appwrite(
+            self._databases.list_documents,
             database_id=self.database_id,
             collection_id=PRACTICE_QUESTIONS_COLLECTION,
             queries=[
@@ -479,7 +583,8 @@ class PracticeQuestionUpserter:
             # Delete question data file from storage
             if q.get("questionDataFileId"):
                 try:
-                    self._storage.delete_file(
+                    await run_appwrite(
+                        self._storage.delete_file,
                         bucket_id=PRACTICE_CONTENT_BUCKET_ID,
                         file_id=q["questionDataFileId"]
                     )
@@ -490,7 +595,8 @@ class PracticeQuestionUpserter:
             # Delete diagram file if exists
             if q.get("diagramFileId"):
                 try:
-                    self._storage.delete_file(
+                    await run_appwrite(
+                        self._storage.delete_file,
                         bucket_id=PRACTICE_CONTENT_BUCKET_ID,
                         file_id=q["diagramFileId"]
                     )
@@ -500,7 +606,8 @@ class PracticeQuestionUpserter:
 
             # Delete question document
             try:
-                self._databases.delete_document(
+                await run_appwrite(
+                    self._databases.delete_document,
                     database_id=self.database_id,
                     collection_id=PRACTICE_QUESTIONS_COLLECTION,
                     document_id=q["$id"]
@@ -511,7 +618,8 @@ class PracticeQuestionUpserter:
                 raise RuntimeError(f"Failed to delete question: {e}")
 
         # 2. Get all blocks and delete them + their storage files
-        blocks_result = self._databases.list_documents(
+        blocks_result = await run_appwrite(
+            self._databases.list_documents,
             database_id=self.database_id,
             collection_id=PRACTICE_BLOCKS_COLLECTION,
             queries=[
@@ -524,7 +632,8 @@ class PracticeQuestionUpserter:
             # Delete block data file from storage
             if b.get("blockDataFileId"):
                 try:
-                    self._storage.delete_file(
+                    await run_appwrite(
+                        self._storage.delete_file,
                         bucket_id=PRACTICE_CONTENT_BUCKET_ID,
                         file_id=b["blockDataFileId"]
                     )
@@ -534,7 +643,8 @@ class PracticeQuestionUpserter:
 
             # Delete block document
             try:
-                self._databases.delete_document(
+                await run_appwrite(
+                    self._databases.delete_document,
                     database_id=self.database_id,
                     collection_id=PRACTICE_BLOCKS_COLLECTION,
                     document_id=b["$id"]
@@ -568,7 +678,8 @@ class PracticeQuestionUpserter:
         questions = []
 
         # Fetch all questions for this lesson
-        result = self._databases.list_documents(
+        result = await run_appwrite(
+            self._databases.list_documents,
             database_id=self.database_id,
             collection_id=PRACTICE_QUESTIONS_COLLECTION,
             queries=[
@@ -582,7 +693,8 @@ class PracticeQuestionUpserter:
             question_data = {}
             if doc.get("questionDataFileId"):
                 try:
-                    file_content = self._storage.get_file_download(
+                    file_content = await run_appwrite(
+                        self._storage.get_file_download,
                         bucket_id=PRACTICE_CONTENT_BUCKET_ID,
                         file_id=doc["questionDataFileId"]
                     )
@@ -662,7 +774,8 @@ class PracticeQuestionUpserter:
 
             try:
                 # Note: diagramJson is stored in storage file, not as collection attribute
-                self._databases.update_document(
+                await run_appwrite(
+                    self._databases.update_document,
                     database_id=self.database_id,
                     collection_id=PRACTICE_QUESTIONS_COLLECTION,
                     document_id=q.question_id,
@@ -707,13 +820,17 @@ async def run_practice_content_upsert(
         lesson_template_id, blocks, execution_id
     )
 
-    question_ids = await upserter.upsert_questions(
+    question_report = await upserter.bulk_upsert_questions(
         lesson_template_id, questions, execution_id
     )
+    question_report.raise_for_failures()
 
     return {
         "blocks_upserted": len(block_ids),
-        "questions_upserted": len(question_ids),
+        "questions_upserted": len(question_report.doc_ids),
+        "questions_created": len(question_report.created),
+        "questions_updated": len(question_report.updated),
+        "questions_unchanged": len(question_report.skipped),
         "block_ids": block_ids,
-        "question_ids": question_ids
+        "question_ids": question_report.doc_ids
     }
@@ -435,9 +435,8 @@ async def upload_diagrams_to_storage(
         Dict mapping question_id to Appwrite file_id
     """
     from pathlib import Path as PathLib
-    from appwrite.client import Client
-    from appwrite.services.storage import Storage
     from appwrite.input_file import InputFile
+    from .appwrite_pool import get_appwrite_connection
     import hashlib
 
     manifest_path = workspace_path / "diagram_manifest.json"
@@ -448,34 +447,8 @@ async def upload_diagrams_to_storage(
     with open(manifest_path) as f:
         manifest = json.load(f)
 
-    # Initialize Appwrite client from MCP config
-    config_path = PathLib(mcp_config_path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-    with open(config_path) as f:
-        mcp_config = json.load(f)
-
-    appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-    args = appwrite_config.get("args", [])
-
-    endpoint, api_key, project_id = None, None, None
-    for arg in args:
-        if arg.startswith("APPWRITE_ENDPOINT="):
-            endpoint = arg.split("=", 1)[1]
-        elif arg.startswith("APPWRITE_API_KEY="):
-            api_key = arg.split("=", 1)[1]
-        elif arg.startswith("APPWRITE_PROJECT_ID="):
-            project_id = arg.split("=", 1)[1]
-
-    if not all([endpoint, api_key, project_id]):
-        raise ValueError("Missing Appwrite credentials in MCP config")
-
-    client = Client()
-    client.set_endpoint(endpoint)
-    client.set_project(project_id)
-    client.set_key(api_key)
-    storage = Storage(client)
+    # Shared pooled Appwrite client
+    storage = get_appwrite_connection(mcp_config_path).storage
 
     # Upload each successful diagram
     file_id_map = {}
@@ -0,0 +1,256 @@
+"""Course-scoped cache of parsed Authored_SOW entries.
+
+Every lesson in a batch needs the same published SOW, and parsing its
+``entries`` field can mean downloading a ``storage:<file_id>`` blob and
+gunzipping it. This module caches the parsed entries in memory and on disk,
+keyed by the SOW document ``$id`` + ``$updatedAt``:
+
+- Republishing a SOW bumps ``$updatedAt``, so the next lookup misses and the
+  stale version (memory and disk) is evicted automatically.
+- Entries are indexed by ``order`` for O(1) lesson lookups.
+- The disk layer lets separate processes in one batch run (or a re-run)
+  skip the download entirely.
+
+Callers still query Authored_SOW themselves (filters and error messages differ
+per caller); only the expensive parse step goes through the cache.
+
+Usage:
+    sow = await load_sow_entries(sow_doc, mcp_config_path, courseId)
+    entry = sow.entry_for_order(order)
+
+Cache directory defaults to ``workspace/.sow_cache`` and can be overridden with
+the ``SOW_CACHE_DIR`` environment variable.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .compression import parse_sow_entries
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "workspace" / ".sow_cache"
+
+
+@dataclass
+class CachedSOW:
+    """Parsed entries for one published version of a SOW document.
+
+    Entries are shared between callers - treat them as read-only.
+    """
+    sow_id: str
+    updated_at: str
+    entries: List[Dict[str, Any]]
+    entries_by_order: Dict[int, Dict[str, Any]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Duplicate orders do occur in authored SOWs; keep the first entry
+        # so lookups match the original linear scan.
+        self.entries_by_order = {}
+        for e in self.entries:
+            if not isinstance(e, dict) or "order" not in e:
+                continue
+            if e["order"] in self.entries_by_order:
+                logger.warning(
+                    f"SOW {self.sow_id} has duplicate order {e['order']}; "
+                    f"using the first entry"
+                )
+                continue
+            self.entries_by_order[e["order"]] = e
+
+    def entry_for_order(self, order: int, courseId: str = "unknown") -> Dict[str, Any]:
+        """Return the entry at ``order``.
+
+        Raises:
+            ValueError: If no entry has that order
+        """
+        entry = self.entries_by_order.get(order)
+        if entry is None:
+            raise ValueError(
+                f"Order {order} not found in SOW entries for courseId '{courseId}'. "
+                f"Available orders: {sorted(self.entries_by_order)}"
+            )
+        return entry
+
+
+def _cache_key(sow_doc: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Return (sow_id, updated_at), or None if the document can't be versioned."""
+    sow_id = sow_doc.get("$id")
+    updated_at = sow_doc.get("$updatedAt")
+    if not sow_id or not updated_at:
+        return None
+    return sow_id, updated_at
+
+
+class SOWCache:
+    """Two-level (memory + disk) cache of parsed SOW entries."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(
+            os.environ.get("SOW_CACHE_DIR", DEFAULT_CACHE_DIR)
+        )
+        self._memory: Dict[str, CachedSOW] = {}  # sow_id -> latest version seen
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "invalidations": 0}
+
+    def _path_for(self, sow_id: str, updated_at: str) -> Path:
+        digest = hashlib.sha256(f"{sow_id}@{updated_at}".encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{sow_id}-{digest}.json"
+
+    def get(self, sow_doc: Dict[str, Any]) -> Optional[CachedSOW]:
+        """Return cached entries for this exact SOW version, or None."""
+        key = _cache_key(sow_doc)
+        if key is None:
+            return None
+        sow_id, updated_at = key
+
+        with self._lock:
+            cached = self._memory.get(sow_id)
+            if cached is not None and cached.updated_at == updated_at:
+                self.stats["memory_hits"] += 1
+                return cached
+
+        path = self._path_for(sow_id, updated_at)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable SOW cache file {path}: {e}")
+            return None
+
+        cached = CachedSOW(sow_id=sow_id, updated_at=updated_at, entries=payload["entries"])
+        self._remember(cached)
+        with self._lock:
+            self.stats["disk_hits"] += 1
+        logger.debug(f"SOW cache disk hit: {sow_id} ({updated_at})")
+        return cached
+
+    def put(self, sow_doc: Dict[str, Any], entries: List[Dict[str, Any]]) -> CachedSOW:
+        """Store parsed entries for this SOW version and evict older versions.
+
+        Documents without $id/$updatedAt are wrapped but not cached.
+        """
+        key = _cache_key(sow_doc)
+        if key is None:
+            return CachedSOW(sow_id=sow_doc.get("$id", ""), updated_at="", entries=entries)
+        sow_id, updated_at = key
+
+        cached = CachedSOW(sow_id=sow_id, updated_at=updated_at, entries=entries)
+        self._remember(cached)
+
+        path = self._path_for(sow_id, updated_at)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{sow_id}-*.json"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"sow_id": sow_id, "updated_at": updated_at, "entries": entries}),
+                encoding="utf-8"
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # Disk layer is an optimisation; the in-memory copy is still valid
+            logger.warning(f"Could not write SOW cache file {path}: {e}")
+
+        return cached
+
+    def _remember(self, cached: CachedSOW) -> None:
+        with self._lock:
+            previous = self._memory.get(cached.sow_id)
+            if previous is not None and previous.updated_at != cached.updated_at:
+                self.stats["invalidations"] += 1
+                logger.info(
+                    f"SOW {cached.sow_id} republished ({previous.updated_at} -> {cached.updated_at}), "
+                    f"invalidating cached entries"
+                )
+            self._memory[cached.sow_id] = cached
+
+    async def get_or_parse(
+        self,
+        sow_doc: Dict[str, Any],
+        mcp_config_path: str,
+        courseId: str = "unknown"
+    ) -> CachedSOW:
+        """Return cached entries, parsing with parse_sow_entries() on a miss."""
+        cached = self.get(sow_doc)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            self.stats["misses"] += 1
+        entries = await parse_sow_entries(
+            entries_raw=sow_doc.get("entries", []),
+            mcp_config_path=mcp_config_path,
+            courseId=courseId
+        )
+        return self.put(sow_doc, entries)
+
+    def get_or_load(
+        self,
+        sow_doc: Dict[str, Any],
+        loader: Callable[[Any], List[Dict[str, Any]]]
+    ) -> CachedSOW:
+        """Synchronous variant for callers with their own entries decoder."""
+        cached = self.get(sow_doc)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return self.put(sow_doc, loader(sow_doc.get("entries", "")))
+
+    def clear(self) -> None:
+        """Drop the in-memory layer and reset stats (disk files are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self.stats = {key: 0 for key in self.stats}
+
+
+_cache: Optional[SOWCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_sow_cache() -> SOWCache:
+    """Return the process-wide SOW cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SOWCache()
+        return _cache
+
+
+def reset_sow_cache() -> None:
+    """Forget the process-wide cache (next get_sow_cache() builds a new one)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+async def load_sow_entries(
+    sow_doc: Dict[str, Any],
+    mcp_config_path: str,
+    courseId: str = "unknown"
+) -> CachedSOW:
+    """Parse (or reuse) the entries of an Authored_SOW document.
+
+    Args:
+        sow_doc: Authored_SOW document as returned by list_appwrite_documents
+        mcp_config_path: Path to MCP config for storage bucket access
+        courseId: Course identifier for error messages
+
+    Returns:
+        CachedSOW with entries and entries_by_order
+
+    Raises:
+        ValueError: If entries cannot be parsed (see parse_sow_entries)
+    """
+    return await get_sow_cache().get_or_parse(sow_doc, mcp_config_path, courseId)
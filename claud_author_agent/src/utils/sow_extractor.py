@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, Tuple
 
 from .appwrite_mcp import list_appwrite_documents
-from .compression import parse_sow_entries
+from .sow_cache import load_sow_entries
 
 logger = logging.getLogger(__name__)
 
@@ -68,27 +68,14 @@ async def extract_sow_entry_to_workspace(
     sow_doc = sow_docs[0]
 
     # Parse entries field (handles all formats: storage bucket, compressed, uncompressed)
-    # Uses unified parse_sow_entries() helper that supports:
-    # - Storage bucket: "storage:<file_id>" - fetch from bucket, decompress
-    # - TypeScript "gzip:" prefix: inline compressed
-    # - Python legacy raw base64: inline compressed
-    # - Uncompressed JSON: legacy format
-    entries_raw = sow_doc.get('entries', [])
-    entries = await parse_sow_entries(
-        entries_raw=entries_raw,
+    # through the SOW cache (parsed once per published SOW version)
+    sow = await load_sow_entries(
+        sow_doc=sow_doc,
         mcp_config_path=mcp_config_path,
         courseId=courseId
     )
-
-    # Find entry with matching order
-    entry = next((e for e in entries if e.get('order') == order), None)
-
-    if entry is None:
-        available_orders = [e.get('order') for e in entries if 'order' in e]
-        raise ValueError(
-            f"Order {order} not found in SOW entries for courseId '{courseId}'. "
-            f"Available orders: {sorted(available_orders)}"
-        )
+    entries = sow.entries
+    entry = sow.entry_for_order(order, courseId)
 
     logger.info(f"Found SOW entry: {entry.get('label', 'N/A')}")
 
@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any
 
-from .compression import compress_json_gzip_base64, get_compression_stats
+from .compression import compress_json
 from ..tools.sow_validator_tool import validate_sow_schema
 
 logger = logging.getLogger(__name__)
@@ -246,8 +246,9 @@ async def upsert_sow_to_appwrite(
 
     # Compress entries array using gzip+base64
     # If compressed size exceeds 100k, we'll use Storage Bucket approach
-    entries_compressed = compress_json_gzip_base64(sow_data["entries"])
-    entries_stats = get_compression_stats(sow_data["entries"])
+    entries_compression = compress_json(sow_data["entries"])
+    entries_compressed = entries_compression.encoded
+    entries_stats = entries_compression.stats()
 
     # Check if entries exceed Appwrite's 100k character limit
     # Use Storage Bucket approach for large entries (stores file_id in entries field)
@@ -24,14 +24,16 @@ Usage:
 import asyncio
 import base64
 import hashlib
-import json
 import logging
 import ssl
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from io import BytesIO
 from urllib3.exceptions import SSLError as Urllib3SSLError
 
+from .appwrite_async import run_appwrite
+from .appwrite_pool import get_appwrite_connection
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration for transient network errors
@@ -176,16 +178,21 @@ def generate_file_id(lesson_template_id: str, card_id: str, diagram_context: Opt
 async def upload_diagram_image(
     lesson_template_id: str,
     card_id: str,
-    image_base64: str,
+    image_base64: Optional[str] = None,
     diagram_context: Optional[str] = None,
     diagram_index: int = 0,
-    mcp_config_path: str = ".mcp.json"
+    mcp_config_path: str = ".mcp.json",
+    image_path: Optional[Union[str, Path]] = None
 ) -> str:
-    """Upload base64-encoded PNG image to Appwrite Storage.
+    """Upload a PNG image to Appwrite Storage.
 
     Uploads diagram image to the 'image' bucket with a deterministic file ID.
     If a file with the same ID already exists, it will be overwritten.
 
+    Pass either image_base64 or image_path. With image_path the PNG is read
+    from disk by the SDK at upload time (chunked for large files), so the
+    caller never holds the image - or its base64 form - in memory.
+
     Args:
         lesson_template_id: Lesson template document ID
         card_id: Card identifier (e.g., "card_001")
@@ -193,12 +200,14 @@ async def upload_diagram_image(
         diagram_context: Diagram usage context ("lesson" or "cfu") - optional for backward compatibility
         diagram_index: Diagram index for multi-diagram cards (default 0 for backward compatibility)
         mcp_config_path: Path to MCP configuration file
+        image_path: Path to a PNG file in the workspace (alternative to image_base64)
 
     Returns:
         str: File ID of uploaded image (e.g., "dgm_image_a1b2c3d4")
 
     Raises:
-        ValueError: If image_base64 is empty or invalid
+        ValueError: If neither/both image sources are given, the file is
+            missing, or image_base64 is invalid
         Exception: If upload fails (network error, quota exceeded, etc.)
 
     Example:
@@ -218,8 +227,11 @@ async def upload_diagram_image(
     )
 
     # Validation
-    if not image_base64:
-        raise ValueError("image_base64 is required and cannot be empty")
+    if bool(image_base64) == bool(image_path):
+        raise ValueError("Exactly one of image_base64 or image_path is required")
+
+    if image_path and not Path(image_path).is_file():
+        raise ValueError(f"image_path does not exist: {image_path}")
 
     if not lesson_template_id:
         raise ValueError("lesson_template_id is required")
@@ -232,72 +244,50 @@ async def upload_diagram_image(
 
     try:
         # Import Appwrite SDK
-        from appwrite.client import Client
-        from appwrite.services.storage import Storage
         from appwrite.input_file import InputFile
         from appwrite.exception import AppwriteException
 
-        # Load MCP config for credentials
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        # Extract credentials
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError("Missing Appwrite credentials in MCP config")
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        storage = get_appwrite_connection(mcp_config_path).storage
 
-        # Initialize client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        storage = Storage(client)
-
-        # Decode base64 to binary
-        try:
-            image_binary = base64.b64decode(image_base64)
-        except Exception as e:
-            raise ValueError(f"Failed to decode base64 image: {e}")
-
-        logger.info(f"Image size: {len(image_binary)} bytes ({len(image_binary) / 1024:.2f} KB)")
-
-        # Create InputFile from binary data
-        input_file = InputFile.from_bytes(
-            image_binary,
-            filename=f"{file_id}.png",
-            mime_type="image/png"
-        )
+        if image_path:
+            image_size = Path(image_path).stat().st_size
+        else:
+            # Decode base64 to binary
+            try:
+                image_binary = base64.b64decode(image_base64)
+            except Exception as e:
+                raise ValueError(f"Failed to decode base64 image: {e}")
+            image_size = len(image_binary)
+
+        logger.info(f"Image size: {image_size} bytes ({image_size / 1024:.2f} KB)")
+
+        def make_input_file() -> "InputFile":
+            """Build a fresh InputFile (one is consumed per upload attempt)."""
+            if image_path:
+                input_file = InputFile.from_path(str(image_path))
+                input_file.filename = f"{file_id}.png"
+                input_file.mime_type = "image/png"
+                return input_file
+            return InputFile.from_bytes(
+                image_binary,
+                filename=f"{file_id}.png",
+                mime_type="image/png"
+            )
 
         # Upload to Storage bucket with retry logic for transient errors
         async def do_upload() -> str:
             """Perform the actual upload (wrapped for retry)."""
             # Check if file already exists and delete it (for overwrite behavior)
             try:
-                existing_file = storage.get_file(
+                existing_file = await run_appwrite(
+                    storage.get_file,
                     bucket_id=DIAGRAM_IMAGE_BUCKET_ID,
                     file_id=file_id
                 )
                 logger.info(f"File {file_id} already exists - deleting for overwrite")
-                storage.delete_file(
+                await run_appwrite(
+                    storage.delete_file,
                     bucket_id=DIAGRAM_IMAGE_BUCKET_ID,
                     file_id=file_id
                 )
@@ -311,14 +301,11 @@ async def upload_diagram_image(
                     raise
 
             # Need to recreate InputFile for each retry (consumed on first attempt)
-            retry_input_file = InputFile.from_bytes(
-                image_binary,
-                filename=f"{file_id}.png",
-                mime_type="image/png"
-            )
+            retry_input_file = make_input_file()
 
             # Upload new file
-            result = storage.create_file(
+            result = await run_appwrite(
+                storage.create_file,
                 bucket_id=DIAGRAM_IMAGE_BUCKET_ID,
                 file_id=file_id,
                 file=retry_input_file
@@ -331,7 +318,7 @@ async def upload_diagram_image(
 
             logger.info(
                 f"✓ Image uploaded successfully: {uploaded_file_id} "
-                f"({len(image_binary) / 1024:.2f} KB)"
+                f"({image_size / 1024:.2f} KB)"
             )
 
             return uploaded_file_id
@@ -340,7 +327,7 @@ async def upload_diagram_image(
             # Handle specific Appwrite errors
             if e.code == 413:
                 raise Exception(
-                    f"Image too large for upload: {len(image_binary) / 1024:.2f} KB. "
+                    f"Image too large for upload: {image_size / 1024:.2f} KB. "
                     f"Appwrite bucket may have size limits. Error: {e.message}"
                 )
             elif e.code == 429:
@@ -385,46 +372,14 @@ async def delete_diagram_image(
     logger.info(f"Deleting diagram image: {file_id}")
 
     try:
-        from appwrite.client import Client
-        from appwrite.services.storage import Storage
         from appwrite.exception import AppwriteException
 
-        # Load credentials (same pattern as upload)
-        config_path = Path(mcp_config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"MCP config not found: {mcp_config_path}")
-
-        with open(config_path) as f:
-            mcp_config = json.load(f)
-
-        appwrite_config = mcp_config.get("mcpServers", {}).get("appwrite", {})
-        args = appwrite_config.get("args", [])
-
-        endpoint = None
-        api_key = None
-        project_id = None
-
-        for arg in args:
-            if arg.startswith("APPWRITE_ENDPOINT="):
-                endpoint = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_API_KEY="):
-                api_key = arg.split("=", 1)[1]
-            elif arg.startswith("APPWRITE_PROJECT_ID="):
-                project_id = arg.split("=", 1)[1]
-
-        if not all([endpoint, api_key, project_id]):
-            raise ValueError("Missing Appwrite credentials in MCP config")
-
-        # Initialize client
-        client = Client()
-        client.set_endpoint(endpoint)
-        client.set_project(project_id)
-        client.set_key(api_key)
-
-        storage = Storage(client)
+        # Shared pooled client (config parsed once per process, keep-alive HTTP)
+        storage = get_appwrite_connection(mcp_config_path).storage
 
         # Delete file
-        storage.delete_file(
+        await run_appwrite(
+            storage.delete_file,
             bucket_id=DIAGRAM_IMAGE_BUCKET_ID,
             file_id=file_id
         )
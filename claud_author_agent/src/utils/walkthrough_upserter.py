@@ -7,13 +7,13 @@ This module provides functionality to:
 - Upsert to us_walkthroughs collection
 """
 
-import base64
-import gzip
 import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .appwrite_async import run_appwrite
+from .compression import compress_text, decompress_text
 from ..models.walkthrough_models import (
     WalkthroughDocument,
     QuestionWalkthrough,
@@ -32,25 +32,22 @@ def compress_json_content(data: str) -> str:
         data: JSON string to compress
 
     Returns:
-        Base64-encoded gzip-compressed string
+        Base64-encoded gzip-compressed string ("zstd:"-prefixed when
+        CONTENT_COMPRESSION_CODEC=zstd)
     """
-    # Encode to bytes, compress with gzip, then base64 encode
-    compressed = gzip.compress(data.encode('utf-8'))
-    return base64.b64encode(compressed).decode('ascii')
+    return compress_text(data, prefix=False).encoded
 
 
 def decompress_json_content(compressed: str) -> str:
     """Decompress base64-encoded gzip-compressed JSON string.
 
     Args:
-        compressed: Base64-encoded gzip-compressed string
+        compressed: Base64-encoded gzip-compressed string (raw or prefixed)
 
     Returns:
         Original JSON string
     """
-    # Decode base64, decompress gzip, decode to string
-    decoded = base64.b64decode(compressed.encode('ascii'))
-    return gzip.decompress(decoded).decode('utf-8')
+    return decompress_text(compressed)
 
 
 def parse_walkthrough_template(template_path: Path) -> QuestionWalkthrough:
@@ -219,7 +216,8 @@ async def check_walkthrough_exists(
         databases = Databases(client)
 
         # Try to fetch the document
-        databases.get_document(
+        await run_appwrite(
+            databases.get_document,
             database_id="sqa_education",
             collection_id="us_walkthroughs",
             document_id=walkthrough_id
@@ -277,7 +275,8 @@ async def list_walkthroughs_by_paper_ids(
             batch = paper_ids[i:i + batch_size]
 
             # Query walkthroughs where paper_id is in the batch
-            result = databases.list_documents(
+            result = await run_appwrite(
+                databases.list_documents,
                 database_id="sqa_education",
                 collection_id="us_walkthroughs",
                 queries=[
@@ -329,7 +328,8 @@ async def delete_walkthrough(
         client, _, _, _ = _get_appwrite_client(mcp_config_path)
         databases = Databases(client)
 
-        databases.delete_document(
+        await run_appwrite(
+            databases.delete_document,
             database_id="sqa_education",
             collection_id="us_walkthroughs",
             document_id=walkthrough_id
@@ -415,7 +415,8 @@ async def upsert_walkthrough_via_mcp(
         # (update requires read permission on existing doc, delete doesn't)
         try:
             logger.info(f"Attempting to delete existing walkthrough: {doc_id}")
-            databases.delete_document(
+            await run_appwrite(
+                databases.delete_document,
                 database_id="sqa_education",
                 collection_id="us_walkthroughs",
                 document_id=doc_id
@@ -430,7 +431,8 @@ async def upsert_walkthrough_via_mcp(
 
         # Create fresh document
         logger.info(f"Creating walkthrough: {doc_id}")
-        result = databases.create_document(
+        result = await run_appwrite(
+            databases.create_document,
             database_id="sqa_education",
             collection_id="us_walkthroughs",
             document_id=doc_id,
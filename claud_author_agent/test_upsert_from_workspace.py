@@ -8,7 +8,6 @@ Usage:
 
 import argparse
 import asyncio
-import base64
 import json
 import logging
 from pathlib import Path
@@ -64,16 +63,11 @@ async def run_upsert_test(workspace_path: str) -> dict:
     diagrams_data = []
 
     for diagram in diagrams_output["diagrams"]:
-        # Load PNG and convert to base64
         image_path = Path(diagram["image_path"])
         if not image_path.exists():
             logger.error(f"Image not found: {image_path}")
             continue
 
-        with open(image_path, "rb") as f:
-            image_bytes = f.read()
-        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-
         # Parse critique_feedback (may be string or list)
         critique_feedback = diagram.get("critique_feedback", "")
         if isinstance(critique_feedback, str):
@@ -86,7 +80,7 @@ async def run_upsert_test(workspace_path: str) -> dict:
             "card_id": diagram["cardId"],
             "diagram_index": diagram.get("diagram_index", 0),
             "jsxgraph_json": diagram.get("jsxgraph_json", ""),  # Empty for gemini_nano backend
-            "image_base64": image_base64,
+            "image_path": str(image_path),
             "diagram_type": diagram.get("diagram_type", "geometry"),
             "visual_critique_score": diagram.get("visual_critique_score", 0.0),
             "critique_iterations": diagram.get("critique_iterations", 1),
@@ -100,7 +94,7 @@ async def run_upsert_test(workspace_path: str) -> dict:
         diagrams_data.append(upsert_data)
         logger.info(
             f"  Prepared: {diagram['cardId']} - {diagram.get('diagram_context', 'lesson')} - "
-            f"index {diagram.get('diagram_index', 0)} - {len(image_base64)} bytes base64"
+            f"index {diagram.get('diagram_index', 0)} - {image_path.stat().st_size} bytes"
         )
 
     if not diagrams_data:
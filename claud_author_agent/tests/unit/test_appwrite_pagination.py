@@ -0,0 +1,100 @@
+"""
+Unit Tests for cursor-based Appwrite pagination.
+"""
+
+import json
+
+import pytest
+from appwrite.query import Query
+
+from src.utils.appwrite_pagination import build_select_fields, iter_document_pages
+
+
+class FakeDatabases:
+    """In-memory list_documents that honours limit/cursorAfter/select/equal."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    def list_documents(self, database_id, collection_id, queries):
+        parsed = [json.loads(q) for q in queries]
+        self.calls.append(parsed)
+
+        docs = self.documents
+        limit = 25
+        select = None
+        for q in parsed:
+            if q["method"] == "equal":
+                docs = [d for d in docs if d.get(q["attribute"]) in q["values"]]
+            elif q["method"] == "limit":
+                limit = q["values"][0]
+            elif q["method"] == "select":
+                select = q["values"]
+            elif q["method"] == "offset":
+                raise AssertionError("offset pagination should not be used")
+
+        for q in parsed:
+            if q["method"] == "cursorAfter":
+                ids = [d["$id"] for d in docs]
+                docs = docs[ids.index(q["values"][0]) + 1:]
+
+        page = docs[:limit]
+        if select:
+            page = [{k: v for k, v in d.items() if k in select} for d in page]
+        return {"total": len(self.documents), "documents": page}
+
+
+def make_docs(n):
+    return [
+        {"$id": f"doc_{i:03d}", "courseId": "c1", "sow_order": i, "cards": "x" * 100}
+        for i in range(1, n + 1)
+    ]
+
+
+async def collect(pages):
+    return [page async for page in pages]
+
+
+@pytest.mark.asyncio
+async def test_pages_with_cursor_until_exhausted():
+    databases = FakeDatabases(make_docs(25))
+
+    pages = await collect(iter_document_pages(databases, "default", "lesson_templates", page_size=10))
+
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert [d["sow_order"] for p in pages for d in p] == list(range(1, 26))
+    cursors = [q["values"][0] for call in databases.calls for q in call if q["method"] == "cursorAfter"]
+    assert cursors == ["doc_010", "doc_020"]
+
+
+@pytest.mark.asyncio
+async def test_exact_multiple_of_page_size_ends_with_empty_request():
+    databases = FakeDatabases(make_docs(20))
+
+    pages = await collect(iter_document_pages(databases, "default", "lesson_templates", page_size=10))
+
+    assert [len(p) for p in pages] == [10, 10]
+    assert len(databases.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_select_projects_fields_and_keeps_id():
+    databases = FakeDatabases(make_docs(3))
+
+    pages = await collect(iter_document_pages(
+        databases, "default", "lesson_templates",
+        query_objects=[Query.equal("courseId", ["c1"])],
+        select=["sow_order"]
+    ))
+
+    assert pages == [[
+        {"$id": "doc_001", "sow_order": 1},
+        {"$id": "doc_002", "sow_order": 2},
+        {"$id": "doc_003", "sow_order": 3},
+    ]]
+
+
+def test_build_select_fields_dedupes_and_prepends_id():
+    assert build_select_fields(["sow_order", "sow_order"]) == ["$id", "sow_order"]
+    assert build_select_fields(["sow_order", "$id"]) == ["sow_order", "$id"]
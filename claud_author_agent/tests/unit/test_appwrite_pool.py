@@ -0,0 +1,133 @@
+"""
+Unit Tests for the pooled Appwrite client registry.
+
+Covers:
+- Config parsing and error handling
+- Client caching per config path (and invalidation on config change)
+- Keep-alive connection reuse against a local HTTP server
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils.appwrite_pool import (
+    get_appwrite_connection,
+    get_appwrite_pool_stats,
+    load_appwrite_credentials,
+    reset_appwrite_pool,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+def write_mcp_config(path, endpoint="http://127.0.0.1:1/v1", api_key="key", project_id="proj"):
+    """Write a minimal .mcp.json with Appwrite MCP server args."""
+    args = ["mcp-server-appwrite"]
+    if endpoint:
+        args.append(f"APPWRITE_ENDPOINT={endpoint}")
+    if api_key:
+        args.append(f"APPWRITE_API_KEY={api_key}")
+    if project_id:
+        args.append(f"APPWRITE_PROJECT_ID={project_id}")
+    path.write_text(json.dumps({"mcpServers": {"appwrite": {"args": args}}}))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    reset_appwrite_pool()
+    yield
+    reset_appwrite_pool()
+
+
+class _DocumentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"$id": self.path.rsplit("/", 1)[-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def appwrite_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DocumentHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class TestLoadCredentials:
+    def test_parses_args(self, tmp_path):
+        config = write_mcp_config(tmp_path / ".mcp.json")
+        creds = load_appwrite_credentials(str(config))
+        assert creds.endpoint == "http://127.0.0.1:1/v1"
+        assert creds.api_key == "key"
+        assert creds.project_id == "proj"
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            get_appwrite_connection(str(tmp_path / "missing.json"))
+
+    def test_missing_credentials_raises(self, tmp_path):
+        config = write_mcp_config(tmp_path / ".mcp.json", api_key=None)
+        with pytest.raises(ValueError, match="Missing Appwrite credentials"):
+            get_appwrite_connection(str(config))
+
+
+class TestRegistry:
+    def test_same_path_returns_cached_connection(self, tmp_path):
+        config = write_mcp_config(tmp_path / ".mcp.json")
+        first = get_appwrite_connection(str(config))
+        second = get_appwrite_connection(str(config))
+
+        assert first is second
+        assert first.databases is second.databases
+        stats = get_appwrite_pool_stats()
+        assert stats["clients_created"] == 1
+        assert stats["client_cache_hits"] == 1
+
+    def test_config_change_invalidates_cache(self, tmp_path):
+        config = write_mcp_config(tmp_path / ".mcp.json")
+        first = get_appwrite_connection(str(config))
+
+        write_mcp_config(config, project_id="other")
+        stat = config.stat()
+        os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = get_appwrite_connection(str(config))
+        assert second is not first
+        assert second.project_id == "other"
+
+
+class TestConnectionReuse:
+    def test_requests_share_keep_alive_connection(self, tmp_path, appwrite_server):
+        config = write_mcp_config(tmp_path / ".mcp.json", endpoint=appwrite_server)
+
+        for i in range(5):
+            client = get_appwrite_connection(str(config)).client
+            doc = client.call("get", f"/databases/default/collections/courses/documents/doc_{i}")
+            assert doc["$id"] == f"doc_{i}"
+
+        stats = get_appwrite_pool_stats()
+        assert stats["http_requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
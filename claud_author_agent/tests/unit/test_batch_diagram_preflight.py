@@ -0,0 +1,110 @@
+"""
+Unit Tests for the batched pre-flight in batch_diagram_generator.
+
+Covers fetching all lesson templates with one query and answering the
+existing-diagram check with one equal("lessonTemplateId", [...]) query.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import appwrite_mcp, diagram_extractor
+from src.utils.batch_diagram_utils import check_existing_diagrams_batch
+from src.utils.compression import compress_json_gzip_base64
+from src.utils.diagram_extractor import fetch_lesson_templates_by_order
+from src.utils.diagram_validator import validate_structure_batch
+
+
+class FakeCollections:
+    """Stand-in for iter_appwrite_documents that records each query."""
+
+    def __init__(self, collections):
+        self.collections = collections
+        self.calls = []
+
+    async def __call__(self, database_id, collection_id, queries=None, mcp_config_path=".mcp.json", select=None, **kwargs):
+        self.calls.append((collection_id, queries))
+        filters = [json.loads(q) for q in appwrite_mcp._parse_query_strings(queries)]
+        for doc in self.collections[collection_id]:
+            if all(doc.get(f["attribute"]) in f["values"] for f in filters):
+                yield doc
+
+
+def make_templates():
+    return [
+        {"$id": "lt_1", "courseId": "c1", "sow_order": 1, "title": "One",
+         "cards": compress_json_gzip_base64([{"id": "card_001"}])},
+        {"$id": "lt_2", "courseId": "c1", "sow_order": 2, "title": "Two", "cards": []},
+        {"$id": "lt_2_dup", "courseId": "c1", "sow_order": 2, "title": "Two (dup)", "cards": []},
+        {"$id": "lt_other", "courseId": "c2", "sow_order": 1, "title": "Other", "cards": []},
+    ]
+
+
+@pytest.fixture
+def fake():
+    fake = FakeCollections({
+        "lesson_templates": make_templates(),
+        "lesson_diagrams": [
+            {"$id": "d1", "lessonTemplateId": "lt_1", "cardId": "card_001", "diagram_context": "lesson"},
+            {"$id": "d2", "lessonTemplateId": "lt_1", "cardId": "card_001", "diagram_context": "cfu"},
+            {"$id": "d3", "lessonTemplateId": "lt_other", "cardId": "card_009"},
+        ],
+    })
+    with patch.object(diagram_extractor, "iter_appwrite_documents", fake), \
+         patch.object(appwrite_mcp, "iter_appwrite_documents", fake):
+        yield fake
+
+
+@pytest.mark.asyncio
+async def test_templates_fetched_with_one_query_keeping_first_duplicate(fake):
+    templates = await fetch_lesson_templates_by_order("c1", [1, 2, 3], ".mcp.json")
+
+    assert len(fake.calls) == 1
+    assert {order: t["$id"] for order, t in templates.items()} == {1: "lt_1", 2: "lt_2"}
+
+
+@pytest.mark.asyncio
+async def test_existing_diagrams_answered_with_one_query(fake):
+    templates = await fetch_lesson_templates_by_order("c1", [1, 2, 3], ".mcp.json")
+    fake.calls.clear()
+
+    existing = await check_existing_diagrams_batch("c1", [1, 2, 3], ".mcp.json", templates=templates)
+
+    assert fake.calls == [("lesson_diagrams", ['equal("lessonTemplateId", ["lt_1", "lt_2"])'])]
+    assert existing == {1: [("card_001", "lesson"), ("card_001", "cfu")], 2: [], 3: []}
+
+
+@pytest.mark.asyncio
+async def test_structure_validation_shares_decoded_templates(fake):
+    templates = await fetch_lesson_templates_by_order("c1", [1, 3], ".mcp.json")
+    fake.calls.clear()
+
+    results = await validate_structure_batch("c1", [1, 3], ".mcp.json", templates=templates)
+
+    assert fake.calls == []
+    assert templates[1]["cards"] == [{"id": "card_001"}]
+    assert results[3]["lesson_title"] == "NOT FOUND"
+    assert not results[3]["valid"]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_query_only_blanks_the_failing_lesson(fake):
+    templates = await fetch_lesson_templates_by_order("c1", [1, 2], ".mcp.json")
+    templates[2] = {**templates[2], "$id": "lt_broken"}
+    fake.collections["lesson_diagrams"].append(
+        {"$id": "d4", "lessonTemplateId": "lt_broken", "cardId": "card_002"}
+    )
+    original = fake.__call__
+
+    async def failing(database_id, collection_id, queries=None, **kwargs):
+        if "lt_broken" in queries[0]:
+            raise RuntimeError("Appwrite 500")
+        async for doc in original(database_id, collection_id, queries=queries, **kwargs):
+            yield doc
+
+    with patch.object(appwrite_mcp, "iter_appwrite_documents", failing):
+        existing = await check_existing_diagrams_batch("c1", [1, 2], ".mcp.json", templates=templates)
+
+    assert existing == {1: [("card_001", "lesson"), ("card_001", "cfu")], 2: []}
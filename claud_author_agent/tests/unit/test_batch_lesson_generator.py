@@ -0,0 +1,89 @@
+"""
+Unit Tests for concurrent batch lesson generation.
+
+Covers the --max-concurrent worker pool in execute_batch_generation:
+- Lessons run in parallel up to the limit
+- Results and batch_summary.json stay in SOW order
+- Skip logic is unchanged
+"""
+
+import asyncio
+import json
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src import batch_lesson_generator
+from src.batch_lesson_generator import execute_batch_generation
+
+
+def make_entries(n):
+    return [{"order": i, "label": f"Lesson {i}"} for i in range(1, n + 1)]
+
+
+class FakeGenerator:
+    """Stand-in for generate_single_lesson that tracks concurrency."""
+
+    def __init__(self, fail_orders=()):
+        self.active = 0
+        self.peak = 0
+        self.fail_orders = set(fail_orders)
+
+    async def __call__(self, courseId, order, label, log_file_path, config):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        # Later lessons finish first to exercise ordered reporting
+        await asyncio.sleep(0.01 * (10 - order))
+        self.active -= 1
+
+        if order in self.fail_orders:
+            return {"success": False, "error": "boom", "duration_seconds": 1, "cost_usd": 0.5, "tokens": 10}
+        return {"success": True, "doc_id": f"doc_{order}", "duration_seconds": 1, "cost_usd": 1.0, "tokens": 100}
+
+
+async def run_batch(tmp_path, entries, existing, generator, max_concurrent):
+    config = {"mcp_config_path": ".mcp.json", "max_retries": 1, "max_concurrent": max_concurrent}
+    batch_logger = logging.getLogger("test.batch")
+
+    with patch.object(batch_lesson_generator, "fetch_sow_entries", AsyncMock(return_value=entries)), \
+         patch.object(batch_lesson_generator, "check_existing_lessons", AsyncMock(return_value=existing)), \
+         patch.object(batch_lesson_generator, "generate_single_lesson", generator):
+        return await execute_batch_generation(
+            courseId="course_test",
+            force_mode=False,
+            batch_id="batch_test",
+            log_dir=tmp_path,
+            batch_logger=batch_logger,
+            config=config
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_results_are_reported_in_sow_order(tmp_path):
+    generator = FakeGenerator(fail_orders={4})
+
+    summary = await run_batch(tmp_path, make_entries(6), {}, generator, max_concurrent=3)
+
+    assert generator.peak == 3
+    assert [r["order"] for r in summary["results"]] == [1, 2, 3, 4, 5, 6]
+    assert summary["generated"] == 5
+    assert summary["failed"] == 1
+    assert summary["total_tokens"] == 510
+    assert summary["max_concurrent"] == 3
+
+    written = json.loads((tmp_path / "batch_summary.json").read_text())
+    assert [r["status"] for r in written["results"]] == ["success"] * 3 + ["failed"] + ["success"] * 2
+
+
+@pytest.mark.asyncio
+async def test_default_runs_sequentially_and_skips_existing(tmp_path):
+    generator = FakeGenerator()
+    existing = {2: {"doc_id": "existing_2", "model_version": "claud_Agent_sdk"}}
+
+    summary = await run_batch(tmp_path, make_entries(3), existing, generator, max_concurrent=1)
+
+    assert generator.peak == 1
+    assert [r["status"] for r in summary["results"]] == ["success", "skipped", "success"]
+    assert summary["skipped"] == 1
+    assert summary["results"][1]["existing_doc_id"] == "existing_2"
@@ -0,0 +1,84 @@
+"""
+Unit Tests for the shared content codec in utils/compression.py.
+
+Covers format compatibility of the gzip output, zstd auto-detection and the
+single-pass size stats used by the upserters.
+"""
+
+import base64
+import gzip
+import json
+
+import pytest
+
+from src.nat5_plus.exam_upserter import compress_json as compress_exam_json, decompress_json as decompress_exam_json
+from src.utils.compression import (
+    compress_json,
+    compress_json_gzip_base64,
+    decompress_json_gzip_base64,
+    get_compression_stats,
+    is_compressed,
+)
+from src.utils.lesson_upserter import compress_cards_gzip_base64, decompress_cards_gzip_base64
+
+PAYLOAD = [{"order": i, "title": f"Lesson {i}", "cards": [{"id": f"card_{i:03d}", "text": "x" * 40}]} for i in range(20)]
+
+
+def test_gzip_output_matches_legacy_readers():
+    encoded = compress_json_gzip_base64(PAYLOAD)
+
+    assert encoded.startswith("gzip:")
+    raw = gzip.decompress(base64.b64decode(encoded[len("gzip:"):]))
+    assert json.loads(raw) == PAYLOAD
+
+    # Lesson cards and Nat5+ exams stay raw base64 gzip for the frontend
+    cards = compress_cards_gzip_base64(PAYLOAD)
+    assert json.loads(gzip.decompress(base64.b64decode(cards))) == PAYLOAD
+    assert decompress_json_gzip_base64(cards) == PAYLOAD
+    assert decompress_exam_json(compress_exam_json({"sections": PAYLOAD})) == {"sections": PAYLOAD}
+
+
+def test_uncompressed_json_still_parses():
+    assert decompress_json_gzip_base64(json.dumps(PAYLOAD)) == PAYLOAD
+
+
+def test_zstd_is_prefixed_and_auto_detected():
+    pytest.importorskip("zstandard")
+
+    result = compress_json(PAYLOAD, codec="zstd", level=3, prefix=False)
+
+    assert result.encoded.startswith("zstd:")
+    assert is_compressed(result.encoded)
+    assert decompress_json_gzip_base64(result.encoded) == PAYLOAD
+    assert decompress_cards_gzip_base64(result.encoded) == PAYLOAD
+
+
+def test_stats_come_from_the_single_encode_pass():
+    result = compress_json(PAYLOAD, codec="gzip", level=1)
+
+    assert result.original_size == len(json.dumps(PAYLOAD))
+    assert result.compressed_size == len(result.encoded)
+    assert result.stats()["compressed"] == result.compressed_size
+    assert result.stats()["level"] == 1
+    assert get_compression_stats(PAYLOAD)["compressed"] == len(compress_json_gzip_base64(PAYLOAD))
+
+
+def test_unknown_codec_and_corrupt_data_raise_value_error():
+    with pytest.raises(ValueError, match="Unsupported compression codec"):
+        compress_json(PAYLOAD, codec="brotli")
+
+    with pytest.raises(ValueError, match="Failed to decompress"):
+        decompress_json_gzip_base64("gzip:" + base64.b64encode(b"\x1f\x8bnot gzip").decode())
+
+
+def test_levels_are_validated_per_codec(monkeypatch):
+    with pytest.raises(ValueError, match="Invalid gzip compression level 19"):
+        compress_json(PAYLOAD, codec="gzip", level=19)
+
+    # A zstd level in the environment must not leak into gzip calls
+    monkeypatch.setenv("CONTENT_COMPRESSION_ZSTD_LEVEL", "19")
+    assert compress_json(PAYLOAD, codec="gzip").level == 9
+
+    monkeypatch.setenv("CONTENT_COMPRESSION_GZIP_LEVEL", "19")
+    with pytest.raises(ValueError, match="Invalid gzip compression level 19"):
+        compress_json(PAYLOAD, codec="gzip")
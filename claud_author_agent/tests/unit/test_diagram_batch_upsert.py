@@ -0,0 +1,85 @@
+"""
+Unit Tests for concurrent, file-streaming diagram upserts.
+
+Covers bounded concurrency and ordering in batch_upsert_diagrams, the
+throughput fields in its result, and streaming a PNG path to Storage.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from appwrite.exception import AppwriteException
+
+from src.utils import diagram_upserter, storage_uploader
+from src.utils.diagram_upserter import batch_upsert_diagrams
+from src.utils.storage_uploader import upload_diagram_image
+
+
+def make_item(card_id, image_path):
+    return {
+        "lesson_template_id": "lt_1", "card_id": card_id, "tool_name": "jsxgraph",
+        "image_path": image_path, "diagram_type": "geometry", "visual_critique_score": 0.9,
+        "critique_iterations": 1, "critique_feedback": [], "execution_id": "exec_1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_bounded_concurrency_and_keeps_input_order(tmp_path):
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_upsert(**kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01 if kwargs["card_id"] != "card_000" else 0.03)
+        in_flight["now"] -= 1
+        assert kwargs["image_base64"] is None
+        if kwargs["card_id"] == "card_003":
+            raise RuntimeError("storage down")
+        return {"$id": f"dgm_{kwargs['card_id']}"}
+
+    items = []
+    for n in range(8):
+        png = tmp_path / f"card_{n:03d}.png"
+        png.write_bytes(b"\x89PNG" + b"\0" * 1020)
+        items.append(make_item(f"card_{n:03d}", str(png)))
+
+    with patch.object(diagram_upserter, "upsert_lesson_diagram", fake_upsert):
+        result = await batch_upsert_diagrams(items, concurrency=3)
+
+    assert in_flight["max"] == 3
+    assert [d["$id"] for d in result["documents"]] == [f"dgm_card_{n:03d}" for n in range(8) if n != 3]
+    assert result["errors"][0]["card_id"] == "card_003" and result["errors"][0]["index"] == 4
+    assert result["bytes_uploaded"] == 7 * 1024
+    assert result["diagrams_per_second"] > 0 and result["mb_per_second"] > 0
+
+
+class FakeStorage:
+    def __init__(self):
+        self.uploaded = []
+
+    def get_file(self, bucket_id, file_id):
+        raise AppwriteException("not found", code=404)
+
+    def create_file(self, bucket_id, file_id, file):
+        self.uploaded.append(file)
+        return {"$id": file_id}
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_png_from_path(tmp_path):
+    png = tmp_path / "card_001_lesson.png"
+    png.write_bytes(b"\x89PNG fake")
+    storage = FakeStorage()
+
+    with patch.object(storage_uploader, "get_appwrite_connection", lambda path: SimpleNamespace(storage=storage)):
+        file_id = await upload_diagram_image("lt_1", "card_001", image_path=png, diagram_context="lesson")
+
+    uploaded = storage.uploaded[0]
+    assert file_id.startswith("dgm_image_")
+    assert uploaded.source_type == "path" and uploaded.path == str(png)
+    assert uploaded.filename == f"{file_id}.png" and uploaded.mime_type == "image/png"
+
+    with pytest.raises(ValueError, match="Exactly one"):
+        await upload_diagram_image("lt_1", "card_001", image_base64="aGk=", image_path=png)
@@ -0,0 +1,131 @@
+"""
+Unit Tests for the shared async HTTP client used by the diagram tools.
+
+Runs against a local HTTP/1.1 server that tracks connections and concurrency.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.tools import diagram_http_client
+from src.tools.diagram_http_client import (
+    aclose_diagram_http_client,
+    get_render_latency_stats,
+    post_render_request,
+    reset_render_latency_stats,
+)
+
+
+class RenderServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), RenderHandler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.connections = set()
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(body.get("delay", 0))
+
+        with server.lock:
+            server.active -= 1
+
+        status = 500 if body.get("fail") else 200
+        payload = json.dumps({"success": status == 200, "image": "aGVsbG8="}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = RenderServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    reset_render_latency_stats()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def render_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/api/v1/render"
+
+
+@pytest.mark.asyncio
+async def test_sequential_renders_reuse_one_connection(server):
+    for _ in range(3):
+        response = await post_render_request("jsxgraph", render_url(server), {}, {}, timeout=5)
+        assert response.json()["success"]
+    await aclose_diagram_http_client()
+
+    assert len(server.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_limit(server, monkeypatch):
+    monkeypatch.setattr(diagram_http_client, "MAX_CONCURRENT_RENDERS_PER_HOST", 2)
+
+    await asyncio.gather(*[
+        post_render_request("desmos", render_url(server), {"delay": 0.1}, {}, timeout=5)
+        for _ in range(6)
+    ])
+    await aclose_diagram_http_client()
+
+    assert server.peak == 2
+    assert get_render_latency_stats()["desmos"]["mean_queued_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_latency_histogram_per_tool(server):
+    await post_render_request("plotly", render_url(server), {}, {}, timeout=5)
+    await post_render_request("plotly", render_url(server), {"fail": True}, {}, timeout=5)
+    await post_render_request("imagen", render_url(server), {"delay": 0.3}, {}, timeout=5)
+    await aclose_diagram_http_client()
+
+    stats = get_render_latency_stats()
+    assert stats["plotly"]["requests"] == 2
+    assert stats["plotly"]["errors"] == 1
+    assert stats["plotly"]["histogram_ms"]["<=100"] == 2
+    assert stats["imagen"]["histogram_ms"]["<=500"] == 1
+    assert stats["imagen"]["max_ms"] >= 300
+
+
+@pytest.mark.asyncio
+async def test_cached_render_skips_the_network(server, tmp_path, monkeypatch):
+    from src.tools.diagram_render_cache import DiagramRenderCache
+
+    cache = DiagramRenderCache(cache_dir=tmp_path, max_bytes=10_000)
+    monkeypatch.setattr(diagram_http_client, "get_render_cache", lambda: cache)
+    payload = {"diagram": {"board": {}, "elements": []}, "options": {"width": 800}}
+
+    first = await post_render_request("jsxgraph", render_url(server), payload, {}, timeout=5, cache=True)
+    second = await post_render_request("jsxgraph", render_url(server), payload, {}, timeout=5, cache=True)
+    await aclose_diagram_http_client()
+
+    assert second.json()["image"] == first.json()["image"]
+    assert get_render_latency_stats()["jsxgraph"]["requests"] == 1
+    assert cache.get_stats()["hits"] == 1
@@ -0,0 +1,64 @@
+"""
+Unit Tests for the content-addressed diagram render cache.
+"""
+
+import os
+
+from src.tools.diagram_render_cache import DiagramRenderCache, render_cache_key
+
+
+def test_key_is_canonical_and_tool_scoped():
+    a = render_cache_key("jsxgraph", {"diagram": {"b": 1, "a": [1, 2]}, "options": {"width": 800}})
+    b = render_cache_key("jsxgraph", {"options": {"width": 800}, "diagram": {"a": [1, 2], "b": 1}})
+
+    assert a == b
+    assert a != render_cache_key("desmos", {"diagram": {"b": 1, "a": [1, 2]}, "options": {"width": 800}})
+    assert a != render_cache_key("jsxgraph", {"diagram": {"b": 1, "a": [1, 2]}, "options": {"width": 801}})
+
+
+def test_roundtrip_and_stats(tmp_path):
+    cache = DiagramRenderCache(cache_dir=tmp_path, max_bytes=10_000)
+
+    assert cache.get("plotly", "k1") is None
+    cache.put("k1", b"\x89PNG...", {"renderTimeMs": 42})
+    hit = cache.get("plotly", "k1")
+
+    assert hit.png_bytes == b"\x89PNG..."
+    assert hit.metadata == {"renderTimeMs": 42}
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+    assert stats["by_tool"]["plotly"] == {"hits": 1, "misses": 1}
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    cache = DiagramRenderCache(cache_dir=tmp_path, max_bytes=700)
+    for key in ("a", "b", "c"):
+        cache.put(key, b"x" * 200)
+    cache.get("jsxgraph", "a")  # a becomes most recently used
+
+    cache.put("d", b"x" * 200)
+
+    assert cache.get("jsxgraph", "b") is None
+    assert cache.get("jsxgraph", "a") is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert not (tmp_path / "b.png").exists()
+
+
+def test_index_survives_restart_in_lru_order(tmp_path):
+    cache = DiagramRenderCache(cache_dir=tmp_path, max_bytes=10_000)
+    cache.put("old", b"x" * 200)
+    cache.put("new", b"x" * 200)
+    os.utime(tmp_path / "old.png", (1, 1))
+
+    restarted = DiagramRenderCache(cache_dir=tmp_path, max_bytes=300)
+
+    assert restarted.get("matplotlib", "old") is None
+    assert restarted.get("matplotlib", "new") is not None
+
+
+def test_zero_size_disables_cache(tmp_path):
+    cache = DiagramRenderCache(cache_dir=tmp_path, max_bytes=0)
+    cache.put("k", b"png")
+
+    assert cache.get("plotly", "k") is None
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,53 @@
+"""
+Unit Tests for running DiagramAuthorClaudeAgent workers concurrently.
+
+Two workers started in the same second get the same timestamp execution ID;
+with a workspace_parent_dir each lesson must still get its own workspace, and
+workers must not reconfigure root logging.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import diagram_author_claude_client
+from src.diagram_author_claude_client import DiagramAuthorClaudeAgent
+
+
+@pytest.mark.asyncio
+async def test_workers_started_in_same_second_get_separate_workspaces(tmp_path):
+    workspaces = []
+
+    def record_workspace(workspace_path, **kwargs):
+        workspaces.append(workspace_path)
+        return workspace_path / "run.log"
+
+    async def fetch_lesson_template(course_id, order, mcp_config_path):
+        await asyncio.sleep(0)  # Let the other worker create its workspace
+        raise RuntimeError("stop after workspace setup")
+
+    frozen = MagicMock(wraps=datetime)
+    frozen.now.return_value = datetime(2026, 10, 16, 9, 30, 0)
+
+    with patch.object(diagram_author_claude_client, "datetime", frozen), \
+         patch.object(diagram_author_claude_client, "setup_logging") as setup_logging, \
+         patch.object(diagram_author_claude_client, "check_diagram_service_health",
+                      return_value={"available": True, "url": "http://diagram"}), \
+         patch.object(diagram_author_claude_client, "add_workspace_file_handler", record_workspace), \
+         patch.object(diagram_author_claude_client, "fetch_lesson_template", fetch_lesson_template):
+        agents = [
+            DiagramAuthorClaudeAgent(workspace_parent_dir=tmp_path, configure_logging=False)
+            for _ in range(2)
+        ]
+        results = await asyncio.gather(
+            agents[0].execute(courseId="course_c84774", order=1),
+            agents[1].execute(courseId="course_c84774", order=2),
+        )
+
+    assert agents[0].execution_id == agents[1].execution_id
+    assert not setup_logging.called
+    assert [r["success"] for r in results] == [False, False]
+    assert sorted(workspaces) == [tmp_path / "lesson_order_001", tmp_path / "lesson_order_002"]
+    assert all((w / "README.md").exists() for w in workspaces)
@@ -0,0 +1,75 @@
+"""
+Unit Tests for the per-card eligibility decision cache.
+
+Covers key stability, reusing cached decisions so only changed cards reach
+the agent, and the avoided-analysis counts reported in batch summaries.
+"""
+
+import pytest
+
+from src.eligibility_analyzer_agent import EligibilityAnalyzerAgent
+from src.utils.eligibility_cache import EligibilityCache, eligibility_cache_key
+
+
+def make_template(explainers):
+    return {
+        "lessonTemplateId": "lt_1",
+        "title": "Pythagoras",
+        "cards": [
+            {"id": f"card_{n:03d}", "cardType": "teach", "explainer": text}
+            for n, text in enumerate(explainers, start=1)
+        ],
+    }
+
+
+class RecordingAgent(EligibilityAnalyzerAgent):
+    """Analyzer whose 'LLM' marks every card mentioning a triangle as eligible."""
+
+    def __init__(self, cache):
+        super().__init__(cache=cache, prefilter=False)
+        self.sessions = []
+
+    async def _run_agent(self, lesson_template):
+        cards = lesson_template["cards"]
+        self.sessions.append([card["id"] for card in cards])
+        return [
+            {"id": card["id"], "diagram_contexts": ["lesson"], "lesson_diagram_specs": [{"description": card["explainer"]}]}
+            for card in cards if "triangle" in card["explainer"]
+        ]
+
+
+def test_key_ignores_card_id_but_tracks_content_and_prompt():
+    card = {"id": "card_001", "explainer": "A right triangle"}
+
+    key = eligibility_cache_key(card, "p1", "sonnet")
+    assert key == eligibility_cache_key({**card, "id": "card_009"}, "p1", "sonnet")
+    assert key != eligibility_cache_key({**card, "explainer": "A square"}, "p1", "sonnet")
+    assert key != eligibility_cache_key(card, "p2", "sonnet")
+
+
+@pytest.mark.asyncio
+async def test_only_changed_cards_go_to_the_agent(tmp_path):
+    cache = EligibilityCache(cache_dir=tmp_path, enabled=True)
+    agent = RecordingAgent(cache)
+
+    first = await agent.analyze(make_template(["A right triangle", "Add fractions", "An isosceles triangle"]))
+    again = await agent.analyze(make_template(["A right triangle", "Add fractions", "An isosceles triangle"]))
+    edited = await agent.analyze(make_template(["A right triangle", "A triangle of fractions", "An isosceles triangle"]))
+
+    assert agent.sessions == [["card_001", "card_002", "card_003"], ["card_002"]]
+    assert again == first
+    assert [c["id"] for c in edited] == ["card_001", "card_002", "card_003"]
+    stats = cache.get_stats()
+    assert (stats["lessons_analyzed"], stats["analyses_avoided"]) == (3, 1)
+    assert (stats["hits"], stats["misses"]) == (5, 4)
+
+
+@pytest.mark.asyncio
+async def test_renumbered_cards_reuse_decisions_under_their_new_id(tmp_path):
+    agent = RecordingAgent(EligibilityCache(cache_dir=tmp_path, enabled=True))
+    await agent.analyze(make_template(["Add fractions", "A right triangle"]))
+
+    reused = await agent.analyze(make_template(["A right triangle"]))
+
+    assert len(agent.sessions) == 1
+    assert reused[0]["id"] == "card_001"
@@ -0,0 +1,72 @@
+"""
+Unit Tests for the deterministic diagram-eligibility pre-filter.
+
+Covers the individual rules, zero false rejections on the labelled fixture,
+and keeping rejected cards away from the LLM analyzer.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.eligibility_analyzer_agent import EligibilityAnalyzerAgent
+from src.utils.diagram_extractor import PrefilterRules, classify_card_for_diagrams, prefilter_cards
+from src.utils.eligibility_cache import EligibilityCache
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "eligibility_labelled_cards.json"
+
+
+@pytest.mark.parametrize("card, forward", [
+    ({"title": "Key Words", "explainer": "A theorem is a proved statement.", "cfu": {"type": "mcq", "stem": "Pick one"}}, False),
+    ({"title": "Points", "explainer": "Mark A at (3, -2).", "cfu": {"type": "short", "stem": "Where?"}}, True),
+    ({"title": "Angles", "explainer": "One angle is 35°.", "cfu": {"type": "numeric", "stem": "Find x"}}, True),
+    ({"title": "Lengths", "explainer": "The side is 12 cm long.", "cfu": {"type": "numeric", "stem": "?"}}, True),
+    ({"title": "Recall", "explainer": "Takes 5 minutes.", "cfu": {"type": "graph", "stem": "?"}}, True),
+    ({"title": "Recall", "explainer": "Takes 5 minutes.", "cfu": {"type": "numeric", "stem": "?"}}, False),
+])
+def test_rules(card, forward):
+    assert classify_card_for_diagrams(card)[0] is forward
+
+
+def test_rules_are_configurable():
+    card = {"cardType": "summary", "title": "Summary", "explainer": "Well done!"}
+
+    assert classify_card_for_diagrams(card)[0] is False
+    assert classify_card_for_diagrams(card, PrefilterRules(always_forward_card_types=("summary",)))[0] is True
+
+
+def test_no_labelled_eligible_card_is_rejected():
+    lessons = json.loads(FIXTURE.read_text(encoding="utf-8"))["lessons"]
+
+    for lesson in lessons:
+        _, rejected = prefilter_cards(lesson["cards"])
+        assert [c["id"] for c in rejected if lesson["labels"][c["id"]]] == []
+
+
+class RecordingAgent(EligibilityAnalyzerAgent):
+    def __init__(self, cache):
+        super().__init__(cache=cache, prefilter=True)
+        self.sessions = []
+
+    async def _run_agent(self, lesson_template):
+        self.sessions.append([card["id"] for card in lesson_template["cards"]])
+        return [{"id": card["id"], "diagram_contexts": ["lesson"]} for card in lesson_template["cards"]]
+
+
+@pytest.mark.asyncio
+async def test_rejected_cards_never_reach_the_agent(tmp_path):
+    cache = EligibilityCache(cache_dir=tmp_path, enabled=True)
+    agent = RecordingAgent(cache)
+    template = {"cards": [
+        {"id": "c1", "title": "Vocabulary", "explainer": "A prime has two factors."},
+        {"id": "c2", "title": "Graphs", "explainer": "Plot y = 2x."},
+    ]}
+
+    eligible = await agent.analyze(template)
+    await agent.analyze({"cards": template["cards"][:1]})
+
+    assert agent.sessions == [["c2"]]
+    assert [c["id"] for c in eligible] == ["c2"]
+    stats = cache.get_stats()
+    assert (stats["cards_prefiltered"], stats["analyses_avoided"]) == (2, 1)
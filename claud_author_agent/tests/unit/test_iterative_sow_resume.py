@@ -0,0 +1,103 @@
+"""
+Unit Tests for resuming IterativeSOWAuthor runs from persisted artifacts.
+
+The critique loops are stubbed; these cover reloading approved lesson_NN.json
+files, continuing from the first missing lesson, regenerating an outline that
+no longer validates, and refusing a workspace from another course.
+"""
+
+import json
+
+import pytest
+
+from src.iterative_sow_author import (
+    OUTLINE_APPROVED_MARKER,
+    IterativeSOWAuthor,
+    load_approved_lessons,
+    validate_resume_workspace,
+)
+from tests.unit.test_iterative_sow_waves import make_entry, make_outline
+
+
+def test_load_approved_lessons_skips_invalid_and_drafts(tmp_path):
+    (tmp_path / "lesson_01.json").write_text(make_entry(1).model_dump_json())
+    (tmp_path / "lesson_02.json").write_text('{"order": 2, "label": "truncated')
+    (tmp_path / "lesson_03_draft.json").write_text(make_entry(3).model_dump_json())
+
+    approved = load_approved_lessons(tmp_path, total_lessons=3)
+
+    assert list(approved) == [1]
+
+
+@pytest.mark.asyncio
+async def test_sequential_resume_continues_from_first_missing_lesson(tmp_path, monkeypatch):
+    author = IterativeSOWAuthor()
+    calls = {}
+
+    async def fake_loop(workspace_path, order, outline_entry, previous_lessons, subject, level, neighbour_digest=None):
+        calls[order] = [lesson["order"] for lesson in previous_lessons]
+        return make_entry(order)
+
+    monkeypatch.setattr(author, "_generate_lesson_with_critique_loop", fake_loop)
+
+    lessons = await author._generate_lessons_sequentially(
+        tmp_path, make_outline(4), "maths", "higher",
+        approved={1: make_entry(1), 2: make_entry(2)}
+    )
+
+    assert [l.order for l in lessons] == [1, 2, 3, 4]
+    assert calls == {3: [1, 2], 4: [1, 2, 3]}
+    assert not (tmp_path / "lesson_01.json").exists()
+    assert (tmp_path / "lesson_04.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_invalid_approved_outline_is_regenerated_without_stale_marker(tmp_path, monkeypatch):
+    (tmp_path / "lesson_outline.json").write_text('{"total_lessons": 3, "outlines": [')
+    (tmp_path / OUTLINE_APPROVED_MARKER).touch()
+    (tmp_path / "lesson_01.json").write_text(make_entry(1).model_dump_json())
+    (tmp_path / "lesson_02_draft.json").write_text(make_entry(2).model_dump_json())
+
+    author = IterativeSOWAuthor()
+    seen_during_critique = {}
+
+    async def fake_outline_loop(workspace_path, subject, level):
+        seen_during_critique["marker"] = (workspace_path / OUTLINE_APPROVED_MARKER).exists()
+        seen_during_critique["lesson_01"] = (workspace_path / "lesson_01.json").exists()
+        return make_outline(3)
+
+    monkeypatch.setattr(author, "_generate_outline_with_critique_loop", fake_outline_loop)
+
+    outline, approved = await author._load_or_generate_outline(
+        tmp_path, "applications-of-mathematics", "higher", resume=True
+    )
+
+    assert seen_during_critique == {"marker": False, "lesson_01": False}
+    assert outline.total_lessons == 3
+    assert approved == {}
+    assert (tmp_path / OUTLINE_APPROVED_MARKER).exists()
+    assert (tmp_path / "lesson_02_draft.json").exists()
+
+
+def write_resume_workspace(path, course_id="course_c84774"):
+    (path / "Course_outcomes.json").write_text(json.dumps({"courseId": course_id, "outcomes": [{"outcomeId": "O1"}]}))
+    (path / "lesson_outline.json").write_text(make_outline(3).model_dump_json())
+    (path / OUTLINE_APPROVED_MARKER).touch()
+
+
+def test_resume_workspace_for_same_course_is_accepted(tmp_path):
+    write_resume_workspace(tmp_path)
+
+    validate_resume_workspace(tmp_path, "course_c84774", "applications_of_mathematics", "Higher")
+
+
+@pytest.mark.parametrize("course_id, subject, level, match", [
+    ("course_c84473", "applications-of-mathematics", "higher", "courseId 'course_c84774'"),
+    ("course_c84774", "physics", "higher", "subject"),
+    ("course_c84774", "applications-of-mathematics", "national-5", "level"),
+])
+def test_resume_workspace_for_other_course_raises(tmp_path, course_id, subject, level, match):
+    write_resume_workspace(tmp_path)
+
+    with pytest.raises(ValueError, match=match):
+        validate_resume_workspace(tmp_path, course_id, subject, level)
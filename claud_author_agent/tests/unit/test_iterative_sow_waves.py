@@ -0,0 +1,132 @@
+"""
+Unit Tests for wave-mode lesson generation in IterativeSOWAuthor.
+
+The per-lesson critique loop is stubbed; these cover wave scheduling, the
+concurrency limit and the neighbour digest each lesson receives.
+"""
+
+import asyncio
+
+import pytest
+
+from src.iterative_sow_author import IterativeSOWAuthor, build_neighbour_digest
+from src.tools.sow_schema_models import LessonOutline, SOWEntry
+
+
+def make_outline(total: int) -> LessonOutline:
+    outlines = [
+        {
+            "order": order,
+            "lesson_type": "mock_exam" if order == total else "teach",
+            "label_hint": f"Outline lesson {order}",
+            "block_name": "Financial Mathematics",
+            "block_index": "B1",
+            "primary_outcome_or_skill": "Compound interest",
+            "standards_or_skills_codes": [f"Skill {order}"],
+            "rationale": "Builds on the previous lesson in the sequence"
+        }
+        for order in range(1, total + 1)
+    ]
+    return LessonOutline.model_validate({
+        "course_subject": "applications-of-mathematics",
+        "course_level": "higher",
+        "total_lessons": total,
+        "structure_type": "skills_based",
+        "outlines": outlines,
+    })
+
+
+def make_entry(order: int) -> SOWEntry:
+    return SOWEntry.model_validate({
+        "order": order,
+        "label": f"Generated lesson {order}",
+        "lesson_type": "teach",
+        "coherence": {"block_name": "Financial Mathematics", "block_index": "B1"},
+        "policy": {"calculator_section": "calc"},
+        "engagement_tags": ["finance"],
+        "standards_or_skills_addressed": [{"skill_name": f"Skill {order}", "description": "Skill description"}],
+        "lesson_plan": {
+            "summary": "A lesson summary that is comfortably longer than fifty characters.",
+            "card_structure": [{
+                "card_number": 1,
+                "card_type": "explainer",
+                "title": "Explainer card",
+                "purpose": "Introduce the idea",
+                "pedagogical_approach": "Worked explanation with examples",
+                "cfu_strategy": "Quick check question",
+            }],
+            "lesson_flow_summary": "Explain, then practise the idea",
+            "multi_standard_integration_strategy": "Single skill focus throughout",
+            "assessment_progression": "Check understanding after the explainer",
+        },
+        "accessibility_profile": {"dyslexia_friendly": True},
+        "lesson_instruction": "Teach the lesson using the card sequence, checking understanding as you go.",
+    })
+
+
+def test_digest_prefers_generated_neighbours_and_is_windowed():
+    outline_entries = [e.model_dump(mode="json") for e in make_outline(6).outlines]
+
+    digest = build_neighbour_digest(4, outline_entries, {2: make_entry(2)}, window=2)
+
+    assert [d["order"] for d in digest] == [2, 3, 5, 6]
+    assert digest[0] == {
+        "order": 2,
+        "status": "generated",
+        "label": "Generated lesson 2",
+        "lesson_type": "teach",
+        "block": "Financial Mathematics",
+        "outcome_refs": ["Skill 2"],
+        "card_types": ["explainer"],
+    }
+    assert digest[1]["status"] == "planned"
+    assert digest[1]["outcome_refs"] == ["Skill 3"]
+
+
+@pytest.mark.asyncio
+async def test_waves_respect_concurrency_and_pass_digests(tmp_path, monkeypatch):
+    author = IterativeSOWAuthor(lesson_concurrency=2)
+    active = 0
+    peak = 0
+    digests = {}
+
+    async def fake_loop(workspace_path, order, outline_entry, previous_lessons, subject, level, neighbour_digest=None):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        digests[order] = neighbour_digest
+        await asyncio.sleep(0.01)
+        active -= 1
+        return make_entry(order)
+
+    monkeypatch.setattr(author, "_generate_lesson_with_critique_loop", fake_loop)
+
+    lessons = await author._generate_lessons_in_waves(tmp_path, make_outline(5), "maths", "higher")
+
+    assert [l.order for l in lessons] == [1, 2, 3, 4, 5]
+    assert peak == 2
+    assert all(digest is not None for digest in digests.values())
+    # Lesson 3 (wave 2) sees lessons 1-2 as generated, 4-5 as planned
+    assert [(d["order"], d["status"]) for d in digests[3]] == [
+        (1, "generated"), (2, "generated"), (4, "planned"), (5, "planned")
+    ]
+    assert (tmp_path / "lesson_05.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_failed_wave_persists_approved_lessons_then_raises(tmp_path, monkeypatch):
+    author = IterativeSOWAuthor(lesson_concurrency=3)
+
+    async def fake_loop(workspace_path, order, outline_entry, previous_lessons, subject, level, neighbour_digest=None):
+        if order == 2:
+            raise ValueError("critic rejected")
+        return make_entry(order)
+
+    monkeypatch.setattr(author, "_generate_lesson_with_critique_loop", fake_loop)
+
+    with pytest.raises(ValueError, match="lesson 2: critic rejected"):
+        await author._generate_lessons_in_waves(tmp_path, make_outline(4), "maths", "higher")
+
+    assert (tmp_path / "lesson_01.json").exists()
+    assert (tmp_path / "lesson_03.json").exists()
+    assert not (tmp_path / "lesson_04.json").exists()
@@ -0,0 +1,91 @@
+"""
+Unit Tests for the pre-warmed Matplotlib sandbox worker pool.
+
+These spawn real worker processes (matplotlib must be installed).
+"""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from src.tools.matplotlib_worker_pool import MatplotlibWorkerPool
+
+SAFE_IMPORTS = ["matplotlib", "numpy", "math"]
+
+
+def plot_code(output_path):
+    return (
+        "import matplotlib.pyplot as plt\n"
+        "fig, ax = plt.subplots()\n"
+        "ax.plot([0, 1], [0, 1])\n"
+        f"plt.savefig(r\"{output_path}\")\n"
+    )
+
+
+@pytest.fixture
+def pool():
+    pool = MatplotlibWorkerPool(safe_imports=SAFE_IMPORTS, timeout=10, size=1, max_renders=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_renders_reuse_warm_worker_and_recycle(pool, tmp_path):
+    for i in range(3):
+        result = pool.render(plot_code(tmp_path / f"d{i}.png"), tmp_path, 8.0, 6.0, 100)
+        assert result["success"], result
+        assert (tmp_path / f"d{i}.png").exists()
+
+    # The first worker was recycled after max_renders=2; the third render ran on its replacement
+    assert pool.stats["workers_recycled"] == 1
+    assert pool.stats["workers_started"] == 2
+
+
+def test_disallowed_import_is_rejected(pool, tmp_path):
+    result = pool.render("import os\nplt.savefig(OUTPUT)", tmp_path, 8.0, 6.0, 100)
+
+    assert not result["success"]
+    assert "Import of 'os' is not allowed" in result["error"]
+
+
+def test_state_does_not_leak_between_renders(pool, tmp_path):
+    pool.render("secret = 1\nplt.rcParams['lines.linewidth'] = 9", tmp_path, 8.0, 6.0, 100)
+
+    result = pool.render(
+        "assert 'secret' not in globals()\n"
+        "assert plt.rcParams['lines.linewidth'] != 9\n"
+        "assert plt.get_fignums() == []\n",
+        tmp_path, 8.0, 6.0, 100
+    )
+
+    assert result["success"], result
+
+
+def test_timeout_kills_worker_and_pool_recovers(tmp_path):
+    pool = MatplotlibWorkerPool(safe_imports=SAFE_IMPORTS, timeout=1, size=1)
+    try:
+        result = pool.render("while True:\n    pass", tmp_path, 8.0, 6.0, 100)
+        assert result["timed_out"]
+        assert pool.stats["timeouts"] == 1
+
+        result = pool.render(plot_code(tmp_path / "after.png"), tmp_path, 8.0, 6.0, 100)
+        assert result["success"], result
+    finally:
+        pool.shutdown()
+
+
+def test_crashed_worker_is_replaced(pool, tmp_path):
+    # SystemExit from render code is a failed render, not a crash
+    result = pool.render("raise SystemExit(3)", tmp_path, 8.0, 6.0, 100)
+    assert not result["success"]
+    assert pool.stats["worker_crashes"] == 0
+
+    worker = pool._idle[0]
+    worker.process.kill()
+    worker.process.wait()
+
+    result = pool.render(plot_code(tmp_path / "x.png"), tmp_path, 8.0, 6.0, 100)
+    assert not result["success"]
+    assert pool.stats["worker_crashes"] == 1
+
+    result = pool.render(plot_code(tmp_path / "y.png"), tmp_path, 8.0, 6.0, 100)
+    assert result["success"], result
@@ -0,0 +1,58 @@
+"""
+Unit Tests for concurrent Phase 3 question generation in the Nat5+ exam generator.
+
+Covers the concurrency bound, stable question numbering and per-question
+latency/error reporting of generate_questions().
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.nat5_plus import exam_generator_client
+
+
+@pytest.fixture
+def fake_generator(monkeypatch):
+    state = {"running": 0, "peak": 0, "fail": set()}
+
+    async def fake_generate_single_question(spec, sow_topics, templates, workspace_path, question_index):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        # Later questions finish first to prove order comes from the spec list
+        await asyncio.sleep(0.01 * (10 - question_index))
+        state["running"] -= 1
+        if question_index in state["fail"]:
+            raise RuntimeError(f"agent error {question_index}")
+        return SimpleNamespace(question_id=f"q{question_index}", topic=spec.topic)
+
+    monkeypatch.setattr(exam_generator_client, "generate_single_question", fake_generate_single_question)
+    return state
+
+
+def _specs(n):
+    return [SimpleNamespace(topic=f"topic {i}") for i in range(n)]
+
+
+def test_questions_run_concurrently_in_spec_order(fake_generator, tmp_path):
+    results = asyncio.run(exam_generator_client.generate_questions(_specs(8), [], [], tmp_path, concurrency=3))
+
+    assert [q.question_id for q, _ in results] == [f"q{i}" for i in range(8)]
+    assert [q.topic for q, _ in results] == [f"topic {i}" for i in range(8)]
+    assert fake_generator["peak"] == 3
+    assert all(latency > 0 for _, latency in results)
+
+
+def test_failures_are_returned_in_place(fake_generator, tmp_path):
+    fake_generator["fail"].add(2)
+
+    results = asyncio.run(exam_generator_client.generate_questions(_specs(4), [], [], tmp_path, concurrency=4))
+
+    assert isinstance(results[2][0], RuntimeError)
+    assert [q.question_id for i, (q, _) in enumerate(results) if i != 2] == ["q0", "q1", "q3"]
+
+
+def test_concurrency_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="concurrency"):
+        asyncio.run(exam_generator_client.generate_questions(_specs(1), [], [], tmp_path, concurrency=0))
@@ -0,0 +1,161 @@
+"""
+Unit Tests for the Nat5+ near-duplicate question index (MinHash/LSH).
+
+Covers near-duplicate detection, the tunable threshold, .npz persistence,
+that UniquenessManager's candidate-based exam check agrees with a full scan,
+and that only saved exams add stems to the shared question index.
+"""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.nat5_plus import exam_generator_client
+from src.nat5_plus.near_duplicate_index import QuestionIndex, optimal_bands
+from src.nat5_plus.uniqueness_manager import ExamSummary, UniquenessManager
+
+STEM = "Calculate the gradient of the straight line joining the points A(2, 3) and B(6, 11)."
+NEAR_DUPLICATE = "Calculate the gradient of the straight line joining the points A(2, 5) and B(6, 11)."
+UNRELATED = "Solve the quadratic equation x squared minus 5x plus 6 equals 0, giving both roots."
+
+
+def test_near_duplicates_match_and_unrelated_stems_do_not():
+    index = QuestionIndex(threshold=0.8)
+    index.add("fp1", STEM, exam_id="exam_1")
+
+    matches = index.find_similar(NEAR_DUPLICATE)
+
+    assert [key for key, _ in matches] == ["fp1"]
+    assert matches[0][1] >= 0.8
+    assert index.find_similar(UNRELATED) == []
+    # Threshold is tunable per lookup
+    assert index.find_similar(NEAR_DUPLICATE, threshold=0.99) == []
+
+
+def test_band_layout_keeps_recall_at_threshold():
+    for threshold in (0.5, 0.7, 0.8, 0.9):
+        bands, rows = optimal_bands(threshold, 64)
+        assert bands * rows == 64
+        assert 1 - (1 - threshold ** rows) ** bands >= 0.95
+
+    with pytest.raises(ValueError):
+        optimal_bands(1.0, 64)
+
+
+def test_index_round_trips_and_drops_deleted_exams(tmp_path):
+    index = QuestionIndex()
+    index.add("fp1", STEM, exam_id="exam_1")
+    index.add("fp2", UNRELATED, exam_id="exam_2")
+    path = tmp_path / "course.npz"
+    index.save(path)
+
+    loaded = QuestionIndex.load(path).retain_exams({"exam_1"})
+
+    assert len(loaded) == 1
+    assert loaded.stem("fp1") == STEM
+    # Stored stems are only shingled once they come up as LSH candidates
+    assert loaded._shingles == {}
+    assert [key for key, _ in loaded.find_similar(NEAR_DUPLICATE)] == ["fp1"]
+    assert set(loaded._shingles) == {"fp1"}
+    assert len(QuestionIndex.load(tmp_path / "missing.npz")) == 0
+
+
+def test_manager_flags_near_duplicate_questions():
+    manager = UniquenessManager([])
+    manager.register_question(STEM)
+
+    assert not manager.check_question_unique(STEM)
+    assert not manager.check_question_unique(NEAR_DUPLICATE)
+    assert manager.check_question_unique(UNRELATED)
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7])
+def test_exam_check_matches_full_scan(threshold):
+    rng = random.Random(7)
+    topics = [f"topic_{i}" for i in range(30)]
+    fingerprints = [f"fp_{i}" for i in range(400)]
+    summaries = [
+        ExamSummary(
+            exam_id=f"exam_{i}",
+            course_id="course",
+            topic_ids=rng.sample(topics, 10),
+            question_styles=[],
+            difficulty_mix={},
+            question_fingerprints=rng.sample(fingerprints, 15),
+            created_at=""
+        )
+        for i in range(150)
+    ]
+    manager = UniquenessManager(summaries, similarity_threshold=threshold)
+
+    for _ in range(20):
+        base = rng.choice(summaries)
+        topic_ids = base.topic_ids[:8] + rng.sample(topics, 2)
+        question_fps = base.question_fingerprints[:rng.randint(0, 15)] + rng.sample(fingerprints, 3)
+
+        expected = []
+        for summary in summaries:
+            combined = (
+                0.6 * manager._jaccard_similarity(set(topic_ids), set(summary.topic_ids))
+                + 0.4 * len(set(question_fps) & set(summary.question_fingerprints)) / len(set(question_fps))
+            )
+            if combined > threshold:
+                expected.append(summary.exam_id)
+
+        result = manager.check_exam_unique(topic_ids, question_fps)
+        assert sorted(result.conflicting_exams) == sorted(expected)
+
+
+@pytest.fixture
+def fake_upsert(monkeypatch, tmp_path):
+    monkeypatch.setenv("NAT5_PLUS_UNIQUENESS_INDEX_DIR", str(tmp_path))
+    state = {"fail": False, "summaries": []}
+
+    async def upsert_exam(exam):
+        if state["fail"]:
+            raise RuntimeError("Appwrite unavailable")
+        return "exam_new"
+
+    async def update_exam_summary(exam, doc_id, fingerprints):
+        state["summaries"].append((doc_id, fingerprints))
+
+    monkeypatch.setattr(exam_generator_client, "upsert_exam", upsert_exam)
+    monkeypatch.setattr(exam_generator_client, "update_exam_summary", update_exam_summary)
+    return state
+
+
+def _persist(manager, dry_run=False):
+    questions = [SimpleNamespace(stem=STEM), SimpleNamespace(stem=UNRELATED)]
+    return asyncio.run(exam_generator_client.persist_exam(object(), questions, manager, "course", dry_run))
+
+
+def test_dry_run_leaves_question_index_unchanged(fake_upsert):
+    manager = UniquenessManager([])
+
+    assert _persist(manager, dry_run=True) == "DRY_RUN"
+
+    assert len(manager.question_index) == 0
+    assert manager.check_question_unique(STEM)
+
+
+def test_failed_upsert_leaves_question_index_unchanged(fake_upsert):
+    fake_upsert["fail"] = True
+    manager = UniquenessManager([])
+
+    with pytest.raises(RuntimeError):
+        _persist(manager)
+
+    assert len(manager.question_index) == 0
+
+
+def test_saved_exam_registers_stems_under_its_id(fake_upsert, tmp_path):
+    manager = UniquenessManager([])
+
+    assert _persist(manager) == "exam_new"
+
+    assert len(manager.question_index) == 2
+    assert set(manager.question_index._exam_ids.values()) == {"exam_new"}
+    assert fake_upsert["summaries"] == [("exam_new", [manager.fingerprint(STEM), manager.fingerprint(UNRELATED)])]
+    assert (tmp_path / "course.npz").exists()
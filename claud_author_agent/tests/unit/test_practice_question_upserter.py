@@ -0,0 +1,117 @@
+"""
+Unit Tests for the bulk question path in PracticeQuestionUpserter.
+
+Covers the single projected existence query, skipping unchanged questions
+without per-item GETs, input-ordered doc IDs and partial-failure reporting.
+"""
+
+import json
+
+import pytest
+
+from src.models.practice_question_models import GeneratedQuestion
+from src.utils.practice_question_upserter import (
+    PracticeQuestionUpserter,
+    _generate_doc_id,
+)
+
+
+class FakeDatabases:
+    """In-memory practice_questions collection that records every call."""
+
+    def __init__(self, documents=None, fail_on=()):
+        self.documents = {d["$id"]: d for d in documents or []}
+        self.fail_on = set(fail_on)
+        self.calls = []
+
+    def list_documents(self, database_id, collection_id, queries):
+        parsed = [json.loads(q) for q in queries]
+        self.calls.append(("list", parsed))
+        lesson = next(q["values"] for q in parsed if q["method"] == "equal")
+        select = next(q["values"] for q in parsed if q["method"] == "select")
+        docs = [d for d in self.documents.values() if d["lessonTemplateId"] in lesson]
+        return {"documents": [{k: d[k] for k in select} for d in docs]}
+
+    def get_document(self, **kwargs):
+        raise AssertionError("bulk upsert must not GET per question")
+
+    def _write(self, op, document_id, data, **kwargs):
+        self.calls.append((op, document_id))
+        if data["blockId"] in self.fail_on:
+            raise RuntimeError("boom")
+        self.documents[document_id] = {"$id": document_id, **data}
+        return self.documents[document_id]
+
+    def create_document(self, **kwargs):
+        return self._write("create", **kwargs)
+
+    def update_document(self, **kwargs):
+        return self._write("update", **kwargs)
+
+
+class FakeStorage:
+    def __init__(self):
+        self.uploads = []
+
+    def create_file(self, bucket_id, file_id, file):
+        self.uploads.append(file_id)
+        return {"$id": file_id}
+
+
+def make_question(n, block_id="block_001"):
+    return GeneratedQuestion(
+        question_id=f"q{n}", block_id=block_id, block_title="Fractions", difficulty="easy",
+        question_type="numeric", stem_preview=f"What is {n} + 1?", stem=f"What is {n} + 1?",
+        correct_answer=str(n + 1), solution=f"{n} + 1 = {n + 1}",
+    )
+
+
+def make_upserter(databases):
+    upserter = PracticeQuestionUpserter()
+    upserter._client = object()
+    upserter._databases = databases
+    upserter._storage = FakeStorage()
+    return upserter
+
+
+def doc_id_for(question, lesson="lt_1"):
+    content_hash = question.compute_content_hash()
+    return _generate_doc_id(f"{lesson}:{question.block_id}:{question.difficulty}:{content_hash[:16]}")
+
+
+@pytest.mark.asyncio
+async def test_unchanged_questions_skipped_after_one_projected_query():
+    questions = [make_question(n) for n in range(6)]
+    stored = [
+        {"$id": doc_id_for(q), "lessonTemplateId": "lt_1", "contentHash": q.compute_content_hash()}
+        for q in questions[:4]
+    ]
+    databases = FakeDatabases(stored)
+    upserter = make_upserter(databases)
+
+    report = await upserter.bulk_upsert_questions("lt_1", questions + [questions[5]], "exec_1", concurrency=3)
+
+    lists = [c for op, c in databases.calls if op == "list"]
+    assert len(lists) == 1
+    assert {"method": "select", "values": ["$id", "contentHash"]} in lists[0]
+    assert sorted(report.created) == sorted(doc_id_for(q) for q in questions[4:])
+    assert len(report.skipped) == 5
+    assert len(upserter._storage.uploads) == 2
+    assert report.failed == {}
+    assert report.doc_ids == [doc_id_for(q) for q in questions + [questions[5]]]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_without_aborting_the_batch():
+    questions = [make_question(1), make_question(2, block_id="bad"), make_question(3)]
+    upserter = make_upserter(FakeDatabases(fail_on={"bad"}))
+
+    report = await upserter.bulk_upsert_questions("lt_1", questions, "exec_1")
+
+    assert set(report.failed) == {"q2"}
+    assert len(report.created) == 2
+    assert report.doc_ids == [doc_id_for(questions[0]), doc_id_for(questions[2])]
+    with pytest.raises(RuntimeError, match=r"Failed to upsert 1 question\(s\) \(2 succeeded\): q2: boom"):
+        report.raise_for_failures()
+    with pytest.raises(ValueError, match="concurrency"):
+        await upserter.bulk_upsert_questions("lt_1", questions, "exec_1", concurrency=0)
@@ -0,0 +1,109 @@
+"""
+Unit Tests for targeted section revision in SectionBasedOrchestrator.
+
+Covers mapping critic issues to section indices and regenerating only those
+sections while the others are reused with their token cost reported as saved.
+"""
+
+import asyncio
+
+import pytest
+
+from src.agents.section_based_orchestrator import (
+    SectionBasedOrchestrator,
+    SectionResult,
+    map_critic_to_sections,
+)
+from src.tools.mock_exam_critic_schema_models import MockExamCriticResult
+
+EXAM_SECTIONS = [
+    {"section_order": 1, "questions": [{"question_number": 1}, {"question_number": 2}]},
+    {"section_order": 2, "questions": [{"question_number": 3}, {"question_number": 4}]},
+    {"section_order": 3, "questions": [{"question_number": 5}]},
+    {"section_order": 4, "questions": [{"question_number": 6}, {"question_number": 7}]},
+]
+
+
+def _critic(clarity_issues=(), improvements=(), clarity_pass=False):
+    return MockExamCriticResult.model_validate({
+        "pass": False,
+        "overall_score": 3.1,
+        "schema_gate": {"pass": True, "failed_checks": []},
+        "dimensions": {
+            "question_clarity": {"score": 2.8, "pass": clarity_pass, "issues": list(clarity_issues)},
+            "accessibility": {"score": 4.2, "pass": True, "issues": ["Q1 could use simpler wording"]},
+        },
+        "summary": "Several questions need clearer wording before release.",
+        "improvements_required": list(improvements),
+    })
+
+
+def test_critic_issues_map_to_section_indices():
+    critic = _critic(
+        clarity_issues=["Q3 stem is ambiguous about units", "Question 7: missing diagram reference"],
+        improvements=["Rebalance marks in sections[2]", "Question 99 does not exist"],
+    )
+
+    # Q3 -> section 2, Q7 -> section 4, sections[2] -> section 3; passing dimension ignored
+    assert map_critic_to_sections(critic, EXAM_SECTIONS) == {1, 2, 3}
+    assert map_critic_to_sections(_critic(improvements=["Section 1 timing too tight"]), EXAM_SECTIONS) == {0}
+    assert map_critic_to_sections(_critic(improvements=["Use more real-world contexts"]), EXAM_SECTIONS) == set()
+
+
+class _Spec:
+    def __init__(self, index):
+        self.section_index = index
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    orch = SectionBasedOrchestrator(workspace_path=tmp_path, parallel=True)
+    calls = []
+
+    async def fake_generate_section(spec):
+        calls.append(spec.section_index)
+        return SectionResult(section_index=spec.section_index, success=True,
+                             section={"v": 2}, input_tokens=900, output_tokens=100)
+
+    monkeypatch.setattr(orch, "_generate_section", fake_generate_section)
+    orch.calls = calls
+    return orch
+
+
+def _previous():
+    return [
+        SectionResult(section_index=i, success=True, section={"v": 1}, input_tokens=800, output_tokens=200)
+        for i in range(4)
+    ]
+
+
+def test_only_referenced_sections_are_regenerated(orchestrator):
+    specs = [_Spec(i) for i in range(4)]
+    critic = _critic(clarity_issues=["Q5 marking scheme unclear"])
+
+    results = asyncio.run(orchestrator._revise_failed_sections(
+        specs, critic, None, previous_results=_previous(), exam_sections=EXAM_SECTIONS
+    ))
+
+    assert orchestrator.calls == [2]
+    assert [r.section for r in results] == [{"v": 1}, {"v": 1}, {"v": 2}, {"v": 1}]
+    report = orchestrator._iteration_report(2, results)
+    assert report["sections_regenerated"] == [2]
+    assert report["tokens_used"] == 1000
+    assert report["tokens_saved_estimate"] == 3000
+
+
+def test_unlocalised_feedback_or_failed_generation(orchestrator):
+    specs = [_Spec(i) for i in range(4)]
+
+    asyncio.run(orchestrator._revise_failed_sections(
+        specs, _critic(improvements=["Overall tone too formal"]), None,
+        previous_results=_previous(), exam_sections=EXAM_SECTIONS
+    ))
+    assert sorted(orchestrator.calls) == [0, 1, 2, 3]
+
+    orchestrator.calls.clear()
+    previous = _previous()
+    previous[1] = SectionResult(section_index=1, success=False, error="max turns")
+    asyncio.run(orchestrator._revise_failed_sections(specs, None, None, previous_results=previous))
+    assert orchestrator.calls == [1]
@@ -0,0 +1,100 @@
+"""
+Unit Tests for the course-scoped SOW entries cache.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.utils import sow_cache
+from src.utils.compression import compress_json_gzip_base64
+from src.utils.sow_cache import SOWCache
+
+
+ENTRIES = [{"order": 2, "label": "Fractions"}, {"order": 1, "label": "Intro"}]
+
+
+def make_doc(updated_at="2025-01-01T00:00:00.000+00:00", entries=ENTRIES):
+    return {
+        "$id": "sow_abc",
+        "$updatedAt": updated_at,
+        "courseId": "course_test",
+        "entries": compress_json_gzip_base64(entries),
+    }
+
+
+@pytest.fixture
+def counting_parse():
+    """Wrap parse_sow_entries so tests can count real parses."""
+    real = sow_cache.parse_sow_entries
+    mock = AsyncMock(side_effect=real)
+    with patch.object(sow_cache, "parse_sow_entries", mock):
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_parses_once_per_version_and_indexes_by_order(tmp_path, counting_parse):
+    cache = SOWCache(cache_dir=tmp_path)
+
+    first = await cache.get_or_parse(make_doc(), ".mcp.json", "course_test")
+    second = await cache.get_or_parse(make_doc(), ".mcp.json", "course_test")
+
+    assert counting_parse.await_count == 1
+    assert second is first
+    assert first.entry_for_order(1)["label"] == "Intro"
+    assert cache.stats["memory_hits"] == 1
+
+    with pytest.raises(ValueError, match=r"Available orders: \[1, 2\]"):
+        first.entry_for_order(7, "course_test")
+
+
+@pytest.mark.asyncio
+async def test_disk_layer_survives_new_process(tmp_path, counting_parse):
+    await SOWCache(cache_dir=tmp_path).get_or_parse(make_doc(), ".mcp.json")
+
+    fresh = SOWCache(cache_dir=tmp_path)
+    cached = await fresh.get_or_parse(make_doc(), ".mcp.json")
+
+    assert counting_parse.await_count == 1
+    assert fresh.stats["disk_hits"] == 1
+    assert [e["order"] for e in cached.entries] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_republish_invalidates_memory_and_disk(tmp_path, counting_parse):
+    cache = SOWCache(cache_dir=tmp_path)
+    await cache.get_or_parse(make_doc(), ".mcp.json")
+
+    republished = make_doc(
+        updated_at="2025-02-01T00:00:00.000+00:00",
+        entries=[{"order": 1, "label": "Intro v2"}]
+    )
+    cached = await cache.get_or_parse(republished, ".mcp.json")
+
+    assert counting_parse.await_count == 2
+    assert cached.entry_for_order(1)["label"] == "Intro v2"
+    assert cache.stats["invalidations"] == 1
+    assert len(list(tmp_path.glob("sow_abc-*.json"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_documents_without_updated_at_are_not_cached(tmp_path, counting_parse):
+    cache = SOWCache(cache_dir=tmp_path)
+    doc = make_doc()
+    del doc["$updatedAt"]
+
+    await cache.get_or_parse(doc, ".mcp.json")
+    await cache.get_or_parse(doc, ".mcp.json")
+
+    assert counting_parse.await_count == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_duplicate_orders_keep_first_entry():
+    sow = sow_cache.CachedSOW(
+        sow_id="sow_abc",
+        updated_at="2025-01-01T00:00:00.000+00:00",
+        entries=[{"order": 1, "label": "First"}, {"order": 1, "label": "Second"}],
+    )
+
+    assert sow.entry_for_order(1)["label"] == "First"
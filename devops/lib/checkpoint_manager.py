@@ -1,7 +1,13 @@
 """Checkpoint Manager for Pipeline State Persistence.
 
 Manages pipeline state persistence for checkpoint/resume capability.
-State is stored as JSON files in devops/checkpoints/{run_id}/checkpoint.json.
+State is stored in devops/checkpoints/{run_id}/ as a write-ahead journal:
+
+- checkpoint.json: full snapshot, written atomically (temp file + fsync + rename)
+- journal.jsonl: append-only deltas (step / lesson / state) since the snapshot,
+  each tagged with a sequence number so replay is idempotent
+- devops/checkpoints/index.json: one summary per run, so list/status never
+  parse every run directory
 
 Usage:
     checkpoint_mgr = CheckpointManager(run_id="20260109_143022")
@@ -11,19 +17,76 @@ Usage:
     state.last_completed_step = "sow"
     checkpoint_mgr.save(state)
 
+    # Cheap per-lesson progress (one JSONL line, no snapshot rewrite)
+    checkpoint_mgr.record_lesson(state, order=3, record={"doc_id": "lt_abc"})
+
     # Resume from checkpoint
-    state = checkpoint_mgr.load_or_create()  # Loads existing state
+    state = checkpoint_mgr.load_or_create()  # Loads snapshot + replays journal
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 import json
 import logging
+import os
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_PATH = Path(__file__).parent.parent / "checkpoints"
+INDEX_FILE = "index.json"
+JOURNAL_FILE = "journal.jsonl"
+
+# Snapshot key holding the last journal sequence number folded into it
+JOURNAL_SEQ_KEY = "_journal_seq"
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def _atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """Write JSON to path via temp file + fsync + rename (never half-written)."""
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, "w") as f:
+            json.dump(data, f, indent=indent, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except Exception:
+        if temp_file.exists():
+            temp_file.unlink()
+        raise
+
+
+def _run_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary row used by list_runs (and stored in index.json)."""
+    return {
+        "run_id": data["run_id"],
+        "pipeline": data.get("pipeline", "lessons"),
+        "subject": data["subject"],
+        "level": data["level"],
+        "course_id": data.get("course_id"),
+        "status": data["status"],
+        "started_at": data["started_at"],
+        "updated_at": data.get("updated_at"),
+        "last_completed_step": data.get("last_completed_step"),
+        "next_step": data.get("next_step"),
+        "total_cost_usd": data.get("total_cost_usd", 0),
+        "total_tokens": data.get("total_tokens", 0),
+        "error": data.get("error"),
+        "steps_completed": len(data.get("completed_steps", [])),
+        "lessons_completed": len(data.get("lesson_progress", {}) or {})
+    }
+
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human-readable string.
@@ -113,6 +176,7 @@ class PipelineState:
     total_cost_usd: float = 0.0
     total_tokens: int = 0
     error: Optional[str] = None
+    lesson_progress: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # order -> record
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -123,6 +187,7 @@ class PipelineState:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PipelineState":
         """Create from dictionary."""
+        data = {k: v for k, v in data.items() if k != JOURNAL_SEQ_KEY}
         completed_steps = [
             StepState.from_dict(s) for s in (data.pop("completed_steps", []) or [])
         ]
@@ -150,19 +215,31 @@ class PipelineState:
             self.total_tokens += step.metrics.get("output_tokens", 0)
 
 
+# Scalar PipelineState fields carried by journal entries (everything except
+# completed_steps and lesson_progress, which have their own entry types)
+STATE_FIELDS = (
+    "course_id", "status", "updated_at", "last_completed_step",
+    "next_step", "total_cost_usd", "total_tokens", "error"
+)
+
+
 class CheckpointManager:
     """Manages pipeline state persistence for checkpoint/resume.
 
     Features:
-    - JSON-based state persistence
-    - Atomic writes with temp file + rename
-    - Resume from any completed step
-    - List all runs with status
+    - Write-ahead journal: small JSONL deltas appended (and fsynced) per step,
+      per lesson and per status change, instead of rewriting the snapshot
+    - Atomic snapshots with temp file + fsync + rename; save() compacts the
+      journal into the snapshot
+    - Resume from any completed step (snapshot + journal replay)
+    - Run index so list/status stay fast with hundreds of runs
 
     Directory structure:
         devops/checkpoints/
+        ├── index.json               # Run summaries for list_runs()
         ├── 20260109_143022/
-        │   ├── checkpoint.json      # Main state file
+        │   ├── checkpoint.json      # Snapshot (includes _journal_seq)
+        │   ├── journal.jsonl        # Deltas since the snapshot
         │   └── step_results/        # Optional: per-step detailed results
         │       ├── seed.json
         │       ├── sow.json
@@ -179,10 +256,12 @@ class CheckpointManager:
             base_path: Base directory for checkpoints (default: devops/checkpoints)
         """
         self.run_id = run_id
-        self.base_path = base_path or Path(__file__).parent.parent / "checkpoints"
+        self.base_path = base_path or DEFAULT_BASE_PATH
         self.checkpoint_dir = self.base_path / run_id
         self.checkpoint_file = self.checkpoint_dir / "checkpoint.json"
+        self.journal_file = self.checkpoint_dir / JOURNAL_FILE
         self.step_results_dir = self.checkpoint_dir / "step_results"
+        self._seq = 0  # Last journal sequence number written or replayed
 
     def exists(self) -> bool:
         """Check if checkpoint exists for this run."""
@@ -220,34 +299,144 @@ class CheckpointManager:
         return self._create(subject, level)
 
     def save(self, state: PipelineState) -> None:
-        """Save current state to checkpoint file.
+        """Write a full snapshot and compact the journal into it.
 
-        Uses atomic write (temp file + rename) to prevent corruption.
+        Uses atomic write (temp file + fsync + rename) to prevent corruption.
+        The snapshot records the last journal sequence number it contains, so
+        a crash between the rename and the journal truncation is harmless:
+        replay skips entries the snapshot already covers.
 
         Args:
             state: Pipeline state to save
         """
-        state.updated_at = datetime.utcnow().isoformat() + "Z"
+        state.updated_at = _now()
 
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         self.step_results_dir.mkdir(parents=True, exist_ok=True)
 
-        # Atomic write: write to temp file then rename
-        temp_file = self.checkpoint_file.with_suffix(".tmp")
+        data = state.to_dict()
+        data[JOURNAL_SEQ_KEY] = self._seq
 
         try:
-            with open(temp_file, "w") as f:
-                json.dump(state.to_dict(), f, indent=2, default=str)
-
-            temp_file.rename(self.checkpoint_file)
+            _atomic_write_json(self.checkpoint_file, data)
+            if self.journal_file.exists():
+                self.journal_file.unlink()
             logger.debug(f"Checkpoint saved: {self.checkpoint_file}")
-
         except Exception as e:
-            # Clean up temp file on error
-            if temp_file.exists():
-                temp_file.unlink()
             raise RuntimeError(f"Failed to save checkpoint: {e}") from e
 
+        self._update_index(data)
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # Journal (append-only deltas)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def append_step(self, state: PipelineState, step: StepState) -> None:
+        """Journal a finished step (and the state fields it changed).
+
+        Call after state.add_step(); cheaper than save() because only one
+        line is appended instead of rewriting the whole snapshot.
+
+        Args:
+            state: Pipeline state after add_step()
+            step: The step that was added
+        """
+        state.updated_at = _now()
+        self._append("step", {"step": step.to_dict(), "state": self._state_fields(state)})
+        self._update_index(state.to_dict())
+
+    def append_state(self, state: PipelineState) -> None:
+        """Journal a status/error/next_step change without a snapshot rewrite.
+
+        Args:
+            state: Pipeline state after the change
+        """
+        state.updated_at = _now()
+        self._append("state", {"state": self._state_fields(state)})
+        self._update_index(state.to_dict())
+
+    def record_lesson(self, state: PipelineState, order: int, record: Dict[str, Any]) -> None:
+        """Record one finished lesson in state and journal it immediately.
+
+        The run index is not touched here (lesson counts refresh on the next
+        step/state write) so per-lesson progress costs a single append.
+
+        Args:
+            state: Pipeline state to update
+            order: Lesson order number (SOW entry order)
+            record: Per-lesson outcome (doc id, tokens, cost, duration, ...)
+        """
+        key = str(order)
+        state.lesson_progress[key] = record
+        self._append("lesson", {"order": key, "record": record})
+
+    def _state_fields(self, state: PipelineState) -> Dict[str, Any]:
+        return {name: getattr(state, name) for name in STATE_FIELDS}
+
+    def _append(self, entry_type: str, data: Dict[str, Any]) -> None:
+        """Append one fsynced JSONL entry to the run journal."""
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self._seq += 1
+        line = json.dumps(
+            {"seq": self._seq, "ts": _now(), "type": entry_type, "data": data},
+            default=str,
+            separators=(",", ":")
+        )
+        try:
+            with open(self.journal_file, "ab+") as f:
+                # Start on a fresh line if a previous run died mid-append
+                if f.seek(0, os.SEEK_END) and (f.seek(-1, os.SEEK_END), f.read(1))[1] != b"\n":
+                    line = "\n" + line
+                f.write((line + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            raise RuntimeError(f"Failed to append checkpoint journal: {e}") from e
+
+    def _replay(self, state: PipelineState, after_seq: int) -> int:
+        """Apply journal entries newer than the snapshot to state.
+
+        Returns:
+            Number of entries applied
+        """
+        if not self.journal_file.exists():
+            return 0
+
+        applied = 0
+        with open(self.journal_file) as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line means the process died mid-append
+                    logger.warning(
+                        f"Ignoring unreadable journal line {line_no} in {self.journal_file}"
+                    )
+                    continue
+
+                seq = entry.get("seq", 0)
+                self._seq = max(self._seq, seq)
+                if seq <= after_seq:
+                    continue
+
+                data = entry.get("data", {})
+                if entry.get("type") == "step":
+                    step = StepState.from_dict(data["step"])
+                    state.completed_steps = [
+                        s for s in state.completed_steps if s.step != step.step
+                    ]
+                    state.completed_steps.append(step)
+                elif entry.get("type") == "lesson":
+                    state.lesson_progress[data["order"]] = data["record"]
+
+                for name, value in data.get("state", {}).items():
+                    setattr(state, name, value)
+                applied += 1
+
+        return applied
+
     def save_step_result(self, step_name: str, result: Dict[str, Any]) -> None:
         """Save detailed result for a specific step.
 
@@ -256,10 +445,7 @@ class CheckpointManager:
             result: Full result dictionary from step execution
         """
         self.step_results_dir.mkdir(parents=True, exist_ok=True)
-
-        result_file = self.step_results_dir / f"{step_name}.json"
-        with open(result_file, "w") as f:
-            json.dump(result, f, indent=2, default=str)
+        _atomic_write_json(self.step_results_dir / f"{step_name}.json", result)
 
     def load_step_result(self, step_name: str) -> Optional[Dict[str, Any]]:
         """Load detailed result for a specific step.
@@ -278,16 +464,24 @@ class CheckpointManager:
             return json.load(f)
 
     def _load(self) -> PipelineState:
-        """Load state from checkpoint file."""
+        """Load state from the snapshot and replay the journal on top."""
         try:
             with open(self.checkpoint_file) as f:
                 data = json.load(f)
-            return PipelineState.from_dict(data)
         except json.JSONDecodeError as e:
             raise FileNotFoundError(
                 f"Checkpoint file corrupted: {self.checkpoint_file}. Error: {e}"
             ) from e
 
+        snapshot_seq = data.get(JOURNAL_SEQ_KEY, 0)
+        self._seq = snapshot_seq
+        state = PipelineState.from_dict(data)
+
+        applied = self._replay(state, snapshot_seq)
+        if applied:
+            logger.info(f"Replayed {applied} journal entries for {self.run_id}")
+        return state
+
     def _create(self, subject: str, level: str) -> PipelineState:
         """Create new pipeline state."""
         return PipelineState(
@@ -296,61 +490,62 @@ class CheckpointManager:
             subject=subject,
             level=level,
             status="pending",
-            started_at=datetime.utcnow().isoformat() + "Z",
+            started_at=_now(),
             completed_steps=[]
         )
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # Run index
+    # ═══════════════════════════════════════════════════════════════════════
+
+    def _update_index(self, data: Dict[str, Any]) -> None:
+        """Upsert this run's summary into index.json (best effort)."""
+        try:
+            with _locked_index(self.base_path) as index:
+                index[self.run_id] = _run_summary(data)
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Could not update checkpoint index for {self.run_id}: {e}")
+
     @classmethod
     def list_runs(cls, base_path: Optional[Path] = None) -> List[Dict[str, Any]]:
         """List all pipeline runs with their status.
 
+        Reads summaries from index.json. Run directories missing from the
+        index (older runs, or runs whose index write failed) are loaded once
+        and added; index entries whose directory was deleted are dropped.
+
         Args:
             base_path: Base directory for checkpoints
 
         Returns:
             List of run summaries sorted by start time (newest first)
         """
-        base = base_path or Path(__file__).parent.parent / "checkpoints"
-        runs = []
+        base = base_path or DEFAULT_BASE_PATH
 
         if not base.exists():
-            return runs
+            return []
 
-        for run_dir in base.iterdir():
-            if not run_dir.is_dir():
-                continue
+        run_ids = {
+            d.name for d in base.iterdir()
+            if d.is_dir() and (d / "checkpoint.json").exists()
+        }
 
-            checkpoint = run_dir / "checkpoint.json"
-            if not checkpoint.exists():
-                continue
+        with _locked_index(base) as index:
+            for stale in set(index) - run_ids:
+                del index[stale]
 
-            try:
-                with open(checkpoint) as f:
-                    data = json.load(f)
-
-                runs.append({
-                    "run_id": data["run_id"],
-                    "pipeline": data.get("pipeline", "lessons"),
-                    "subject": data["subject"],
-                    "level": data["level"],
-                    "course_id": data.get("course_id"),
-                    "status": data["status"],
-                    "started_at": data["started_at"],
-                    "updated_at": data.get("updated_at"),
-                    "last_completed_step": data.get("last_completed_step"),
-                    "next_step": data.get("next_step"),
-                    "total_cost_usd": data.get("total_cost_usd", 0),
-                    "total_tokens": data.get("total_tokens", 0),
-                    "error": data.get("error"),
-                    "steps_completed": len(data.get("completed_steps", []))
-                })
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Skipping corrupted checkpoint: {checkpoint}. Error: {e}")
-                continue
+            for run_id in sorted(run_ids - set(index)):
+                try:
+                    state = cls(run_id, base)._load()
+                    index[run_id] = _run_summary(state.to_dict())
+                except (FileNotFoundError, KeyError, TypeError) as e:
+                    logger.warning(f"Skipping corrupted checkpoint: {run_id}. Error: {e}")
+
+            runs = list(index.values())
 
         # Sort by started_at descending
         runs.sort(
-            key=lambda r: r.get("started_at", ""),
+            key=lambda r: r.get("started_at") or "",
             reverse=True
         )
 
@@ -371,15 +566,12 @@ class CheckpointManager:
         Returns:
             Detailed run information dict or None if not found
         """
-        base = base_path or Path(__file__).parent.parent / "checkpoints"
-        checkpoint = base / run_id / "checkpoint.json"
-
-        if not checkpoint.exists():
+        manager = cls(run_id, base_path)
+        if not manager.exists():
             return None
 
         try:
-            with open(checkpoint) as f:
-                data = json.load(f)
+            data = manager._load().to_dict()
 
             # Parse completed steps with full details
             completed_steps = []
@@ -432,10 +624,11 @@ class CheckpointManager:
                 "total_cost_usd": data.get("total_cost_usd", 0),
                 "total_tokens": data.get("total_tokens", 0),
                 "error": data.get("error"),
-                "completed_steps": completed_steps
+                "completed_steps": completed_steps,
+                "lessons_completed": len(data.get("lesson_progress", {}))
             }
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (FileNotFoundError, KeyError, TypeError) as e:
             logger.warning(f"Failed to load run details for {run_id}: {e}")
             return None
 
@@ -468,9 +661,9 @@ class CheckpointManager:
         """
         import shutil
 
-        base = base_path or Path(__file__).parent.parent / "checkpoints"
+        base = base_path or DEFAULT_BASE_PATH
         runs = cls.list_runs(base)
-        deleted = 0
+        deleted_ids = []
         cutoff = datetime.utcnow().timestamp() - (max_age_days * 24 * 60 * 60)
 
         for run in runs:
@@ -485,10 +678,48 @@ class CheckpointManager:
                 run_dir = base / run["run_id"]
                 if run_dir.exists():
                     shutil.rmtree(run_dir)
-                    deleted += 1
+                    deleted_ids.append(run["run_id"])
                     logger.info(f"Deleted old run: {run['run_id']}")
 
             except (ValueError, OSError) as e:
                 logger.warning(f"Failed to cleanup run {run['run_id']}: {e}")
 
-        return deleted
+        if deleted_ids:
+            with _locked_index(base) as index:
+                for run_id in deleted_ids:
+                    index.pop(run_id, None)
+
+        return len(deleted_ids)
+
+
+@contextmanager
+def _locked_index(base_path: Path) -> Iterator[Dict[str, Dict[str, Any]]]:
+    """Yield the run index for read-modify-write under an exclusive lock.
+
+    Concurrent pipeline runs share index.json, so updates are serialised with
+    an flock on a sidecar lock file (skipped where fcntl is unavailable) and
+    written back atomically when the block exits without error.
+    """
+    base_path.mkdir(parents=True, exist_ok=True)
+    index_file = base_path / INDEX_FILE
+
+    with open(base_path / f"{INDEX_FILE}.lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            try:
+                with open(index_file) as f:
+                    index = json.load(f).get("runs", {})
+            except FileNotFoundError:
+                index = {}
+            except json.JSONDecodeError:
+                logger.warning(f"Rebuilding corrupted checkpoint index: {index_file}")
+                index = {}
+
+            before = json.dumps(index, sort_keys=True, default=str)
+            yield index
+            if json.dumps(index, sort_keys=True, default=str) != before:
+                _atomic_write_json(index_file, {"version": 1, "runs": index}, indent=None)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
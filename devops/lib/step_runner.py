@@ -22,10 +22,11 @@ import os
 import re
 import shutil
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 
 # Add claud_author_agent to path for direct imports
 DEVOPS_LIB_DIR = Path(__file__).parent
@@ -37,6 +38,9 @@ AGENT_PATH = PROJECT_ROOT / "claud_author_agent"
 if str(AGENT_PATH) not in sys.path:
     sys.path.insert(0, str(AGENT_PATH))
 
+# Concurrent DiagramAuthorClaudeAgent workers in streamed lessons+diagrams mode
+DIAGRAM_WORKERS = int(os.environ.get("PIPELINE_DIAGRAM_WORKERS", "2"))
+
 
 @dataclass
 class StepResult:
@@ -89,6 +93,9 @@ class StepRunner:
         self.mcp_config_path = str(AGENT_PATH / ".mcp.json")
         self.logger = logging.getLogger(f"step_runner.{config.run_id}")
 
+        # course_id -> {sow_order: lesson_template $id}, shared by lessons + diagrams steps
+        self._lesson_index: Dict[str, Dict[int, str]] = {}
+
     # ═══════════════════════════════════════════════════════════════════════════
     # STEP 1: SEED (TypeScript - subprocess)
     # ═══════════════════════════════════════════════════════════════════════════
@@ -219,18 +226,33 @@ class StepRunner:
     # STEP 3: LESSON AUTHOR (Direct Python Import - Batch)
     # ═══════════════════════════════════════════════════════════════════════════
 
-    async def run_lessons(self, course_id: str) -> StepResult:
+    async def run_lessons(
+        self,
+        course_id: str,
+        lesson_progress: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_lesson_complete: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> StepResult:
         """Execute Step 3: Batch lesson generation via direct Python import.
 
         Iterates through all SOW entries and generates lessons.
         Collects metrics from each lesson's CostTracker.
 
+        Orders already present in lesson_progress (from the run checkpoint)
+        are skipped without touching Appwrite; if every order is recorded
+        there the lesson index query is skipped too. Step metrics only cover
+        lessons generated in this attempt, since earlier attempts were already
+        added to the run totals.
+
         Args:
             course_id: Course identifier
+            lesson_progress: Finished lessons from the checkpoint, keyed by str(order)
+            on_lesson_complete: Called with (order, record) as each lesson finishes
+                (doc_id, tokens, cost, duration) so it can be checkpointed
 
         Returns:
             StepResult with batch statistics in outputs
         """
+        lesson_progress = lesson_progress or {}
         self.logger.info(f"Starting batch lesson generation for {course_id}")
 
         try:
@@ -249,19 +271,20 @@ class StepRunner:
             if not sow_docs:
                 raise ValueError(f"No SOW found for course {course_id}")
 
-            # Parse entries from SOW document using unified parser
-            # Handles all formats: list, gzip:, storage:, plain JSON
-            from src.utils.compression import parse_sow_entries
+            # Parse entries from SOW document via the course-scoped SOW cache
+            # Handles all formats: list, gzip:, storage:, plain JSON; each
+            # lesson agent below reuses this parse instead of re-downloading
+            from src.utils.sow_cache import load_sow_entries
 
             sow_doc = sow_docs[0]
-            entries_raw = sow_doc.get("entries", "[]")
 
             try:
-                entries = await parse_sow_entries(
-                    entries_raw=entries_raw,
+                sow = await load_sow_entries(
+                    sow_doc=sow_doc,
                     mcp_config_path=self.mcp_config_path,
                     courseId=course_id
                 )
+                entries = sow.entries
             except ValueError as e:
                 raise ValueError(f"SOW entries parsing failed for {course_id}: {e}")
 
@@ -272,25 +295,34 @@ class StepRunner:
             completed = 0
             failed = 0
             skipped = 0
+            resumed = 0
             total_metrics = {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0}
             lesson_results = []
 
+            lesson_index = await self._resolve_lesson_index(course_id, entries, lesson_progress)
+
             for entry in entries:
                 order = entry.get("order")
                 self.logger.info(f"Processing lesson {order}/{total_lessons}")
 
+                # Finished in an earlier attempt of this run
+                record = lesson_progress.get(str(order))
+                if record is not None:
+                    self.logger.info(f"Lesson {order} recorded in checkpoint, skipping")
+                    skipped += 1
+                    resumed += 1
+                    lesson_results.append({
+                        "order": order,
+                        "success": True,
+                        "skipped": True,
+                        "resumed": True,
+                        "doc_id": record.get("doc_id")
+                    })
+                    continue
+
                 # Check if lesson already exists (skip logic)
                 if not self.config.force:
-                    existing = await list_appwrite_documents(
-                        database_id="default",
-                        collection_id="lesson_templates",
-                        queries=[
-                            f'equal("courseId", "{course_id}")',
-                            f'equal("sow_order", {order})'
-                        ],
-                        mcp_config_path=self.mcp_config_path
-                    )
-                    if existing:
+                    if order in lesson_index:
                         self.logger.info(f"Lesson {order} already exists, skipping")
                         skipped += 1
                         lesson_results.append({
@@ -298,9 +330,15 @@ class StepRunner:
                             "success": True,
                             "skipped": True
                         })
+                        self._notify_lesson_complete(on_lesson_complete, order, {
+                            "doc_id": lesson_index[order],
+                            "skipped": True
+                        })
                         continue
 
                 try:
+                    lesson_started = time.monotonic()
+
                     # Create agent instance for each lesson
                     agent = LessonAuthorClaudeAgent(
                         mcp_config_path=self.mcp_config_path,
@@ -319,6 +357,15 @@ class StepRunner:
                         total_metrics["input_tokens"] += metrics.get("input_tokens", 0)
                         total_metrics["output_tokens"] += metrics.get("output_tokens", 0)
                         total_metrics["cost_usd"] += metrics.get("cost_usd", 0)
+                        self._record_lesson(course_id, order, result.get("appwrite_document_id"))
+                        self._notify_lesson_complete(on_lesson_complete, order, {
+                            "doc_id": result.get("appwrite_document_id"),
+                            "input_tokens": metrics.get("input_tokens", 0),
+                            "output_tokens": metrics.get("output_tokens", 0),
+                            "cost_usd": metrics.get("cost_usd", 0),
+                            "duration_seconds": round(time.monotonic() - lesson_started, 1),
+                            "execution_id": result.get("execution_id")
+                        })
                     else:
                         failed += 1
 
@@ -354,6 +401,7 @@ class StepRunner:
                     "completed": completed,
                     "failed": failed,
                     "skipped": skipped,
+                    "resumed": resumed,
                     "lesson_results": lesson_results
                 },
                 metrics=total_metrics,
@@ -387,131 +435,290 @@ class StepRunner:
         self.logger.info(f"Starting batch diagram generation for {course_id}")
 
         try:
-            # Import agent and utilities
-            from src.diagram_author_claude_client import DiagramAuthorClaudeAgent
-            from src.utils.appwrite_mcp import list_appwrite_documents
+            # Fail fast if the agent cannot be imported
+            from src.diagram_author_claude_client import DiagramAuthorClaudeAgent  # noqa: F401
 
-            # Get all lesson templates for this course
-            lessons = await list_appwrite_documents(
-                database_id="default",
-                collection_id="lesson_templates",
-                queries=[f'equal("courseId", "{course_id}")'],
-                mcp_config_path=self.mcp_config_path
-            )
+            # Lesson templates for this course: reuse the index built by the
+            # lessons step (or build it with one projected query on resume)
+            lesson_index = await self._load_lesson_index(course_id)
 
-            if not lessons:
+            if not lesson_index:
                 raise ValueError(f"No lesson templates found for course {course_id}")
 
-            # Sort by sow_order
-            lessons.sort(key=lambda x: x.get("sow_order", 0))
+            # Sorted by sow_order
+            lessons = [
+                {"$id": lesson_id, "sow_order": order}
+                for order, lesson_id in sorted(lesson_index.items())
+            ]
 
-            total_lessons = len(lessons)
-            completed = 0
-            failed = 0
-            skipped = 0
-            total_metrics = {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0}
             diagram_results = []
-
             for lesson in lessons:
                 order = lesson.get("sow_order")
-                lesson_id = lesson.get("$id")
-                self.logger.info(f"Processing diagrams for lesson {order}/{total_lessons}")
+                self.logger.info(f"Processing diagrams for lesson {order}/{len(lessons)}")
+                diagram_results.append(
+                    await self._generate_lesson_diagrams(course_id, order, lesson.get("$id"))
+                )
 
-                # Check if diagrams already exist for this lesson (skip logic)
-                if not self.config.force:
-                    existing_diagrams = await list_appwrite_documents(
-                        database_id="default",
-                        collection_id="lesson_diagrams",
-                        queries=[f'equal("lessonTemplateId", "{lesson_id}")'],
-                        mcp_config_path=self.mcp_config_path
-                    )
-                    if existing_diagrams:
-                        self.logger.info(
-                            f"Lesson {order} already has {len(existing_diagrams)} diagrams, skipping"
-                        )
-                        skipped += 1
-                        diagram_results.append({
-                            "order": order,
-                            "lesson_id": lesson_id,
-                            "success": True,
-                            "skipped": True,
-                            "existing_diagrams": len(existing_diagrams)
-                        })
-                        continue
+            return self._build_diagrams_result(len(lessons), diagram_results)
+
+        except ImportError as e:
+            error_msg = f"Failed to import DiagramAuthorClaudeAgent: {e}"
+            self.logger.error(error_msg)
+            return StepResult(success=False, error=error_msg)
 
+        except Exception as e:
+            self.logger.error(f"Batch diagram generation failed: {e}", exc_info=True)
+            return StepResult(success=False, error=str(e))
+
+        finally:
+            await self._close_diagram_http_client()
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # STREAMED LESSONS + DIAGRAMS (diagram workers fed by finished lessons)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    async def run_lessons_with_diagrams(
+        self,
+        course_id: str,
+        lesson_progress: Optional[Dict[str, Dict[str, Any]]] = None,
+        on_lesson_complete: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        diagram_workers: int = DIAGRAM_WORKERS
+    ) -> Tuple[StepResult, StepResult]:
+        """Execute Steps 3 and 4 as a pipeline.
+
+        Every lesson template that becomes available - generated now, already
+        in Appwrite, or recorded in the checkpoint - is put on a queue that
+        diagram_workers DiagramAuthorClaudeAgent workers consume while the
+        remaining lessons are still being written, so the course is built in
+        roughly the time of the slower stage instead of the sum of both.
+
+        Args:
+            course_id: Course identifier
+            lesson_progress: Finished lessons from the checkpoint (see run_lessons)
+            on_lesson_complete: Checkpoint callback (see run_lessons)
+            diagram_workers: Number of concurrent diagram agents
+
+        Returns:
+            (lessons StepResult, diagrams StepResult)
+
+        Raises:
+            ValueError: If diagram_workers < 1
+        """
+        if diagram_workers < 1:
+            raise ValueError(f"diagram_workers must be >= 1, got {diagram_workers}")
+
+        try:
+            from src.diagram_author_claude_client import DiagramAuthorClaudeAgent  # noqa: F401
+            from src.utils.logging_config import log_scope, setup_logging
+        except ImportError as e:
+            error_msg = f"Failed to import DiagramAuthorClaudeAgent: {e}"
+            self.logger.error(error_msg)
+            lessons_result = await self.run_lessons(course_id, lesson_progress, on_lesson_complete)
+            return lessons_result, StepResult(success=False, error=error_msg)
+
+        # Configure agent logging once: workers must not reset root handlers
+        # while other workers are mid-run
+        setup_logging(log_level="INFO")
+        # One lesson_order_NNN workspace per lesson (agent execution IDs only
+        # have one-second resolution, so concurrent workers could collide)
+        workspace_dir = AGENT_PATH / "workspace" / f"diagrams_{self.config.run_id}"
+
+        queue: asyncio.Queue = asyncio.Queue()
+        queued_orders = set()
+        diagram_results: List[Dict[str, Any]] = []
+
+        def enqueue(order: int, lesson_id: Optional[str]) -> None:
+            if lesson_id and order not in queued_orders:
+                queued_orders.add(order)
+                queue.put_nowait((order, lesson_id))
+
+        def lesson_complete(order: int, record: Dict[str, Any]) -> None:
+            enqueue(order, record.get("doc_id"))
+            self._notify_lesson_complete(on_lesson_complete, order, record)
+
+        # Lessons finished in an earlier attempt still need their diagrams
+        for order_key, record in sorted(
+            (lesson_progress or {}).items(), key=lambda item: int(item[0])
+        ):
+            enqueue(int(order_key), record.get("doc_id"))
+
+        async def diagram_worker(worker_id: int) -> None:
+            while True:
+                item = await queue.get()
                 try:
-                    agent = DiagramAuthorClaudeAgent(
-                        mcp_config_path=self.mcp_config_path,
-                        persist_workspace=True,
-                        log_level="INFO"
-                    )
+                    if item is None:
+                        return
+                    order, lesson_id = item
+                    self.logger.info(f"[diagram worker {worker_id}] Lesson {order} ({lesson_id})")
+                    with log_scope(f"diagram_order_{order:03d}"):
+                        diagram_results.append(
+                            await self._generate_lesson_diagrams(
+                                course_id, order, lesson_id,
+                                workspace_parent_dir=workspace_dir,
+                                configure_logging=False
+                            )
+                        )
+                finally:
+                    queue.task_done()
 
-                    result = await agent.execute(
-                        courseId=course_id,
-                        order=order,
-                        force=self.config.force
-                    )
+        started = time.monotonic()
+        workers = [asyncio.create_task(diagram_worker(i + 1)) for i in range(diagram_workers)]
+        try:
+            lessons_result = await self.run_lessons(course_id, lesson_progress, lesson_complete)
+            lessons_elapsed = time.monotonic() - started
+        finally:
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+            await self._close_diagram_http_client()
+
+        elapsed = time.monotonic() - started
+        diagram_results.sort(key=lambda r: r.get("order") or 0)
+        diagrams_result = self._build_diagrams_result(len(queued_orders), diagram_results)
+        diagrams_result.outputs["streamed"] = True
+        diagrams_result.outputs["diagram_workers"] = diagram_workers
+        diagrams_result.outputs["lessons_elapsed_seconds"] = round(lessons_elapsed, 1)
+        diagrams_result.outputs["pipeline_elapsed_seconds"] = round(elapsed, 1)
+        self.logger.info(
+            f"Streamed lessons+diagrams finished in {elapsed:.1f}s "
+            f"(lessons alone: {lessons_elapsed:.1f}s, {len(queued_orders)} lessons diagrammed)"
+        )
+        return lessons_result, diagrams_result
 
-                    if result.get("success"):
-                        completed += 1
-                        metrics = self._extract_agent_metrics(result)
-                        total_metrics["input_tokens"] += metrics.get("input_tokens", 0)
-                        total_metrics["output_tokens"] += metrics.get("output_tokens", 0)
-                        total_metrics["cost_usd"] += metrics.get("cost_usd", 0)
-                    elif result.get("skipped"):
-                        skipped += 1
-                    else:
-                        failed += 1
+    async def _close_diagram_http_client(self) -> None:
+        """Close the diagram render tools' keep-alive client for this loop.
 
-                    diagram_results.append({
-                        "order": order,
-                        "lesson_id": lesson_id,
-                        "success": result.get("success"),
-                        "skipped": result.get("skipped", False),
-                        "diagrams_created": result.get("diagrams_created", 0),
-                        "error": result.get("error")
-                    })
+        The tools create it again on next use, so this is safe between steps.
+        """
+        try:
+            from src.tools.diagram_http_client import aclose_diagram_http_client
+        except ImportError:
+            return
+        await aclose_diagram_http_client()
 
-                    # Collect agent logs for this diagram
-                    self._collect_agent_logs(
-                        step_name="diagrams",
-                        execution_id=result.get("execution_id"),
-                        workspace_path=result.get("workspace_path")
-                    )
+    async def _generate_lesson_diagrams(
+        self,
+        course_id: str,
+        order: int,
+        lesson_id: str,
+        workspace_parent_dir: Optional[Path] = None,
+        configure_logging: bool = True
+    ) -> Dict[str, Any]:
+        """Generate diagrams for one lesson template.
 
-                except Exception as e:
-                    self.logger.error(f"Diagram generation for lesson {order} failed: {e}")
-                    failed += 1
-                    diagram_results.append({
+        Args:
+            course_id: Course identifier
+            order: Lesson sow_order
+            lesson_id: lesson_templates document $id
+            workspace_parent_dir: Optional directory for per-lesson
+                lesson_order_NNN/ workspaces (required for concurrent workers)
+            configure_logging: Passed to DiagramAuthorClaudeAgent
+
+        Returns:
+            Result record for diagram_results (with agent metrics under "metrics")
+        """
+        from src.diagram_author_claude_client import DiagramAuthorClaudeAgent
+        from src.utils.appwrite_mcp import list_appwrite_documents
+
+        try:
+            # Check if diagrams already exist for this lesson (skip logic)
+            if not self.config.force:
+                existing_diagrams = await list_appwrite_documents(
+                    database_id="default",
+                    collection_id="lesson_diagrams",
+                    queries=[f'equal("lessonTemplateId", "{lesson_id}")'],
+                    mcp_config_path=self.mcp_config_path
+                )
+                if existing_diagrams:
+                    self.logger.info(
+                        f"Lesson {order} already has {len(existing_diagrams)} diagrams, skipping"
+                    )
+                    return {
                         "order": order,
                         "lesson_id": lesson_id,
-                        "success": False,
-                        "error": str(e)
-                    })
+                        "success": True,
+                        "skipped": True,
+                        "existing_diagrams": len(existing_diagrams)
+                    }
 
-            success = failed == 0
+            agent = DiagramAuthorClaudeAgent(
+                mcp_config_path=self.mcp_config_path,
+                persist_workspace=True,
+                log_level="INFO",
+                workspace_parent_dir=workspace_parent_dir,
+                configure_logging=configure_logging
+            )
 
-            return StepResult(
-                success=success,
-                outputs={
-                    "total_lessons": total_lessons,
-                    "completed": completed,
-                    "failed": failed,
-                    "skipped": skipped,
-                    "diagram_results": diagram_results
-                },
-                metrics=total_metrics,
-                error=f"{failed} diagram generations failed" if failed > 0 else None
+            result = await agent.execute(
+                courseId=course_id,
+                order=order,
+                force=self.config.force
             )
 
-        except ImportError as e:
-            error_msg = f"Failed to import DiagramAuthorClaudeAgent: {e}"
-            self.logger.error(error_msg)
-            return StepResult(success=False, error=error_msg)
+            # Collect agent logs for this diagram (nested workspaces can share
+            # an execution ID, so name the log after the lesson too)
+            execution_id = result.get("execution_id")
+            if workspace_parent_dir and execution_id:
+                execution_id = f"{execution_id}_lesson_order_{order:03d}"
+            self._collect_agent_logs(
+                step_name="diagrams",
+                execution_id=execution_id,
+                workspace_path=result.get("workspace_path")
+            )
+
+            return {
+                "order": order,
+                "lesson_id": lesson_id,
+                "success": result.get("success"),
+                "skipped": result.get("skipped", False),
+                "diagrams_created": result.get("diagrams_created", 0),
+                "error": result.get("error"),
+                "metrics": self._extract_agent_metrics(result) if result.get("success") else None
+            }
 
         except Exception as e:
-            self.logger.error(f"Batch diagram generation failed: {e}", exc_info=True)
-            return StepResult(success=False, error=str(e))
+            self.logger.error(f"Diagram generation for lesson {order} failed: {e}")
+            return {
+                "order": order,
+                "lesson_id": lesson_id,
+                "success": False,
+                "error": str(e)
+            }
+
+    def _build_diagrams_result(
+        self,
+        total_lessons: int,
+        diagram_results: List[Dict[str, Any]]
+    ) -> StepResult:
+        """Aggregate per-lesson diagram records into the diagrams StepResult."""
+        completed = 0
+        failed = 0
+        skipped = 0
+        total_metrics = {"input_tokens": 0, "output_tokens": 0, "cost_usd": 0}
+
+        for record in diagram_results:
+            metrics = record.pop("metrics", None)
+            if record.get("success") and not record.get("skipped"):
+                completed += 1
+                for key in total_metrics:
+                    total_metrics[key] += (metrics or {}).get(key, 0)
+            elif record.get("skipped"):
+                skipped += 1
+            else:
+                failed += 1
+
+        return StepResult(
+            success=failed == 0,
+            outputs={
+                "total_lessons": total_lessons,
+                "completed": completed,
+                "failed": failed,
+                "skipped": skipped,
+                "diagram_results": diagram_results
+            },
+            metrics=total_metrics,
+            error=f"{failed} diagram generations failed" if failed > 0 else None
+        )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # COURSE/SOW LOOKUP HELPERS (for --skip-seed-sow)
@@ -581,7 +788,7 @@ class StepRunner:
             ValueError: If no SOW found
         """
         from src.utils.appwrite_mcp import list_appwrite_documents
-        from src.utils.compression import parse_sow_entries
+        from src.utils.sow_cache import load_sow_entries
 
         self.logger.info(f"Validating SOW exists for {course_id}")
 
@@ -598,19 +805,17 @@ class StepRunner:
                 f"Run without --skip-seed-sow to generate SOW first."
             )
 
-        entries_raw = sow_docs[0].get("entries", "[]")
-
-        # Use unified parser that handles all formats:
+        # Use unified parser (via the SOW cache) that handles all formats:
         # - list: already parsed
         # - gzip: prefix: inline compressed
         # - storage: prefix: storage bucket reference
         # - plain JSON string
         try:
-            entries = await parse_sow_entries(
-                entries_raw=entries_raw,
+            entries = (await load_sow_entries(
+                sow_doc=sow_docs[0],
                 mcp_config_path=self.mcp_config_path,
                 courseId=course_id
-            )
+            )).entries
         except ValueError as e:
             raise ValueError(f"SOW entries parsing failed for {course_id}: {e}")
 
@@ -629,6 +834,108 @@ class StepRunner:
     # HELPER METHODS
     # ═══════════════════════════════════════════════════════════════════════════
 
+    async def _load_lesson_index(self, course_id: str) -> Dict[int, str]:
+        """Return {sow_order: lesson_template $id} for every lesson of a course.
+
+        Built once per course with a single cursor-paged query projected to
+        sow_order, then kept up to date by _record_lesson() as lessons are
+        generated, so the diagrams step can reuse it without re-querying.
+
+        Args:
+            course_id: Course identifier
+
+        Returns:
+            Mapping of sow_order to lesson template document ID
+        """
+        if course_id in self._lesson_index:
+            return self._lesson_index[course_id]
+
+        from src.utils.appwrite_mcp import iter_appwrite_documents
+
+        index: Dict[int, str] = {}
+        async for lesson in iter_appwrite_documents(
+            database_id="default",
+            collection_id="lesson_templates",
+            queries=[f'equal("courseId", "{course_id}")'],
+            mcp_config_path=self.mcp_config_path,
+            select=["sow_order"]
+        ):
+            order = lesson.get("sow_order")
+            if order is None:
+                continue
+            if order in index:
+                self.logger.warning(
+                    f"Duplicate lesson_templates for sow_order {order}: "
+                    f"{index[order]}, {lesson.get('$id')} (using first)"
+                )
+                continue
+            index[order] = lesson.get("$id")
+
+        self.logger.info(f"Indexed {len(index)} existing lesson templates for {course_id}")
+        self._lesson_index[course_id] = index
+        return index
+
+    async def _resolve_lesson_index(
+        self,
+        course_id: str,
+        entries: List[Dict[str, Any]],
+        lesson_progress: Dict[str, Dict[str, Any]]
+    ) -> Dict[int, str]:
+        """Build the lesson index for run_lessons, from the checkpoint if possible.
+
+        The Appwrite query is skipped only when every SOW order is checkpointed
+        with a doc_id. A record without one (the agent reported no document ID)
+        would leave that lesson out of the index and so out of the diagrams
+        step, so the index is then loaded from Appwrite as usual.
+        """
+        records = [lesson_progress.get(str(e.get("order"))) for e in entries]
+        if all(record and record.get("doc_id") for record in records):
+            self.logger.info(
+                f"All {len(entries)} lessons recorded in checkpoint, skipping lesson lookup"
+            )
+            lesson_index = self._lesson_index.setdefault(course_id, {})
+        else:
+            # One projected query for every existing lesson of the course
+            # (replaces a per-entry lookup); reused by the diagrams step
+            lesson_index = await self._load_lesson_index(course_id)
+
+        # Checkpointed doc ids are as good as indexed ones for the diagrams step
+        for order_key, record in lesson_progress.items():
+            if record.get("doc_id"):
+                lesson_index.setdefault(int(order_key), record["doc_id"])
+        return lesson_index
+
+    def _record_lesson(self, course_id: str, order: int, lesson_id: Optional[str]) -> None:
+        """Record a freshly generated lesson in the course lesson index.
+
+        If the agent did not report a document ID the index is dropped so the
+        next step rebuilds it from Appwrite rather than trusting stale data.
+        """
+        if course_id not in self._lesson_index:
+            return
+        if lesson_id:
+            self._lesson_index[course_id][order] = lesson_id
+        else:
+            del self._lesson_index[course_id]
+
+    def _notify_lesson_complete(
+        self,
+        callback: Optional[Callable[[int, Dict[str, Any]], None]],
+        order: int,
+        record: Dict[str, Any]
+    ) -> None:
+        """Pass a finished lesson to the checkpoint callback.
+
+        A failed checkpoint write only costs resume granularity, so it is
+        logged rather than failing the lesson that was just generated.
+        """
+        if callback is None:
+            return
+        try:
+            callback(order, record)
+        except Exception as e:
+            self.logger.warning(f"Could not checkpoint lesson {order}: {e}")
+
     def _extract_agent_metrics(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Extract metrics from agent result (direct access to CostTracker data).
 
@@ -25,6 +25,9 @@ Usage:
 
     # Combine flags: skip seed+SOW and diagrams
     python pipeline_runner.py lessons --subject aom --level h --skip-seed-sow --skip-diagrams
+
+    # Start each lesson's diagrams as soon as the lesson is upserted
+    python pipeline_runner.py lessons --subject physics --level higher --stream-diagrams --diagram-workers 3
 """
 
 import argparse
@@ -34,7 +37,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -47,7 +50,7 @@ from devops.lib.checkpoint_manager import (
     format_duration,
     calculate_duration_seconds
 )
-from devops.lib.step_runner import StepRunner, StepResult
+from devops.lib.step_runner import StepRunner, StepResult, DIAGRAM_WORKERS
 from devops.lib.observability import ObservabilityManager
 from devops.lib.diagram_service import DiagramServiceManager, DiagramServiceError
 from devops.lib.validators import validate_subject_level, get_valid_subjects, get_valid_levels
@@ -76,6 +79,8 @@ class PipelineConfig:
     diagram_timeout: int = 60
     use_iterative_sow: bool = True  # Use iterative SOW authoring by default
     version: str = "1"  # SOW version number
+    stream_diagrams: bool = False  # Generate diagrams while lessons are still being written
+    diagram_workers: int = DIAGRAM_WORKERS
 
     @classmethod
     def from_checkpoint(cls, run_id: str) -> "PipelineConfig":
@@ -177,7 +182,7 @@ class LessonsPipeline:
 
                 # Mark SEED and SOW as skipped in state
                 state.last_completed_step = "sow"
-                self.checkpoint_mgr.save(state)
+                self.checkpoint_mgr.append_state(state)
 
                 self.observability.step_skipped("seed", "skip_seed_sow flag set")
                 self.observability.step_skipped("sow", "skip_seed_sow flag set")
@@ -191,6 +196,9 @@ class LessonsPipeline:
                     f"(completed: {state.last_completed_step})"
                 )
 
+            # Diagrams result produced alongside the lessons step in streamed mode
+            streamed_results: Dict[PipelineStep, StepResult] = {}
+
             for step in self.STEPS[start_index:]:
                 # Skip SEED/SOW if --skip-seed-sow is set
                 if self.config.skip_seed_sow and step in (PipelineStep.SEED, PipelineStep.SOW):
@@ -201,38 +209,55 @@ class LessonsPipeline:
                     self.observability.step_skipped(step.value, "skip_diagrams flag set")
                     continue
 
-                # Pre-step: Health check for diagram service
-                if step == PipelineStep.DIAGRAMS:
+                if step in streamed_results:
+                    result = streamed_results.pop(step)
+                    self.observability.step_completed(
+                        step.value,
+                        result.to_dict(),
+                        success=result.success
+                    )
+
+                elif step == PipelineStep.LESSONS and self._streams_diagrams():
+                    # Diagram workers start on the first finished lesson
                     await self._ensure_diagram_service()
+                    result, streamed_results[PipelineStep.DIAGRAMS] = \
+                        await self._execute_streamed_lessons(state)
 
-                # Execute step
-                result = await self._execute_step(step, state)
-
-                # Update state and checkpoint
-                state = self._update_state(state, step, result)
-                self.checkpoint_mgr.save(state)
-
-                # Save detailed step result
-                self.checkpoint_mgr.save_step_result(
-                    step.value,
-                    {
-                        "success": result.success,
-                        "outputs": result.outputs,
-                        "metrics": result.metrics,
-                        "error": result.error
-                    }
-                )
+                else:
+                    # Pre-step: Health check for diagram service
+                    if step == PipelineStep.DIAGRAMS:
+                        await self._ensure_diagram_service()
+
+                    # Execute step
+                    result = await self._execute_step(step, state)
+
+                # Update state, journal the finished step and save its result
+                state = self._record_step(state, step, result)
 
                 # Check for failure
                 if not result.success:
+                    # Streamed diagrams finished (and paid for) their work
+                    # alongside the failed lessons; record it without moving
+                    # the resume point past the lessons step
+                    streamed_diagrams = streamed_results.pop(PipelineStep.DIAGRAMS, None)
+                    if streamed_diagrams is not None:
+                        self.observability.step_completed(
+                            PipelineStep.DIAGRAMS.value,
+                            streamed_diagrams.to_dict(),
+                            success=streamed_diagrams.success
+                        )
+                        state = self._record_step(
+                            state, PipelineStep.DIAGRAMS, streamed_diagrams, advance=False
+                        )
+
                     state.status = "failed"
                     state.error = result.error
                     state.next_step = step.value
-                    self.checkpoint_mgr.save(state)
+                    self.checkpoint_mgr.append_state(state)
                     self.observability.pipeline_failed(state, step.value, result.error)
                     return self._build_result(state, success=False, error=result.error)
 
-            # Pipeline completed successfully
+            # Pipeline completed successfully (snapshot compacts the journal)
             state.status = "completed"
             self.checkpoint_mgr.save(state)
             self.observability.pipeline_completed(state)
@@ -241,7 +266,7 @@ class LessonsPipeline:
         except Exception as e:
             state.status = "failed"
             state.error = str(e)
-            self.checkpoint_mgr.save(state)
+            self.checkpoint_mgr.append_state(state)
             self.observability.pipeline_failed(state, None, str(e))
             raise
 
@@ -293,7 +318,13 @@ class LessonsPipeline:
         elif step == PipelineStep.LESSONS:
             if not state.course_id:
                 raise ValueError("course_id not set. Run seed step first.")
-            result = await self.step_runner.run_lessons(course_id=state.course_id)
+            result = await self.step_runner.run_lessons(
+                course_id=state.course_id,
+                lesson_progress=state.lesson_progress,
+                on_lesson_complete=lambda order, record: self.checkpoint_mgr.record_lesson(
+                    state, order, record
+                )
+            )
 
         elif step == PipelineStep.DIAGRAMS:
             if not state.course_id:
@@ -311,6 +342,52 @@ class LessonsPipeline:
 
         return result
 
+    def _streams_diagrams(self) -> bool:
+        """Whether the diagrams step runs concurrently with the lessons step."""
+        return (
+            self.config.stream_diagrams
+            and not self.config.skip_diagrams
+            and not self.config.dry_run
+        )
+
+    async def _execute_streamed_lessons(
+        self,
+        state: PipelineState
+    ) -> Tuple[StepResult, StepResult]:
+        """Execute LESSONS with DIAGRAMS fed from each finished lesson.
+
+        Args:
+            state: Current pipeline state
+
+        Returns:
+            (lessons StepResult, diagrams StepResult)
+        """
+        if not state.course_id:
+            raise ValueError("course_id not set. Run seed step first.")
+
+        self.observability.step_started(PipelineStep.LESSONS.value)
+        self.observability.log_info(
+            f"Streaming diagrams with {self.config.diagram_workers} worker(s) "
+            "as lessons complete"
+        )
+        self.observability.step_started(PipelineStep.DIAGRAMS.value)
+
+        lessons_result, diagrams_result = await self.step_runner.run_lessons_with_diagrams(
+            course_id=state.course_id,
+            lesson_progress=state.lesson_progress,
+            on_lesson_complete=lambda order, record: self.checkpoint_mgr.record_lesson(
+                state, order, record
+            ),
+            diagram_workers=self.config.diagram_workers
+        )
+
+        self.observability.step_completed(
+            PipelineStep.LESSONS.value,
+            lessons_result.to_dict(),
+            success=lessons_result.success
+        )
+        return lessons_result, diagrams_result
+
     async def _ensure_diagram_service(self) -> None:
         """Health check + wait for diagram service.
 
@@ -353,6 +430,43 @@ class LessonsPipeline:
 
         return 0
 
+    def _record_step(
+        self,
+        state: PipelineState,
+        step: PipelineStep,
+        result: StepResult,
+        advance: bool = True
+    ) -> PipelineState:
+        """Update state, journal the finished step and save its detailed result.
+
+        Args:
+            state: Current pipeline state
+            step: Finished step
+            result: Step result
+            advance: If False, keep last_completed_step/next_step unchanged so
+                a resume still starts from the current step
+
+        Returns:
+            Updated pipeline state
+        """
+        last_completed_step, next_step = state.last_completed_step, state.next_step
+        state = self._update_state(state, step, result)
+        if not advance:
+            state.last_completed_step, state.next_step = last_completed_step, next_step
+        self.checkpoint_mgr.append_step(state, state.get_step_state(step.value))
+
+        # Save detailed step result
+        self.checkpoint_mgr.save_step_result(
+            step.value,
+            {
+                "success": result.success,
+                "outputs": result.outputs,
+                "metrics": result.metrics,
+                "error": result.error
+            }
+        )
+        return state
+
     def _update_state(
         self,
         state: PipelineState,
@@ -775,6 +889,17 @@ async def main() -> int:
         default=60,
         help="Timeout in seconds for diagram service (default: 60)"
     )
+    lessons_parser.add_argument(
+        "--stream-diagrams",
+        action="store_true",
+        help="Generate each lesson's diagrams as soon as the lesson is upserted"
+    )
+    lessons_parser.add_argument(
+        "--diagram-workers",
+        type=int,
+        default=DIAGRAM_WORKERS,
+        help=f"Concurrent diagram agents with --stream-diagrams (default: {DIAGRAM_WORKERS})"
+    )
 
     # SOW authoring mode options (mutually exclusive)
     sow_mode_group = lessons_parser.add_mutually_exclusive_group()
@@ -867,6 +992,8 @@ async def main() -> int:
                 config.skip_seed_sow = args.skip_seed_sow
                 config.force = args.force
                 config.diagram_timeout = args.diagram_timeout
+                config.stream_diagrams = args.stream_diagrams
+                config.diagram_workers = args.diagram_workers
                 config.use_iterative_sow = not args.legacy  # --legacy overrides default
                 config.version = args.sow_version  # SOW version
             else:
@@ -892,6 +1019,8 @@ async def main() -> int:
                     skip_seed_sow=args.skip_seed_sow,
                     force=args.force,
                     diagram_timeout=args.diagram_timeout,
+                    stream_diagrams=args.stream_diagrams,
+                    diagram_workers=args.diagram_workers,
                     use_iterative_sow=use_iterative,
                     version=args.sow_version
                 )
@@ -0,0 +1,56 @@
+"""
+Unit Tests for recording streamed diagrams when the lessons step fails.
+
+The step runner and observability are stubbed; checkpoints are written to a
+temporary directory.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from devops.lib.checkpoint_manager import CheckpointManager
+from devops.lib.step_runner import StepResult
+from devops.pipeline_runner import LessonsPipeline, PipelineConfig
+
+
+class FakeStepRunner:
+    async def run_lessons_with_diagrams(self, course_id, lesson_progress, on_lesson_complete, diagram_workers):
+        lessons = StepResult(success=False, error="lesson 3 failed", metrics={"cost_usd": 1.0})
+        diagrams = StepResult(success=True, outputs={"diagrams": 4}, metrics={"cost_usd": 0.5})
+        return lessons, diagrams
+
+
+def make_pipeline(tmp_path):
+    config = PipelineConfig(subject="mathematics", level="national_5", run_id="run_test", stream_diagrams=True)
+    pipeline = LessonsPipeline.__new__(LessonsPipeline)
+    pipeline.config = config
+    pipeline.checkpoint_mgr = CheckpointManager(config.run_id, base_path=tmp_path)
+    pipeline.observability = MagicMock()
+    pipeline.step_runner = FakeStepRunner()
+
+    async def healthy():
+        return None
+
+    pipeline._ensure_diagram_service = healthy
+
+    state = pipeline.checkpoint_mgr.load_or_create(subject=config.subject, level=config.level)
+    state.course_id = "course_test"
+    state.last_completed_step = "sow"
+    pipeline.checkpoint_mgr.save(state)
+    return pipeline
+
+
+def test_failed_lessons_still_record_streamed_diagrams(tmp_path):
+    pipeline = make_pipeline(tmp_path)
+
+    result = asyncio.run(pipeline.run())
+
+    assert result["success"] is False
+    state = CheckpointManager("run_test", base_path=tmp_path).load_or_create()
+    diagrams = state.get_step_state("diagrams")
+    assert diagrams is not None and diagrams.status == "completed"
+    assert state.total_cost_usd == 1.5
+    # Resume must still start from the failed lessons step
+    assert state.last_completed_step == "sow"
+    assert state.next_step == "lessons"
+    assert (tmp_path / "run_test" / "step_results" / "diagrams.json").exists()
@@ -0,0 +1,57 @@
+"""
+Unit Tests for resuming the lessons step from the run checkpoint.
+
+Appwrite is replaced by a stubbed lesson index lookup; these cover when the
+checkpoint alone is trusted to build the lesson index for the diagrams step.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from devops.lib.step_runner import StepRunner
+
+ENTRIES = [{"order": 1}, {"order": 2}, {"order": 3}]
+
+
+def make_runner(appwrite_index):
+    runner = StepRunner(SimpleNamespace(run_id="run_test", force=False), observability=None)
+    lookups = []
+
+    async def fake_load(course_id):
+        lookups.append(course_id)
+        runner._lesson_index[course_id] = dict(appwrite_index)
+        return runner._lesson_index[course_id]
+
+    runner._load_lesson_index = fake_load
+    return runner, lookups
+
+
+def test_fully_checkpointed_course_skips_lesson_lookup():
+    runner, lookups = make_runner({})
+    progress = {str(o): {"doc_id": f"lt_{o}"} for o in (1, 2, 3)}
+
+    index = asyncio.run(runner._resolve_lesson_index("course_test", ENTRIES, progress))
+
+    assert lookups == []
+    assert index == {1: "lt_1", 2: "lt_2", 3: "lt_3"}
+
+
+def test_checkpoint_record_without_doc_id_reloads_index():
+    runner, lookups = make_runner({1: "lt_1", 2: "lt_2_appwrite", 3: "lt_3"})
+    progress = {"1": {"doc_id": "lt_1"}, "2": {"doc_id": None}, "3": {"doc_id": "lt_3"}}
+
+    index = asyncio.run(runner._resolve_lesson_index("course_test", ENTRIES, progress))
+
+    assert lookups == ["course_test"]
+    assert index == {1: "lt_1", 2: "lt_2_appwrite", 3: "lt_3"}
+    assert runner._lesson_index["course_test"] is index
+
+
+def test_pending_orders_reload_index_and_keep_checkpointed_ids():
+    runner, lookups = make_runner({3: "lt_3"})
+    progress = {"1": {"doc_id": "lt_1"}}
+
+    index = asyncio.run(runner._resolve_lesson_index("course_test", ENTRIES, progress))
+
+    assert lookups == ["course_test"]
+    assert index == {1: "lt_1", 3: "lt_3"}
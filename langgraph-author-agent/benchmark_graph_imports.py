@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for the graphs in langgraph.json.
+
+The LangGraph server imports every graph module at start-up, so anything a
+module does at import time (client construction, MCP subprocess start-up,
+tool discovery) is paid before the first request. This script measures:
+
+    - cold import of each graph on its own (fresh interpreter per graph)
+    - loading all graphs in one interpreter, in langgraph.json order, as
+      the server does (shared modules such as sow_author_tools load once)
+
+and reports whether the shared Appwrite MCP client was started.
+
+Usage:
+    python benchmark_graph_imports.py
+    python benchmark_graph_imports.py --repeat 5
+    python benchmark_graph_imports.py --graphs research lesson_author
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+# Runs in a child interpreter: load graph files by path like the server does
+_LOADER = r"""
+import importlib.util, json, sys, time
+sys.path.insert(0, {root!r})
+timings = {{}}
+started = time.perf_counter()
+for graph_id, path in {graphs!r}:
+    t0 = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(f"graph_{{graph_id}}", path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+        timings[graph_id] = {{"seconds": time.perf_counter() - t0}}
+    except BaseException as e:
+        timings[graph_id] = {{"seconds": time.perf_counter() - t0, "error": f"{{type(e).__name__}}: {{e}}"}}
+tools = [sys.modules[m] for m in ("src.sow_author_tools", "sow_author_tools") if m in sys.modules]
+print(json.dumps({{
+    "total": time.perf_counter() - started,
+    "graphs": timings,
+    "mcp_started": any(getattr(t, "_mcp_client", None) is not None for t in tools),
+}}))
+"""
+
+
+def load_graphs():
+    """Return [(graph_id, absolute path)] from langgraph.json."""
+    config = json.loads((ROOT / "langgraph.json").read_text())
+    return [
+        (graph_id, str((ROOT / target.split(":")[0]).resolve()))
+        for graph_id, target in config["graphs"].items()
+    ]
+
+
+def run_loader(graphs):
+    """Import graphs in a fresh interpreter and return its timing report."""
+    code = _LOADER.format(root=str(ROOT), graphs=graphs)
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if proc.returncode != 0 or not proc.stdout.strip():
+        raise RuntimeError(f"Loader failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LangGraph graph import time")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (default: 3)")
+    parser.add_argument("--graphs", nargs="*", help="Graph IDs to load (default: all in langgraph.json)")
+    args = parser.parse_args()
+
+    graphs = load_graphs()
+    if args.graphs:
+        unknown = set(args.graphs) - {graph_id for graph_id, _ in graphs}
+        if unknown:
+            parser.error(f"Unknown graph IDs: {', '.join(sorted(unknown))}")
+        graphs = [g for g in graphs if g[0] in args.graphs]
+
+    print(f"Graphs: {len(graphs)}   repeats: {args.repeat}")
+    print("─" * 72)
+
+    # Cold import of each graph in its own interpreter
+    for graph_id, path in graphs:
+        reports = [run_loader([(graph_id, path)]) for _ in range(args.repeat)]
+        entry = reports[-1]["graphs"][graph_id]
+        seconds = statistics.median(r["graphs"][graph_id]["seconds"] for r in reports)
+        mcp = "MCP started" if reports[-1]["mcp_started"] else "no MCP"
+        status = f"❌ {entry['error']}" if "error" in entry else "✓"
+        print(f"{graph_id:<16} {seconds * 1000:9.1f} ms  {mcp:<12} {status}")
+
+    # Server-style start: every graph in one interpreter
+    reports = [run_loader(graphs) for _ in range(args.repeat)]
+    total = statistics.median(r["total"] for r in reports)
+    print("─" * 72)
+    print(f"{'server start':<16} {total * 1000:9.1f} ms  "
+          f"{'MCP started' if reports[-1]['mcp_started'] else 'no MCP'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,24 +22,17 @@ except ImportError:
     )
     from research_agent_prompts import SUB_RESEARCH_PROMPT
 
-# Import tool utilities (Tavily + Appwrite MCP)
+# Import tool utilities (Tavily only - importing the Appwrite exports would
+# start the shared MCP server, which this graph never uses)
 try:
     from src.sow_author_tools import (
         internet_search,
-        appwrite_tools,
-        all_tools,
-        internet_only_tools,
-        appwrite_only_tools,
-        APPWRITE_AVAILABLE
+        internet_only_tools
     )
 except ImportError:
     from sow_author_tools import (
         internet_search,
-        appwrite_tools,
-        all_tools,
-        internet_only_tools,
-        appwrite_only_tools,
-        APPWRITE_AVAILABLE
+        internet_only_tools
     )
 
 # Import model factory for dynamic model selection
@@ -1,13 +1,12 @@
-import os
 from typing import Literal
 
-from tavily import TavilyClient
-from langchain_mcp_adapters.client import MultiServerMCPClient
-
 from deepagents import create_deep_agent
 
-# It's best practice to initialize the client once and reuse it.
-tavily_client = TavilyClient(api_key=os.environ["TAVILY_API_KEY"])
+# Shared Tavily client behind the persistent search cache
+try:
+    from src.sow_author_tools import cached_search
+except ImportError:
+    from sow_author_tools import cached_search
 
 # Search tool to use to do research
 def internet_search(
@@ -17,11 +16,11 @@ def internet_search(
     include_raw_content: bool = False,
 ):
     """Run a web search"""
-    search_docs = tavily_client.search(
+    search_docs = cached_search(
         query,
         max_results=max_results,
-        include_raw_content=include_raw_content,
         topic=topic,
+        include_raw_content=include_raw_content,
     )
     return search_docs
 
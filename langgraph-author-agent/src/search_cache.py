@@ -0,0 +1,250 @@
+"""Persistent response cache for Tavily internet searches.
+
+The research, SoW and lesson agents issue the same SQA-curriculum lookups
+across courses and reruns. Each response is stored on disk, keyed by:
+
+    sha256(json.dumps({"query": <normalized query>, "params": {...}},
+                      sort_keys=True, separators=(",", ":")))
+
+The query is normalized (Unicode NFKC, case-folded, whitespace collapsed),
+so "SQA  National 5 Maths" and "sqa national 5 maths" share an entry. The
+search parameters (max_results, topic, include_raw_content) are part of the
+key because they change the response.
+
+Entries live as one ``<key>.json`` file each. An entry older than the TTL
+counts as a miss and is deleted. When the number of entries goes over the
+size bound, the least recently used ones are evicted (a hit refreshes the
+file's mtime).
+
+Configuration:
+    TAVILY_CACHE_DIR          (default: langgraph-author-agent/.cache/tavily)
+    TAVILY_CACHE_ENABLED      (default: 1; 0 disables the cache)
+    TAVILY_CACHE_TTL_SECONDS  (default: 604800 = 7 days)
+    TAVILY_CACHE_MAX_ENTRIES  (default: 5000)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "tavily"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def normalize_query(query: str) -> str:
+    """Return the cache form of a query: NFKC, case-folded, single-spaced."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def search_cache_key(query: str, **params: Any) -> str:
+    """Return the content address for a search.
+
+    Args:
+        query: Search query as issued by the agent
+        **params: Tavily search parameters that affect the response
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        {"query": normalize_query(query), "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """Disk cache of Tavily search responses with TTL and LRU size bound (thread-safe)."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        enabled: Optional[bool] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(
+            os.environ.get("TAVILY_CACHE_DIR", DEFAULT_CACHE_DIR)
+        )
+        if enabled is None:
+            enabled = os.environ.get("TAVILY_CACHE_ENABLED", "1") != "0"
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get("TAVILY_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+        if max_entries is None:
+            max_entries = int(os.environ.get("TAVILY_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entry_count: Optional[int] = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "stores": 0,
+            "evictions": 0,
+            "seconds_saved": 0.0,
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _entries(self):
+        try:
+            return [p for p in self.cache_dir.iterdir() if p.suffix == ".json"]
+        except FileNotFoundError:
+            return []
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            entry = None
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable search cache entry {key[:12]}: {e}")
+            entry = None
+
+        expired = entry is not None and self._clock() - entry.get("stored_at", 0) > self.ttl_seconds
+        if expired:
+            self._remove(path)
+            entry = None
+        elif entry is not None:
+            try:
+                os.utime(path)  # Mark as recently used for LRU eviction
+            except OSError:
+                pass
+
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                self._stats["expired"] += int(expired)
+            else:
+                self._stats["hits"] += 1
+                self._stats["seconds_saved"] += entry.get("latency_seconds", 0.0)
+        return None if entry is None else entry["response"]
+
+    def put(self, key: str, query: str, response: Any, latency_seconds: float = 0.0) -> None:
+        """Store a search response (JSON-serializable) and enforce the size bound."""
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        data = json.dumps({
+            "query": query,
+            "stored_at": self._clock(),
+            "latency_seconds": latency_seconds,
+            "response": response,
+        }, ensure_ascii=False).encode("utf-8")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            is_new = not path.exists()
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            print(f"⚠️  Could not write search cache entry {key[:12]}: {e}")
+            return
+
+        with self._lock:
+            self._stats["stores"] += 1
+            if self._entry_count is None:
+                self._entry_count = len(self._entries())
+            elif is_new:
+                self._entry_count += 1
+            if self._entry_count > self.max_entries:
+                self._evict()
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"⚠️  Could not remove search cache entry {path.name}: {e}")
+            return
+        with self._lock:
+            if self._entry_count is not None:
+                self._entry_count -= 1
+
+    def _evict(self) -> None:
+        """Drop least recently used entries down to max_entries (caller holds the lock)."""
+        entries = []
+        for path in self._entries():
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        excess = len(entries) - self.max_entries
+        for _, path in entries[:max(excess, 0)]:
+            try:
+                path.unlink()
+                self._stats["evictions"] += 1
+            except OSError:
+                pass
+        self._entry_count = min(len(entries), self.max_entries)
+
+    def clear(self) -> int:
+        """Delete every entry on disk. Returns the number removed."""
+        removed = 0
+        for path in self._entries():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._entry_count = 0
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counts, hit rate and search time saved."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "seconds_saved": round(self._stats["seconds_saved"], 3),
+                "lookups": lookups,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "enabled": self.enabled,
+            }
+
+
+_cache: Optional[SearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Return the process-wide search cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SearchCache()
+        return _cache
+
+
+def reset_search_cache() -> None:
+    """Forget the process-wide cache object (files on disk are kept)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -2,22 +2,118 @@
 
 Provides Tavily internet search and Appwrite MCP database tools
 for curriculum research and data access.
+
+Searches go through a persistent response cache (see search_cache.py).
+
+Nothing is started at import time. The Tavily client is created on the first
+search, and the Appwrite MCP client (a ``uvx mcp-server-appwrite`` stdio
+subprocess) is started and its tools discovered the first time a graph asks
+for them. Both are process-wide singletons, so every graph loaded by the
+LangGraph server shares one Tavily client and one MCP client.
+
+The module-level tool lists (``appwrite_tools``, ``appwrite_only_tools``,
+``all_tools``, ``APPWRITE_AVAILABLE``) are resolved on first attribute access,
+so graphs that only import ``internet_search`` / ``internet_only_tools`` never
+start the MCP server.
 """
 
-import os
 import asyncio
-from typing import Literal
+import os
+import threading
+import time
+from typing import Any, List, Literal, Optional
 
-from tavily import TavilyClient
-from langchain_mcp_adapters.client import MultiServerMCPClient
+# reset_search_cache is re-exported so callers reset the same search_cache
+# module this one uses (it may be imported as src.search_cache or search_cache).
+try:
+    from src.search_cache import get_search_cache, search_cache_key
+    from src.search_cache import reset_search_cache  # noqa: F401 - re-export
+except ImportError:
+    from search_cache import get_search_cache, search_cache_key
+    from search_cache import reset_search_cache  # noqa: F401 - re-export
 
 
 # =============================================================================
 # TAVILY INTERNET SEARCH TOOL
 # =============================================================================
 
-# Initialize Tavily client
-tavily_client = TavilyClient(api_key=os.environ["TAVILY_API_KEY"])
+_tavily_client = None
+_tavily_lock = threading.Lock()
+
+
+def get_tavily_client():
+    """Return the process-wide Tavily client, creating it on first use.
+
+    With TAVILY_USE_STUB=1 an offline StubTavilyClient is used instead (no
+    API key or network needed).
+
+    Raises:
+        KeyError: If TAVILY_API_KEY is not set
+    """
+    global _tavily_client
+    with _tavily_lock:
+        if _tavily_client is None:
+            if os.environ.get("TAVILY_USE_STUB", "0") == "1":
+                try:
+                    from src.tavily_stub import StubTavilyClient
+                except ImportError:
+                    from tavily_stub import StubTavilyClient
+
+                _tavily_client = StubTavilyClient()
+            else:
+                from tavily import TavilyClient
+
+                _tavily_client = TavilyClient(api_key=os.environ["TAVILY_API_KEY"])
+        return _tavily_client
+
+
+def set_tavily_client(client) -> None:
+    """Replace the shared Tavily client (e.g. with a StubTavilyClient in tests).
+
+    Pass None to have the next search create a real client again.
+    """
+    global _tavily_client
+    with _tavily_lock:
+        _tavily_client = client
+
+
+def cached_search(
+    query: str,
+    max_results: int = 5,
+    topic: str = "general",
+    include_raw_content: bool = False,
+):
+    """Run a Tavily search through the persistent search cache.
+
+    Identical searches (same normalized query and parameters) within the
+    cache TTL are answered from disk without calling Tavily. Failed
+    searches raise as before and are never cached. The key includes the
+    client's cache_namespace ("tavily" for the real client), so offline
+    stub responses are never served to real runs.
+    """
+    client = get_tavily_client()
+    cache = get_search_cache()
+    key = search_cache_key(
+        query,
+        client=getattr(client, "cache_namespace", "tavily"),
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=include_raw_content,
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        print(f"♻️  Search cache hit ({cache.get_stats()['hit_rate']:.0%} hit rate): {query[:80]}")
+        return cached
+
+    started = time.perf_counter()
+    search_docs = client.search(
+        query,
+        max_results=max_results,
+        include_raw_content=include_raw_content,
+        topic=topic,
+    )
+    cache.put(key, query, search_docs, latency_seconds=time.perf_counter() - started)
+    return search_docs
 
 
 def internet_search(
@@ -35,35 +131,35 @@ def internet_search(
         include_raw_content: Include full page content (default: False)
 
     Returns:
-        Search results from Tavily API
+        Search results from Tavily API (served from the local search cache
+        when the same query was made recently)
     """
-    search_docs = tavily_client.search(
+    return cached_search(
         query,
         max_results=max_results,
-        include_raw_content=include_raw_content,
         topic=topic,
+        include_raw_content=include_raw_content,
     )
-    return search_docs
 
 
 # =============================================================================
 # APPWRITE MCP DATABASE TOOLS
 # =============================================================================
 
-def _init_appwrite_tools():
-    """Initialize Appwrite MCP tools synchronously for module-level use.
+_mcp_client = None
+_appwrite_tools: Optional[List[Any]] = None
+_appwrite_available = False
+_appwrite_lock = threading.Lock()
+# Held for the whole discovery so concurrent graph loads start one server
+_appwrite_init_lock = threading.Lock()
 
-    Runs async MCP initialization at module load time, returning
-    synchronous LangChain tool objects.
 
-    Returns:
-        List of LangChain BaseTool objects for Appwrite operations
+def _appwrite_mcp_servers() -> dict:
+    """Build the MultiServerMCPClient config for the Appwrite MCP server.
 
     Raises:
         RuntimeError: If required environment variables missing
-        ConnectionError: If MCP server connection fails
     """
-    # Validate required environment variables
     required_vars = ["APPWRITE_PROJECT_ID", "APPWRITE_API_KEY"]
     missing = [var for var in required_vars if not os.environ.get(var)]
 
@@ -72,54 +168,115 @@ def _init_appwrite_tools():
             f"Missing Appwrite env vars: {', '.join(missing)}"
         )
 
-    async def _async_init():
-        """Async initialization of MCP client."""
-        mcp_servers = {
-            "appwrite": {
-                "command": "uvx",
-                "args": [
-                    "mcp-server-appwrite",
-                    "--databases",  # Enable databases API
-                ],
-                "transport": "stdio",
-                "env": {
-                    "APPWRITE_PROJECT_ID": os.environ["APPWRITE_PROJECT_ID"],
-                    "APPWRITE_API_KEY": os.environ["APPWRITE_API_KEY"],
-                    "APPWRITE_ENDPOINT": os.environ.get(
-                        "APPWRITE_ENDPOINT",
-                        "https://cloud.appwrite.io/v1"
-                    )
-                }
+    return {
+        "appwrite": {
+            "command": "uvx",
+            "args": [
+                "mcp-server-appwrite",
+                "--databases",  # Enable databases API
+            ],
+            "transport": "stdio",
+            "env": {
+                "APPWRITE_PROJECT_ID": os.environ["APPWRITE_PROJECT_ID"],
+                "APPWRITE_API_KEY": os.environ["APPWRITE_API_KEY"],
+                "APPWRITE_ENDPOINT": os.environ.get(
+                    "APPWRITE_ENDPOINT",
+                    "https://cloud.appwrite.io/v1"
+                )
             }
         }
+    }
 
-        try:
-            mcp_client = MultiServerMCPClient(mcp_servers)
-            tools = await mcp_client.get_tools()
-            return tools
-        except Exception as e:
-            raise ConnectionError(f"MCP init failed: {str(e)}") from e
 
-    # Run async init synchronously at module load
+def get_mcp_client():
+    """Return the process-wide Appwrite MCP client, creating it on first use.
+
+    Raises:
+        RuntimeError: If required environment variables missing
+    """
+    global _mcp_client
+    with _appwrite_lock:
+        if _mcp_client is None:
+            from langchain_mcp_adapters.client import MultiServerMCPClient
+
+            _mcp_client = MultiServerMCPClient(_appwrite_mcp_servers())
+        return _mcp_client
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    Graph modules may be imported while an event loop is already running
+    (e.g. inside the LangGraph server), where run_until_complete would fail,
+    so the coroutine then runs on its own loop in a helper thread.
+    """
     try:
-        loop = asyncio.get_event_loop()
+        asyncio.get_running_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        return asyncio.run(coro)
 
-    return loop.run_until_complete(_async_init())
+    result = {}
 
+    def _worker():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as e:
+            result["error"] = e
 
-# Initialize Appwrite tools at module load (runs once when imported)
-try:
-    appwrite_tools = _init_appwrite_tools()
-    APPWRITE_AVAILABLE = True
-    print(f"✅ Initialized {len(appwrite_tools)} Appwrite MCP tools")
-except (RuntimeError, ConnectionError) as e:
-    print(f"⚠️  Appwrite init failed: {e}")
-    print("   Agent will run with Tavily search only")
-    appwrite_tools = []
-    APPWRITE_AVAILABLE = False
+    thread = threading.Thread(target=_worker, name="appwrite-mcp-init")
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def _init_appwrite_tools():
+    """Start the shared MCP client and discover its Appwrite tools.
+
+    Returns:
+        List of LangChain BaseTool objects for Appwrite operations
+
+    Raises:
+        RuntimeError: If required environment variables missing
+        ConnectionError: If MCP server connection fails
+    """
+    mcp_client = get_mcp_client()
+    try:
+        return _run_sync(mcp_client.get_tools())
+    except Exception as e:
+        raise ConnectionError(f"MCP init failed: {str(e)}") from e
+
+
+def get_appwrite_tools() -> List[Any]:
+    """Return the Appwrite MCP tools, discovering them once per process.
+
+    A failed initialization is cached as an empty list (Tavily-only mode),
+    as it was when tools were discovered at import time; call
+    reset_appwrite_tools() to retry.
+    """
+    global _appwrite_tools, _appwrite_available
+    with _appwrite_init_lock:
+        if _appwrite_tools is None:
+            try:
+                _appwrite_tools = _init_appwrite_tools()
+                _appwrite_available = True
+                print(f"✅ Initialized {len(_appwrite_tools)} Appwrite MCP tools")
+            except (RuntimeError, ConnectionError) as e:
+                print(f"⚠️  Appwrite init failed: {e}")
+                print("   Agent will run with Tavily search only")
+                _appwrite_tools = []
+                _appwrite_available = False
+        return _appwrite_tools
+
+
+def reset_appwrite_tools() -> None:
+    """Forget the shared MCP client and discovered tools (next use re-initializes)."""
+    global _mcp_client, _appwrite_tools, _appwrite_available
+    with _appwrite_init_lock, _appwrite_lock:
+        _mcp_client = None
+        _appwrite_tools = None
+        _appwrite_available = False
 
 
 # =============================================================================
@@ -129,8 +286,18 @@ except (RuntimeError, ConnectionError) as e:
 # Internet search only (lightweight research)
 internet_only_tools = [internet_search]
 
-# Appwrite database access only (curriculum data)
-appwrite_only_tools = appwrite_tools
 
-# Combined: Tavily + Appwrite (full capability)
-all_tools = [internet_search] + appwrite_tools
+def __getattr__(name: str):
+    """Resolve the Appwrite-backed exports lazily (PEP 562)."""
+    if name in ("appwrite_tools", "appwrite_only_tools"):
+        # Appwrite database access only (curriculum data)
+        return get_appwrite_tools()
+    if name == "all_tools":
+        # Combined: Tavily + Appwrite (full capability)
+        return [internet_search] + get_appwrite_tools()
+    if name == "APPWRITE_AVAILABLE":
+        get_appwrite_tools()
+        return _appwrite_available
+    if name == "tavily_client":
+        return get_tavily_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,61 @@
+"""Offline stand-in for TavilyClient.
+
+Returns deterministic, Tavily-shaped responses without network access or an
+API key, and records every call so tests can assert how many real searches
+would have been made. Enable it for whole agent runs with TAVILY_USE_STUB=1.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+
+class StubTavilyClient:
+    """Deterministic TavilyClient replacement (same search() signature)."""
+
+    # Keeps stub responses in their own search-cache keyspace (see cached_search)
+    cache_namespace = "stub"
+
+    def __init__(self, api_key: Optional[str] = None, responses: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            api_key: Ignored; accepted for drop-in compatibility
+            responses: Optional canned responses keyed by exact query string
+        """
+        self.responses = responses or {}
+        self.calls: List[Dict[str, Any]] = []
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_raw_content: bool = False,
+        topic: str = "general",
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        self.calls.append({
+            "query": query,
+            "max_results": max_results,
+            "include_raw_content": include_raw_content,
+            "topic": topic,
+            **kwargs,
+        })
+        if query in self.responses:
+            return self.responses[query]
+
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()[:8]
+        return {
+            "query": query,
+            "answer": None,
+            "images": [],
+            "results": [
+                {
+                    "title": f"Stub result {i + 1} for {query}",
+                    "url": f"https://example.org/stub/{digest}/{i + 1}",
+                    "content": f"Offline stub content for '{query}' ({topic}).",
+                    "score": round(1.0 - i / max(max_results, 1), 3),
+                    "raw_content": f"Offline stub page for '{query}'." if include_raw_content else None,
+                }
+                for i in range(max_results)
+            ],
+            "response_time": 0.0,
+        }
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """Test lesson_author agent tool assignments.
 
-Verifies that critic subagents have correct tool lists matching their prompts.
-Ensures no unnecessary Appwrite tools are assigned to critics that don't use them.
+Verifies that subagents have correct tool lists matching their prompts.
+Ensures no Appwrite tools are assigned to subagents that don't use them.
 
 This test validates the fix for the ToolException error caused by critics
-having Appwrite tools they don't need.
+having Appwrite tools they don't need. The lesson author graph now only uses
+Tavily, so importing it must not start the Appwrite MCP server either.
 """
 
 import sys
@@ -14,101 +15,43 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import lesson_author_agent
 from lesson_author_agent import (
-    pedagogical_design_critic,
-    assessment_design_critic,
-    accessibility_critic,
-    scottish_context_critic,
-    coherence_critic,
     research_subagent,
-    lesson_author_subagent,
-    all_tools,
-    internet_only_tools,
-    appwrite_only_tools
+    combined_lesson_critic,
 )
 
+# The graph imports sow_author_tools as either src.sow_author_tools or
+# sow_author_tools depending on sys.path; check the copy it actually used.
+sow_author_tools = sys.modules[lesson_author_agent.internet_search.__module__]
+internet_only_tools = sow_author_tools.internet_only_tools
 
-def test_pedagogical_critic_has_no_tools():
-    """Pedagogical critic should have no external tools - only reads/writes files."""
-    tools = pedagogical_design_critic["tools"]
-    assert isinstance(tools, list), "Tools should be a list"
-    assert len(tools) == 0, "Pedagogical critic should have empty tools list (no external tools needed)"
 
-
-def test_assessment_critic_has_no_tools():
-    """Assessment critic should have no external tools - only reads/writes files."""
-    tools = assessment_design_critic["tools"]
-    assert isinstance(tools, list), "Tools should be a list"
-    assert len(tools) == 0, "Assessment critic should have empty tools list (no external tools needed)"
-
-
-def test_accessibility_critic_has_internet_only():
-    """Accessibility critic should have Tavily for research, no Appwrite."""
-    tools = accessibility_critic["tools"]
+def test_research_subagent_has_internet_only():
+    """Research subagent answers clarification questions with Tavily, no Appwrite."""
+    tools = research_subagent["tools"]
     assert tools == internet_only_tools, \
-        "Accessibility critic should have internet_only_tools (Tavily for accessibility research)"
+        "Research subagent should have internet_only_tools (Tavily for Scottish context research)"
 
 
-def test_scottish_context_critic_has_internet_only():
-    """Scottish context critic should have Tavily for context research, no Appwrite."""
-    tools = scottish_context_critic["tools"]
+def test_combined_lesson_critic_has_internet_only():
+    """Combined critic validates with Tavily only - its prompt never queries Appwrite."""
+    tools = combined_lesson_critic["tools"]
     assert tools == internet_only_tools, \
-        "Scottish context critic should have internet_only_tools (Tavily for Scottish context research)"
-
-
-def test_coherence_critic_has_appwrite_only():
-    """Coherence critic needs Appwrite for SoW validation queries."""
-    tools = coherence_critic["tools"]
-    assert tools == appwrite_only_tools, \
-        "Coherence critic should have appwrite_only_tools (database access for SoW alignment)"
-
-
-def test_research_subagent_has_all_tools():
-    """Research subagent needs both Tavily and Appwrite for comprehensive research."""
-    tools = research_subagent["tools"]
-    assert tools == all_tools, \
-        "Research subagent should have all_tools (Tavily + Appwrite for comprehensive research)"
-
+        "Combined lesson critic should have internet_only_tools (Tavily for research and validation)"
 
-def test_lesson_author_subagent_has_all_tools():
-    """Lesson author subagent needs both Tavily and Appwrite for authoring."""
-    tools = lesson_author_subagent["tools"]
-    assert tools == all_tools, \
-        "Lesson author subagent should have all_tools (Tavily + Appwrite for comprehensive authoring)"
 
-
-def test_no_critic_has_all_tools():
-    """Verify no critic subagent has all_tools (Tavily + Appwrite combined).
-
-    This was the bug - critics had all_tools but prompts didn't use Appwrite,
-    causing ToolException when LLM hallucinated Appwrite tool calls.
-    """
-    critics = [
-        ("pedagogical_design_critic", pedagogical_design_critic),
-        ("assessment_design_critic", assessment_design_critic),
-        ("accessibility_critic", accessibility_critic),
-        ("scottish_context_critic", scottish_context_critic),
-        ("coherence_critic", coherence_critic)
-    ]
-
-    for name, critic in critics:
-        tools = critic["tools"]
-        if tools == all_tools:
-            raise AssertionError(
-                f"{name} has all_tools but should only have specific tools matching its prompt. "
-                f"This causes ToolException when LLM hallucinates Appwrite tool usage."
-            )
+def test_importing_graph_does_not_start_appwrite():
+    """Building the lesson author graph must not initialise the Appwrite MCP tools."""
+    assert sow_author_tools._appwrite_tools is None, \
+        "Appwrite MCP tools were initialised although no lesson author subagent uses them"
 
 
 def test_tool_lists_are_defined():
-    """Verify tool list constants exist and are lists."""
-    assert isinstance(all_tools, list), "all_tools should be a list"
+    """Verify the internet-only tool list exists and holds just internet_search."""
     assert isinstance(internet_only_tools, list), "internet_only_tools should be a list"
-    assert isinstance(appwrite_only_tools, list), "appwrite_only_tools should be a list"
-
-    # Verify they're different lists
-    assert len(all_tools) > len(internet_only_tools), "all_tools should have more tools than internet_only"
-    assert len(all_tools) > len(appwrite_only_tools), "all_tools should have more tools than appwrite_only"
+    assert internet_only_tools == [sow_author_tools.internet_search], \
+        "internet_only_tools should contain only internet_search"
 
 
 if __name__ == "__main__":
@@ -116,29 +59,14 @@ if __name__ == "__main__":
     print("=" * 60)
 
     try:
-        test_pedagogical_critic_has_no_tools()
-        print("✅ Pedagogical critic has no tools")
-
-        test_assessment_critic_has_no_tools()
-        print("✅ Assessment critic has no tools")
-
-        test_accessibility_critic_has_internet_only()
-        print("✅ Accessibility critic has internet_only_tools")
-
-        test_scottish_context_critic_has_internet_only()
-        print("✅ Scottish context critic has internet_only_tools")
-
-        test_coherence_critic_has_appwrite_only()
-        print("✅ Coherence critic has appwrite_only_tools")
-
-        test_research_subagent_has_all_tools()
-        print("✅ Research subagent has all_tools")
+        test_research_subagent_has_internet_only()
+        print("✅ Research subagent has internet_only_tools")
 
-        test_lesson_author_subagent_has_all_tools()
-        print("✅ Lesson author subagent has all_tools")
+        test_combined_lesson_critic_has_internet_only()
+        print("✅ Combined lesson critic has internet_only_tools")
 
-        test_no_critic_has_all_tools()
-        print("✅ No critic has all_tools (prevents ToolException)")
+        test_importing_graph_does_not_start_appwrite()
+        print("✅ Appwrite MCP tools not initialised by the lesson author graph")
 
         test_tool_lists_are_defined()
         print("✅ Tool lists are properly defined")
@@ -0,0 +1,147 @@
+"""Tests for the persistent Tavily search cache.
+
+Runs fully offline: searches go to StubTavilyClient, and TTL expiry uses an
+injected clock.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import sow_author_tools
+from search_cache import SearchCache, normalize_query, search_cache_key
+from tavily_stub import StubTavilyClient
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def stub_client(tmp_path, monkeypatch):
+    """Route internet_search through a stub client and a temp cache dir.
+
+    The process-wide cache is reset through sow_author_tools, which may have
+    loaded it as src.search_cache rather than search_cache.
+    """
+    monkeypatch.setenv("TAVILY_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("TAVILY_CACHE_ENABLED", "1")
+    sow_author_tools.reset_search_cache()
+    client = StubTavilyClient()
+    sow_author_tools.set_tavily_client(client)
+    yield client
+    sow_author_tools.set_tavily_client(None)
+    sow_author_tools.reset_search_cache()
+
+
+def test_query_normalization_shares_keys_but_params_do_not():
+    assert normalize_query("  SQA   National 5\tMaths ") == "sqa national 5 maths"
+    assert search_cache_key("SQA National 5 Maths", max_results=5) == search_cache_key(
+        "sqa  national 5 maths", max_results=5
+    )
+    assert search_cache_key("sqa national 5 maths", max_results=5) != search_cache_key(
+        "sqa national 5 maths", max_results=10
+    )
+
+
+def test_repeated_search_is_served_from_cache(stub_client):
+    first = sow_author_tools.internet_search("SQA National 5 Applications of Maths")
+    second = sow_author_tools.internet_search("sqa national 5  applications of maths")
+    sow_author_tools.internet_search("SQA National 5 Applications of Maths", max_results=3)
+
+    assert first == second
+    assert [c["max_results"] for c in stub_client.calls] == [5, 3]
+
+    stats = sow_author_tools.get_search_cache().get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(0.333)
+
+
+def test_cache_persists_across_processes(stub_client):
+    sow_author_tools.internet_search("Curriculum for Excellence numeracy")
+    sow_author_tools.reset_search_cache()  # New cache object, same directory
+
+    sow_author_tools.internet_search("Curriculum for Excellence numeracy")
+
+    assert len(stub_client.calls) == 1
+
+
+def test_stub_results_are_not_served_to_a_real_client(stub_client):
+    stubbed = sow_author_tools.internet_search("SQA Higher Mathematics course specification")
+
+    class RealClient:
+        """Stands in for TavilyClient (no cache_namespace attribute)."""
+
+        def __init__(self):
+            self.calls = 0
+
+        def search(self, query, **kwargs):
+            self.calls += 1
+            return {"query": query, "results": [{"title": "Real result"}]}
+
+    real = RealClient()
+    sow_author_tools.set_tavily_client(real)
+
+    result = sow_author_tools.internet_search("SQA Higher Mathematics course specification")
+
+    assert result != stubbed
+    assert result["results"] == [{"title": "Real result"}]
+    assert real.calls == 1
+
+
+def test_expired_entries_are_misses(tmp_path):
+    clock = FakeClock()
+    cache = SearchCache(cache_dir=tmp_path, ttl_seconds=60, clock=clock)
+    key = search_cache_key("q", max_results=5)
+    cache.put(key, "q", {"results": []})
+
+    clock.now += 59
+    assert cache.get(key) == {"results": []}
+    clock.now += 2
+    assert cache.get(key) is None
+    assert not (tmp_path / f"{key}.json").exists()
+    assert cache.get_stats()["expired"] == 1
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    cache = SearchCache(cache_dir=tmp_path, max_entries=2)
+    keys = [search_cache_key(q) for q in ("a", "b", "c")]
+    cache.put(keys[0], "a", {"n": 0})
+    cache.put(keys[1], "b", {"n": 1})
+    # Make "a" the most recently used, so "b" is evicted next
+    os.utime(tmp_path / f"{keys[1]}.json", (1, 1))
+    assert cache.get(keys[0]) == {"n": 0}
+
+    cache.put(keys[2], "c", {"n": 2})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == {"n": 0}
+    assert cache.get(keys[2]) == {"n": 2}
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_disabled_cache_always_calls_client(stub_client, monkeypatch):
+    monkeypatch.setenv("TAVILY_CACHE_ENABLED", "0")
+    sow_author_tools.reset_search_cache()
+
+    sow_author_tools.internet_search("SQA Higher Physics")
+    sow_author_tools.internet_search("SQA Higher Physics")
+
+    assert len(stub_client.calls) == 2
+
+
+def test_invalid_bounds_raise_value_error(tmp_path):
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        SearchCache(cache_dir=tmp_path, ttl_seconds=0)
+    with pytest.raises(ValueError, match="max_entries"):
+        SearchCache(cache_dir=tmp_path, max_entries=0)